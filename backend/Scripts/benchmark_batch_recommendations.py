@@ -0,0 +1,79 @@
+"""
+Benchmark: per-user content scoring loop vs batch (users x careers) scoring
+
+Times scoring a cohort one user at a time (what N calls to
+/recommendations/careers do) against CareerMatrix.batch_content_scores
+in chunks of RECOMMENDATION_BATCH_CHUNK users.
+
+Usage (from backend/):
+    python Scripts/benchmark_batch_recommendations.py --users 2000 --careers 10000 --dim 768
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+from benchmark_recommendations import make_careers
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.models.user_preferences import UserPreferences
+from ai_career_advisor.services.career_matrix import CareerMatrix
+
+
+def make_users(n: int, dim: int, rng: random.Random, np_rng: np.random.Generator):
+    users = [
+        UserPreferences(
+            user_email=f"user{i}@example.com",
+            skills=[f"skill_{rng.randrange(2000)}" for _ in range(8)],
+            interests=[f"interest_{rng.randrange(300)}" for _ in range(3)],
+            education_level=rng.choice(["12th", "graduate", None]),
+            preferred_work_style=rng.choice(["remote", "office", None])
+        )
+        for i in range(n)
+    ]
+    return users, np_rng.standard_normal((n, dim), dtype=np.float32).tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--careers", type=int, default=10000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--chunk", type=int, default=settings.RECOMMENDATION_BATCH_CHUNK)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    np_rng = np.random.default_rng(0)
+    matrix = CareerMatrix(make_careers(args.careers, args.dim, rng, np_rng))
+    users, vectors = make_users(args.users, args.dim, rng, np_rng)
+
+    started = time.perf_counter()
+    per_user = [CareerMatrix.top_k(matrix.content_scores(u, v), args.top_k) for u, v in zip(users, vectors)]
+    loop_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batched = []
+    for start in range(0, len(users), args.chunk):
+        scores = matrix.batch_content_scores(users[start:start + args.chunk], vectors[start:start + args.chunk])
+        batched += [CareerMatrix.top_k(row, args.top_k) for row in scores]
+    batch_s = time.perf_counter() - started
+
+    agree = np.mean([set(a) == set(b) for a, b in zip(per_user, batched)])
+    print("=" * 72)
+    print(f"{args.users} users x {args.careers} careers (dim {args.dim}, chunk {args.chunk})")
+    print(f"per-user loop: {loop_s:7.2f}s  {args.users / loop_s:8.0f} users/s")
+    print(f"batch:         {batch_s:7.2f}s  {args.users / batch_s:8.0f} users/s  ({loop_s / batch_s:.1f}x)")
+    print(f"identical top-{args.top_k}: {agree:.1%}")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark: exact career scoring vs IVF ANN candidates + exact re-rank
+
+Synthetic careers are clustered (industries) in both semantic and
+attribute space. Reports index build time and, per query, exact vs ANN
+latency and tie-aware recall@k for recommendations and similar careers.
+
+Usage (from backend/):
+    python Scripts/benchmark_career_ann.py --sizes 10000,100000 --dim 768
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.models.career_attributes import CareerAttributes
+from ai_career_advisor.models.user_preferences import UserPreferences
+from ai_career_advisor.services.career_matrix import CareerMatrix
+from ai_career_advisor.services.career_ann import CareerANNService
+
+INDUSTRIES = 200
+
+
+def make_careers(n: int, dim: int, seed: int = 0):
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    centers = np_rng.standard_normal((INDUSTRIES, dim), dtype=np.float32)
+    industry = np_rng.integers(0, INDUSTRIES, n)
+    vectors = centers[industry] + 0.6 * np_rng.standard_normal((n, dim), dtype=np.float32)
+    pools = [[f"skill_{c}_{t}" for t in range(30)] for c in range(INDUSTRIES)]
+    careers = [
+        CareerAttributes(
+            id=str(i),
+            career_name=f"Career {i}",
+            required_skills=rng.sample(pools[industry[i]], 5) + rng.sample(pools[rng.randrange(INDUSTRIES)], 1),
+            interest_tags=[f"interest_{industry[i] % 40}", f"interest_{rng.randrange(40)}"],
+            personality_fit=[],
+            semantic_vector=vectors[i].tolist()
+        )
+        for i in range(n)
+    ]
+    return careers, centers
+
+
+def score_recall(approx, exact, scores) -> float:
+    return float(np.mean(scores[approx] >= scores[exact[-1]] - 1e-6))
+
+
+async def run(n: int, args):
+    careers, centers = make_careers(n, args.dim)
+    matrix = CareerMatrix(careers)
+    service = CareerANNService(Path(tempfile.mkdtemp()))
+
+    started = time.perf_counter()
+    await service.ensure(matrix)
+    build_s = time.perf_counter() - started
+
+    np_rng = np.random.default_rng(1)
+    exact_ms, ann_ms, recalls = [], [], []
+    for q in range(args.queries):
+        user = UserPreferences(
+            user_email="bench@example.com",
+            skills=list(careers[q].required_skills[:3]),
+            interests=list(careers[q].interest_tags),
+            education_level="graduate"
+        )
+        user_vector = (centers[q % INDUSTRIES] + 0.6 * np_rng.standard_normal(args.dim)).tolist()
+
+        started = time.perf_counter()
+        scores = matrix.content_scores(user, user_vector)
+        exact = CareerMatrix.top_k(scores, args.top_k)
+        exact_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        rows, literal = await service.recommendation_candidates(matrix, user, user_vector, args.top_k)
+        approx = rows[CareerMatrix.top_k(matrix.content_scores(user, user_vector, rows, literal), args.top_k)]
+        ann_ms.append((time.perf_counter() - started) * 1000)
+        recalls.append(score_recall(approx, exact, scores))
+
+    sim_exact_ms, sim_ann_ms, sim_recalls = [], [], []
+    for name in matrix.names[:args.queries]:
+        started = time.perf_counter()
+        similarity = matrix.attribute_similarity(name)
+        exact = CareerMatrix.top_k(similarity, args.top_k, exclude=matrix.index[name])
+        sim_exact_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        rows = await service.similar_candidates(matrix, name, args.top_k)
+        approx = rows[CareerMatrix.top_k(matrix.attribute_similarity(name, rows), args.top_k)]
+        sim_ann_ms.append((time.perf_counter() - started) * 1000)
+        sim_recalls.append(score_recall(approx, exact, similarity))
+
+    print(f"{n:>8} {build_s:>8.2f} {'recommend':>10} {np.median(exact_ms):>10.2f} {np.median(ann_ms):>9.2f} "
+          f"{np.mean(recalls):>9.3f}")
+    print(f"{'':>8} {'':>8} {'similar':>10} {np.median(sim_exact_ms):>10.2f} {np.median(sim_ann_ms):>9.2f} "
+          f"{np.mean(sim_recalls):>9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    settings.ANN_MIN_CAREERS = 0
+
+    print("=" * 62)
+    print(f"{'careers':>8} {'build s':>8} {'query':>10} {'exact ms':>10} {'ANN ms':>9} {'recall@k':>9}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        asyncio.run(run(n, args))
+    print("=" * 62)
+
+
+if __name__ == "__main__":
+    main()
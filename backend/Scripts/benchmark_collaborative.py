@@ -0,0 +1,151 @@
+"""
+Benchmark: collaborative scoring latency, before vs after the item-item model
+
+Builds a synthetic user_career_interactions table (default 100k users) in a
+temporary SQLite database and measures p50/p99 per recommendation request:
+  - n+1:       the old loop, 3 queries per career (user history, similar users, avg)
+  - group-by:  one aggregate query per request
+  - item-item: precomputed similarities, one sparse mat-vec per request
+
+Usage (from backend/):
+    python Scripts/benchmark_collaborative.py --users 100000 --careers 500
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+from ai_career_advisor.models.user_career_interaction import UserCareerInteraction, INTERACTION_SCORES
+from ai_career_advisor.services.collaborative_model import CollaborativeModelService
+
+
+async def seed(Session, users: int, careers: int, per_user: int):
+    """Users cluster around a 'home' group of careers so similarities are meaningful"""
+    rng = random.Random(0)
+    names = [f"Career {i}" for i in range(careers)]
+    types = list(INTERACTION_SCORES)
+    rows = []
+    for u in range(users):
+        home = rng.randrange(0, careers, 10)
+        for _ in range(rng.randint(1, per_user * 2)):
+            career = names[(home + int(abs(rng.gauss(0, 5)))) % careers]
+            kind = rng.choice(types)
+            rows.append({"id": f"{u}-{len(rows)}", "user_email": f"user{u}@example.com",
+                         "career_name": career, "interaction_type": kind, "score": INTERACTION_SCORES[kind]})
+
+    async with Session() as db:
+        for start in range(0, len(rows), 50_000):
+            await db.execute(UserCareerInteraction.__table__.insert(), rows[start:start + 50_000])
+        await db.commit()
+    return names, len(rows)
+
+
+async def n_plus_one(db, user_email, names):
+    """Old _calculate_collaborative_score, called once per career"""
+    scores = []
+    for career_name in names:
+        result = await db.execute(select(UserCareerInteraction).where(UserCareerInteraction.user_email == user_email))
+        user_careers = {i.career_name for i in result.scalars().all()}
+        similar = await db.execute(
+            select(UserCareerInteraction.user_email)
+            .where(UserCareerInteraction.career_name.in_(user_careers))
+            .where(UserCareerInteraction.user_email != user_email).distinct()
+        )
+        emails = [row[0] for row in similar.fetchall()]
+        avg = await db.execute(
+            select(func.avg(UserCareerInteraction.score))
+            .where(UserCareerInteraction.user_email.in_(emails))
+            .where(UserCareerInteraction.career_name == career_name)
+        )
+        scores.append(min(1.0, max(0.0, avg.scalar() or 0.5)))
+    return scores
+
+
+async def group_by(db, user_email, names):
+    """One aggregate query per request"""
+    result = await db.execute(select(UserCareerInteraction.career_name).where(UserCareerInteraction.user_email == user_email))
+    user_careers = {row[0] for row in result.all()}
+    similar = (
+        select(UserCareerInteraction.user_email)
+        .where(UserCareerInteraction.career_name.in_(user_careers))
+        .where(UserCareerInteraction.user_email != user_email).distinct()
+    )
+    result = await db.execute(
+        select(UserCareerInteraction.career_name, func.avg(UserCareerInteraction.score))
+        .where(UserCareerInteraction.user_email.in_(similar))
+        .group_by(UserCareerInteraction.career_name)
+    )
+    by_career = dict(result.all())
+    return [min(1.0, max(0.0, by_career.get(n) or 0.5)) for n in names]
+
+
+def make_item_item(service):
+    async def item_item(db, user_email, names):
+        result = await db.execute(select(UserCareerInteraction).where(UserCareerInteraction.user_email == user_email))
+        return await service.score_user(db, result.scalars().all(), names)
+    return item_item
+
+
+async def measure(Session, fn, emails, names):
+    latencies = []
+    async with Session() as db:
+        for email in emails:
+            started = time.perf_counter()
+            await fn(db, email, names)
+            latencies.append((time.perf_counter() - started) * 1000)
+    return np.percentile(latencies, 50), np.percentile(latencies, 99)
+
+
+async def main(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(UserCareerInteraction.metadata.create_all, tables=[UserCareerInteraction.__table__])
+        Session = async_sessionmaker(engine, expire_on_commit=False)
+
+        started = time.perf_counter()
+        names, total = await seed(Session, args.users, args.careers, args.per_user)
+        print(f"Seeded {total} interactions for {args.users} users / {args.careers} careers "
+              f"in {time.perf_counter() - started:.1f}s")
+
+        service = CollaborativeModelService()
+        async with Session() as db:
+            await service.refresh(db)
+        print(f"Item-item model built in {service.last_refresh_seconds:.2f}s: {service.model.get_stats()}")
+
+        rng = random.Random(1)
+        emails = [f"user{rng.randrange(args.users)}@example.com" for _ in range(args.requests)]
+
+        print("=" * 60)
+        print(f"{'method':<10} {'requests':>9} {'p50 ms':>12} {'p99 ms':>12}")
+        for name, fn, count in [
+            ("n+1", n_plus_one, args.legacy_requests),
+            ("group-by", group_by, args.requests),
+            ("item-item", make_item_item(service), args.requests),
+        ]:
+            p50, p99 = await measure(Session, fn, emails[:count], names)
+            print(f"{name:<10} {count:>9} {p50:>12.2f} {p99:>12.2f}")
+        print("=" * 60)
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--careers", type=int, default=500)
+    parser.add_argument("--per-user", type=int, default=3, help="Average interactions per user")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--legacy-requests", type=int, default=3, help="The n+1 loop is slow; time only a few")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,91 @@
+"""
+Benchmark: per-request intent inference vs the micro-batcher
+
+Runs the real DistilBERT classifier at 1 / 8 / 64 concurrent callers and
+reports throughput plus p50/p99 latency for:
+  - baseline: classifier.predict() per request in the default thread pool
+  - batched:  get_intent_batcher().submit() (one forward pass per batch)
+
+Usage (from backend/):
+    python Scripts/benchmark_intent_batcher.py --requests 512
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+from ai_career_advisor.ml_models.intent_loader import get_intent_classifier, get_intent_batcher
+from ai_career_advisor.core.logger import logger
+
+
+def load_queries() -> list:
+    with open(backend_dir / "data" / "intent_training_data_augmented.json", encoding="utf-8") as f:
+        data = json.load(f)
+    return [row["text"] for row in data["training_data"]]
+
+
+async def run(label: str, call, queries: list, concurrency: int, total: int) -> dict:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(text):
+        async with semaphore:
+            started = time.perf_counter()
+            await call(text)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(random.choice(queries)) for _ in range(total)))
+    elapsed = time.perf_counter() - started
+
+    ms = np.array(latencies) * 1000
+    return {
+        "mode": label,
+        "concurrency": concurrency,
+        "throughput_rps": round(total / elapsed, 1),
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p99_ms": round(float(np.percentile(ms, 99)), 2)
+    }
+
+
+async def main(total: int):
+    queries = load_queries()
+    classifier = get_intent_classifier()
+    batcher = get_intent_batcher()
+    loop = asyncio.get_running_loop()
+
+    async def baseline(text):
+        return await loop.run_in_executor(None, classifier.predict, text)
+
+    # Warm-up (first forward pass allocates)
+    classifier.predict_batch(queries[:8])
+
+    results = []
+    for concurrency in (1, 8, 64):
+        results.append(await run("per-request", baseline, queries, concurrency, total))
+        results.append(await run("micro-batch", batcher.submit, queries, concurrency, total))
+
+    logger.info("=" * 60)
+    for row in results:
+        logger.info(
+            f"{row['mode']:>12} | c={row['concurrency']:>3} | {row['throughput_rps']:>8} req/s | "
+            f"p50 {row['p50_ms']:>7} ms | p99 {row['p99_ms']:>7} ms"
+        )
+    logger.info(f"Batcher stats: {batcher.get_stats()}")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=512)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,114 @@
+"""
+Benchmark: PyTorch vs ONNX Runtime (FP32 / INT8) intent classifier
+
+Each backend runs in a fresh subprocess so import time and resident
+memory are measured the way a new gunicorn worker would see them.
+Reports load time, RSS, single-query p50/p99, batch-32 throughput and
+accuracy on the augmented dataset.
+
+Usage (from backend/, after running the export):
+    python -m ai_career_advisor.ml_models.export_intent_onnx
+    python Scripts/benchmark_intent_onnx.py
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+DATA_PATH = backend_dir / "data" / "intent_training_data_augmented.json"
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process"""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * resource.getpagesize() / 1e6
+
+
+def measure(backend: str, model_dir: str, onnx_dir: str, repeats: int) -> dict:
+    """Runs inside the subprocess for one backend"""
+    import numpy as np
+
+    with open(DATA_PATH, encoding="utf-8") as f:
+        data = json.load(f)["training_data"]
+    texts = [row["text"] for row in data]
+    labels = [row["label"] for row in data]
+
+    rss_before = rss_mb()
+    started = time.perf_counter()
+    if backend == "torch":
+        from ai_career_advisor.ml_models.intent_classifier import IntentClassifier
+        classifier = IntentClassifier(model_path=model_dir, device="cpu")
+    else:
+        from ai_career_advisor.ml_models.onnx_intent_classifier import OnnxIntentClassifier
+        classifier = OnnxIntentClassifier(onnx_dir, quantized=backend == "onnx-int8")
+    load_s = time.perf_counter() - started
+
+    classifier.predict_batch(texts[:8])  # warm-up
+
+    single = []
+    for text in texts[:repeats]:
+        started = time.perf_counter()
+        classifier.predict(text)
+        single.append((time.perf_counter() - started) * 1000)
+
+    predictions = []
+    started = time.perf_counter()
+    for start in range(0, len(texts), 32):
+        predictions += [p[0] for p in classifier.predict_batch(texts[start:start + 32])]
+    batch_s = time.perf_counter() - started
+
+    return {
+        "backend": backend,
+        "load_s": round(load_s, 2),
+        "rss_mb": round(rss_mb(), 1),
+        "model_rss_mb": round(rss_mb() - rss_before, 1),
+        "single_p50_ms": round(float(np.percentile(single, 50)), 2),
+        "single_p99_ms": round(float(np.percentile(single, 99)), 2),
+        "batch32_qps": round(len(texts) / batch_s, 1),
+        "accuracy": round(float(np.mean([p == l for p, l in zip(predictions, labels)])), 4)
+    }
+
+
+def main():
+    from ai_career_advisor.ml_models.intent_loader import TORCH_MODEL_DIR, ONNX_MODEL_DIR
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model-dir", default=str(TORCH_MODEL_DIR))
+    parser.add_argument("--onnx-dir", default=str(ONNX_MODEL_DIR))
+    parser.add_argument("--repeats", type=int, default=300, help="Single-query calls per backend")
+    parser.add_argument("--backends", default="torch,onnx-fp32,onnx-int8")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, args.model_dir, args.onnx_dir, args.repeats)))
+        return
+
+    rows = []
+    for backend in args.backends.split(","):
+        output = subprocess.run(
+            [sys.executable, __file__, "--worker", backend, "--model-dir", args.model_dir,
+             "--onnx-dir", args.onnx_dir, "--repeats", str(args.repeats)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        rows.append(json.loads(output.strip().splitlines()[-1]))
+
+    print("=" * 100)
+    print(f"{'backend':<10} {'load s':>7} {'RSS MB':>8} {'model MB':>9} {'p50 ms':>8} "
+          f"{'p99 ms':>8} {'batch32 q/s':>12} {'accuracy':>9}")
+    for row in rows:
+        print(f"{row['backend']:<10} {row['load_s']:>7} {row['rss_mb']:>8} {row['model_rss_mb']:>9} "
+              f"{row['single_p50_ms']:>8} {row['single_p99_ms']:>8} {row['batch32_qps']:>12} {row['accuracy']:>9}")
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark: legacy KnowledgeLoader.load_college_details (materialize + N+1
+college lookups) vs keyset-paginated, joined streaming
+
+Builds a synthetic SQLite college_details table per size and reports
+rows/s and peak Python heap (tracemalloc) for:
+  legacy   - select(CollegeDetails).all() + one select(College) per row
+  stream   - KnowledgeLoader.stream_source("college_detail") page by page
+  pipeline - KnowledgeIndexer.sync streaming into a no-op embedder/store
+             (diff against + write to the SQLite manifest included)
+
+Usage (from backend/):
+    python Scripts/benchmark_knowledge_loader.py --sizes 100000,500000 --legacy-max 20000
+"""
+
+import argparse
+import asyncio
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+import ai_career_advisor.models  # noqa: F401
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.database import Base
+from ai_career_advisor.models.college import College
+from ai_career_advisor.models.college_details import CollegeDetails
+from ai_career_advisor.rag.indexer import KnowledgeIndexer
+from ai_career_advisor.rag.knowledge_loader import KnowledgeLoader
+
+COLLEGES = 5000
+
+
+def build_db(path: Path, rows: int):
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync_engine, tables=[College.__table__, CollegeDetails.__table__])
+    sync_engine.dispose()
+
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO colleges (id, name, city, state, nirf_rank) VALUES (?, ?, ?, ?, ?)",
+        ((i, f"College {i}", "City", "State", i) for i in range(1, COLLEGES + 1))
+    )
+    conn.executemany(
+        "INSERT INTO college_details (id, college_id, degree, branch, fees_value, avg_package_value, cutoff_value) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        ((i, i % COLLEGES + 1, "B.Tech", f"Branch {i}", f"{i % 20} L", f"{i % 30} LPA", f"Rank {i % 9000}")
+         for i in range(1, rows + 1))
+    )
+    conn.commit()
+    conn.close()
+
+
+async def legacy_load(Session) -> int:
+    """The pre-streaming loader: whole table in memory + one college query per row"""
+    documents = []
+    async with Session() as db:
+        details = (await db.execute(select(CollegeDetails))).scalars().all()
+        for detail in details:
+            college = (await db.execute(select(College).where(College.id == detail.college_id))).scalar_one_or_none()
+            if college:
+                documents.append(KnowledgeLoader._college_detail_doc(detail, college.name))
+    return len(documents)
+
+
+async def stream_load(Session) -> int:
+    count = 0
+    async for batch in KnowledgeLoader.stream_source("college_detail", session_factory=Session):
+        count += len(batch)
+    return count
+
+
+class NullStore:
+    def get_or_create_collection(self, name):
+        return name
+
+    def delete_collection(self, name):
+        pass
+
+    def upsert_documents(self, **kwargs):
+        pass
+
+    def delete_documents(self, collection, ids):
+        pass
+
+
+async def null_embed(texts):
+    return [[0.0]] * len(texts)
+
+
+async def pipeline_load(Session) -> int:
+    indexer = KnowledgeIndexer(
+        persist_directory=Path(tempfile.mkdtemp()), vector_store=NullStore(),
+        embed_fn=null_embed, embedding_model="null"
+    )
+    # Only colleges/college_details exist here, the other sources just log and are skipped
+    stats = await indexer.sync(documents=None, session_factory=Session)
+    return stats["embedded"]
+
+
+async def measure(fn, Session):
+    started = time.perf_counter()
+    count = await fn(Session)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    await fn(Session)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak / 2**20
+
+
+async def run(rows: int, args):
+    path = Path(tempfile.mkdtemp()) / "kb.db"
+    build_db(path, rows)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+
+    modes = [("stream", stream_load), ("pipeline", pipeline_load)]
+    if rows <= args.legacy_max:
+        modes.insert(0, ("legacy", legacy_load))
+    for name, fn in modes:
+        count, elapsed, peak_mb = await measure(fn, Session)
+        print(f"{rows:>8} {name:>9} {count:>8} {elapsed:>8.2f} {count / elapsed:>10.0f} {peak_mb:>9.1f}")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="20000,100000,500000")
+    parser.add_argument("--legacy-max", type=int, default=20000, help="Largest size to run the N+1 loader on")
+    parser.add_argument("--batch-size", type=int, default=settings.RAG_LOADER_BATCH_SIZE)
+    args = parser.parse_args()
+
+    settings.RAG_LOADER_BATCH_SIZE = args.batch_size
+    from loguru import logger
+    logger.remove()
+
+    print("=" * 60)
+    print(f"{'rows':>8} {'mode':>9} {'docs':>8} {'seconds':>8} {'docs/s':>10} {'peak MiB':>9}")
+    for rows in (int(s) for s in args.sizes.split(",")):
+        asyncio.run(run(rows, args))
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Load test: per-request RAG query embedding vs the query micro-batcher
+
+Fires N chat-style queries at 1 / 8 / 32 / 64 concurrent callers and
+reports throughput, p50/p99 latency and process CPU for:
+  - per-request: RAG_QUERY_BATCH_ENABLED=False (one encode job per query
+                 in the embedding thread pool)
+  - micro-batch: concurrent queries coalesced into one encode call
+
+The embedding cache is disabled so every query really hits the model.
+By default the full RAGRetriever.search path (encode + Chroma lookup) is
+timed; --embed-only times generate_query_embedding alone.
+
+Usage (from backend/):
+    python Scripts/benchmark_query_embedding_batcher.py --requests 512
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+from ai_career_advisor.rag.embeddings import EmbeddingService
+
+
+def load_queries() -> list:
+    with open(backend_dir / "data" / "intent_training_data_augmented.json", encoding="utf-8") as f:
+        data = json.load(f)
+    return [row["text"] for row in data["training_data"]]
+
+
+def cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def run(label: str, call, queries: list, concurrency: int, total: int) -> dict:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(text):
+        async with semaphore:
+            started = time.perf_counter()
+            await call(text)
+            latencies.append(time.perf_counter() - started)
+
+    cpu_started, started = cpu_seconds(), time.perf_counter()
+    await asyncio.gather(*(one(random.choice(queries)) for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    cpu = cpu_seconds() - cpu_started
+
+    ms = np.array(latencies) * 1000
+    return {
+        "mode": label,
+        "concurrency": concurrency,
+        "throughput_rps": round(total / elapsed, 1),
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p99_ms": round(float(np.percentile(ms, 99)), 2),
+        "cpu_ms_per_query": round(1000 * cpu / total, 2),
+        "cpu_util": round(cpu / elapsed, 2)
+    }
+
+
+async def main(total: int, embed_only: bool, model: str):
+    settings.RAG_EMBED_CACHE_ENABLED = False
+    if model:
+        EmbeddingService.MODEL_NAME = model
+    queries = load_queries()
+
+    if embed_only:
+        call = EmbeddingService.generate_query_embedding
+    else:
+        from ai_career_advisor.rag.retriever import RAGRetriever
+        call = RAGRetriever().search
+
+    # Warm-up (model load + first forward pass)
+    await EmbeddingService.generate_embedding(queries[0])
+
+    results = []
+    for concurrency in (1, 8, 32, 64):
+        for label, enabled in (("per-request", False), ("micro-batch", True)):
+            settings.RAG_QUERY_BATCH_ENABLED = enabled
+            results.append(await run(label, call, queries, concurrency, total))
+
+    logger.info("=" * 60)
+    for row in results:
+        logger.info(
+            f"{row['mode']:>12} | c={row['concurrency']:>3} | {row['throughput_rps']:>8} q/s | "
+            f"p50 {row['p50_ms']:>8} ms | p99 {row['p99_ms']:>8} ms | "
+            f"CPU {row['cpu_ms_per_query']:>6} ms/query ({row['cpu_util']:.2f} cores)"
+        )
+    logger.info(f"Batcher stats: {EmbeddingService.get_query_batching_stats()}")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=512)
+    parser.add_argument("--embed-only", action="store_true", help="Skip the Chroma lookup")
+    parser.add_argument("--model", default="", help="Embedding model name or local path (default: EmbeddingService.MODEL_NAME)")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.embed_only, args.model))
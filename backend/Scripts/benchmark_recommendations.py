@@ -0,0 +1,118 @@
+"""
+Benchmark: per-career Python scoring vs the vectorized career matrix
+
+Generates synthetic careers (random skills / interests / semantic vectors)
+and times one user's recommendation scoring at 1k / 10k / 100k careers.
+The legacy loop is timed on a slice and extrapolated above --legacy-limit.
+
+Usage (from backend/):
+    python Scripts/benchmark_recommendations.py --sizes 1000,10000,100000 --dim 768
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+# The legacy per-career formulas live with the tests that use them as an oracle
+sys.path.insert(0, str(backend_dir / "test"))
+
+from ai_career_advisor.models.career_attributes import CareerAttributes
+from ai_career_advisor.models.user_preferences import UserPreferences
+from ai_career_advisor.services.career_matrix import CareerMatrix
+from test_career_matrix import reference_content_score
+
+
+def make_careers(n: int, dim: int, rng: random.Random, np_rng: np.random.Generator) -> list:
+    skills = [f"skill_{i}" for i in range(2000)]
+    interests = [f"interest_{i}" for i in range(300)]
+    vectors = np_rng.standard_normal((n, dim), dtype=np.float32)
+    return [
+        CareerAttributes(
+            id=str(i),
+            career_name=f"Career {i}",
+            required_skills=rng.sample(skills, 6),
+            interest_tags=rng.sample(interests, 3),
+            personality_fit=[],
+            min_education=rng.choice(["12th", "graduate", "postgraduate", None]),
+            work_style=rng.choice(["remote", "office", "hybrid", None]),
+            popularity_score=rng.random(),
+            semantic_vector=vectors[i].tolist()
+        )
+        for i in range(n)
+    ]
+
+
+def legacy_scores(user, careers, user_vector):
+    """The per-career loop from the old get_recommendations"""
+    return [reference_content_score(user, career, user_vector) for career in careers]
+
+
+def timed(fn, repeats: int) -> float:
+    """Median wall time in ms"""
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return float(np.median(samples))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--dim", type=int, default=768, help="gemini-embedding-001 is 3072 at full size")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--legacy-limit", type=int, default=5000, help="Careers scored by the legacy loop before extrapolating")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    np_rng = np.random.default_rng(0)
+    user = UserPreferences(
+        user_email="bench@example.com",
+        skills=[f"skill_{i}" for i in range(0, 60, 7)],
+        interests=["interest_1", "interest_5", "interest_9"],
+        education_level="graduate",
+        preferred_work_style="remote"
+    )
+    user_vector = np_rng.standard_normal(args.dim).tolist()
+
+    print("=" * 96)
+    print(f"{'careers':>8} {'build s':>8} {'matrix MB':>10} {'legacy ms':>11} {'vectorized ms':>14} "
+          f"{'top-k ms':>9} {'speedup':>8}")
+
+    for n in (int(s) for s in args.sizes.split(",")):
+        careers = make_careers(n, args.dim, rng, np_rng)
+
+        started = time.perf_counter()
+        matrix = CareerMatrix(careers)
+        build_s = time.perf_counter() - started
+
+        sample = careers[:min(n, args.legacy_limit)]
+        legacy_ms = timed(lambda: legacy_scores(user, sample, user_vector), 1) * n / len(sample)
+
+        scores = matrix.content_scores(user, user_vector)
+        vectorized_ms = timed(lambda: matrix.content_scores(user, user_vector), args.repeats)
+        top_k_ms = timed(lambda: CareerMatrix.top_k(scores, args.top_k), args.repeats)
+
+        # Same answer as the legacy loop on the slice
+        np.testing.assert_allclose(scores[:len(sample)], legacy_scores(user, sample, user_vector), atol=1e-4)
+
+        matrix_mb = (matrix.vectors.nbytes + matrix.skills.data.nbytes + matrix.skills.indices.nbytes +
+                     matrix.interests.data.nbytes + matrix.interests.indices.nbytes) / 1e6
+        extrapolated = "*" if len(sample) < n else " "
+        print(f"{n:>8} {build_s:>8.2f} {matrix_mb:>10.1f} {legacy_ms:>10.1f}{extrapolated} {vectorized_ms:>14.2f} "
+              f"{top_k_ms:>9.3f} {legacy_ms / (vectorized_ms + top_k_ms):>7.0f}x")
+
+    print("=" * 96)
+    print("* extrapolated from --legacy-limit careers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark: Chroma vs memory-mapped vector store (RAG_VECTOR_BACKEND)
+
+Builds the same synthetic corpus (N x 384 normalised float32 vectors with
+knowledge-base style metadata) in both backends, then starts W worker
+processes per backend, like gunicorn workers, each opening the store and
+running the same queries. Reports per backend:
+  - build time
+  - query p50 / p95 latency (top-20, unfiltered and source-filtered)
+  - per-worker RSS and PSS after the queries (PSS splits shared pages
+    between the processes mapping them, so sum(PSS) is the real cost)
+
+Chroma is skipped if chromadb is not installed.
+
+Usage (from backend/):
+    python Scripts/benchmark_vector_store.py --docs 30000 --workers 4
+"""
+
+import argparse
+import multiprocessing as mp
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+SOURCES = ["college_detail", "college", "entrance_exam", "career", "roadmap", "llm_generated"]
+DIM = 384
+
+
+def memory_kb() -> dict:
+    """RSS / PSS of this process from /proc (Linux)"""
+    usage = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, value = line.split(":", 1)
+                if key in ("Rss", "Pss"):
+                    usage[key.lower()] = int(value.split()[0])
+    except OSError:
+        import resource
+        usage["rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage
+
+
+def open_store(backend: str, directory: str):
+    if backend == "mmap":
+        from ai_career_advisor.rag.mmap_store import MmapVectorStore
+        return MmapVectorStore(directory)
+    from ai_career_advisor.rag.vector_store import VectorStore
+    return VectorStore(directory)
+
+
+def build(backend: str, directory: str, docs: int, batch: int) -> float:
+    rng = np.random.default_rng(42)
+    store = open_store(backend, directory)
+    collection = store.get_or_create_collection("career_knowledge")
+    started = time.perf_counter()
+    for start in range(0, docs, batch):
+        n = min(batch, docs - start)
+        vectors = rng.normal(size=(n, DIM)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        ids = [f"doc_{start + i}" for i in range(n)]
+        store.upsert_documents(
+            collection,
+            documents=[f"Document {start + i}: fees, placements and cut-offs" for i in range(n)],
+            embeddings=vectors,
+            metadatas=[{"source": SOURCES[(start + i) % len(SOURCES)], "row": start + i} for i in range(n)],
+            ids=ids
+        )
+    return time.perf_counter() - started
+
+
+def worker(backend: str, directory: str, queries: np.ndarray, top_k: int, results):
+    from ai_career_advisor.core.logger import logger
+    logger.remove()
+    store = open_store(backend, directory)
+    collection = store.get_or_create_collection("career_knowledge")
+
+    timings = {"unfiltered": [], "filtered": []}
+    for i, query in enumerate(queries):
+        for label, where in (("unfiltered", None), ("filtered", {"source": SOURCES[i % len(SOURCES)]})):
+            started = time.perf_counter()
+            store.search(collection, query.tolist(), top_k=top_k, filter_metadata=where)
+            timings[label].append(1000 * (time.perf_counter() - started))
+    results.put({"timings": timings, **memory_kb()})
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+
+def run_backend(backend: str, args) -> dict:
+    with tempfile.TemporaryDirectory(prefix=f"vs_{backend}_") as directory:
+        build_s = build(backend, directory, args.docs, args.batch)
+
+        rng = np.random.default_rng(7)
+        queries = rng.normal(size=(args.queries, DIM)).astype(np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+        ctx = mp.get_context("spawn")
+        results = ctx.Queue()
+        workers = [ctx.Process(target=worker, args=(backend, directory, queries, args.top_k, results)) for _ in range(args.workers)]
+        for p in workers:
+            p.start()
+        rows = [results.get() for _ in workers]
+        for p in workers:
+            p.join()
+
+    unfiltered = [t for row in rows for t in row["timings"]["unfiltered"]]
+    filtered = [t for row in rows for t in row["timings"]["filtered"]]
+    return {
+        "backend": backend,
+        "build_s": build_s,
+        "p50": statistics.median(unfiltered),
+        "p95": percentile(unfiltered, 0.95),
+        "filtered_p50": statistics.median(filtered),
+        "rss_mb": statistics.mean(row.get("rss", 0) for row in rows) / 1024,
+        "pss_mb": statistics.mean(row.get("pss", 0) for row in rows) / 1024,
+        "total_pss_mb": sum(row.get("pss", 0) for row in rows) / 1024
+    }
+
+
+def main(args):
+    report = []
+    for backend in args.backends.split(","):
+        if backend == "chroma":
+            try:
+                import chromadb  # noqa: F401
+            except ImportError:
+                print("chroma: skipped (chromadb not installed)")
+                continue
+        report.append(run_backend(backend, args))
+
+    print(f"\n{args.docs} x {DIM}-d vectors, {args.workers} workers x {args.queries} queries, top-{args.top_k}")
+    print(f"{'backend':>8} | {'build s':>8} | {'p50 ms':>7} | {'p95 ms':>7} | {'filt p50':>8} | {'RSS/wkr MB':>10} | {'PSS/wkr MB':>10} | {'sum PSS MB':>10}")
+    for row in report:
+        print(
+            f"{row['backend']:>8} | {row['build_s']:8.1f} | {row['p50']:7.2f} | {row['p95']:7.2f} | "
+            f"{row['filtered_p50']:8.2f} | {row['rss_mb']:10.1f} | {row['pss_mb']:10.1f} | {row['total_pss_mb']:10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, default=30000)
+    parser.add_argument("--batch", type=int, default=256, help="Documents per upsert (the indexer's batch size)")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--backends", default="chroma,mmap")
+    main(parser.parse_args())
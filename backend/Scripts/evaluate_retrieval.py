@@ -0,0 +1,149 @@
+"""
+Offline retrieval evaluation: recall@k, precision@k, MRR and latency per retrieval mode
+
+Runs a labelled query set against the live knowledge index in each mode:
+  vector  - dense only (RAG_HYBRID_ENABLED=False)
+  bm25    - BM25 only (hybrid with RAG_FUSION_VECTOR_WEIGHT=0)
+  hybrid  - BM25 + dense, reciprocal rank fusion
+  rerank  - hybrid + cross-encoder rerank of the fused candidates
+  routed  - hybrid restricted to the query intent's sources
+            (RAG_ROUTING_SOURCES), global search on low recall
+
+Besides the labelled metrics, on-intent@k is the share of the top k that
+comes from the intent's sources, i.e. how much of the prompt is on topic,
+and "fallback" the share of routed searches that went global.
+
+Query set format (JSON list):
+    [{"query": "IIT Bombay CSE fees", "relevant_ids": ["college_detail_42"], "intent": "college_query"}]
+"intent" defaults from "source" (SOURCE_INTENTS) for older query files.
+
+--generate N samples N exact-name queries ("<college> <degree> <branch> fees",
+"<exam> exam", "<college>") from the database into --queries first, since
+document IDs are specific to each database.
+
+Usage (from backend/):
+    python Scripts/evaluate_retrieval.py --generate 200
+    python Scripts/evaluate_retrieval.py --modes vector,hybrid --k 1,5,10
+    python Scripts/evaluate_retrieval.py --modes hybrid,routed
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+from ai_career_advisor.rag.evaluation import RetrievalEvaluator
+from ai_career_advisor.rag.knowledge_loader import KnowledgeLoader
+
+MODES = {
+    "vector": {"RAG_HYBRID_ENABLED": False},
+    "bm25": {"RAG_FUSION_VECTOR_WEIGHT": 0.0},
+    "hybrid": {},
+    "rerank": {"RAG_RERANK_ENABLED": True},
+    "routed": {"RAG_ROUTING_ENABLED": True}
+}
+
+# What IntentFilterML predicts for the generated query templates
+SOURCE_INTENTS = {
+    "college_detail": "college_query",
+    "entrance_exam": "exam_query",
+    "college": "college_query"
+}
+
+TEMPLATES = {
+    # content starts with "<college> <degree> <branch>: Fees: ..."
+    "college_detail": lambda doc: doc["content"].split(":")[0] + " fees",
+    "entrance_exam": lambda doc: doc["metadata"].get("exam_name", doc["content"]),
+    "college": lambda doc: doc["metadata"]["college_name"]
+}
+
+
+async def generate_queries(path: Path, count: int, seed: int = 42):
+    """Reservoir-sample exact-name queries from the knowledge base sources"""
+    rng = random.Random(seed)
+    per_source = max(1, count // len(TEMPLATES))
+    queries = []
+    for source, template in TEMPLATES.items():
+        sample, seen = [], 0
+        async for batch in KnowledgeLoader.stream_source(source):
+            for doc in batch:
+                seen += 1
+                if len(sample) < per_source:
+                    sample.append(doc)
+                elif (j := rng.randrange(seen)) < per_source:
+                    sample[j] = doc
+        queries += [
+            {"query": template(doc), "relevant_ids": [doc["id"]], "source": source, "intent": SOURCE_INTENTS[source]}
+            for doc in sample
+        ]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(queries, f, ensure_ascii=False, indent=2)
+    logger.info(f"📝 Wrote {len(queries)} labelled queries to {path}")
+
+
+async def main(args):
+    path = Path(args.queries)
+    if args.generate:
+        await generate_queries(path, args.generate)
+    queries = RetrievalEvaluator.load_queries(path)
+    ks = [int(k) for k in args.k.split(",")]
+
+    # Every query should reach the model / index, not the caches
+    settings.RAG_EMBED_CACHE_ENABLED = False
+    from ai_career_advisor.rag.retriever import retriever
+
+    intents = {q["query"]: q.get("intent") or SOURCE_INTENTS.get(q.get("source")) for q in queries}
+    on_intent = []
+
+    async def search_ids(query: str, top_k: int):
+        result = await retriever.search(query, top_k=top_k, intent=intents[query])
+        routed_sources = settings.RAG_ROUTING_SOURCES.get(intents[query])
+        if routed_sources:
+            top = [m.get("source") for m in result["metadatas"][:top_k]]
+            on_intent.append(sum(source in routed_sources for source in top) / top_k)
+        return result["ids"]
+
+    # Routing is only switched on in the routed mode
+    defaults = {key: getattr(settings, key) for overrides in MODES.values() for key in overrides}
+    defaults["RAG_ROUTING_ENABLED"] = False
+    results = []
+    for mode in args.modes.split(","):
+        for key, value in {**defaults, **MODES[mode]}.items():
+            setattr(settings, key, value)
+        on_intent.clear()
+        routes_before = retriever.get_routing_stats()
+        row = await RetrievalEvaluator.evaluate(search_ids, queries, ks)
+        routes = retriever.get_routing_stats()
+        routed = routes["routed"] + routes["fallback"] - routes_before["routed"] - routes_before["fallback"]
+        row["on_intent"] = sum(on_intent) / len(on_intent) if on_intent else 0.0
+        row["fallback"] = (routes["fallback"] - routes_before["fallback"]) / routed if routed else 0.0
+        results.append((mode, row))
+
+    logger.info("=" * 60)
+    logger.info(f"{len(queries)} queries from {path.name}, on-intent@{max(ks)}")
+    for mode, row in results:
+        recalls = " | ".join(f"R@{k} {row[f'recall@{k}']:.3f}" for k in ks)
+        logger.info(
+            f"{mode:>7} | {recalls} | P@{max(ks)} {row[f'precision@{max(ks)}']:.3f} | MRR {row['mrr']:.3f} | "
+            f"on-intent {row['on_intent']:.3f} | fallback {row['fallback']:.1%} | "
+            f"p50 {row['latency_p50_ms']:.1f} ms | p95 {row['latency_p95_ms']:.1f} ms | {len(row['misses'])} misses"
+        )
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", default=str(backend_dir / "data" / "rag_eval_queries.json"))
+    parser.add_argument("--generate", type=int, default=0, help="Sample N labelled queries from the database first")
+    parser.add_argument("--modes", default="vector,bm25,hybrid,rerank")
+    parser.add_argument("--k", default="1,5,10")
+    asyncio.run(main(parser.parse_args()))
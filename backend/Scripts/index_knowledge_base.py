@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -5,67 +6,35 @@ from pathlib import Path
 backend_dir = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(backend_dir / "src"))
 
-from ai_career_advisor.RAG.knowledge_loader import KnowledgeLoader
-from ai_career_advisor.RAG.embeddings import EmbeddingService
-from ai_career_advisor.RAG.vector_store import VectorStore
+from ai_career_advisor.rag.indexer import knowledge_indexer
+from ai_career_advisor.rag.embeddings import EmbeddingService
 from ai_career_advisor.core.logger import logger
 
-async def index_knowledge_base():
-    """Index all knowledge base into ChromaDB"""
+async def index_knowledge_base(full_rebuild: bool = False):
+    """
+    Sync the knowledge base into ChromaDB
+    
+    Only new/changed documents are embedded; --full rebuilds into a shadow
+    collection and swaps it in once complete (the live one keeps serving)
+    """
     
     logger.info("=" * 60)
     logger.info("🚀 KNOWLEDGE BASE INDEXING STARTED")
+    logger.info(f"   Mode: {'full rebuild (shadow swap)' if full_rebuild else 'incremental'}")
     logger.info("=" * 60)
     
-    logger.info("\n Step 1: Loading documents from database...")
-    documents = await KnowledgeLoader.load_all()
+    logger.info("\n Step 1-3: Loading documents, embedding changes, storing in ChromaDB...")
+    try:
+        stats = await knowledge_indexer.sync(full_rebuild=full_rebuild)
+    finally:
+        EmbeddingService.stop_pool()
     
-    if not documents:
+    if not stats["documents"]:
         logger.error(" No documents found to index!")
         return
     
-    logger.success(f" Loaded {len(documents)} documents\n")
-    
-    
-    logger.info(" Step 2: Generating embeddings...")
-    logger.info(" This may take 5-15 minutes depending on data size...")
-    logger.info(" Tip: Go grab a coffee! \n")
-    
-    texts = [doc["content"] for doc in documents]
-    embeddings = await EmbeddingService.generate_batch_embeddings(texts)
-    
-    valid_count = len([e for e in embeddings if e is not None])
-    logger.success(f" Generated {valid_count}/{len(texts)} embeddings\n")
-    
-
-    logger.info(" Step 3: Storing in ChromaDB...")
-    
-    vs = VectorStore()
-    
-    
-    try:
-        vs.delete_collection("career_knowledge")
-        logger.info("  Deleted old index (if existed)")
-    except:
-        logger.info("  No old index found (first run)")
-    
-    # Create fresh collection
-    collection = vs.get_or_create_collection("career_knowledge")
-    
-    # Prepare data
-    ids = [doc["id"] for doc in documents]
-    metadatas = [doc["metadata"] for doc in documents]
-    
-    # Add to collection
-    vs.add_documents(
-        collection=collection,
-        documents=texts,
-        embeddings=embeddings,
-        metadatas=metadatas,
-        ids=ids
-    )
-    
-    logger.success(f" Stored {valid_count} documents in ChromaDB\n")
+    vs = knowledge_indexer.vector_store
+    collection = vs.get_or_create_collection(knowledge_indexer.active_collection())
     
     # Step 4: Test search
     logger.info(" Step 4: Testing semantic search...\n")
@@ -90,16 +59,20 @@ async def index_knowledge_base():
     logger.success(" KNOWLEDGE BASE INDEXING COMPLETE!")
     logger.info("=" * 60)
     logger.info(f"\n Summary:")
-    logger.info(f"   Total documents loaded: {len(documents)}")
-    logger.info(f"   Embeddings generated: {valid_count}")
+    logger.info(f"   Total documents loaded: {stats['documents']}")
+    logger.info(f"   Embeddings generated: {stats['embedded']} (unchanged: {stats['unchanged']}, failed: {stats['failed']})")
+    logger.info(f"   Documents deleted: {stats['deleted']}")
     logger.info(f"   Storage location: {vs.persist_directory}")
-    logger.info(f"   Collection name: career_knowledge")
+    logger.info(f"   Collection: {stats['collection']} (alias: career_knowledge)")
     logger.info(f"\n Your chatbot knowledge base is ready!")
     logger.info("=" * 60)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Index the RAG knowledge base")
+    parser.add_argument("--full", action="store_true", help="Rebuild into a shadow collection and swap atomically")
+    args = parser.parse_args()
     try:
-        asyncio.run(index_knowledge_base())
+        asyncio.run(index_knowledge_base(full_rebuild=args.full))
     except KeyboardInterrupt:
         logger.warning("\n  Indexing interrupted by user")
     except Exception as e:
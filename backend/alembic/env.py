@@ -21,6 +21,7 @@ from ai_career_advisor.models.career_attributes import CareerAttributes
 from ai_career_advisor.models.career_template import CareerTemplate
 from ai_career_advisor.models.career_insight import CareerInsight
 from ai_career_advisor.models.user_career_interaction import UserCareerInteraction
+from ai_career_advisor.models.user_recommendation import UserRecommendation
 
 # Roadmap models
 from ai_career_advisor.models.roadmap import Roadmap
@@ -0,0 +1,39 @@
+"""add user_recommendations table
+
+Revision ID: a7c3e9f1b2d4
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f1b2d4'
+down_revision: Union[str, Sequence[str], None] = 'f1a2b3c4d5e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_recommendations',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('user_email', sa.String(length=255), nullable=False),
+    sa.Column('recommendations', sa.JSON(), nullable=True),
+    sa.Column('top_k', sa.Integer(), nullable=False),
+    sa.Column('preferences_hash', sa.String(length=64), nullable=False),
+    sa.Column('career_signature', sa.String(length=100), nullable=True),
+    sa.Column('generated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_user_recommendations_user_email'), 'user_recommendations', ['user_email'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_user_recommendations_user_email'), table_name='user_recommendations')
+    op.drop_table('user_recommendations')
@@ -0,0 +1,28 @@
+"""add interactions_key to user_recommendations
+
+Revision ID: b8d4f0a2c6e1
+Revises: a7c3e9f1b2d4
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d4f0a2c6e1'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e9f1b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user_recommendations', sa.Column('interactions_key', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user_recommendations', 'interactions_key')
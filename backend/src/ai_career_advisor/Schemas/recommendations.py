@@ -3,7 +3,7 @@ Recommendation System Pydantic Schemas
 Request/Response models for recommendation API endpoints
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Dict
 from datetime import datetime
 
 
@@ -77,6 +77,20 @@ class RecommendationsResponse(BaseModel):
     recommendation_method: str
 
 
+class BatchRecommendationsRequest(BaseModel):
+    """Request body for scoring a whole cohort (school, counselling camp)"""
+    user_emails: List[str] = Field(..., min_length=1, max_length=5000, description="Users to score")
+    top_k: int = Field(5, ge=1, le=10, description="Recommendations per user")
+    persist: bool = Field(True, description="Also write to user_recommendations for the online endpoint")
+
+
+class BatchRecommendationsResponse(BaseModel):
+    """Response for batch recommendations"""
+    results: Dict[str, List[CareerRecommendation]]
+    total_users: int
+    generated_at: datetime
+
+
 class SimilarCareersResponse(BaseModel):
     """Response for similar careers"""
     target_career: str
@@ -2,7 +2,7 @@
 Career Counselor Agent using LangGraph
 Stateful, multi-turn conversation agent with tool calling
 """
-from typing import TypedDict, List, Dict, Any, Annotated
+from typing import TypedDict, List, Dict, Any, Annotated, AsyncIterator
 from langgraph.graph import StateGraph, END, START
 from langgraph.prebuilt import ToolNode
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
@@ -73,7 +73,7 @@ class CareerAgent:
             from ai_career_advisor.services.intentfilter import IntentFilter
             
             last_message = state["messages"][-1].content
-            intent_result = IntentFilter.is_career_related(last_message)
+            intent_result = await IntentFilter.is_career_related_async(last_message)
             
             # Determine intent
             if intent_result.get("is_greeting"):
@@ -198,8 +198,8 @@ Please ask a career or education-related question! 😊"""
                         }
             
             # For general career queries, try RAG first
-            from ai_career_advisor.RAG.retriever import retriever
-            rag_result = await retriever.search_and_build_context(user_query, top_k=5)
+            from ai_career_advisor.rag.retriever import retriever
+            rag_result = await retriever.search_and_build_context(user_query, top_k=5, intent=intent)
             
             if rag_result["found"]:
                 tool_outputs["rag"] = {
@@ -217,8 +217,8 @@ Please ask a career or education-related question! 😊"""
         state["tool_outputs"] = tool_outputs
         return state
     
-    async def synthesis_node(self, state: AgentState) -> AgentState:
-        """Synthesize final response using LLM"""
+    def _build_synthesis_prompt(self, state: AgentState) -> str:
+        """Build the full LLM prompt from tool outputs and the user query"""
         user_query = state["messages"][-1].content
         tool_outputs = state.get("tool_outputs", {})
         language = state["language"]
@@ -260,40 +260,54 @@ Please ask a career or education-related question! 😊"""
           * Career Roadmap: [Career Roadmap](/roadmap/backward)
           * Stream Finder: [Stream Finder](/stream-finder)"""
 
+        # Combine system and user prompt for ModelManager
+        return f"{system_prompt}\n\nUser Query: {user_query}"
+    
+    def _format_citations(self, citations: List[str], state: AgentState) -> str:
+        """Format citations as a markdown References block (empty if none)"""
+        # Deduplicate and clean
+        clean_sources = list(set([s for s in citations or [] if s and s.startswith("http")]))
+        
+        if not clean_sources:
+            return ""
+        
+        source_text = "\n\n**References:**\n"
+        for i, source in enumerate(clean_sources[:5], 1):
+            try:
+                from urllib.parse import urlparse
+                parsed = urlparse(source)
+                domain = parsed.netloc.replace("www.", "")
+                source_text += f"{i}. [{domain}]({source})\n"
+            except:
+                source_text += f"{i}. [{source}]({source})\n"
+        
+        # Store in tool_outputs for frontend/logging
+        if "extra_sources" not in state["tool_outputs"]:
+            state["tool_outputs"]["extra_sources"] = clean_sources
+        
+        return source_text
+    
+    async def synthesis_node(self, state: AgentState) -> AgentState:
+        """Synthesize final response using LLM"""
+        user_query = state["messages"][-1].content
+        
         try:
-            # Combine system and user prompt for ModelManager
-            full_prompt = f"{system_prompt}\n\nUser Query: {user_query}"
+            full_prompt = self._build_synthesis_prompt(state)
             
             # Use ModelManager with preference
             model_pref = state.get("model_preference", "auto")
             
             # Use generate_extended to get citations
-            result = await ModelManager.generate_extended(full_prompt, preference=model_pref)
-            
-            response_text = result["content"]
-            citations = result.get("citations", [])
+            # Near-duplicate questions over the same retrieved context share a cached answer
+            result = await ModelManager.generate_extended(
+                full_prompt,
+                preference=model_pref,
+                cache_ttl=3600,
+                semantic_key=user_query
+            )
             
             # Format and append citations if present
-            if citations:
-                # Deduplicate and clean
-                clean_sources = list(set([s for s in citations if s and s.startswith("http")]))
-                
-                if clean_sources:
-                    source_text = "\n\n**References:**\n"
-                    for i, source in enumerate(clean_sources[:5], 1):
-                        try:
-                            from urllib.parse import urlparse
-                            parsed = urlparse(source)
-                            domain = parsed.netloc.replace("www.", "")
-                            source_text += f"{i}. [{domain}]({source})\n"
-                        except:
-                            source_text += f"{i}. [{source}]({source})\n"
-                    
-                    response_text += source_text
-                    
-                    # Store in tool_outputs for frontend/logging
-                    if "extra_sources" not in state["tool_outputs"]:
-                        state["tool_outputs"]["extra_sources"] = clean_sources
+            response_text = result["content"] + self._format_citations(result.get("citations", []), state)
             
             state["messages"].append(AIMessage(content=response_text))
             
@@ -323,9 +337,8 @@ Please ask a career or education-related question! 😊"""
         
         return None
     
-    async def run(self, query: str, user_email: str, session_id: str, language: str = "en", model_preference: str = "auto") -> Dict[str, Any]:
-        """Run the agent graph"""
-        initial_state = {
+    def _initial_state(self, query: str, user_email: str, session_id: str, language: str, model_preference: str) -> AgentState:
+        return {
             "messages": [HumanMessage(content=query)],
             "user_email": user_email,
             "session_id": session_id,
@@ -335,6 +348,10 @@ Please ask a career or education-related question! 😊"""
             "tool_outputs": {},
             "db": self.db
         }
+    
+    async def run(self, query: str, user_email: str, session_id: str, language: str = "en", model_preference: str = "auto") -> Dict[str, Any]:
+        """Run the agent graph"""
+        initial_state = self._initial_state(query, user_email, session_id, language, model_preference)
         
         try:
             final_state = await self.graph.ainvoke(initial_state)
@@ -356,3 +373,57 @@ Please ask a career or education-related question! 😊"""
                 "response": "I apologize, but I encountered an error. Please try again.",
                 "error": str(e)
             }
+    
+    async def stream(
+        self,
+        query: str,
+        user_email: str,
+        session_id: str,
+        language: str = "en",
+        model_preference: str = "auto"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Same path as the graph (intent -> greeting/rejection or tools -> synthesis)
+        but streams the synthesis tokens as they arrive
+        
+        Yields {"type": "token", "text": str} events, then one
+        {"type": "result", "response": str, "references": str, "intent": str, "tool_outputs": dict}
+        where `response` is the streamed text and `references` the citations block
+        """
+        state = self._initial_state(query, user_email, session_id, language, model_preference)
+        state = await self.intent_node(state)
+        route = self.router(state)
+        
+        if route in ("greeting", "rejected"):
+            node = self.greeting_node if route == "greeting" else self.rejection_node
+            state = await node(state)
+            text = state["messages"][-1].content
+            yield {"type": "token", "text": text}
+            yield {"type": "result", "response": text, "references": "", "intent": state["intent"], "tool_outputs": {}}
+            return
+        
+        state = await self.tool_selection_node(state)
+        
+        # Tools only read from the DB; give the pooled connection back before the long LLM stream
+        if self.db is not None:
+            await self.db.close()
+        
+        result = None
+        async for event in ModelManager.stream_generate(
+            self._build_synthesis_prompt(state),
+            preference=state.get("model_preference", "auto"),
+            cache_ttl=3600,
+            semantic_key=query
+        ):
+            if event["type"] == "token":
+                yield event
+            else:
+                result = event
+        
+        yield {
+            "type": "result",
+            "response": result["content"],
+            "references": self._format_citations(result.get("citations", []), state),
+            "intent": state["intent"],
+            "tool_outputs": state.get("tool_outputs", {})
+        }
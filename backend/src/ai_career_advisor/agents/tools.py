@@ -110,7 +110,7 @@ async def search_web_tool(query: str) -> Dict[str, Any]:
     """
     try:
         from ai_career_advisor.core.config import settings
-        import httpx
+        from ai_career_advisor.core.http_client import http_clients
         
         PERPLEXITY_API_KEY = settings.PERPLEXITY_API_KEY
         
@@ -130,38 +130,39 @@ INSTRUCTIONS:
 - Keep response under 250 words
 - Be factual and cite official sources"""
 
-        async with httpx.AsyncClient(timeout=45.0) as client:
-            response = await client.post(
-                "https://api.perplexity.ai/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "sonar",
-                    "messages": [
-                        {"role": "system", "content": "You are an expert Indian education and career counselor."},
-                        {"role": "user", "content": prompt}
-                    ]
-                }
-            )
+        client = http_clients.get("perplexity")
+        response = await client.post(
+            "https://api.perplexity.ai/chat/completions",
+            timeout=45.0,
+            headers={
+                "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "sonar",
+                "messages": [
+                    {"role": "system", "content": "You are an expert Indian education and career counselor."},
+                    {"role": "user", "content": prompt}
+                ]
+            }
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            answer = data["choices"][0]["message"]["content"].strip()
+            citations = data.get("citations", [])
+            
+            return {
+                "success": True,
+                "answer": answer,
+                "sources": citations[:5] if citations else ["Web Search"]
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"API error: {response.status_code}"
+            }
             
-            if response.status_code == 200:
-                data = response.json()
-                answer = data["choices"][0]["message"]["content"].strip()
-                citations = data.get("citations", [])
-                
-                return {
-                    "success": True,
-                    "answer": answer,
-                    "sources": citations[:5] if citations else ["Web Search"]
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"API error: {response.status_code}"
-                }
-                
     except Exception as e:
         logger.error(f"Web search tool error: {e}")
         return {
@@ -182,7 +183,7 @@ async def search_rag_tool(query: str) -> Dict[str, Any]:
         Dictionary with context and sources
     """
     try:
-        from ai_career_advisor.RAG.retriever import retriever
+        from ai_career_advisor.rag.retriever import retriever
         
         result = await retriever.search_and_build_context(query, top_k=5)
         
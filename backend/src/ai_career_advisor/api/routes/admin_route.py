@@ -1,21 +1,93 @@
 from fastapi import APIRouter
 from ai_career_advisor.services.scheduler import scheduler
+from ai_career_advisor.core.http_client import http_clients
+from ai_career_advisor.core.response_cache import response_cache
+from ai_career_advisor.core.model_manager import ModelManager
+from ai_career_advisor.core.hedging import hedged_generator
+from ai_career_advisor.services.career_matrix import career_matrix_engine
+from ai_career_advisor.services.career_ann import career_ann
+from ai_career_advisor.services.collaborative_model import collaborative_model
+from ai_career_advisor.services.profile_embedding import profile_embeddings
+from ai_career_advisor.services.write_behind import write_behind
+from ai_career_advisor.rag.indexer import knowledge_indexer
+from ai_career_advisor.rag.compaction import knowledge_compactor
+from ai_career_advisor.rag.embedding_cache import embedding_cache
+from ai_career_advisor.rag.embeddings import EmbeddingService
+from ai_career_advisor.rag.context_builder import context_builder
 from ai_career_advisor.core.logger import logger
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
 @router.post("/reindex-knowledge-base")
-async def trigger_reindex():
-    logger.info("Manual re-index triggered by admin")
-    scheduler.trigger_manual_reindex()
+async def trigger_reindex(full_rebuild: bool = False):
+    """Incremental sync by default; full_rebuild=true rebuilds into a shadow collection and swaps"""
+    logger.info(f"Manual re-index triggered by admin (full_rebuild={full_rebuild})")
+    scheduler.trigger_manual_reindex(full_rebuild=full_rebuild)
     
     return {
         "message": "Re-indexing started in background",
+        "mode": "full_rebuild" if full_rebuild else "incremental",
         "status": "processing"
     }
 
 
+@router.post("/compact-knowledge-base")
+async def trigger_compaction(dry_run: bool = False):
+    """Evict expired / near-duplicate / over-cap llm_generated documents; dry_run=true only reports"""
+    logger.info(f"Manual knowledge compaction triggered by admin (dry_run={dry_run})")
+    scheduler.trigger_manual_compaction(dry_run=dry_run)
+    
+    return {
+        "message": "Compaction started in background",
+        "mode": "dry_run" if dry_run else "evict",
+        "status": "processing"
+    }
+
+
+@router.get("/knowledge-compaction-stats")
+async def get_knowledge_compaction_stats():
+    """Last compaction run: evictions by reason, collection size and search latency before/after"""
+    return knowledge_compactor.get_stats()
+
+
+@router.get("/embedding-cache-stats")
+async def get_embedding_cache_stats():
+    """Local embedding cache hit ratio (memory LRU + SQLite) for this worker"""
+    return embedding_cache.get_metrics()
+
+
+@router.get("/query-embedding-batching-stats")
+async def get_query_embedding_batching_stats():
+    """How well concurrent RAG query embeddings are being coalesced (null until first use)"""
+    return {"batching": EmbeddingService.get_query_batching_stats()}
+
+
+@router.get("/rag-context-stats")
+async def get_rag_context_stats():
+    """Prompt tokens used / saved by the MMR context builder vs the legacy 2000-char builder"""
+    return context_builder.get_metrics()
+
+
+@router.get("/rag-routing-stats")
+async def get_rag_routing_stats():
+    """Intent-routed vs global RAG searches, and how often routing fell back to global"""
+    from ai_career_advisor.rag.retriever import retriever
+    return retriever.get_routing_stats()
+
+
+@router.get("/write-behind-stats")
+async def get_write_behind_stats():
+    """Chatbot write-behind queue depth, flush latency and dropped writes for this worker"""
+    return write_behind.get_metrics()
+
+
+@router.get("/knowledge-index-stats")
+async def get_knowledge_index_stats():
+    """Active collection, manifest size and last sync of the RAG knowledge index"""
+    return knowledge_indexer.get_stats()
+
+
 @router.get("/scheduler-status")
 async def get_scheduler_status():
     job = scheduler.scheduler.get_job('weekly_reindex')
@@ -30,3 +102,70 @@ async def get_scheduler_status():
         return {
             "status": "not_running"
         }
+
+
+@router.get("/http-pool-stats")
+async def get_http_pool_stats():
+    """Outbound connection pool usage for this worker (multiply by gunicorn workers for totals)"""
+    return http_clients.get_metrics()
+
+
+@router.get("/llm-cache-stats")
+async def get_llm_cache_stats():
+    """LLM response cache hit ratio and latency saved for this worker"""
+    return response_cache.get_metrics()
+
+
+@router.post("/llm-cache/clear")
+async def clear_llm_cache():
+    logger.info("LLM response cache cleared by admin")
+    response_cache.clear()
+    
+    return {
+        "message": "LLM response cache cleared",
+        "status": "ok"
+    }
+
+
+@router.get("/llm-scheduler-status")
+async def get_llm_scheduler_status():
+    """Token buckets, cooldowns and EWMA health of every Gemini key/model pair"""
+    return await ModelManager.get_scheduler().get_status()
+
+
+@router.get("/llm-hedging-stats")
+async def get_llm_hedging_stats():
+    """Per-provider win rates and end-to-end tail latency of hedged generation"""
+    return hedged_generator.get_metrics()
+
+
+@router.get("/recommendation-engine-stats")
+async def get_recommendation_engine_stats():
+    """Size and freshness of the in-memory career scoring matrix"""
+    return career_matrix_engine.get_stats()
+
+
+@router.get("/career-ann-stats")
+async def get_career_ann_stats():
+    """Size, list count and last incremental sync of the career ANN indexes"""
+    return career_ann.get_stats()
+
+
+@router.get("/profile-embedding-stats")
+async def get_profile_embedding_stats():
+    """Stored profile vector reuse vs recomputation"""
+    return profile_embeddings.get_stats()
+
+
+@router.get("/collaborative-model-stats")
+async def get_collaborative_model_stats():
+    """Size and age of the item-item collaborative filtering model"""
+    return collaborative_model.get_stats()
+
+
+@router.post("/collaborative-model/refresh")
+async def refresh_collaborative_model():
+    """Rebuild the item-item model now instead of waiting for the scheduler"""
+    model = await collaborative_model.refresh()
+    logger.info("Collaborative model refreshed by admin")
+    return model.get_stats()
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from ai_career_advisor.Schemas.chatbot import (
     IntentCheckRequest,
@@ -16,6 +17,7 @@ from ai_career_advisor.core.database import get_db
 from ai_career_advisor.core.security import get_current_user
 from ai_career_advisor.core.logger import logger
 from sqlalchemy import select
+import json
 
 router = APIRouter(prefix="/chatbot", tags=["Chatbot"])
 
@@ -25,7 +27,7 @@ async def check_intent(request: IntentCheckRequest):
     try:
         logger.info(f"Checking intent for: {request.query}")
         
-        result = IntentFilter.is_career_related(request.query)
+        result = await IntentFilter.is_career_related_async(request.query)
         
         return {
             "query": request.query,
@@ -72,6 +74,36 @@ async def ask_chatbot(
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
+@router.post("/ask/stream")
+async def ask_chatbot_stream(
+    request: ChatbotAskRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Streaming variant of /ask (Server-Sent Events)
+    Events: start, token (many), sources, done - or error
+    """
+    logger.info(f"Chatbot stream from user {current_user.email}: {request.query}")
+    
+    async def event_stream():
+        async for event in ChatbotService.ask_stream(
+            query=request.query,
+            session_id=request.sessionid,
+            user_email=current_user.email,
+            model_preference=request.model
+        ):
+            yield f"event: {event['event']}\ndata: {json.dumps(event['data'], ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Don't let nginx buffer the stream
+        }
+    )
+
+
 @router.get("/history/{sessionid}")
 async def get_conversation_history(
     sessionid: str,
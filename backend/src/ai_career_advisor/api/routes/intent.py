@@ -5,6 +5,7 @@ This endpoint allows you to test the intent classifier directly.
 Useful for debugging and demo during interviews.
 """
 
+import asyncio
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
@@ -68,7 +69,7 @@ async def classify_intent(request: IntentRequest):
          -d '{"query": "best colleges for computer science"}'
     """
     try:
-        result = IntentFilterML.is_career_related(request.query)
+        result = await IntentFilterML.is_career_related_async(request.query)
         
         return IntentResponse(
             query=request.query,
@@ -115,17 +116,22 @@ async def classify_batch(request: BatchIntentRequest):
     Classify multiple queries at once
     
     Useful for evaluating model performance on a test set.
+    Queries are classified concurrently, so the micro-batcher groups them
+    into a few forward passes instead of one pass per query.
     """
     try:
-        results = []
-        for query in request.queries:
-            result = IntentFilterML.is_career_related(query)
-            results.append({
+        classified = await asyncio.gather(
+            *(IntentFilterML.is_career_related_async(query) for query in request.queries)
+        )
+        results = [
+            {
                 "query": query,
                 "intent": result.get("intent"),
                 "confidence": result.get("confidence"),
                 "method": result.get("method")
-            })
+            }
+            for query, result in zip(request.queries, classified)
+        ]
         
         return {"results": results, "count": len(results)}
     
@@ -165,14 +171,16 @@ async def intent_classifier_health():
     """
     try:
         # Test with a sample query
-        result = IntentFilterML.is_career_related("test query")
+        result = await IntentFilterML.is_career_related_async("test query")
         
         return {
             "status": "healthy",
             "ml_model_active": result.get("method") == "ml",
             "fallback_active": result.get("method") in ["keyword", "default"],
             "test_query": "test query",
-            "test_result": result
+            "test_result": result,
+            "batching": IntentFilterML.get_batching_stats(),
+            "cache": IntentFilterML.get_cache_stats()
         }
     except Exception as e:
         return {
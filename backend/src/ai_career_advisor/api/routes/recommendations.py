@@ -12,13 +12,16 @@ from ai_career_advisor.Schemas.recommendations import (
     UserPreferencesResponse,
     RecommendationsResponse,
     CareerRecommendation,
+    BatchRecommendationsRequest,
+    BatchRecommendationsResponse,
     SimilarCareersResponse,
     InteractionTrackRequest,
     InteractionResponse,
     RecommendationFeedbackRequest,
     FeedbackResponse
 )
-from typing import Optional
+from typing import Optional, Dict, Any
+from datetime import datetime, timezone
 
 
 router = APIRouter(prefix="/recommendations", tags=["Recommendations"])
@@ -68,6 +71,23 @@ async def submit_quiz(
 
 # ================== RECOMMENDATION ENDPOINTS ==================
 
+def _to_career_recommendation(r: Dict[str, Any]) -> CareerRecommendation:
+    career = r["career"]
+    return CareerRecommendation(
+        career_name=career["career_name"],
+        career_category=career.get("career_category"),
+        short_description=career.get("short_description"),
+        match_score=r["match_score"],
+        content_score=r.get("content_score"),
+        recommendation_type=r["recommendation_type"],
+        required_skills=career.get("required_skills", []),
+        salary_range=career.get("salary_range"),
+        min_education=career.get("min_education"),
+        difficulty_level=career.get("difficulty_level", 3),
+        work_style=career.get("work_style")
+    )
+
+
 @router.get("/careers", response_model=RecommendationsResponse)
 async def get_career_recommendations(
     user_email: str,  # In production, get from auth token
@@ -94,22 +114,7 @@ async def get_career_recommendations(
             top_k=top_k
         )
         
-        recommendations = []
-        for r in results:
-            career = r["career"]
-            recommendations.append(CareerRecommendation(
-                career_name=career["career_name"],
-                career_category=career.get("career_category"),
-                short_description=career.get("short_description"),
-                match_score=r["match_score"],
-                content_score=r.get("content_score"),
-                recommendation_type=r["recommendation_type"],
-                required_skills=career.get("required_skills", []),
-                salary_range=career.get("salary_range"),
-                min_education=career.get("min_education"),
-                difficulty_level=career.get("difficulty_level", 3),
-                work_style=career.get("work_style")
-            ))
+        recommendations = [_to_career_recommendation(r) for r in results]
         
         # Determine method used
         method = "popularity" if not results else results[0].get("recommendation_type", "unknown")
@@ -126,6 +131,41 @@ async def get_career_recommendations(
         raise HTTPException(status_code=500, detail=f"Error getting recommendations: {str(e)}")
 
 
+@router.post("/batch", response_model=BatchRecommendationsResponse)
+async def get_batch_recommendations(
+    request: BatchRecommendationsRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Score a whole cohort at once (matrix-matrix products instead of one request per user).
+    
+    With persist=true the results are materialized, so later
+    /recommendations/careers calls for these users are served from the table.
+    """
+    try:
+        logger.info(f"🎯 Batch recommendations for {len(request.user_emails)} users")
+        
+        results = await RecommendationService.get_batch_recommendations(
+            db=db,
+            user_emails=request.user_emails,
+            top_k=request.top_k,
+            persist=request.persist
+        )
+        
+        return BatchRecommendationsResponse(
+            results={
+                email: [_to_career_recommendation(r) for r in recommendations]
+                for email, recommendations in results.items()
+            },
+            total_users=len(results),
+            generated_at=datetime.now(timezone.utc)
+        )
+        
+    except Exception as e:
+        logger.error(f"Batch recommendation error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error getting batch recommendations: {str(e)}")
+
+
 @router.get("/similar/{career_name}", response_model=SimilarCareersResponse)
 async def get_similar_careers(
     career_name: str,
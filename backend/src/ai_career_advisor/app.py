@@ -3,6 +3,7 @@ from ai_career_advisor.core.logger import logger
 from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.middleware import add_middlewares
 from ai_career_advisor.services.scheduler import scheduler
+from ai_career_advisor.core.http_client import http_clients
 from contextlib import asynccontextmanager
 import ai_career_advisor.models
 
@@ -18,6 +19,7 @@ async def lifespan(app: FastAPI):
     logger.info("Application shutting down...")
     scheduler.stop()
     logger.info("Scheduler stopped")
+    await http_clients.aclose()
 
 
 def create_app() -> FastAPI:
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 import os
 
@@ -25,6 +25,134 @@ class Settings(BaseSettings):
     GEMINI_API_KEY_3: Optional[str] = None  # Another alternative
     PERPLEXITY_API_KEY: Optional[str] = None
 
+    # Outbound HTTP connection pool (per upstream host, per gunicorn worker)
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2_ENABLED: bool = True
+    HTTP_CONNECT_RETRIES: int = 1  # TCP/TLS connect retries only, a request that reached the upstream is never resent
+
+    # LLM response cache (exact + semantic tiers, per worker process)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 1000
+    LLM_CACHE_TTL_SECONDS: float = 6 * 3600
+    LLM_CACHE_SIMILARITY_THRESHOLD: float = 0.92
+
+    # Gemini key/model scheduler (token bucket per key+model pair)
+    GEMINI_REQUESTS_PER_MINUTE: float = 10
+    GEMINI_BURST: float = 3
+    LLM_SCHEDULER_MAX_WAIT: float = 10.0  # keep >= 60 / GEMINI_REQUESTS_PER_MINUTE (one token refill)
+    LLM_SCHEDULER_DEFAULT_COOLDOWN: float = 60.0
+    LLM_SCHEDULER_FAILURE_THRESHOLD: int = 3
+    LLM_SCHEDULER_FAILURE_COOLDOWN: float = 30.0
+    LLM_SCHEDULER_EWMA_ALPHA: float = 0.3
+
+    # Hedged generation across the Flash -> Flash-Lite -> Sonar-Pro chain
+    LLM_HEDGING_MODE: str = "hedged"  # sequential | hedged | race
+    LLM_HEDGE_PERCENTILE: float = 95.0
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_HEDGE_DEFAULT_DELAY: float = 6.0
+    LLM_HEDGE_MIN_DELAY: float = 1.0
+    LLM_HEDGE_MAX_DELAY: float = 15.0
+
+    # Intent classifier micro-batching (flush at B items or N ms, whichever first)
+    INTENT_BATCH_MAX_SIZE: int = 32
+    INTENT_BATCH_MAX_WAIT_MS: float = 5.0
+
+    # Intent classifier backend: ONNX Runtime export (INT8) or PyTorch
+    INTENT_MODEL_BACKEND: str = "auto"  # auto | onnx | torch
+    INTENT_ONNX_QUANTIZED: bool = True
+    INTENT_CACHE_MAX_ENTRIES: int = 4096  # normalized query -> prediction LRU, 0 disables
+
+    # Item-item collaborative filtering model (rebuilt by the scheduler)
+    COLLAB_MODEL_REFRESH_MINUTES: int = 30
+    COLLAB_MODEL_NEIGHBORS: int = 50
+    COLLAB_MODEL_SHRINKAGE: float = 0.5
+
+    # Embedding space shared by career semantic_vector and user profile vectors
+    RECOMMENDATION_EMBEDDING_BACKEND: str = "gemini"  # gemini | local (sentence-transformers, offline)
+
+    # Approximate nearest neighbour (IVF) indexes over career vectors
+    ANN_ENABLED: bool = True
+    ANN_MIN_CAREERS: int = 5000  # exact search below this size
+    ANN_N_PROBE: int = 8  # inverted lists scanned per query
+    ANN_CANDIDATE_FACTOR: int = 20  # candidates re-ranked exactly = max(top_k * factor, 100)
+    ANN_ATTRIBUTE_DIM: int = 128  # hashed projection size for skill/interest/personality sets
+    ANN_INDEX_DIR: str = ""  # default: ann_index/ next to the SQLite DB
+
+    # Batch scoring + user_recommendations materialized table
+    RECOMMENDATION_BATCH_CHUNK: int = 256  # users per (users x careers) matrix product
+    RECOMMENDATION_PRECOMPUTE_TTL_MINUTES: int = 1440  # older rows fall back to live scoring
+
+    # Vector store backend: chroma (PersistentClient per worker) | mmap (.npy segments shared via the page cache)
+    RAG_VECTOR_BACKEND: str = "chroma"
+    RAG_MMAP_DIR: str = ""  # default: vector_store_mmap/ next to chroma_db
+    RAG_MMAP_MAX_SEGMENTS: int = 8  # a write merges all segments beyond this
+    RAG_MMAP_MAX_DEAD_RATIO: float = 0.25  # ... or when this share of rows is deleted/overwritten
+
+    # Incremental RAG indexing (content-hashed manifest, shadow-collection rebuilds)
+    RAG_INDEX_BATCH_SIZE: int = 256  # documents embedded + upserted per batch
+    RAG_LOADER_BATCH_SIZE: int = 1000  # rows per keyset page when streaming the knowledge base
+    RAG_INDEX_QUEUE_SIZE: int = 4  # batches buffered between load/embed/upsert stages
+
+    # Local (sentence-transformers) batch embedding
+    RAG_EMBED_BATCH_SIZE: int = 64  # texts per model forward pass
+    RAG_EMBED_CHUNK_SIZE: int = 1024  # texts per retry / progress unit
+    RAG_EMBED_WORKERS: int = 0  # encode processes, 0 = one per CPU core, 1 = in-process only
+    RAG_EMBED_MAX_RETRIES: int = 2  # per chunk
+    RAG_EMBED_CACHE_ENABLED: bool = True  # content-hash -> vector cache (SQLite + in-process LRU)
+    RAG_EMBED_CACHE_PATH: str = ""  # default: chroma_db/embedding_cache.sqlite
+    RAG_EMBED_CACHE_MEMORY_ENTRIES: int = 10000
+
+    # Concurrent RAG query embeddings coalesced into one encode call (flush at B queries or N ms)
+    RAG_QUERY_BATCH_ENABLED: bool = True
+    RAG_QUERY_BATCH_MAX_SIZE: int = 32
+    RAG_QUERY_BATCH_MAX_WAIT_MS: float = 5.0
+
+    # Hybrid retrieval: BM25 + dense results fused with reciprocal rank fusion
+    RAG_HYBRID_ENABLED: bool = True
+    RAG_HYBRID_CANDIDATES: int = 20  # hits taken from each retriever before fusion
+    RAG_RRF_K: int = 60
+    RAG_FUSION_VECTOR_WEIGHT: float = 1.0
+    RAG_FUSION_BM25_WEIGHT: float = 1.0
+    RAG_CONTEXT_MIN_SCORE: float = 0.3  # build_context drops hits below this score
+    RAG_RERANK_ENABLED: bool = False  # cross-encoder rerank of the fused candidates
+    RAG_RERANK_MODEL: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    RAG_RERANK_TOP_N: int = 20
+
+    # Context assembly: near-duplicate removal + MMR under a per-model token budget
+    RAG_CONTEXT_MMR_LAMBDA: float = 0.7  # 1.0 = pure relevance, lower = more diverse
+    RAG_CONTEXT_DEDUP_SIMILARITY: float = 0.92  # embedding cosine at/above this = duplicate
+    RAG_CONTEXT_TOKEN_BUDGETS: Dict[str, int] = {"perplexity": 600, "gemini": 600, "default": 500}
+    RAG_CONTEXT_TOKENIZERS: Dict[str, str] = {}  # model -> tokenizer.json path / HF repo id (else estimated)
+
+    # Intent-routed retrieval: the classifier intent restricts search to matching knowledge sources
+    RAG_ROUTING_ENABLED: bool = True
+    RAG_ROUTING_MIN_HITS: int = 2  # fewer routed hits scoring >= RAG_CONTEXT_MIN_SCORE -> global search
+    # llm_generated (chatbot-learned answers, any topic) stays searchable in every partition
+    RAG_ROUTING_SOURCES: Dict[str, List[str]] = {
+        "college_query": ["college", "college_detail", "branch", "llm_generated"],
+        "exam_query": ["entrance_exam", "llm_generated"],
+        "degree_query": ["degree", "branch", "llm_generated"],
+        "career_query": ["career", "career_template", "career_insight", "llm_generated"],
+        "roadmap_request": ["backward_roadmap", "guided_roadmap", "career", "llm_generated"]
+    }  # intents not listed (recommendation_request, ...) search everything
+
+    # Write-behind for chatbot persistence (conversation rows + RAG self-learning saves)
+    WRITE_BEHIND_ENABLED: bool = True  # False = write inline on the request path
+    WRITE_BEHIND_QUEUE_SIZE: int = 1000  # pending writes before producers are held back
+    WRITE_BEHIND_BATCH_SIZE: int = 50  # writes per flush (one bulk insert / one embedding batch)
+    WRITE_BEHIND_FLUSH_MS: float = 200.0  # max time a write waits for its batch to fill
+    WRITE_BEHIND_ENQUEUE_TIMEOUT: float = 2.0  # seconds a producer waits on a full queue before dropping
+    WRITE_BEHIND_DRAIN_TIMEOUT: float = 10.0  # seconds shutdown waits for pending writes
+
+    # Compaction of chatbot-learned (llm_generated) RAG documents, daily at 3:30 AM IST
+    RAG_COMPACTION_ENABLED: bool = True
+    RAG_COMPACTION_TTL_DAYS: float = 90  # older answers are evicted, 0 = no TTL
+    RAG_COMPACTION_SIMILARITY: float = 0.95  # embedding cosine at/above this = same answer
+    RAG_COMPACTION_MAX_DOCUMENTS: int = 5000  # llm_generated documents kept, 0 = no cap
+    RAG_COMPACTION_PROBE_QUERIES: int = 20  # queries timed before/after compaction
+
     API_PREFIX: str = "/api"
     PROJECT_NAME: str = "AI Career Advisor"
 
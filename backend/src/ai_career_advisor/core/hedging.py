@@ -0,0 +1,188 @@
+"""
+Hedged LLM Generation
+Latency tracking and metrics for the Flash -> Flash-Lite -> Sonar-Pro chain
+
+- Each provider's recent latencies give a p95 hedge deadline
+- If the running provider misses its deadline, the next one is fired in
+  parallel; the first valid answer wins and the losers are cancelled
+- Modes: "sequential" (old behaviour), "hedged", "race" (fire all at once)
+"""
+
+import time
+import asyncio
+from collections import deque
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Deque, Tuple
+import numpy as np
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies for one provider"""
+
+    def __init__(self, window: int = 200):
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float):
+        self.samples.append(latency)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        return float(np.percentile(np.fromiter(self.samples, dtype=np.float64), q))
+
+
+class HedgedGenerator:
+    """
+    Runs a provider chain under a hedging policy and keeps per-provider metrics
+
+    Usage:
+        result = await hedged_generator.run([
+            ("gemini-2.5-flash", lambda: flash(prompt)),
+            ("sonar-pro", lambda: sonar(prompt)),
+        ])
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self.latency: Dict[str, LatencyTracker] = {}
+        self.end_to_end = LatencyTracker(window)
+        self.providers: Dict[str, Dict[str, int]] = {}
+        self.requests = 0
+        self.hedges_fired = 0
+        self.hedge_wins = 0
+
+    def _provider(self, name: str) -> Dict[str, int]:
+        if name not in self.providers:
+            self.providers[name] = {"launched": 0, "wins": 0, "failures": 0, "cancelled": 0}
+            self.latency[name] = LatencyTracker(self.window)
+        return self.providers[name]
+
+    def hedge_delay(self, name: str) -> float:
+        """p95 of the provider's latency, clamped; default until enough samples exist"""
+        self._provider(name)
+        tracker = self.latency[name]
+        if len(tracker.samples) < settings.LLM_HEDGE_MIN_SAMPLES:
+            delay = settings.LLM_HEDGE_DEFAULT_DELAY
+        else:
+            delay = tracker.percentile(settings.LLM_HEDGE_PERCENTILE)
+        return min(max(delay, settings.LLM_HEDGE_MIN_DELAY), settings.LLM_HEDGE_MAX_DELAY)
+
+    @staticmethod
+    def _is_valid(result: Any) -> bool:
+        return isinstance(result, dict) and bool((result.get("content") or "").strip())
+
+    async def run(
+        self,
+        providers: List[Tuple[str, Callable[[], Awaitable[Dict[str, Any]]]]],
+        mode: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Run providers (in priority order) and return the first valid result
+        Raises the last error if every provider fails
+        """
+        mode = (mode or settings.LLM_HEDGING_MODE).lower()
+        self.requests += 1
+        started = time.perf_counter()
+
+        running: Dict[asyncio.Task, Tuple[str, float]] = {}
+        next_index = 0
+        last_error: Optional[BaseException] = None
+
+        def launch():
+            nonlocal next_index
+            name, factory = providers[next_index]
+            next_index += 1
+            self._provider(name)["launched"] += 1
+            task = asyncio.ensure_future(factory())
+            running[task] = (name, time.perf_counter())
+            return name
+
+        try:
+            launch()
+            if mode == "race":
+                while next_index < len(providers):
+                    launch()
+
+            while running:
+                # Deadline of the most recently launched provider decides when to hedge
+                can_hedge = mode == "hedged" and next_index < len(providers)
+                timeout = self.hedge_delay(providers[next_index - 1][0]) if can_hedge else None
+
+                done, _ = await asyncio.wait(
+                    list(running), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    name = launch()
+                    self.hedges_fired += 1
+                    logger.info(f"⏱️ Hedging: primary slow after {timeout:.1f}s, firing {name} in parallel")
+                    continue
+
+                for task in done:
+                    name, task_started = running.pop(task)
+                    error = task.exception()
+                    result = None if error else task.result()
+
+                    if error is None and self._is_valid(result):
+                        self.latency[name].record(time.perf_counter() - task_started)
+                        self.providers[name]["wins"] += 1
+                        if name != providers[0][0]:
+                            self.hedge_wins += 1
+                        self.end_to_end.record(time.perf_counter() - started)
+                        logger.success(f"🏁 {name} answered first")
+                        return result
+
+                    self.providers[name]["failures"] += 1
+                    last_error = error or ValueError(f"{name} returned empty content")
+                    logger.warning(f"{name} failed: {last_error}")
+
+                # Nothing valid yet: move down the chain right away if nothing is left running
+                if not running and next_index < len(providers):
+                    launch()
+
+        finally:
+            for task, (name, _) in running.items():
+                task.cancel()
+                self.providers[name]["cancelled"] += 1
+
+        logger.error(f"All providers failed. Final error: {last_error}")
+        raise Exception(f"All models failed. Last error: {last_error}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Win rates and tail latencies for the admin dashboard"""
+        providers = {}
+        for name, counts in self.providers.items():
+            tracker = self.latency[name]
+            providers[name] = {
+                **counts,
+                "win_rate": round(counts["wins"] / self.requests, 3) if self.requests else 0.0,
+                "p50_latency_s": tracker.percentile(50),
+                "p95_latency_s": tracker.percentile(95),
+                "hedge_delay_s": round(self.hedge_delay(name), 2)
+            }
+
+        e2e_p95 = self.end_to_end.percentile(95)
+        primary = next(iter(self.providers), None)
+        primary_p95 = self.latency[primary].percentile(95) if primary else None
+
+        return {
+            "mode": settings.LLM_HEDGING_MODE,
+            "requests": self.requests,
+            "hedges_fired": self.hedges_fired,
+            "hedge_wins": self.hedge_wins,
+            "end_to_end": {
+                "p50_s": self.end_to_end.percentile(50),
+                "p95_s": e2e_p95,
+                "p99_s": self.end_to_end.percentile(99)
+            },
+            # Primary latencies only include calls it won, so this underestimates the gain
+            "p95_improvement_vs_primary_s": (
+                round(primary_p95 - e2e_p95, 3) if primary_p95 is not None and e2e_p95 is not None else None
+            ),
+            "providers": providers
+        }
+
+
+# Global instance
+hedged_generator = HedgedGenerator()
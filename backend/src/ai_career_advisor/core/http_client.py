@@ -0,0 +1,213 @@
+"""
+Shared HTTP Client Registry
+Long-lived, pooled httpx clients for all outbound API calls (Perplexity, Gemini, Brevo, web)
+"""
+
+import os
+import time
+import inspect
+import httpx
+from typing import Dict, Any
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class PoolStats:
+    """Counters for a single upstream connection pool"""
+
+    # Waits shorter than this are treated as an immediately available connection
+    WAIT_THRESHOLD_MS = 1.0
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self.errors = 0
+        self.waits = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def record(self, opened_connection: bool, wait_ms: float, failed: bool):
+        self.requests += 1
+        if opened_connection:
+            self.new_connections += 1
+        if failed:
+            self.errors += 1
+        if wait_ms >= self.WAIT_THRESHOLD_MS:
+            self.waits += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        reused = self.requests - self.new_connections
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": reused,
+            "reuse_ratio": round(reused / self.requests, 3) if self.requests else 0.0,
+            "pool_waits": self.waits,
+            "avg_wait_ms": round(self.total_wait_ms / self.requests, 2) if self.requests else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 2),
+            "errors": self.errors
+        }
+
+
+class _MeteredTransport(httpx.AsyncHTTPTransport):
+    """
+    AsyncHTTPTransport that records pool usage via httpcore trace events
+    - A "connect_tcp" event means a new connection was opened (no reuse)
+    - Time until the connection is acquired is recorded as pool wait
+    """
+
+    def __init__(self, stats: PoolStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+        self.http2 = kwargs.get("http2", False)
+
+    @property
+    def open_connections(self) -> int:
+        return len(self._pool.connections)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        state = {"opened": False, "acquired": None}
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict):
+            if event_name == "connection.connect_tcp.started":
+                state["opened"] = True
+                if state["acquired"] is None:
+                    state["acquired"] = time.perf_counter()
+            elif event_name.endswith("send_request_headers.started"):
+                if state["acquired"] is None:
+                    state["acquired"] = time.perf_counter()
+
+            if outer_trace is not None:
+                result = outer_trace(event_name, info)
+                if inspect.iscoroutine(result):
+                    await result
+
+        request.extensions["trace"] = trace
+        failed = False
+        try:
+            return await super().handle_async_request(request)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            acquired = state["acquired"] or time.perf_counter()
+            self.stats.record(
+                opened_connection=state["opened"],
+                wait_ms=(acquired - started) * 1000,
+                failed=failed
+            )
+
+
+class HTTPClientRegistry:
+    """
+    One pooled httpx.AsyncClient per upstream host
+    - Keep-alive connections are reused across requests (no TCP+TLS per call)
+    - HTTP/2 multiplexing when the `h2` package is installed
+    - Per-host connection caps (limits apply per upstream, per worker process)
+    - Failed TCP/TLS connects are retried HTTP_CONNECT_RETRIES times (httpx
+      transport retries never resend a request that was already sent)
+    - Closed on application shutdown via the FastAPI lifespan
+
+    Usage:
+        client = http_clients.get("perplexity")
+        response = await client.post(url, json=payload, timeout=30.0)
+    """
+
+    # Per-upstream overrides; anything missing falls back to settings
+    UPSTREAMS: Dict[str, Dict[str, Any]] = {
+        "perplexity": {"timeout": 45.0},
+        "gemini": {"timeout": 60.0},
+        "brevo": {"timeout": 30.0, "max_connections": 5},
+        "web": {"timeout": 10.0, "http2": False},
+        # "retries": N overrides HTTP_CONNECT_RETRIES per upstream
+    }
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._transports: Dict[str, _MeteredTransport] = {}
+        self._stats: Dict[str, PoolStats] = {}
+
+    def _limits_for(self, name: str) -> httpx.Limits:
+        config = self.UPSTREAMS.get(name, {})
+        max_connections = config.get("max_connections", settings.HTTP_MAX_CONNECTIONS)
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(
+                max_connections,
+                config.get("max_keepalive_connections", settings.HTTP_MAX_KEEPALIVE_CONNECTIONS)
+            ),
+            keepalive_expiry=config.get("keepalive_expiry", settings.HTTP_KEEPALIVE_EXPIRY)
+        )
+
+    def _build(self, name: str) -> httpx.AsyncClient:
+        config = self.UPSTREAMS.get(name, {})
+        use_http2 = settings.HTTP2_ENABLED and HTTP2_AVAILABLE and config.get("http2", True)
+
+        stats = self._stats.setdefault(name, PoolStats())
+        transport = _MeteredTransport(
+            stats,
+            http2=use_http2,
+            limits=self._limits_for(name),
+            retries=config.get("retries", settings.HTTP_CONNECT_RETRIES)
+        )
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=config.get("timeout", 30.0)
+        )
+
+        self._transports[name] = transport
+        logger.info(f"🔌 HTTP pool '{name}' created (http2={use_http2})")
+        return client
+
+    def get(self, name: str = "web") -> httpx.AsyncClient:
+        """Get (or lazily create) the shared client for an upstream"""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._build(name)
+            self._clients[name] = client
+        return client
+
+    async def aclose(self):
+        """Close every pooled client (called on application shutdown)"""
+        for name, client in list(self._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP pool '{name}': {e}")
+        self._clients.clear()
+        self._transports.clear()
+        logger.info("🔌 HTTP pools closed")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Pool metrics for the admin dashboard (values are per worker process)"""
+        pools = {}
+        for name, stats in self._stats.items():
+            transport = self._transports.get(name)
+            limits = self._limits_for(name)
+            pools[name] = {
+                **stats.to_dict(),
+                "open_connections": transport.open_connections if transport else 0,
+                "max_connections": limits.max_connections,
+                "max_keepalive_connections": limits.max_keepalive_connections,
+                "http2": bool(transport and transport.http2)
+            }
+
+        return {
+            "worker_pid": os.getpid(),
+            "http2_available": HTTP2_AVAILABLE,
+            "pools": pools
+        }
+
+
+# Global instance
+http_clients = HTTPClientRegistry()
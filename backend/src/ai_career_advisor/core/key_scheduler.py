@@ -0,0 +1,441 @@
+"""
+Gemini Key/Model Scheduler
+Health-aware selection over (API key, model) pairs
+
+- Per-pair token bucket (requests per minute + burst)
+- Cooldowns that really expire, driven by Retry-After / retryDelay
+- EWMA latency and error rate per pair
+- Picks the least-loaded healthy pair, models in priority order
+- State shared across gunicorn workers via Redis (settings.REDIS_URL),
+  with an in-memory fallback when Redis is not configured or unreachable
+"""
+
+import time
+import asyncio
+import hashlib
+from typing import Dict, Any, List, Optional
+from google.api_core.exceptions import ResourceExhausted
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_asyncio = None
+    REDIS_AVAILABLE = False
+
+
+# Latency assumed for a pair that has not been measured yet
+DEFAULT_LATENCY = 3.0
+
+
+class SchedulerPair:
+    """One (API key, model) combination handed out by the scheduler"""
+
+    def __init__(self, api_key: str, model: str):
+        self.api_key = api_key
+        self.model = model
+        self.key_id = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:10]
+        self.id = f"{self.key_id}:{model}"
+
+    def __repr__(self):
+        return f"SchedulerPair({self.id})"
+
+
+class InMemorySchedulerBackend:
+    """Pair state for a single worker process"""
+
+    name = "memory"
+
+    def __init__(self):
+        self._state: Dict[str, Dict[str, float]] = {}
+
+    def _get(self, pair_id: str, capacity: float, now: float) -> Dict[str, float]:
+        return self._state.setdefault(pair_id, {
+            "tokens": capacity,
+            "updated": now,
+            "cooldown_until": 0.0,
+            "ewma_latency": 0.0,
+            "ewma_error": 0.0,
+            "failures": 0
+        })
+
+    async def snapshot(self, pair_ids: List[str], rate: float, capacity: float, now: float) -> Dict[str, Dict[str, float]]:
+        result = {}
+        for pair_id in pair_ids:
+            state = dict(self._get(pair_id, capacity, now))
+            state["tokens"] = min(capacity, state["tokens"] + (now - state["updated"]) * rate)
+            result[pair_id] = state
+        return result
+
+    async def try_take(self, pair_id: str, rate: float, capacity: float, now: float) -> bool:
+        state = self._get(pair_id, capacity, now)
+        if state["cooldown_until"] > now:
+            return False
+        state["tokens"] = min(capacity, state["tokens"] + (now - state["updated"]) * rate)
+        state["updated"] = now
+        if state["tokens"] >= 1:
+            state["tokens"] -= 1
+            return True
+        return False
+
+    async def record(
+        self,
+        pair_id: str,
+        latency: Optional[float],
+        success: bool,
+        cooldown_until: float,
+        now: float,
+        capacity: float
+    ):
+        state = self._get(pair_id, capacity, now)
+        alpha = settings.LLM_SCHEDULER_EWMA_ALPHA
+
+        if latency is not None:
+            state["ewma_latency"] = latency if not state["ewma_latency"] else (
+                alpha * latency + (1 - alpha) * state["ewma_latency"]
+            )
+        state["ewma_error"] = alpha * (0.0 if success else 1.0) + (1 - alpha) * state["ewma_error"]
+        state["failures"] = 0 if success else state["failures"] + 1
+
+        if state["failures"] >= settings.LLM_SCHEDULER_FAILURE_THRESHOLD:
+            cooldown_until = max(cooldown_until, now + settings.LLM_SCHEDULER_FAILURE_COOLDOWN)
+        state["cooldown_until"] = max(state["cooldown_until"], cooldown_until)
+
+    async def reset(self, pair_ids: List[str]):
+        for pair_id in pair_ids:
+            self._state.pop(pair_id, None)
+
+
+class RedisSchedulerBackend:
+    """
+    Pair state in Redis hashes, shared by every worker
+    Token taking and health updates run as Lua scripts so they are atomic
+    """
+
+    name = "redis"
+    PREFIX = "llm_scheduler"
+    TTL_SECONDS = 24 * 3600
+
+    TAKE_SCRIPT = """
+    local now = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local capacity = tonumber(ARGV[3])
+    local s = redis.call('HMGET', KEYS[1], 'tokens', 'updated', 'cooldown_until')
+    local tokens = tonumber(s[1]) or capacity
+    local updated = tonumber(s[2]) or now
+    local cooldown = tonumber(s[3]) or 0
+    if cooldown > now then return 0 end
+    tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+    local ok = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+        ok = 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+    redis.call('EXPIRE', KEYS[1], tonumber(ARGV[4]))
+    return ok
+    """
+
+    RECORD_SCRIPT = """
+    local latency = tonumber(ARGV[1])
+    local success = tonumber(ARGV[2])
+    local cooldown_until = tonumber(ARGV[3])
+    local now = tonumber(ARGV[4])
+    local alpha = tonumber(ARGV[5])
+    local threshold = tonumber(ARGV[6])
+    local failure_cooldown = tonumber(ARGV[7])
+    local s = redis.call('HMGET', KEYS[1], 'ewma_latency', 'ewma_error', 'failures', 'cooldown_until')
+    local ewma_latency = tonumber(s[1]) or 0
+    local ewma_error = tonumber(s[2]) or 0
+    local failures = tonumber(s[3]) or 0
+    local cooldown = tonumber(s[4]) or 0
+    if latency >= 0 then
+        if ewma_latency == 0 then
+            ewma_latency = latency
+        else
+            ewma_latency = alpha * latency + (1 - alpha) * ewma_latency
+        end
+    end
+    ewma_error = alpha * (1 - success) + (1 - alpha) * ewma_error
+    if success == 1 then failures = 0 else failures = failures + 1 end
+    if failures >= threshold then
+        cooldown_until = math.max(cooldown_until, now + failure_cooldown)
+    end
+    cooldown = math.max(cooldown, cooldown_until)
+    redis.call('HSET', KEYS[1],
+        'ewma_latency', tostring(ewma_latency),
+        'ewma_error', tostring(ewma_error),
+        'failures', tostring(failures),
+        'cooldown_until', tostring(cooldown))
+    redis.call('EXPIRE', KEYS[1], tonumber(ARGV[8]))
+    return 1
+    """
+
+    def __init__(self, url: str):
+        self.client = redis_asyncio.from_url(url, decode_responses=True)
+        self._take = self.client.register_script(self.TAKE_SCRIPT)
+        self._record = self.client.register_script(self.RECORD_SCRIPT)
+
+    def _key(self, pair_id: str) -> str:
+        return f"{self.PREFIX}:{pair_id}"
+
+    async def snapshot(self, pair_ids: List[str], rate: float, capacity: float, now: float) -> Dict[str, Dict[str, float]]:
+        pipe = self.client.pipeline(transaction=False)
+        for pair_id in pair_ids:
+            pipe.hgetall(self._key(pair_id))
+        rows = await pipe.execute()
+
+        result = {}
+        for pair_id, row in zip(pair_ids, rows):
+            tokens = float(row.get("tokens", capacity))
+            updated = float(row.get("updated", now))
+            result[pair_id] = {
+                "tokens": min(capacity, tokens + max(0.0, now - updated) * rate),
+                "updated": updated,
+                "cooldown_until": float(row.get("cooldown_until", 0)),
+                "ewma_latency": float(row.get("ewma_latency", 0)),
+                "ewma_error": float(row.get("ewma_error", 0)),
+                "failures": int(float(row.get("failures", 0)))
+            }
+        return result
+
+    async def try_take(self, pair_id: str, rate: float, capacity: float, now: float) -> bool:
+        taken = await self._take(keys=[self._key(pair_id)], args=[now, rate, capacity, self.TTL_SECONDS])
+        return bool(int(taken))
+
+    async def record(
+        self,
+        pair_id: str,
+        latency: Optional[float],
+        success: bool,
+        cooldown_until: float,
+        now: float,
+        capacity: float
+    ):
+        await self._record(
+            keys=[self._key(pair_id)],
+            args=[
+                -1 if latency is None else latency,
+                1 if success else 0,
+                cooldown_until,
+                now,
+                settings.LLM_SCHEDULER_EWMA_ALPHA,
+                settings.LLM_SCHEDULER_FAILURE_THRESHOLD,
+                settings.LLM_SCHEDULER_FAILURE_COOLDOWN,
+                self.TTL_SECONDS
+            ]
+        )
+
+    async def reset(self, pair_ids: List[str]):
+        if pair_ids:
+            await self.client.delete(*[self._key(pair_id) for pair_id in pair_ids])
+
+
+class KeyScheduler:
+    """
+    Hands out (API key, model) pairs for Gemini calls
+
+    Usage:
+        pair = await scheduler.acquire(model="gemini-2.5-flash")   # or model=None for any
+        try:
+            text = await client_for(pair.api_key).generate(pair.model, prompt)
+            await scheduler.release(pair, latency=1.2, success=True)
+        except ResourceExhausted as e:
+            await scheduler.release(pair, success=False, retry_after=e.retry_after)
+    """
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        models: List[str],
+        requests_per_minute: float = 10,
+        burst: float = 3,
+        max_wait: float = 10.0,
+        redis_url: Optional[str] = None,
+        dedicated_models: Optional[List[str]] = None
+    ):
+        self.models = list(models)
+        # Only reserved when asked for by name, never for acquire(model=None)
+        # (e.g. the embedding model cannot serve generateContent)
+        self.dedicated_models = set(dedicated_models or [])
+        self.pairs: Dict[str, SchedulerPair] = {}
+        for model in self.models:
+            for api_key in api_keys:
+                pair = SchedulerPair(api_key, model)
+                self.pairs[pair.id] = pair
+
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1.0, float(burst))
+        self.max_wait = max_wait
+        if self.max_wait < 1 / self.rate:
+            logger.warning(
+                f"⚠️ LLM scheduler max wait {self.max_wait:.1f}s is shorter than one token refill "
+                f"({1 / self.rate:.1f}s): calls past the burst will fail instead of waiting"
+            )
+
+        # In-flight calls are tracked per worker (load within this process)
+        self.in_flight: Dict[str, int] = {pair_id: 0 for pair_id in self.pairs}
+
+        self._fallback = InMemorySchedulerBackend()
+        self.backend = self._fallback
+        if redis_url:
+            if REDIS_AVAILABLE:
+                self.backend = RedisSchedulerBackend(redis_url)
+                logger.info("🔗 LLM scheduler state shared via Redis")
+            else:
+                logger.warning("⚠️ REDIS_URL set but redis package not installed, scheduler state is per worker")
+
+    # ================== BACKEND ==================
+
+    async def _call(self, method: str, *args):
+        """Run a backend call, dropping to the in-memory backend if Redis fails"""
+        try:
+            return await getattr(self.backend, method)(*args)
+        except Exception as e:
+            if self.backend is self._fallback:
+                raise
+            logger.error(f"❌ Redis scheduler backend failed ({e}), falling back to in-memory state")
+            self.backend = self._fallback
+            return await getattr(self.backend, method)(*args)
+
+    # ================== SELECTION ==================
+
+    def _cost(self, pair_id: str, state: Dict[str, float]) -> float:
+        """Lower is better: slow, busy, error-prone or drained pairs cost more"""
+        latency = state["ewma_latency"] or DEFAULT_LATENCY
+        return (
+            latency
+            * (1 + self.in_flight.get(pair_id, 0))
+            * (1 + 4 * state["ewma_error"])
+            / (1 + state["tokens"] / self.capacity)
+        )
+
+    def _candidates(self, model: Optional[str]) -> List[List[str]]:
+        """Pair ids grouped by model, in model priority order"""
+        models = [model] if model else [m for m in self.models if m not in self.dedicated_models]
+        return [
+            [pair_id for pair_id, pair in self.pairs.items() if pair.model == m]
+            for m in models
+        ]
+
+    async def acquire(self, model: Optional[str] = None, max_wait: Optional[float] = None) -> SchedulerPair:
+        """
+        Reserve a token on the best healthy pair
+        - With a model: best key for that model
+        - Without: best pair of the highest-priority model that has capacity
+        Waits up to max_wait for a token/cooldown, then raises ResourceExhausted
+        """
+        groups = [group for group in self._candidates(model) if group]
+        if not groups:
+            raise ValueError(f"No Gemini API keys configured for {model or 'any model'}")
+
+        all_ids = [pair_id for group in groups for pair_id in group]
+        deadline = time.monotonic() + (self.max_wait if max_wait is None else max_wait)
+
+        while True:
+            now = time.time()
+            states = await self._call("snapshot", all_ids, self.rate, self.capacity, now)
+
+            for group in groups:
+                healthy = [
+                    pair_id for pair_id in group
+                    if states[pair_id]["cooldown_until"] <= now and states[pair_id]["tokens"] >= 1
+                ]
+                for pair_id in sorted(healthy, key=lambda p: self._cost(p, states[p])):
+                    if await self._call("try_take", pair_id, self.rate, self.capacity, now):
+                        self.in_flight[pair_id] += 1
+                        return self.pairs[pair_id]
+
+            wait = min(self._time_until_ready(states[pair_id], now) for pair_id in all_ids)
+            remaining = deadline - time.monotonic()
+            if wait > remaining:
+                raise ResourceExhausted(
+                    f"All Gemini key/model pairs for {model or 'any model'} are rate-limited "
+                    f"(next available in {wait:.1f}s)"
+                )
+            await asyncio.sleep(max(wait, 0.05))
+
+    def _time_until_ready(self, state: Dict[str, float], now: float) -> float:
+        cooldown = max(0.0, state["cooldown_until"] - now)
+        refill = 0.0 if state["tokens"] >= 1 else (1 - state["tokens"]) / self.rate
+        return max(cooldown, refill)
+
+    async def release(
+        self,
+        pair: SchedulerPair,
+        latency: Optional[float] = None,
+        success: bool = True,
+        retry_after: Optional[float] = None
+    ):
+        """
+        Report the outcome of a call made with an acquired pair
+        retry_after (seconds) puts the pair on cooldown; 429s without one get
+        settings.LLM_SCHEDULER_DEFAULT_COOLDOWN
+        """
+        self.in_flight[pair.id] = max(0, self.in_flight.get(pair.id, 0) - 1)
+
+        now = time.time()
+        cooldown_until = now + retry_after if retry_after else 0.0
+        await self._call("record", pair.id, latency, success, cooldown_until, now, self.capacity)
+
+        if retry_after:
+            logger.warning(f"🔴 {pair.model} on key {pair.key_id[:6]} cooling down for {retry_after:.0f}s")
+
+    def abandon(self, pair: SchedulerPair):
+        """Release a pair whose call was cancelled (no health update)"""
+        self.in_flight[pair.id] = max(0, self.in_flight.get(pair.id, 0) - 1)
+
+    async def cooldown_model(self, model: str, seconds: float):
+        """Put every key of a model on cooldown"""
+        now = time.time()
+        for group in self._candidates(model):
+            for pair_id in group:
+                await self._call("record", pair_id, None, False, now + seconds, now, self.capacity)
+
+    async def reset(self, model: Optional[str] = None):
+        """Forget health state (all pairs, or all keys of one model)"""
+        pair_ids = [pair_id for group in self._candidates(model) for pair_id in group]
+        await self._call("reset", pair_ids)
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Per-pair health for the admin dashboard"""
+        now = time.time()
+        pair_ids = list(self.pairs)
+        states = await self._call("snapshot", pair_ids, self.rate, self.capacity, now) if pair_ids else {}
+
+        pairs = {}
+        for pair_id, state in states.items():
+            pairs[pair_id] = {
+                "model": self.pairs[pair_id].model,
+                "healthy": state["cooldown_until"] <= now and state["tokens"] >= 1,
+                "tokens": round(state["tokens"], 2),
+                "cooldown_remaining_s": round(max(0.0, state["cooldown_until"] - now), 1),
+                "ewma_latency_s": round(state["ewma_latency"], 3),
+                "ewma_error_rate": round(state["ewma_error"], 3),
+                "consecutive_failures": int(state["failures"]),
+                "in_flight": self.in_flight.get(pair_id, 0)
+            }
+
+        return {
+            "backend": self.backend.name,
+            "requests_per_minute": round(self.rate * 60, 2),
+            "burst": self.capacity,
+            "pairs": pairs
+        }
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Retry-After header / retryDelay ("37s") -> seconds"""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(str(value).strip().rstrip("s")))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        return max(0.0, parsedate_to_datetime(str(value)).timestamp() - time.time())
+    except Exception:
+        return None
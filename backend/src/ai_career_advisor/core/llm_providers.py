@@ -0,0 +1,218 @@
+"""
+Native async LLM provider clients
+Thin REST clients over the shared HTTP pool - no process-global SDK state, no thread pools
+"""
+
+from google.api_core import exceptions as google_exceptions
+from ai_career_advisor.core.http_client import http_clients
+from ai_career_advisor.core.logger import logger
+from typing import Dict, Any, List, Optional, AsyncIterator
+import httpx
+import json
+
+
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+PERPLEXITY_API_URL = "https://api.perplexity.ai/chat/completions"
+
+
+async def _iter_sse_data(response: httpx.Response) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the JSON payload of every `data:` line of a server-sent-events response"""
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if not data or data == "[DONE]":
+            continue
+        try:
+            yield json.loads(data)
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping malformed SSE chunk: {data[:100]}")
+
+
+def _raise_for_gemini_status(response: httpx.Response):
+    """Map Gemini HTTP errors to the same google.api_core exceptions the SDK raises"""
+    if response.status_code == 200:
+        return
+
+    retry_delay = None
+    try:
+        body = response.json().get("error", {})
+        message = body.get("message", response.text)
+        # 429 bodies carry google.rpc.RetryInfo, e.g. {"retryDelay": "37s"}
+        for detail in body.get("details", []):
+            if "retryDelay" in detail:
+                retry_delay = detail["retryDelay"]
+    except Exception:
+        message = response.text
+
+    if response.status_code == 429:
+        error = google_exceptions.ResourceExhausted(message)
+    else:
+        error = google_exceptions.from_http_status(response.status_code, message)
+
+    error.retry_after = response.headers.get("retry-after") or retry_delay
+    raise error
+
+
+class GeminiClient:
+    """
+    Async Gemini client bound to ONE API key
+    - The key travels in the request header, so concurrent calls on
+      different keys can never see each other's credentials
+    - Uses the pooled "gemini" HTTP client (keep-alive, HTTP/2)
+    """
+
+    def __init__(self, api_key: str, http_client: Optional[httpx.AsyncClient] = None):
+        self.api_key = api_key
+        self._http_client = http_client
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        return self._http_client or http_clients.get("gemini")
+
+    @property
+    def key_hint(self) -> str:
+        """Short, log-safe identifier for the key"""
+        return f"...{self.api_key[-4:]}" if self.api_key else "none"
+
+    async def generate(self, model: str, prompt: str, timeout: float = 60.0) -> str:
+        """Generate text with the given model (equivalent of GenerativeModel.generate_content)"""
+        response = await self.http.post(
+            f"{GEMINI_API_BASE}/models/{model}:generateContent",
+            headers={"x-goog-api-key": self.api_key},
+            json={"contents": [{"role": "user", "parts": [{"text": prompt}]}]},
+            timeout=timeout
+        )
+        _raise_for_gemini_status(response)
+
+        data = response.json()
+        candidates = data.get("candidates") or []
+        if not candidates:
+            reason = data.get("promptFeedback", {}).get("blockReason", "no candidates returned")
+            raise ValueError(f"Gemini returned no content ({reason})")
+
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+
+    async def stream_generate(self, model: str, prompt: str, timeout: float = 60.0) -> AsyncIterator[str]:
+        """Yield text chunks as Gemini produces them (streamGenerateContent over SSE)"""
+        async with self.http.stream(
+            "POST",
+            f"{GEMINI_API_BASE}/models/{model}:streamGenerateContent",
+            params={"alt": "sse"},
+            headers={"x-goog-api-key": self.api_key},
+            json={"contents": [{"role": "user", "parts": [{"text": prompt}]}]},
+            timeout=timeout
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                _raise_for_gemini_status(response)
+
+            async for chunk in _iter_sse_data(response):
+                for candidate in chunk.get("candidates", [])[:1]:
+                    for part in candidate.get("content", {}).get("parts", []):
+                        if part.get("text"):
+                            yield part["text"]
+
+    async def embed(
+        self,
+        text: str,
+        model: str = "models/gemini-embedding-001",
+        task_type: str = "retrieval_document",
+        timeout: float = 30.0
+    ) -> List[float]:
+        """Embed a single text (equivalent of genai.embed_content)"""
+        model_name = model if model.startswith("models/") else f"models/{model}"
+        response = await self.http.post(
+            f"{GEMINI_API_BASE}/{model_name}:embedContent",
+            headers={"x-goog-api-key": self.api_key},
+            json={
+                "model": model_name,
+                "content": {"parts": [{"text": text}]},
+                "taskType": task_type.upper()
+            },
+            timeout=timeout
+        )
+        _raise_for_gemini_status(response)
+        return response.json()["embedding"]["values"]
+
+
+class PerplexityClient:
+    """Async Perplexity chat-completions client on the pooled "perplexity" HTTP client"""
+
+    def __init__(self, api_key: str, http_client: Optional[httpx.AsyncClient] = None):
+        self.api_key = api_key
+        self._http_client = http_client
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        return self._http_client or http_clients.get("perplexity")
+
+    async def chat(self, prompt: str, model: str = "sonar-pro", timeout: float = 60.0) -> Dict[str, Any]:
+        """
+        Returns: {"content": str, "citations": List[str], "model": str}
+        """
+        response = await self.http.post(
+            PERPLEXITY_API_URL,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}]
+            },
+            timeout=timeout
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Perplexity API error: {response.status_code} - {response.text}")
+            raise Exception(f"Perplexity API error: {response.status_code}")
+
+        result = response.json()
+        choices = result.get("choices", [{}])[0]
+        return {
+            "content": choices.get("message", {}).get("content", ""),
+            "citations": result.get("citations", []),
+            "model": model
+        }
+
+    async def stream_chat(
+        self,
+        prompt: str,
+        model: str = "sonar-pro",
+        timeout: float = 60.0,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a chat completion
+        Yields {"content": delta} for text and a final {"citations": [...]}
+        """
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+
+        citations: List[str] = []
+        async with self.http.stream(
+            "POST",
+            PERPLEXITY_API_URL,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            },
+            json={"model": model, "messages": messages, "stream": True},
+            timeout=timeout
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                logger.error(f"Perplexity API error: {response.status_code} - {response.text}")
+                raise Exception(f"Perplexity API error: {response.status_code}")
+
+            async for chunk in _iter_sse_data(response):
+                citations = chunk.get("citations") or citations
+                for choice in chunk.get("choices", [])[:1]:
+                    delta = choice.get("delta", {}).get("content")
+                    if delta:
+                        yield {"content": delta}
+
+        yield {"citations": citations}
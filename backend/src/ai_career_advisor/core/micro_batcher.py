@@ -0,0 +1,130 @@
+"""
+Async Micro-Batcher
+Groups concurrent single-item calls into one batched call
+
+📚 STUDY NOTES - WHY BATCH?
+==========================
+- One DistilBERT forward pass for 32 short queries costs barely more than
+  one pass for a single query, so concurrent requests are grouped together
+- Requests wait at most N ms (or until B requests are queued) before a batch runs
+- The batch function runs in ONE dedicated worker thread, so the event loop
+  never blocks and torch never competes with itself across threads
+- Every caller gets its own Future, resolved with its own result
+"""
+
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+from ai_career_advisor.core.logger import logger
+
+
+class MicroBatcher:
+    """
+    Collects concurrent submit() calls into batched calls of batch_fn
+
+    Usage:
+        batcher = MicroBatcher(classifier.predict_batch, max_batch_size=32, max_wait_ms=5)
+        intent, confidence = await batcher.submit("how to become a doctor")
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "micro-batcher"
+    ):
+        # batch_fn(items) must return one result per item, in order
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self.name = name
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.batches = 0
+        self.items = 0
+        self.max_seen_batch = 0
+        self.errors = 0
+        self.batch_seconds = 0.0
+
+    def _ensure_worker(self):
+        """Start the collector task lazily on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect())
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its share of the next batch"""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self):
+        """Gather up to max_batch_size items or until max_wait expires, then run them"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Callers that gave up (timeouts, disconnects) don't need a slot
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if batch:
+                await self._run_batch(batch)
+
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        items = [item for item, _ in batch]
+        started = time.perf_counter()
+
+        try:
+            results = await self._loop.run_in_executor(self._executor, self.batch_fn, items)
+            if len(results) != len(items):
+                raise ValueError(f"batch_fn returned {len(results)} results for {len(items)} items")
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"❌ {self.name}: batch of {len(items)} failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batch_seconds += time.perf_counter() - started
+        self.batches += 1
+        self.items += len(items)
+        self.max_seen_batch = max(self.max_seen_batch, len(items))
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def get_stats(self) -> dict:
+        """Batching efficiency for monitoring"""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size_seen": self.max_seen_batch,
+            "avg_batch_latency_ms": round(1000 * self.batch_seconds / self.batches, 2) if self.batches else 0.0,
+            "errors": self.errors,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000
+        }
+
+    def shutdown(self):
+        if self._worker is not None:
+            self._worker.cancel()
+        self._executor.shutdown(wait=False)
@@ -3,14 +3,16 @@ Smart Model Manager with Fallback Support
 Handles rate limiting and automatic model/API switching
 """
 
-import google.generativeai as genai
-import requests
 from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
+from ai_career_advisor.core.llm_providers import GeminiClient, PerplexityClient
+from ai_career_advisor.core.response_cache import response_cache
+from ai_career_advisor.core.key_scheduler import KeyScheduler, SchedulerPair, parse_retry_after
+from ai_career_advisor.core.hedging import hedged_generator
 from google.api_core.exceptions import ResourceExhausted
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator
 import asyncio
-from functools import partial
+import time
 
 
 class ModelManager:
@@ -31,114 +33,145 @@ class ModelManager:
     # Filter out None values
     GEMINI_API_KEYS = [k for k in GEMINI_API_KEYS if k]
     
-    # Track model/key combination performance and rate limits
-    model_status: Dict[str, Dict[str, Any]] = {
-        model: {"available": True, "rate_limited_until": None, "failures": 0}
-        for model in GEMINI_MODELS
-    }
+    EMBEDDING_MODEL = "gemini-embedding-001"
     
-    current_model_index = 0
-    current_key_index = 0
+    # Token-bucket / health scheduler over (key, model) pairs
+    _scheduler: Optional[KeyScheduler] = None
+    
+    # One pre-built async client per API key (no global genai.configure)
+    _gemini_clients: Dict[str, GeminiClient] = {}
+    _perplexity_client: Optional[PerplexityClient] = None
+    
+    @classmethod
+    def get_gemini_client(cls, api_key: str) -> GeminiClient:
+        """Get the dedicated client for an API key"""
+        client = cls._gemini_clients.get(api_key)
+        if client is None:
+            client = GeminiClient(api_key)
+            cls._gemini_clients[api_key] = client
+        return client
+    
+    @classmethod
+    def get_perplexity_client(cls) -> PerplexityClient:
+        """Get the shared Perplexity client"""
+        if cls._perplexity_client is None or cls._perplexity_client.api_key != settings.PERPLEXITY_API_KEY:
+            cls._perplexity_client = PerplexityClient(settings.PERPLEXITY_API_KEY)
+        return cls._perplexity_client
     
     @classmethod
-    def get_next_gemini_key(cls) -> Optional[str]:
-        """Get the next available Gemini API key and rotate"""
-        if not cls.GEMINI_API_KEYS:
-            return getattr(settings, 'GEMINI_API_KEY', None)
+    def get_scheduler(cls) -> KeyScheduler:
+        """Get the scheduler for the configured keys (rebuilt if the key list changes)"""
+        keys = cls.GEMINI_API_KEYS or [k for k in [getattr(settings, 'GEMINI_API_KEY', None)] if k]
+        models = cls.GEMINI_MODELS + [cls.EMBEDDING_MODEL]
+        expected = {SchedulerPair(k, m).id for k in keys for m in models}
         
-        key = cls.GEMINI_API_KEYS[cls.current_key_index % len(cls.GEMINI_API_KEYS)]
-        cls.current_key_index += 1
-        return key
+        if cls._scheduler is None or set(cls._scheduler.pairs) != expected:
+            cls._scheduler = KeyScheduler(
+                keys,
+                models,
+                requests_per_minute=settings.GEMINI_REQUESTS_PER_MINUTE,
+                burst=settings.GEMINI_BURST,
+                max_wait=settings.LLM_SCHEDULER_MAX_WAIT,
+                redis_url=settings.REDIS_URL,
+                dedicated_models=[cls.EMBEDDING_MODEL]
+            )
+        return cls._scheduler
+    
+    @classmethod
+    async def get_next_gemini_key(cls, model: Optional[str] = None) -> Optional[str]:
+        """Key of the least-loaded healthy pair (does not reserve a request)"""
+        status = await cls.get_scheduler().get_status()
+        candidates = [
+            (pair_id, info) for pair_id, info in status["pairs"].items()
+            if info["healthy"] and info["model"] == (model or cls.GEMINI_MODELS[0])
+        ]
+        if not candidates:
+            return None
+        best_id, _ = min(candidates, key=lambda item: (item[1]["in_flight"], item[1]["ewma_latency_s"]))
+        return cls.get_scheduler().pairs[best_id].api_key
     
     @classmethod
-    def get_available_gemini_model(cls):
-        """Get the next available Gemini model, or rotate if all are rate-limited"""
+    async def get_available_gemini_model(cls) -> Optional[str]:
+        """Highest-priority Gemini model with at least one healthy key"""
+        status = await cls.get_scheduler().get_status()
         for model in cls.GEMINI_MODELS:
-            status = cls.model_status.get(model, {})
-            if status.get("available", True):
+            if any(info["healthy"] and info["model"] == model for info in status["pairs"].values()):
                 logger.info(f"✅ Using Gemini model: {model}")
                 return model
-        
-        # If all are rate limited, reset and use first
-        logger.warning(f"⚠️ All Gemini models rate-limited, resetting to first model")
-        cls.current_model_index = 0
-        return cls.GEMINI_MODELS[0]
+        logger.warning("⚠️ All Gemini models are rate-limited")
+        return None
     
     @classmethod
-    def mark_model_rate_limited(cls, model: str, retry_after: int = 60):
-        """Mark a model as rate-limited"""
+    async def mark_model_rate_limited(cls, model: str, retry_after: int = 60):
+        """Put every key of a model on cooldown"""
         logger.warning(f"🔴 Marking {model} as rate-limited for {retry_after}s")
-        if model in cls.model_status:
-            cls.model_status[model]["available"] = False
-            cls.model_status[model]["rate_limited_until"] = retry_after
+        await cls.get_scheduler().cooldown_model(model, retry_after)
     
     @classmethod
-    def mark_model_available(cls, model: str):
-        """Mark a model as available again"""
-        if model in cls.model_status:
-            cls.model_status[model]["available"] = True
-            cls.model_status[model]["failures"] = 0
+    async def mark_model_available(cls, model: str):
+        """Clear cooldowns and health history for a model"""
+        await cls.get_scheduler().reset(model)
     
     @classmethod
-    async def generate_with_gemini(cls, prompt: str, model: Optional[str] = None) -> str:
+    async def _call_gemini(cls, model: Optional[str], call) -> Any:
         """
-        Generate content using Gemini with automatic fallback
-        - Tries different API keys when one is rate-limited
-        - Tries different models when a model is rate-limited
+        Run `call(client, model)` on the best healthy (key, model) pair
+        - 429s put that pair on cooldown (Retry-After / retryDelay) and move
+          to the next healthy pair immediately
+        - Other errors are recorded against the pair and retried
+        - Raises ResourceExhausted when no pair has capacity
         """
-        # Get the model to use
-        selected_model = model or cls.get_available_gemini_model()
-        
+        scheduler = cls.get_scheduler()
         max_retries = 3
         retry_count = 0
         
-        while retry_count < max_retries:
+        while True:
+            pair = await scheduler.acquire(model=model)
+            client = cls.get_gemini_client(pair.api_key)
+            logger.info(f"📤 Calling {pair.model} (attempt {retry_count + 1}, key {client.key_hint})")
+            started = time.perf_counter()
+            
             try:
-                # Get next API key (rotate through multiple keys)
-                api_key = cls.get_next_gemini_key()
-                if not api_key:
-                    raise ValueError("No Gemini API keys configured")
-                
-                logger.info(f"📤 Generating with {selected_model} (attempt {retry_count + 1})")
-                
-                # Configure and try the selected model
-                genai.configure(api_key=api_key)
-                genai_model = genai.GenerativeModel(selected_model)
-                
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    partial(genai_model.generate_content, prompt)
-                )
-                
-                # Success - mark model as available
-                cls.mark_model_available(selected_model)
-                logger.success(f"✅ Generated with {selected_model}")
-                return response.text.strip()
-                
+                result = await call(client, pair.model)
+                await scheduler.release(pair, latency=time.perf_counter() - started, success=True)
+                return result
+            
             except ResourceExhausted as e:
-                # Rate limited - try next model (if auto-swapping is enabled, but here we specific model)
-                logger.warning(f"🔴 Rate limit hit on {selected_model}: {str(e)}")
-                cls.mark_model_rate_limited(selected_model)
-                
-                # If specifically requested model failed, we stop here to let fallback logic handle it
-                if model:
-                     raise
-                
-                # Otherwise try next available from pool
-                selected_model = cls.get_available_gemini_model()
-                retry_count += 1
-                await asyncio.sleep(2)
+                retry_after = parse_retry_after(getattr(e, "retry_after", None))
+                await scheduler.release(
+                    pair,
+                    success=False,
+                    retry_after=retry_after or settings.LLM_SCHEDULER_DEFAULT_COOLDOWN
+                )
+                logger.warning(f"🔴 Rate limit hit on {pair.model} (key {client.key_hint}): {str(e)}")
+                # No sleep: another healthy pair (or a clean ResourceExhausted) comes next
+            
+            except asyncio.CancelledError:
+                # Lost a hedged race: not the pair's fault, just free the slot
+                scheduler.abandon(pair)
+                raise
             
             except Exception as e:
-                logger.error(f"❌ Error with {selected_model}: {str(e)}")
+                await scheduler.release(pair, latency=time.perf_counter() - started, success=False)
+                logger.error(f"❌ Error with {pair.model}: {str(e)}")
                 retry_count += 1
-                if retry_count < max_retries:
-                    await asyncio.sleep(2)
-                else:
+                if retry_count >= max_retries:
                     raise
+                await asyncio.sleep(2)
+    
+    @classmethod
+    async def generate_with_gemini(cls, prompt: str, model: Optional[str] = None) -> str:
+        """
+        Generate content using Gemini on the healthiest (key, model) pair
+        - model=None lets the scheduler pick the best model in priority order
+        - Rate-limited pairs cool down for their Retry-After and are skipped
+        """
+        async def call(client: GeminiClient, selected_model: str) -> str:
+            text = await client.generate(selected_model, prompt)
+            logger.success(f"✅ Generated with {selected_model}")
+            return text.strip()
         
-        raise Exception("Gemini generation failed after retries")
+        return await cls._call_gemini(model, call)
     
     @classmethod
     async def generate_with_perplexity(cls, prompt: str, return_full: bool = False) -> Any:
@@ -151,180 +184,332 @@ class ModelManager:
         
         logger.info("Switching to Perplexity API as fallback")
         
-        headers = {
-            "Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "model": "sonar-pro",  # Current Perplexity model
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        }
-        
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(
-                    requests.post,
-                    "https://api.perplexity.ai/chat/completions",
-                    json=payload,
-                    headers=headers
-                )
-            )
+            result = await cls.get_perplexity_client().chat(prompt, model="sonar-pro")
+            logger.success("Generated with Perplexity API")
             
-            if response.status_code == 200:
-                result = response.json()
-                logger.success("Generated with Perplexity API")
-                choices = result.get("choices", [{}])[0]
-                content = choices.get("message", {}).get("content", "")
-                citations = result.get("citations", [])
-                
-                if return_full:
-                    return {
-                        "content": content,
-                        "citations": citations,
-                        "model": "sonar-pro"
-                    }
-                return content
-            else:
-                logger.error(f"Perplexity API error: {response.status_code} - {response.text}")
-                raise Exception(f"Perplexity API error: {response.status_code}")
+            if return_full:
+                return result
+            return result["content"]
         
         except Exception as e:
             logger.error(f"Perplexity API exception: {str(e)}")
             raise
     
     @classmethod
-    async def generate_smart(cls, prompt: str, return_full: bool = False) -> Any:
+    async def _generate_smart_uncached(cls, prompt: str) -> Dict[str, Any]:
         """
-        Smart generation with explicit fallback chain:
-        1. Gemini 2.5 Flash
-        2. Gemini 2.5 Flash-Lite
-        3. Perplexity Sonar-Pro (returns citations if return_full=True)
+        Run the Flash -> Flash-Lite -> Sonar-Pro chain (always returns the full dict)
+        settings.LLM_HEDGING_MODE: "sequential", "hedged" (default) or "race"
         """
+        if settings.LLM_HEDGING_MODE.lower() == "sequential":
+            return await cls._generate_sequential(prompt)
+        
+        def gemini(model: str):
+            async def call() -> Dict[str, Any]:
+                content = await cls.generate_with_gemini(prompt, model=model)
+                return {"content": content, "citations": [], "model": model}
+            return call
+        
+        providers = [(model, gemini(model)) for model in cls.GEMINI_MODELS]
+        if settings.PERPLEXITY_API_KEY:
+            providers.append(("sonar-pro", lambda: cls.generate_with_perplexity(prompt, return_full=True)))
+        
+        return await hedged_generator.run(providers)
+    
+    @classmethod
+    async def _generate_sequential(cls, prompt: str) -> Dict[str, Any]:
+        """Try each provider strictly one after another"""
         # 1. Try Gemini 2.5 Flash
         try:
             content = await cls.generate_with_gemini(prompt, model="gemini-2.5-flash")
-            return {"content": content, "citations": [], "model": "gemini-2.5-flash"} if return_full else content
+            return {"content": content, "citations": [], "model": "gemini-2.5-flash"}
         except Exception as e1:
             logger.warning(f"Gemini 2.5 Flash failed: {e1}. Trying Flash-Lite...")
             
             # 2. Try Gemini 2.5 Flash-Lite
             try:
                 content = await cls.generate_with_gemini(prompt, model="gemini-2.5-flash-lite")
-                return {"content": content, "citations": [], "model": "gemini-2.5-flash-lite"} if return_full else content
+                return {"content": content, "citations": [], "model": "gemini-2.5-flash-lite"}
             except Exception as e2:
                 logger.warning(f"Gemini 2.5 Flash-Lite failed: {e2}. Switching to Perplexity...")
                 
                 # 3. Try Perplexity Sonar-Pro
                 try:
-                    return await cls.generate_with_perplexity(prompt, return_full=return_full)
+                    return await cls.generate_with_perplexity(prompt, return_full=True)
                 except Exception as e3:
                     logger.error(f"All providers failed. Final error: {e3}")
                     raise Exception(f"All models failed. Last error: {e3}")
     
     @classmethod
-    async def generate(cls, prompt: str, preference: str = "auto") -> str:
-        """
-        Generate content based on user preference.
-        Returns ONLY text (backward compatibility)
-        """
-        if not preference or preference.lower() == "auto":
-            return await cls.generate_smart(prompt, return_full=False)
-        
-        elif preference.lower() == "sonar-pro":
+    async def _generate_uncached(cls, prompt: str, preference: str) -> Dict[str, Any]:
+        """Route a prompt to the preferred provider (always returns the full dict)"""
+        if preference == "sonar-pro":
             try:
-                return await cls.generate_with_perplexity(prompt, return_full=False)
+                return await cls.generate_with_perplexity(prompt, return_full=True)
             except Exception as e:
                 raise Exception(f"Perplexity Sonar-Pro failed: {str(e)}")
         
-        elif "gemini" in preference.lower():
+        elif "gemini" in preference:
+            model_name = preference if preference in cls.GEMINI_MODELS else "gemini-2.5-flash"
             try:
-                model_name = preference if preference in cls.GEMINI_MODELS else "gemini-2.5-flash"
-                return await cls.generate_with_gemini(prompt, model=model_name)
+                content = await cls.generate_with_gemini(prompt, model=model_name)
+                return {
+                    "content": content,
+                    "citations": [],
+                    "model": model_name
+                }
             except Exception as e:
                 raise Exception(f"{model_name} failed: {str(e)}")
         
-        else:
-            return await cls.generate_smart(prompt, return_full=False)
+        return await cls._generate_smart_uncached(prompt)
+    
+    @classmethod
+    async def _generate_cached(
+        cls,
+        prompt: str,
+        preference: str = "auto",
+        use_cache: bool = True,
+        cache_ttl: Optional[float] = None,
+        semantic_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Serve from the response cache when possible, otherwise generate and store
+        - Exact tier: same normalized prompt + preference
+        - Semantic tier: only when the caller passes a semantic_key
+        """
+        preference = (preference or "auto").lower()
+        if preference != "sonar-pro" and "gemini" not in preference:
+            preference = "auto"
+        
+        if not (use_cache and settings.LLM_CACHE_ENABLED):
+            response_cache.record_bypass()
+            return await cls._generate_uncached(prompt, preference)
+        
+        cached = await response_cache.get(prompt, preference, semantic_key=semantic_key)
+        if cached is not None:
+            return cached
+        
+        started = time.perf_counter()
+        result = await cls._generate_uncached(prompt, preference)
+        await response_cache.put(
+            prompt,
+            preference,
+            result,
+            latency=time.perf_counter() - started,
+            ttl=cache_ttl,
+            semantic_key=semantic_key
+        )
+        return result
+    
+    @classmethod
+    def invalidate_cached(cls, prompt: str, preference: str = "auto"):
+        """Drop a cached response the caller could not use (e.g. invalid JSON)"""
+        preference = (preference or "auto").lower()
+        if preference != "sonar-pro" and "gemini" not in preference:
+            preference = "auto"
+        response_cache.invalidate(prompt, preference)
+    
+    @classmethod
+    async def generate_smart(
+        cls,
+        prompt: str,
+        return_full: bool = False,
+        use_cache: bool = True,
+        cache_ttl: Optional[float] = None,
+        semantic_key: Optional[str] = None
+    ) -> Any:
+        """
+        Smart generation with explicit fallback chain:
+        1. Gemini 2.5 Flash
+        2. Gemini 2.5 Flash-Lite
+        3. Perplexity Sonar-Pro (returns citations if return_full=True)
+        
+        Responses are cached (see core/response_cache.py); pass use_cache=False
+        for prompts that must always hit the provider. semantic_key is for
+        free-text questions only: prompts keyed by an entity name (career
+        details, insights, roadmaps) stay exact-match, since close names like
+        "Data Scientist" / "Data Analyst" must not share an answer.
+        """
+        result = await cls._generate_cached(
+            prompt, "auto", use_cache=use_cache, cache_ttl=cache_ttl, semantic_key=semantic_key
+        )
+        return result if return_full else result["content"]
+    
+    @classmethod
+    async def generate(
+        cls,
+        prompt: str,
+        preference: str = "auto",
+        use_cache: bool = True,
+        cache_ttl: Optional[float] = None,
+        semantic_key: Optional[str] = None
+    ) -> str:
+        """
+        Generate content based on user preference.
+        Returns ONLY text (backward compatibility)
+        """
+        result = await cls._generate_cached(
+            prompt, preference, use_cache=use_cache, cache_ttl=cache_ttl, semantic_key=semantic_key
+        )
+        return result["content"]
 
     @classmethod
-    async def generate_extended(cls, prompt: str, preference: str = "auto") -> Dict[str, Any]:
+    async def generate_extended(
+        cls,
+        prompt: str,
+        preference: str = "auto",
+        use_cache: bool = True,
+        cache_ttl: Optional[float] = None,
+        semantic_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Generate content WITH metadata (citations, model used)
         Returns: {"content": str, "citations": List[str], "model": str}
         """
-        if not preference or preference.lower() == "auto":
-            return await cls.generate_smart(prompt, return_full=True)
+        return await cls._generate_cached(
+            prompt, preference, use_cache=use_cache, cache_ttl=cache_ttl, semantic_key=semantic_key
+        )
+    
+    @classmethod
+    async def _stream_gemini(cls, prompt: str, model: str) -> AsyncIterator[str]:
+        """Stream from Gemini on the best healthy key for the model"""
+        scheduler = cls.get_scheduler()
+        pair = await scheduler.acquire(model=model)
+        client = cls.get_gemini_client(pair.api_key)
+        logger.info(f"📤 Streaming with {pair.model} (key {client.key_hint})")
+        started = time.perf_counter()
+        outcome, retry_after = "abandoned", None
         
-        elif preference.lower() == "sonar-pro":
-            try:
-                return await cls.generate_with_perplexity(prompt, return_full=True)
-            except Exception as e:
-                raise Exception(f"Perplexity Sonar-Pro failed: {str(e)}")
+        try:
+            async for text in client.stream_generate(pair.model, prompt):
+                yield text
+            outcome = "ok"
+        except ResourceExhausted as e:
+            outcome = "rate_limited"
+            retry_after = parse_retry_after(getattr(e, "retry_after", None))
+            raise
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            if outcome == "abandoned":
+                scheduler.abandon(pair)
+            elif outcome == "rate_limited":
+                await scheduler.release(
+                    pair, success=False,
+                    retry_after=retry_after or settings.LLM_SCHEDULER_DEFAULT_COOLDOWN
+                )
+            else:
+                await scheduler.release(pair, latency=time.perf_counter() - started, success=outcome == "ok")
+    
+    @classmethod
+    async def stream_generate(
+        cls,
+        prompt: str,
+        preference: str = "auto",
+        use_cache: bool = True,
+        cache_ttl: Optional[float] = None,
+        semantic_key: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a generation as it is produced
+        Yields {"type": "token", "text": str} events, then one
+        {"type": "done", "content": str, "citations": List[str], "model": str}
+        
+        Falls back down the chain only while nothing has been streamed yet;
+        a provider failing mid-answer raises (the client already has tokens).
+        """
+        preference = (preference or "auto").lower()
+        if preference != "sonar-pro" and "gemini" not in preference:
+            preference = "auto"
         
-        elif "gemini" in preference.lower():
+        caching = use_cache and settings.LLM_CACHE_ENABLED
+        if caching:
+            cached = await response_cache.get(prompt, preference, semantic_key=semantic_key)
+            if cached is not None:
+                yield {"type": "token", "text": cached["content"]}
+                yield {"type": "done", **cached}
+                return
+        else:
+            response_cache.record_bypass()
+        
+        if preference == "sonar-pro":
+            chain = ["sonar-pro"]
+        elif "gemini" in preference:
+            chain = [preference if preference in cls.GEMINI_MODELS else "gemini-2.5-flash"]
+        else:
+            chain = list(cls.GEMINI_MODELS)
+            if settings.PERPLEXITY_API_KEY:
+                chain.append("sonar-pro")
+        
+        last_error: Optional[Exception] = None
+        for model in chain:
+            started = time.perf_counter()
+            parts: List[str] = []
+            citations: List[str] = []
+            
             try:
-                model_name = preference if preference in cls.GEMINI_MODELS else "gemini-2.5-flash"
-                content = await cls.generate_with_gemini(prompt, model=model_name)
-                return {
-                    "content": content,
-                    "citations": [],
-                    "model": model_name
-                }
+                if model == "sonar-pro":
+                    if not settings.PERPLEXITY_API_KEY:
+                        raise ValueError("PERPLEXITY_API_KEY not configured")
+                    async for chunk in cls.get_perplexity_client().stream_chat(prompt, model="sonar-pro"):
+                        if chunk.get("content"):
+                            parts.append(chunk["content"])
+                            yield {"type": "token", "text": chunk["content"]}
+                        citations = chunk.get("citations", citations)
+                else:
+                    async for text in cls._stream_gemini(prompt, model):
+                        parts.append(text)
+                        yield {"type": "token", "text": text}
+            
             except Exception as e:
-                raise Exception(f"{model_name} failed: {str(e)}")
+                if parts:
+                    logger.error(f"❌ {model} failed mid-stream: {e}")
+                    raise
+                logger.warning(f"{model} stream failed before first token: {e}")
+                last_error = e
+                continue
+            
+            if not parts:
+                logger.warning(f"{model} streamed no content")
+                last_error = ValueError(f"{model} returned empty content")
+                continue
+            
+            result = {"content": "".join(parts).strip(), "citations": citations, "model": model}
+            if caching:
+                await response_cache.put(
+                    prompt, preference, result,
+                    latency=time.perf_counter() - started,
+                    ttl=cache_ttl,
+                    semantic_key=semantic_key
+                )
+            logger.success(f"✅ Streamed with {model}")
+            yield {"type": "done", **result}
+            return
         
-        else:
-            return await cls.generate_smart(prompt, return_full=True)
+        raise Exception(f"All models failed. Last error: {last_error}")
     
     @classmethod
     async def get_embedding(cls, text: str) -> List[float]:
         """
         Get text embedding using Gemini's embedding model
         """
-        max_retries = 3
-        retry_count = 0
-        
-        while retry_count < max_retries:
-            try:
-                api_key = cls.get_next_gemini_key()
-                if not api_key:
-                    raise ValueError("No Gemini API keys configured")
-                
-                genai.configure(api_key=api_key)
-                
-                # Using text-embedding-004 (latest Gemini embedding model)
-                # Note: Don't use "models/" prefix for embed_content
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None,
-                    partial(
-                        genai.embed_content,
-                        model="models/gemini-embedding-001",
-                        content=text,
-                        task_type="retrieval_document"
-                    )
-                )
-                
-                return result['embedding']
-                
-            except Exception as e:
-                logger.error(f"❌ Embedding error (attempt {retry_count + 1}): {str(e)}")
-                retry_count += 1
-                await asyncio.sleep(1)
+        async def call(client: GeminiClient, model: str) -> List[float]:
+            return await client.embed(
+                text,
+                model=f"models/{model}",
+                task_type="retrieval_document"
+            )
         
-        raise Exception("Failed to get embedding after retries")
+        try:
+            return await cls._call_gemini(cls.EMBEDDING_MODEL, call)
+        except Exception as e:
+            logger.error(f"❌ Embedding error: {str(e)}")
+            raise Exception(f"Failed to get embedding: {e}")
 
     @classmethod
-    def reset_all_models(cls):
+    async def reset_all_models(cls):
         """Reset all model statuses"""
-        for model in cls.GEMINI_MODELS:
-            cls.mark_model_available(model)
+        await cls.get_scheduler().reset()
         logger.info("🔄 All models reset to available")
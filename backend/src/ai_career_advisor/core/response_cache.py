@@ -0,0 +1,238 @@
+"""
+Semantic LLM Response Cache
+Two-tier cache in front of ModelManager.generate_smart / generate_extended
+
+Tier 1: exact match on (normalized prompt, model preference) - LRU with TTL
+Tier 2: embedding similarity on a caller-supplied semantic key (e.g. the
+        user's question), only among prompts built from the same template,
+        so "how to become data scientist" and "how do i become a data
+        scientist" can share one answer. Not for short entity names:
+        "Data Scientist" and "Data Analyst" embed close enough to collide
+"""
+
+import re
+import time
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+import numpy as np
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+class ResponseCache:
+    """
+    Stores the {"content", "citations", "model"} triple returned by ModelManager
+
+    Usage:
+        hit = await response_cache.get(prompt, "auto", semantic_key="data scientist")
+        if hit is None:
+            result = await produce()
+            await response_cache.put(prompt, "auto", result, latency=1.8, ttl=86400,
+                                     semantic_key="data scientist")
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        default_ttl: float = 6 * 3600,
+        similarity_threshold: float = 0.92
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.similarity_threshold = similarity_threshold
+
+        # exact key -> entry (ordered oldest -> most recently used)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # semantic group -> {exact key: unit-norm float32 vector}
+        self._semantic: Dict[str, Dict[str, np.ndarray]] = {}
+        # requesting prompt's exact key -> key of the entry a semantic hit served it,
+        # so invalidate(prompt) also drops an entry stored under another prompt
+        self._served: "OrderedDict[str, str]" = OrderedDict()
+
+        self.stats = {
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "stores": 0,
+            "evictions": 0,
+            "latency_saved_seconds": 0.0
+        }
+
+    # ================== KEYS ==================
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase and collapse whitespace so trivially different prompts share a key"""
+        return re.sub(r"\s+", " ", (text or "").lower()).strip()
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _exact_key(self, prompt: str, preference: str) -> str:
+        return self._hash(f"{(preference or 'auto').lower()}|{self.normalize(prompt)}")
+
+    def _semantic_group(self, prompt: str, preference: str, semantic_key: str) -> str:
+        """Prompts that differ only in their semantic key belong to the same group"""
+        template = self.normalize(prompt).replace(self.normalize(semantic_key), "")
+        return self._hash(f"{(preference or 'auto').lower()}|{template}")
+
+    @staticmethod
+    async def _embed(text: str) -> Optional[np.ndarray]:
+        """Embed a semantic key with the local EmbeddingService (None if unavailable)"""
+        try:
+            from ai_career_advisor.rag.embeddings import EmbeddingService
+            vector = np.asarray(
+                await EmbeddingService.generate_query_embedding(text),
+                dtype=np.float32
+            )
+            norm = np.linalg.norm(vector)
+            return vector / norm if norm > 0 else None
+        except Exception as e:
+            logger.debug(f"Semantic cache embedding unavailable: {e}")
+            return None
+
+    # ================== LOOKUP / STORE ==================
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry and entry.get("group"):
+            group = self._semantic.get(entry["group"], {})
+            group.pop(key, None)
+            if not group:
+                self._semantic.pop(entry["group"], None)
+
+    def _live_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry["expires_at"] < time.time():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _hit(self, entry: Dict[str, Any], tier: str) -> Dict[str, Any]:
+        self.stats[f"{tier}_hits"] += 1
+        self.stats["latency_saved_seconds"] += entry["latency"]
+        entry["hits"] += 1
+        return dict(entry["result"], citations=list(entry["result"].get("citations", [])))
+
+    async def get(
+        self,
+        prompt: str,
+        preference: str = "auto",
+        semantic_key: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a cached result; returns a copy of the stored triple or None"""
+        key = self._exact_key(prompt, preference)
+        entry = self._live_entry(key)
+        if entry is not None:
+            logger.info("⚡ LLM cache hit (exact)")
+            return self._hit(entry, "exact")
+
+        if semantic_key:
+            group = self._semantic.get(self._semantic_group(prompt, preference, semantic_key))
+            if group:
+                query_vector = await self._embed(semantic_key)
+                if query_vector is not None:
+                    keys = list(group.keys())
+                    scores = np.stack([group[k] for k in keys]) @ query_vector
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.similarity_threshold:
+                        entry = self._live_entry(keys[best])
+                        if entry is not None:
+                            logger.info(f"⚡ LLM cache hit (semantic, similarity {scores[best]:.3f})")
+                            self._served[key] = keys[best]
+                            self._served.move_to_end(key)
+                            while len(self._served) > self.max_entries:
+                                self._served.popitem(last=False)
+                            return self._hit(entry, "semantic")
+
+        self.stats["misses"] += 1
+        return None
+
+    async def put(
+        self,
+        prompt: str,
+        preference: str,
+        result: Dict[str, Any],
+        latency: float = 0.0,
+        ttl: Optional[float] = None,
+        semantic_key: Optional[str] = None
+    ):
+        """Store a generation result"""
+        if not result or not result.get("content"):
+            return
+
+        key = self._exact_key(prompt, preference)
+        self._remove(key)
+
+        group = None
+        if semantic_key:
+            vector = await self._embed(semantic_key)
+            if vector is not None:
+                group = self._semantic_group(prompt, preference, semantic_key)
+                self._semantic.setdefault(group, {})[key] = vector
+
+        self._entries[key] = {
+            "result": {
+                "content": result.get("content", ""),
+                "citations": list(result.get("citations", [])),
+                "model": result.get("model")
+            },
+            "expires_at": time.time() + (ttl if ttl is not None else self.default_ttl),
+            "latency": latency,
+            "group": group,
+            "hits": 0
+        }
+        self.stats["stores"] += 1
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, prompt: str, preference: str = "auto"):
+        """
+        Drop a cached result (e.g. when the caller could not parse it),
+        including the entry a semantic hit served for this prompt
+        """
+        key = self._exact_key(prompt, preference)
+        self._remove(key)
+        served = self._served.pop(key, None)
+        if served is not None:
+            self._remove(served)
+
+    def record_bypass(self):
+        self.stats["bypassed"] += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._semantic.clear()
+        self._served.clear()
+        logger.info("🧹 LLM response cache cleared")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Counters for the admin dashboard"""
+        hits = self.stats["exact_hits"] + self.stats["semantic_hits"]
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "latency_saved_seconds": round(self.stats["latency_saved_seconds"], 2),
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "semantic_groups": len(self._semantic),
+            "max_entries": self.max_entries,
+            "similarity_threshold": self.similarity_threshold
+        }
+
+
+# Global instance
+response_cache = ResponseCache(
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    default_ttl=settings.LLM_CACHE_TTL_SECONDS,
+    similarity_threshold=settings.LLM_CACHE_SIMILARITY_THRESHOLD
+)
@@ -34,11 +34,40 @@ async def lifespan(app: FastAPI):
                 logger.info("✅ share_token column added successfully")
             else:
                 logger.info("✅ share_token column already exists")
+
+            # Cached profile embedding columns on user_preferences
+            if "postgresql" in DATABASE_URL or "postgres" in DATABASE_URL:
+                result = await conn.execute(text(
+                    "SELECT column_name FROM information_schema.columns "
+                    "WHERE table_name = 'user_preferences'"
+                ))
+                pref_columns = {row[0] for row in result.fetchall()}
+            else:
+                result = await conn.execute(text("PRAGMA table_info(user_preferences)"))
+                pref_columns = {col[1] for col in result.fetchall()}
+
+            if pref_columns:
+                for column, column_type in [
+                    ("profile_vector", "JSON"),
+                    ("profile_vector_hash", "VARCHAR(64)"),
+                    ("profile_vector_model", "VARCHAR(100)")
+                ]:
+                    if column not in pref_columns:
+                        logger.info(f"🔧 Adding missing '{column}' column to user_preferences table...")
+                        await conn.execute(text(f"ALTER TABLE user_preferences ADD COLUMN {column} {column_type}"))
     except Exception as e:
         logger.warning(f"⚠️ Auto-migration check failed (non-fatal): {e}")
 
     yield  # App runs here
 
+    # Flush queued chatbot writes (conversation rows, RAG saves)
+    from ai_career_advisor.services.write_behind import write_behind
+    await write_behind.drain()
+
+    # Close pooled outbound HTTP connections
+    from ai_career_advisor.core.http_client import http_clients
+    await http_clients.aclose()
+
 
 app = FastAPI(
     title="AI Career Pilot API",
@@ -2,17 +2,32 @@
 ML Models Package
 
 This package contains machine learning models for:
-- Intent Classification (BERT-based)
+- Intent Classification (BERT-based, PyTorch or ONNX Runtime)
 - Recommendation System
 - Custom NER (future)
+
+IntentClassifier is imported lazily so the ONNX backend never imports torch.
 """
 
-from ai_career_advisor.ml_models.intent_classifier import (
-    IntentClassifier,
-    get_intent_classifier
+from ai_career_advisor.ml_models.intent_loader import (
+    get_intent_classifier,
+    get_intent_batcher
 )
 
+
+def __getattr__(name):
+    if name == "IntentClassifier":
+        from ai_career_advisor.ml_models.intent_classifier import IntentClassifier
+        return IntentClassifier
+    if name == "OnnxIntentClassifier":
+        from ai_career_advisor.ml_models.onnx_intent_classifier import OnnxIntentClassifier
+        return OnnxIntentClassifier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'IntentClassifier',
-    'get_intent_classifier'
+    'OnnxIntentClassifier',
+    'get_intent_classifier',
+    'get_intent_batcher'
 ]
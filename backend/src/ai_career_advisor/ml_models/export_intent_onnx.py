@@ -0,0 +1,148 @@
+"""
+Export Script: Intent Classifier -> ONNX (+ dynamic INT8)
+
+HOW TO RUN THIS SCRIPT:
+==========================
+cd backend
+python -m ai_career_advisor.ml_models.export_intent_onnx
+
+WHAT THIS SCRIPT DOES:
+=========================
+1. Loads the trained DistilBERT model from models/intent_classifier
+2. Exports it to ONNX with dynamic batch + sequence axes (model.onnx)
+3. Quantizes Linear weights to INT8 with onnxruntime (model.int8.onnx)
+4. Copies vocab/tokenizer files and label_mapping.json next to the graphs
+5. Sanity-checks that both graphs agree with PyTorch on a few queries
+
+Output goes to models/intent_classifier_onnx, which get_intent_classifier()
+picks up automatically (INTENT_MODEL_BACKEND=auto).
+
+INTERVIEW KEY POINTS:
+========================
+- ONNX = framework-independent graph format, served by onnxruntime
+- Dynamic quantization = weights stored as INT8, activations quantized on the fly
+- No calibration data needed (unlike static quantization)
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import numpy as np
+import torch
+from onnxruntime.quantization import quantize_dynamic, QuantType
+
+from ai_career_advisor.ml_models.intent_classifier import IntentClassifier
+from ai_career_advisor.ml_models.intent_loader import TORCH_MODEL_DIR, ONNX_MODEL_DIR
+from ai_career_advisor.ml_models.onnx_intent_classifier import (
+    OnnxIntentClassifier,
+    FP32_MODEL_FILE,
+    INT8_MODEL_FILE
+)
+
+
+SANITY_QUERIES = [
+    "hello",
+    "how to become a data scientist",
+    "best iit colleges in india",
+    "what is JEE exam pattern",
+    "what is the weather today",
+    "thanks bye"
+]
+
+
+def export_intent_onnx(
+    model_path: str = str(TORCH_MODEL_DIR),
+    output_dir: str = str(ONNX_MODEL_DIR),
+    quantize: bool = True,
+    opset: int = 17
+) -> Path:
+    """
+    Export a trained IntentClassifier to ONNX (and INT8) in output_dir
+
+    Returns the output directory
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    classifier = IntentClassifier(model_path=model_path, device="cpu")
+    classifier.model.eval()
+
+    # Example input only fixes the rank; batch and sequence stay dynamic
+    example = classifier.tokenizer(SANITY_QUERIES[:2], padding=True, return_tensors="pt")
+
+    fp32_path = output_dir / FP32_MODEL_FILE
+    print(f"[EXPORT] Writing {fp32_path}")
+    with torch.no_grad():
+        torch.onnx.export(
+            classifier.model,
+            (example["input_ids"], example["attention_mask"]),
+            str(fp32_path),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"}
+            },
+            opset_version=opset,
+            do_constant_folding=True,
+            dynamo=False
+        )
+
+    if quantize:
+        int8_path = output_dir / INT8_MODEL_FILE
+        print(f"[QUANTIZE] Writing {int8_path}")
+        quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+
+    # Tokenizer files + label mapping, so the ONNX dir is self-contained
+    classifier.tokenizer.save_pretrained(str(output_dir))
+    with open(output_dir / "label_mapping.json", "w", encoding="utf-8") as f:
+        json.dump({
+            "label2id": classifier.label2id,
+            "id2label": {str(k): v for k, v in classifier.id2label.items()}
+        }, f, indent=2)
+
+    # Sanity check against PyTorch
+    reference = classifier.predict_batch(SANITY_QUERIES)
+    for quantized in ([False, True] if quantize else [False]):
+        onnx_classifier = OnnxIntentClassifier(str(output_dir), quantized=quantized)
+        predictions = onnx_classifier.predict_batch(SANITY_QUERIES)
+        agreement = np.mean([p[0] == r[0] for p, r in zip(predictions, reference)])
+        max_diff = max(abs(p[1] - r[1]) for p, r in zip(predictions, reference))
+        name = "INT8" if quantized else "FP32"
+        print(f"   {name}: label agreement {agreement:.0%}, max confidence diff {max_diff:.4f}")
+
+    for file in (FP32_MODEL_FILE, INT8_MODEL_FILE):
+        path = output_dir / file
+        if path.exists():
+            print(f"   {file}: {path.stat().st_size / 1e6:.1f} MB")
+
+    return output_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the intent classifier to ONNX")
+    parser.add_argument("--model-path", default=str(TORCH_MODEL_DIR))
+    parser.add_argument("--output-dir", default=str(ONNX_MODEL_DIR))
+    parser.add_argument("--no-quantize", action="store_true", help="Only write the FP32 graph")
+    parser.add_argument("--opset", type=int, default=17)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("[START] Intent Classifier ONNX Export")
+    print("=" * 60)
+
+    output_dir = export_intent_onnx(args.model_path, args.output_dir, not args.no_quantize, args.opset)
+
+    print("\n" + "=" * 60)
+    print(f"[DONE] ONNX model saved to: {output_dir}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -141,8 +141,9 @@ class IntentClassifier:
         }
         self.id2label = {v: k for k, v in self.label2id.items()}
         
-        # Load tokenizer
-        self.tokenizer = DistilBertTokenizer.from_pretrained('distilbert-base-uncased')
+        # Load tokenizer (from the saved model dir when present, so no download is needed)
+        has_vocab = model_path and os.path.exists(os.path.join(model_path, 'vocab.txt'))
+        self.tokenizer = DistilBertTokenizer.from_pretrained(model_path if has_vocab else 'distilbert-base-uncased')
         
         # Load model
         if model_path and os.path.exists(model_path):
@@ -318,39 +319,47 @@ class IntentClassifier:
         Returns:
             Tuple of (intent_label, confidence_score)
         """
+        return self.predict_batch([text])[0]
+    
+    def predict_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """
+        Predict intents for multiple texts in ONE forward pass
+        
+        📚 STUDY NOTE - Dynamic Padding:
+        - Texts are padded to the longest text in the batch, not to 64
+        - "hi" alone is 3 tokens instead of 64 -> far less wasted compute
+        - Truncation still caps every text at 64 tokens
+        """
+        if not texts:
+            return []
+        
         self.model.eval()
         
-        # Tokenize input
+        # Tokenize with dynamic padding
         encoding = self.tokenizer(
-            text,
+            texts,
             max_length=64,
-            padding='max_length',
+            padding='longest',
             truncation=True,
             return_tensors='pt'
         )
         
-        # Move to device
         input_ids = encoding['input_ids'].to(self.device)
         attention_mask = encoding['attention_mask'].to(self.device)
         
-        # Get prediction
         with torch.no_grad():
             outputs = self.model(input_ids=input_ids, attention_mask=attention_mask)
             
             # Apply softmax to get probabilities
             probabilities = torch.softmax(outputs.logits, dim=1)
             
-            # Get highest probability and its index
-            confidence, predicted_id = torch.max(probabilities, dim=1)
-            
-            intent = self.id2label[predicted_id.item()]
-            confidence_score = confidence.item()
+            # Get highest probability and its index for every row
+            confidences, predicted_ids = torch.max(probabilities, dim=1)
         
-        return intent, confidence_score
-    
-    def predict_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
-        """Predict intents for multiple texts"""
-        return [self.predict(text) for text in texts]
+        return [
+            (self.id2label[predicted_id], confidence)
+            for predicted_id, confidence in zip(predicted_ids.tolist(), confidences.tolist())
+        ]
     
     def get_detailed_prediction(self, text: str) -> Dict[str, Any]:
         """
@@ -363,7 +372,6 @@ class IntentClassifier:
         encoding = self.tokenizer(
             text,
             max_length=64,
-            padding='max_length',
             truncation=True,
             return_tensors='pt'
         )
@@ -412,31 +420,5 @@ class IntentClassifier:
         return cls(model_path=path)
 
 
-# Singleton instance for the application
-_classifier_instance: Optional[IntentClassifier] = None
-
-
-def get_intent_classifier() -> IntentClassifier:
-    """
-    Get or create the intent classifier instance
-    
-    📚 STUDY NOTE - Singleton Pattern:
-    - Only one instance of the model is created
-    - Model is loaded into memory once at startup
-    - All requests use the same instance
-    - This saves memory and loading time
-    """
-    global _classifier_instance
-    
-    if _classifier_instance is None:
-        # Check for trained model
-        model_path = Path(__file__).parent.parent.parent.parent / "models" / "intent_classifier"
-        
-        if model_path.exists():
-            logger.info("Loading trained intent classifier")
-            _classifier_instance = IntentClassifier(model_path=str(model_path))
-        else:
-            logger.warning("No trained model found. Using base model (will need training)")
-            _classifier_instance = IntentClassifier()
-    
-    return _classifier_instance
+# Singletons now live in intent_loader (torch-free, picks the ONNX or PyTorch backend)
+from ai_career_advisor.ml_models.intent_loader import get_intent_classifier, get_intent_batcher  # noqa: E402,F401
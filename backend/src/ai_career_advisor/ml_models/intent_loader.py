@@ -0,0 +1,124 @@
+"""
+Intent Classifier Loader
+
+Picks the inference backend and owns the application-wide singletons:
+- "onnx":  OnnxIntentClassifier (onnxruntime, INT8 by default, no torch import)
+- "torch": IntentClassifier (PyTorch DistilBERT)
+- "auto":  ONNX when an export exists, otherwise PyTorch
+
+This module must stay free of torch/transformers imports so the ONNX
+path never pays for them.
+"""
+
+from pathlib import Path
+from typing import Any, Optional
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+from ai_career_advisor.core.micro_batcher import MicroBatcher
+
+
+MODELS_DIR = Path(__file__).parent.parent.parent.parent / "models"
+TORCH_MODEL_DIR = MODELS_DIR / "intent_classifier"
+ONNX_MODEL_DIR = MODELS_DIR / "intent_classifier_onnx"
+
+# Git LFS pointer files are ~130 bytes; real weights are hundreds of MB
+_MIN_WEIGHTS_BYTES = 1024
+
+
+def has_trained_weights(model_dir: Path = TORCH_MODEL_DIR) -> bool:
+    """True if the PyTorch model dir holds real weights (not a missing/LFS pointer file)"""
+    for name in ("model.safetensors", "pytorch_model.bin"):
+        path = Path(model_dir) / name
+        if path.exists() and path.stat().st_size > _MIN_WEIGHTS_BYTES:
+            return True
+    return False
+
+
+def has_onnx_export(model_dir: Path = ONNX_MODEL_DIR) -> bool:
+    """True if an ONNX export (matching INTENT_ONNX_QUANTIZED) is on disk and onnxruntime is installed"""
+    from ai_career_advisor.ml_models.onnx_intent_classifier import FP32_MODEL_FILE, INT8_MODEL_FILE
+
+    model_file = INT8_MODEL_FILE if settings.INTENT_ONNX_QUANTIZED else FP32_MODEL_FILE
+    if not (Path(model_dir) / model_file).exists():
+        return False
+    try:
+        import onnxruntime  # noqa: F401
+        return True
+    except ImportError:
+        logger.warning("ONNX intent model found but onnxruntime is not installed")
+        return False
+
+
+def resolve_backend() -> Optional[str]:
+    """Backend that get_intent_classifier() will use, or None if no trained model exists"""
+    backend = settings.INTENT_MODEL_BACKEND.lower()
+
+    if backend in ("onnx", "auto") and has_onnx_export():
+        return "onnx"
+    if backend in ("torch", "auto") and has_trained_weights():
+        return "torch"
+    return None
+
+
+# Singleton instances for the application
+_classifier_instance: Optional[Any] = None
+_batcher_instance: Optional[MicroBatcher] = None
+
+
+def get_intent_classifier() -> Any:
+    """
+    Get or create the intent classifier instance
+
+    📚 STUDY NOTE - Singleton Pattern:
+    - Only one instance of the model is created
+    - Model is loaded into memory once at startup
+    - All requests use the same instance
+    - This saves memory and loading time
+    """
+    global _classifier_instance
+
+    if _classifier_instance is None:
+        backend = resolve_backend()
+
+        if backend == "onnx":
+            from ai_career_advisor.ml_models.onnx_intent_classifier import OnnxIntentClassifier
+            logger.info("Loading ONNX intent classifier")
+            _classifier_instance = OnnxIntentClassifier(
+                str(ONNX_MODEL_DIR), quantized=settings.INTENT_ONNX_QUANTIZED
+            )
+        else:
+            from ai_career_advisor.ml_models.intent_classifier import IntentClassifier
+            if backend == "torch":
+                logger.info("Loading trained intent classifier")
+                _classifier_instance = IntentClassifier(model_path=str(TORCH_MODEL_DIR))
+            else:
+                logger.warning("No trained model found. Using base model (will need training)")
+                _classifier_instance = IntentClassifier()
+
+    return _classifier_instance
+
+
+def get_intent_batcher() -> MicroBatcher:
+    """
+    Get or create the micro-batcher around the singleton classifier
+
+    📚 STUDY NOTE - Micro-Batching:
+    - Concurrent requests are grouped into one forward pass
+    - A batch runs after INTENT_BATCH_MAX_WAIT_MS or INTENT_BATCH_MAX_SIZE items
+    - Usage: intent, confidence = await get_intent_batcher().submit(text)
+    """
+    global _batcher_instance
+
+    if _batcher_instance is None:
+        _batcher_instance = MicroBatcher(
+            get_intent_classifier().predict_batch,
+            max_batch_size=settings.INTENT_BATCH_MAX_SIZE,
+            max_wait_ms=settings.INTENT_BATCH_MAX_WAIT_MS,
+            name="intent-batcher"
+        )
+        logger.info(
+            f"Intent micro-batcher ready (batch {settings.INTENT_BATCH_MAX_SIZE}, "
+            f"wait {settings.INTENT_BATCH_MAX_WAIT_MS}ms)"
+        )
+
+    return _batcher_instance
@@ -0,0 +1,126 @@
+"""
+Intent Classifier served with ONNX Runtime (CPU)
+
+📚 STUDY NOTES - WHY ONNX + INT8?
+================================
+- The PyTorch path imports torch + transformers and keeps ~250MB of FP32
+  weights resident in EVERY gunicorn worker
+- The exported graph is run by onnxruntime: no torch import at all
+- Dynamic INT8 quantization stores Linear weights as 8-bit integers
+  -> ~4x smaller weights, faster matmuls on CPU, tiny accuracy loss
+- The tokenizer is the Rust `tokenizers` WordPiece tokenizer reading the
+  same vocab.txt, so token ids match the PyTorch path
+
+Export first:
+    python -m ai_career_advisor.ml_models.export_intent_onnx
+"""
+
+import json
+from pathlib import Path
+from typing import Tuple, List, Dict, Any, Optional
+import numpy as np
+import onnxruntime as ort
+from tokenizers import BertWordPieceTokenizer
+from ai_career_advisor.core.logger import logger
+
+
+FP32_MODEL_FILE = "model.onnx"
+INT8_MODEL_FILE = "model.int8.onnx"
+
+
+class OnnxIntentClassifier:
+    """
+    Drop-in replacement for IntentClassifier inference
+    (predict / predict_batch / get_detailed_prediction)
+    """
+
+    def __init__(
+        self,
+        model_dir: str,
+        quantized: bool = True,
+        num_threads: Optional[int] = None,
+        max_length: int = 64
+    ):
+        model_dir = Path(model_dir)
+        model_file = model_dir / (INT8_MODEL_FILE if quantized else FP32_MODEL_FILE)
+        if not model_file.exists():
+            raise FileNotFoundError(f"ONNX intent model not found: {model_file}")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.session = ort.InferenceSession(
+            str(model_file), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        # Label mapping written by the exporter (same format as the torch model dir)
+        with open(model_dir / "label_mapping.json", encoding="utf-8") as f:
+            mapping = json.load(f)
+        self.label2id = mapping["label2id"]
+        self.id2label = {int(k): v for k, v in mapping["id2label"].items()}
+        self.num_labels = len(self.id2label)
+
+        lowercase = True
+        config_path = model_dir / "tokenizer_config.json"
+        if config_path.exists():
+            with open(config_path, encoding="utf-8") as f:
+                lowercase = json.load(f).get("do_lower_case", True)
+
+        # Pad to the longest text in each batch (dynamic padding)
+        self.tokenizer = BertWordPieceTokenizer(str(model_dir / "vocab.txt"), lowercase=lowercase)
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding(pad_id=0, pad_token="[PAD]")
+
+        logger.info(f"Loaded ONNX intent classifier from {model_file.name} ({self.num_labels} labels)")
+
+    def _probabilities(self, texts: List[str]) -> np.ndarray:
+        """Tokenize, run one forward pass and return softmax probabilities"""
+        encodings = self.tokenizer.encode_batch(texts)
+        feed = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        }
+        feed = {name: value for name, value in feed.items() if name in self.input_names}
+
+        logits = self.session.run(["logits"], feed)[0]
+
+        # Numerically stable softmax
+        logits = logits - logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """Predict intent for a single text"""
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """Predict intents for multiple texts in ONE forward pass"""
+        if not texts:
+            return []
+
+        probabilities = self._probabilities(texts)
+        predicted_ids = probabilities.argmax(axis=1)
+
+        return [
+            (self.id2label[int(i)], float(probabilities[row, i]))
+            for row, i in enumerate(predicted_ids)
+        ]
+
+    def get_detailed_prediction(self, text: str) -> Dict[str, Any]:
+        """Prediction with all class probabilities"""
+        probabilities = self._probabilities([text])[0]
+
+        all_probs = {self.id2label[i]: float(prob) for i, prob in enumerate(probabilities)}
+        sorted_probs = dict(sorted(all_probs.items(), key=lambda x: x[1], reverse=True))
+
+        top_intent = next(iter(sorted_probs))
+
+        return {
+            "text": text,
+            "predicted_intent": top_intent,
+            "confidence": sorted_probs[top_intent],
+            "all_probabilities": sorted_probs
+        }
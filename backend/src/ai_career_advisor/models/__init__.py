@@ -20,6 +20,7 @@ from .chatconversation import ChatConversation
 from .user_preferences import UserPreferences
 from .career_attributes import CareerAttributes
 from .user_career_interaction import UserCareerInteraction
+from .user_recommendation import UserRecommendation
 
 
 
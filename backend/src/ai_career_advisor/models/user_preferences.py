@@ -54,6 +54,11 @@ class UserPreferences(Base):
     budget_constraint: Mapped[Optional[str]] = mapped_column(String(50))  # Education budget
     time_commitment: Mapped[Optional[str]] = mapped_column(String(50))  # "full_time", "part_time"
     
+    # Cached profile embedding (recomputed only when the profile text changes)
+    profile_vector: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    profile_vector_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)  # sha256 of profile text
+    profile_vector_model: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # "gemini:gemini-embedding-001"
+    
     # Quiz completion tracking
     quiz_completed: Mapped[bool] = mapped_column(default=False)
     quiz_completion_percentage: Mapped[int] = mapped_column(default=0)
@@ -0,0 +1,41 @@
+"""
+User Recommendations Model
+Materialized top-K recommendations written by the batch precompute job
+"""
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, DateTime, JSON, func
+from ai_career_advisor.core.database import Base
+from typing import Optional
+import uuid
+
+
+class UserRecommendation(Base):
+    """
+    One row per user: the scored recommendations plus what they were computed from.
+    
+    The online endpoint serves `recommendations` only while the row is fresh:
+    - generated_at is within RECOMMENDATION_PRECOMPUTE_TTL_MINUTES
+    - preferences_hash still matches the user's preferences
+    - career_signature still matches career_attributes
+    - interactions_key (count + latest timestamp) still matches the user's interactions
+    """
+    __tablename__ = "user_recommendations"
+    
+    id: Mapped[str] = mapped_column(
+        String(36), 
+        primary_key=True, 
+        default=lambda: str(uuid.uuid4())
+    )
+    
+    user_email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    
+    # Same dicts RecommendationService.get_recommendations returns, best first
+    recommendations: Mapped[list] = mapped_column(JSON, default=list)
+    top_k: Mapped[int] = mapped_column(Integer, nullable=False)
+    
+    # Freshness keys
+    preferences_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    career_signature: Mapped[Optional[str]] = mapped_column(String(100))
+    interactions_key: Mapped[Optional[str]] = mapped_column(String(64))
+    
+    generated_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,211 @@
+"""
+BM25 Inverted Index
+Lexical retriever over the same documents as a Chroma collection
+
+📚 STUDY NOTES - WHY BM25 NEXT TO EMBEDDINGS?
+============================================
+- MiniLM embeddings blur proper nouns: "IIT Bombay CSE fees" lands near
+  every engineering-college fees document, not the IIT Bombay one
+- BM25 scores exact term overlap, weighted by rarity (idf) and normalised
+  by document length, so rare names like "bombay" dominate the ranking
+- score(d, q) = sum over terms t in q of
+      idf(t) * tf(t, d) * (k1 + 1) / (tf(t, d) + k1 * (1 - b + b * |d| / avgdl))
+  with idf(t) = ln(1 + (N - df + 0.5) / (df + 0.5))
+- Stored as SQLite next to the collection's manifest: postings(term, doc_id, tf, |d|)
+  plus per-term df, so the indexer can add/remove documents incrementally
+- Terms in more than half the corpus ("fees", "tech" in every college
+  detail) have idf < ln 2 and barely move the ranking, but their postings
+  dominate query time, so on large corpora they are skipped when rarer
+  terms are present
+"""
+
+import json
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+from ai_career_advisor.rag.sqlite_utils import in_chunks
+
+
+STOPWORDS = frozenset("""
+a an and are as at be by do does for from how i in is it me my of on or the
+to what which who why with can should will about tell best top vs
+""".split())
+
+
+class BM25Index:
+    """
+    Usage:
+        index = BM25Index(persist_directory / "career_knowledge_bm25.sqlite")
+        index.add([{"id": ..., "content": ..., "metadata": {...}}])
+        hits = index.search("IIT Bombay CSE fees", top_k=20)
+    """
+
+    K1 = 1.2
+    B = 0.75
+    MAX_DF_RATIO = 0.5
+    PRUNE_MIN_DOCS = 10000
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS docs (
+                doc_id TEXT PRIMARY KEY,
+                length INTEGER NOT NULL,
+                content TEXT NOT NULL,
+                metadata TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                doc_id TEXT NOT NULL,
+                tf INTEGER NOT NULL,
+                doc_length INTEGER NOT NULL,
+                PRIMARY KEY (term, doc_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS ix_postings_doc ON postings (doc_id);
+            CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, df INTEGER NOT NULL) WITHOUT ROWID;
+        """)
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """Lowercased alphanumeric tokens ("B.Tech" -> b, tech), stopwords dropped"""
+        return [t for t in re.findall(r"[a-z0-9]+", (text or "").lower()) if t not in STOPWORDS]
+
+    # ================== WRITE ==================
+
+    def add(self, documents: List[Dict[str, Any]]):
+        """Insert or replace documents (id, content, metadata)"""
+        if not documents:
+            return
+        with self._lock:
+            self._remove([doc["id"] for doc in documents])
+            postings, df = [], Counter()
+            rows = []
+            for doc in documents:
+                tokens = self.tokenize(doc["content"])
+                rows.append((doc["id"], len(tokens), doc["content"], json.dumps(doc.get("metadata") or {}, default=str)))
+                for term, tf in Counter(tokens).items():
+                    postings.append((term, doc["id"], tf, len(tokens)))
+                    df[term] += 1
+            self.conn.executemany("INSERT INTO docs (doc_id, length, content, metadata) VALUES (?, ?, ?, ?)", rows)
+            self.conn.executemany("INSERT INTO postings (term, doc_id, tf, doc_length) VALUES (?, ?, ?, ?)", postings)
+            self.conn.executemany(
+                "INSERT INTO terms (term, df) VALUES (?, ?) ON CONFLICT(term) DO UPDATE SET df = df + excluded.df",
+                df.items()
+            )
+            self.conn.commit()
+
+    def remove(self, doc_ids: List[str]):
+        with self._lock:
+            self._remove(doc_ids)
+            self.conn.commit()
+
+    def _remove(self, doc_ids: List[str]):
+        for chunk, placeholders in in_chunks(doc_ids):
+            gone = self.conn.execute(
+                f"SELECT term, COUNT(*) FROM postings WHERE doc_id IN ({placeholders}) GROUP BY term", chunk
+            ).fetchall()
+            if not gone:
+                self.conn.execute(f"DELETE FROM docs WHERE doc_id IN ({placeholders})", chunk)
+                continue
+            self.conn.executemany("UPDATE terms SET df = df - ? WHERE term = ?", [(n, term) for term, n in gone])
+            self.conn.execute(f"DELETE FROM postings WHERE doc_id IN ({placeholders})", chunk)
+            self.conn.execute(f"DELETE FROM docs WHERE doc_id IN ({placeholders})", chunk)
+        self.conn.execute("DELETE FROM terms WHERE df <= 0")
+
+    # ================== READ ==================
+
+    def search(self, query: str, top_k: int = 20, sources: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Top documents by BM25 score: [{id, score, document, metadata}]
+
+        sources restricts the hits to documents whose metadata source is one
+        of them (idf stays corpus-wide, so scores are comparable either way)
+        """
+        terms = list(dict.fromkeys(self.tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            total_docs, total_length = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs").fetchone()
+            if not total_docs:
+                return []
+            avgdl = max(total_length / total_docs, 1e-9)
+
+            placeholders = ",".join("?" * len(terms))
+            df = self.conn.execute(f"SELECT term, df FROM terms WHERE term IN ({placeholders})", terms).fetchall()
+            selective = [
+                (term, n) for term, n in df
+                if total_docs < self.PRUNE_MIN_DOCS or n <= total_docs * self.MAX_DF_RATIO
+            ]
+            idf = [
+                (term, math.log(1 + (total_docs - n + 0.5) / (n + 0.5)))
+                for term, n in (selective or df)
+            ]
+            if not idf:
+                return []
+
+            # Scored inside SQLite: one pass over the query terms' postings
+            values = ",".join("(?, ?)" for _ in idf)
+            source_filter, source_params = "", []
+            if sources:
+                source_filter = (
+                    "JOIN docs d ON d.doc_id = p.doc_id "
+                    f"WHERE json_extract(d.metadata, '$.source') IN ({','.join('?' * len(sources))})"
+                )
+                source_params = list(sources)
+            ranked: List[Tuple[str, float]] = self.conn.execute(
+                f"""
+                WITH q(term, idf) AS (VALUES {values})
+                SELECT p.doc_id,
+                       SUM(q.idf * p.tf * ({self.K1} + 1)
+                           / (p.tf + {self.K1} * (1 - {self.B} + {self.B} * p.doc_length / ?))) AS score
+                FROM q JOIN postings p ON p.term = q.term
+                {source_filter}
+                GROUP BY p.doc_id
+                ORDER BY score DESC, p.doc_id
+                LIMIT ?
+                """,
+                [value for pair in idf for value in pair] + [avgdl] + source_params + [top_k]
+            ).fetchall()
+            docs = self._docs([doc_id for doc_id, _ in ranked])
+
+        return [
+            {"id": doc_id, "score": score, "document": docs[doc_id][0], "metadata": docs[doc_id][1]}
+            for doc_id, score in ranked
+        ]
+
+    def _docs(self, doc_ids: List[str]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        if not doc_ids:
+            return {}
+        placeholders = ",".join("?" * len(doc_ids))
+        return {
+            doc_id: (content, json.loads(metadata))
+            for doc_id, content, metadata in self.conn.execute(
+                f"SELECT doc_id, content, metadata FROM docs WHERE doc_id IN ({placeholders})", doc_ids
+            )
+        }
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            docs, length = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs").fetchone()
+            terms = self.conn.execute("SELECT COUNT(*) FROM terms").fetchone()[0]
+        return {
+            "documents": docs,
+            "terms": terms,
+            "avg_doc_length": round(length / docs, 1) if docs else 0.0
+        }
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,244 @@
+"""
+Knowledge Base Compaction
+Bounds the llm_generated corpus the chatbot grows by itself
+
+📚 STUDY NOTES - WHY COMPACT?
+============================
+- Every web-search fallback answer is saved back into the knowledge
+  collection under a random ID; popular questions are asked again and again,
+  so the collection fills up with near-identical answers and never shrinks
+- A compaction run only touches source=llm_generated documents:
+    1. TTL: answers older than RAG_COMPACTION_TTL_DAYS are evicted
+       (fees, cut-offs and dates go stale)
+    2. Near-duplicates: answers are ranked (upvoted > unrated > downvoted,
+       then newest first) and greedily clustered; an answer whose cosine
+       similarity to an already-kept one is >= RAG_COMPACTION_SIMILARITY is
+       evicted, so each cluster keeps its best-rated, freshest representative
+    3. Cap: if more than RAG_COMPACTION_MAX_DOCUMENTS survive, the
+       lowest-ranked ones are evicted
+- Ratings come from ChatConversation.upvoted, linked by (session_id, query)
+- Evictions are deleted from the collection AND its BM25 index
+- Collection size and p50 search latency (vector + BM25) are measured on
+  the same probe queries before and after, and kept in last_run
+"""
+
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Callable, Tuple
+import numpy as np
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+from ai_career_advisor.rag.indexer import KnowledgeIndexer, knowledge_indexer
+
+
+class KnowledgeCompactor:
+    """
+    Usage:
+        report = await knowledge_compactor.compact()
+        report = await knowledge_compactor.compact(dry_run=True)  # decide, don't delete
+    """
+
+    SOURCE = "llm_generated"
+    # Sessions per ChatConversation IN (...) query
+    SESSION_CHUNK = 500
+
+    def __init__(self, indexer: Optional[KnowledgeIndexer] = None, session_factory: Optional[Callable] = None):
+        self.indexer = indexer or knowledge_indexer
+        self._session_factory = session_factory
+        self._lock = asyncio.Lock()
+        self.last_run: Dict[str, Any] = {}
+
+    # ================== RATINGS ==================
+
+    async def _ratings(self, metadatas: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Optional[bool]]:
+        """(session_id, query) -> latest ChatConversation.upvoted for the saved answers"""
+        sessions = sorted({m["session_id"] for m in metadatas if m.get("session_id")})
+        if not sessions:
+            return {}
+
+        from sqlalchemy import select
+        from ai_career_advisor.models.chatconversation import ChatConversation
+        session_factory = self._session_factory
+        if session_factory is None:
+            from ai_career_advisor.core.database import AsyncSessionLocal
+            session_factory = AsyncSessionLocal
+
+        ratings: Dict[Tuple[str, str], Optional[bool]] = {}
+        try:
+            async with session_factory() as db:
+                for start in range(0, len(sessions), self.SESSION_CHUNK):
+                    rows = await db.execute(
+                        select(ChatConversation.sessionid, ChatConversation.userquery, ChatConversation.upvoted)
+                        .where(
+                            ChatConversation.sessionid.in_(sessions[start:start + self.SESSION_CHUNK]),
+                            ChatConversation.upvoted.is_not(None)
+                        )
+                        .order_by(ChatConversation.id)
+                    )
+                    for session_id, query, upvoted in rows:
+                        ratings[(session_id, query)] = upvoted
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load answer ratings, ranking by freshness only: {e}")
+        return ratings
+
+    # ================== SELECTION ==================
+
+    @staticmethod
+    def select_evictions(
+        ids: List[str],
+        embeddings: List[Optional[List[float]]],
+        timestamps: List[Optional[float]],
+        ratings: List[Optional[bool]],
+        now: float
+    ) -> Dict[str, List[str]]:
+        """
+        Decide which llm_generated documents to evict
+
+        Returns:
+            {"expired": [...], "duplicates": [...], "over_cap": [...]} document IDs
+        """
+        ttl = settings.RAG_COMPACTION_TTL_DAYS * 86400
+        threshold = settings.RAG_COMPACTION_SIMILARITY
+
+        expired, alive = [], []
+        for i, ts in enumerate(timestamps):
+            # Answers saved without a timestamp can't be aged, only deduplicated / capped
+            if ttl > 0 and ts is not None and now - ts > ttl:
+                expired.append(ids[i])
+            else:
+                alive.append(i)
+
+        # Best first: upvoted > unrated > downvoted, then newest
+        rank = {True: 1, None: 0, False: -1}
+        alive.sort(key=lambda i: (rank[ratings[i]], timestamps[i] or 0.0), reverse=True)
+
+        kept, duplicates = [], []
+        dim = next((len(e) for e in embeddings if e is not None and len(e)), 0)
+        representatives = np.zeros((len(alive), dim), dtype=np.float32)
+        n_representatives = 0
+        for i in alive:
+            vector = embeddings[i]
+            if vector is None or len(vector) != dim or not dim:
+                kept.append(i)
+                continue
+            vector = np.asarray(vector, dtype=np.float32)
+            vector = vector / max(float(np.linalg.norm(vector)), 1e-12)
+            if n_representatives and float((representatives[:n_representatives] @ vector).max()) >= threshold:
+                duplicates.append(ids[i])
+                continue
+            representatives[n_representatives] = vector
+            n_representatives += 1
+            kept.append(i)
+
+        cap = settings.RAG_COMPACTION_MAX_DOCUMENTS
+        over_cap = [ids[i] for i in kept[cap:]] if cap > 0 else []
+        return {"expired": expired, "duplicates": duplicates, "over_cap": over_cap}
+
+    # ================== LATENCY PROBE ==================
+
+    def _probe(self, collection, bm25, queries: List[str], vectors: np.ndarray) -> Dict[str, Any]:
+        """p50 search latency over the probe queries (same queries before and after)"""
+        store = self.indexer.vector_store
+        top_k = settings.RAG_HYBRID_CANDIDATES
+        vector_ms, bm25_ms = [], []
+        for query, vector in zip(queries, vectors):
+            started = time.perf_counter()
+            store.search(collection, vector.tolist(), top_k=top_k)
+            vector_ms.append(1000 * (time.perf_counter() - started))
+            started = time.perf_counter()
+            bm25.search(query, top_k=top_k)
+            bm25_ms.append(1000 * (time.perf_counter() - started))
+        return {
+            "vector_p50_ms": round(statistics.median(vector_ms), 2) if vector_ms else None,
+            "bm25_p50_ms": round(statistics.median(bm25_ms), 2) if bm25_ms else None
+        }
+
+    # ================== RUN ==================
+
+    async def compact(self, dry_run: bool = False) -> Dict[str, Any]:
+        """Evict expired, duplicate and over-cap llm_generated documents from the active collection"""
+        async with self._lock:
+            started = time.perf_counter()
+            store = self.indexer.vector_store
+            name = self.indexer.active_collection()
+            collection = store.get_or_create_collection(name)
+            bm25 = self.indexer.open_bm25(name)
+            loop = asyncio.get_running_loop()
+            try:
+                found = store.get_documents(collection, {"source": self.SOURCE})
+                ids, metadatas = list(found["ids"]), list(found["metadatas"])
+                embeddings = found["embeddings"] if found.get("embeddings") is not None else [None] * len(ids)
+                size_before = store.count(collection)
+
+                # Probe with the questions these answers were saved for
+                probes = list(dict.fromkeys(m.get("original_query") for m in metadatas if m.get("original_query")))
+                probes = probes[:settings.RAG_COMPACTION_PROBE_QUERIES]
+                latency_before = latency_after = {}
+                probe_vectors = None
+                if probes:
+                    try:
+                        probe_vectors = np.asarray(await self.indexer._embed(probes), dtype=np.float32)
+                        latency_before = self._probe(collection, bm25, probes, probe_vectors)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Latency probe failed: {e}")
+                        probe_vectors = None
+
+                ratings = await self._ratings(metadatas)
+                evictions = await loop.run_in_executor(
+                    None, self.select_evictions,
+                    ids,
+                    list(embeddings),
+                    [m.get("timestamp") for m in metadatas],
+                    [ratings.get((m.get("session_id"), m.get("original_query"))) for m in metadatas],
+                    time.time()
+                )
+                evicted = [doc_id for reason in evictions.values() for doc_id in reason]
+
+                if evicted and not dry_run:
+                    page = max(1, settings.RAG_INDEX_BATCH_SIZE)
+                    for start in range(0, len(evicted), page):
+                        store.delete_documents(collection, evicted[start:start + page])
+                    bm25.remove(evicted)
+
+                size_after = store.count(collection)
+                if probe_vectors is not None:
+                    latency_after = latency_before if dry_run else self._probe(collection, bm25, probes, probe_vectors)
+            finally:
+                bm25.close()
+
+            self.last_run = {
+                "collection": name,
+                "dry_run": dry_run,
+                "llm_documents": len(ids),
+                **{reason: len(doc_ids) for reason, doc_ids in evictions.items()},
+                "evicted": len(evicted),
+                "rated": sum(1 for m in metadatas if (m.get("session_id"), m.get("original_query")) in ratings),
+                "collection_size_before": size_before,
+                "collection_size_after": size_after,
+                "latency_before": latency_before,
+                "latency_after": latency_after,
+                "probe_queries": len(probes),
+                "duration_s": round(time.perf_counter() - started, 2),
+                "finished_at": datetime.now(timezone.utc).isoformat()
+            }
+            logger.success(
+                f"✅ Knowledge compaction{' (dry run)' if dry_run else ''}: {len(evicted)}/{len(ids)} llm_generated evicted "
+                f"({len(evictions['expired'])} expired, {len(evictions['duplicates'])} duplicates, "
+                f"{len(evictions['over_cap'])} over cap), collection {size_before} -> {size_after}, "
+                f"vector p50 {latency_before.get('vector_p50_ms')} -> {latency_after.get('vector_p50_ms')} ms"
+            )
+            return self.last_run
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "last_run": self.last_run,
+            "ttl_days": settings.RAG_COMPACTION_TTL_DAYS,
+            "max_documents": settings.RAG_COMPACTION_MAX_DOCUMENTS,
+            "similarity": settings.RAG_COMPACTION_SIMILARITY
+        }
+
+
+# Global instance
+knowledge_compactor = KnowledgeCompactor()
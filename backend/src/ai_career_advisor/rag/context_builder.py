@@ -0,0 +1,233 @@
+"""
+RAG Context Builder
+Turns ranked search hits into the context block of an LLM prompt
+
+📚 STUDY NOTES - WHY NOT JUST "TOP HITS UNTIL 2000 CHARS"?
+=========================================================
+- The chatbot saves every LLM answer back into the knowledge base, so a
+  popular question returns 3-4 near-identical llm_generated answers that
+  eat the whole budget and crowd out the college / exam facts
+- Near-duplicates: cosine similarity of the stored embeddings above
+  RAG_CONTEXT_DEDUP_SIMILARITY -> only the best-ranked copy is kept
+- Maximal Marginal Relevance picks the next document by
+      lambda * relevance(d) - (1 - lambda) * max_similarity(d, already picked)
+  so every added document brings something new
+- The budget is in TOKENS of the target model (what the provider bills
+  and truncates on), not characters
+"""
+
+import hashlib
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+class TokenCounter:
+    """
+    Per target model token counts
+
+    A Hugging Face `tokenizers` file (tokenizer.json path or hub repo id)
+    configured in RAG_CONTEXT_TOKENIZERS gives exact counts; otherwise a
+    conservative chars-per-token estimate is used
+    """
+
+    CHARS_PER_TOKEN = 3.5
+    _tokenizers: Dict[str, Any] = {}
+
+    @classmethod
+    def _get(cls, model: str):
+        if model not in cls._tokenizers:
+            source = settings.RAG_CONTEXT_TOKENIZERS.get(model, "")
+            tokenizer = None
+            if source:
+                try:
+                    from tokenizers import Tokenizer
+                    tokenizer = Tokenizer.from_file(source) if source.endswith(".json") else Tokenizer.from_pretrained(source)
+                    logger.info(f"🔤 Loaded {model} tokenizer from {source}")
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not load {model} tokenizer ({source}): {e}, estimating tokens")
+            cls._tokenizers[model] = tokenizer
+        return cls._tokenizers[model]
+
+    @classmethod
+    def exact(cls, model: str) -> bool:
+        return cls._get(model) is not None
+
+    @classmethod
+    def count(cls, text: str, model: str = "default") -> int:
+        if not text:
+            return 0
+        tokenizer = cls._get(model)
+        if tokenizer is not None:
+            return len(tokenizer.encode(text, add_special_tokens=False).ids)
+        return int(len(text) / cls.CHARS_PER_TOKEN) + 1
+
+    @classmethod
+    def count_many(cls, texts: List[str], model: str = "default") -> List[int]:
+        tokenizer = cls._get(model)
+        if tokenizer is not None and texts:
+            return [len(enc.ids) for enc in tokenizer.encode_batch(texts, add_special_tokens=False)]
+        return [cls.count(text, model) for text in texts]
+
+
+class ContextBuilder:
+    """
+    Usage:
+        context = context_builder.build(search_results, target_model="perplexity")
+    """
+
+    SEPARATOR = "\n\n"
+    # What the old builder allowed: score order, 2000 characters
+    LEGACY_MAX_CHARS = 2000
+
+    def __init__(self):
+        self.stats = {
+            "requests": 0,
+            "documents_in": 0,
+            "documents_used": 0,
+            "duplicates_dropped": 0,
+            "over_budget_dropped": 0,
+            "context_tokens": 0,
+            "legacy_tokens": 0
+        }
+
+    @staticmethod
+    def budget(target_model: str) -> int:
+        budgets = settings.RAG_CONTEXT_TOKEN_BUDGETS
+        return budgets.get(target_model, budgets.get("default", 500))
+
+    @staticmethod
+    def _format(doc: str, metadata: Dict[str, Any]) -> str:
+        return f"[Source: {metadata.get('source', 'unknown')}] {doc}"
+
+    @staticmethod
+    def _similarity_matrix(embeddings: List[Optional[List[float]]]) -> np.ndarray:
+        """Cosine similarity between hits; 0 where a hit has no stored embedding"""
+        n = len(embeddings)
+        present = [i for i, e in enumerate(embeddings) if e is not None and len(e)]
+        sims = np.zeros((n, n), dtype=np.float32)
+        if len(present) > 1:
+            vectors = np.asarray([embeddings[i] for i in present], dtype=np.float32)
+            vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+            sims[np.ix_(present, present)] = vectors @ vectors.T
+        return sims
+
+    def legacy_context(self, search_results: Dict[str, Any]) -> str:
+        """The pre-MMR context (score order, character cap), kept as the savings baseline"""
+        parts, length = [], 0
+        for doc, metadata, score in zip(search_results["documents"], search_results["metadatas"], search_results["scores"]):
+            if score < settings.RAG_CONTEXT_MIN_SCORE:
+                continue
+            text = self._format(doc, metadata)
+            if length + len(text) > self.LEGACY_MAX_CHARS:
+                break
+            parts.append(text)
+            length += len(text)
+        return self.SEPARATOR.join(parts)
+
+    def select(
+        self,
+        search_results: Dict[str, Any],
+        target_model: str = "default",
+        max_tokens: Optional[int] = None
+    ) -> Tuple[List[int], Dict[str, int]]:
+        """
+        Pick hits by MMR within the token budget
+
+        Returns:
+            (indices into the search results in pick order, per-call counters)
+        """
+        budget = max_tokens or self.budget(target_model)
+        lam = settings.RAG_CONTEXT_MMR_LAMBDA
+        threshold = settings.RAG_CONTEXT_DEDUP_SIMILARITY
+
+        documents, metadatas = search_results["documents"], search_results["metadatas"]
+        relevance = search_results.get("fused_scores") or search_results["scores"]
+        embeddings = search_results.get("embeddings") or [None] * len(documents)
+
+        candidates = [i for i, score in enumerate(search_results["scores"]) if score >= settings.RAG_CONTEXT_MIN_SCORE]
+        texts = [self._format(doc, metadata) for doc, metadata in zip(documents, metadatas)]
+        tokens = TokenCounter.count_many([texts[i] for i in candidates], target_model)
+        token_count = dict(zip(candidates, tokens))
+        separator_tokens = TokenCounter.count(self.SEPARATOR, target_model)
+        sims = self._similarity_matrix(embeddings)
+
+        counters = {"documents_in": len(documents), "duplicates_dropped": 0, "over_budget_dropped": 0}
+        selected: List[int] = []
+        seen_text = set()
+        used = 0
+
+        while candidates:
+            best, best_value = None, -np.inf
+            for i in candidates:
+                redundancy = max((float(sims[i, j]) for j in selected), default=0.0)
+                value = lam * relevance[i] - (1 - lam) * redundancy
+                if value > best_value:
+                    best, best_value = i, value
+            candidates.remove(best)
+
+            text_key = hashlib.md5(" ".join(documents[best].lower().split()).encode("utf-8")).hexdigest()
+            if text_key in seen_text or any(sims[best, j] >= threshold for j in selected):
+                counters["duplicates_dropped"] += 1
+                continue
+
+            cost = token_count[best] + (separator_tokens if selected else 0)
+            if used + cost > budget:
+                # A shorter, less relevant document may still fit
+                counters["over_budget_dropped"] += 1
+                continue
+
+            selected.append(best)
+            seen_text.add(text_key)
+            used += cost
+
+        return selected, counters
+
+    def build(
+        self,
+        search_results: Dict[str, Any],
+        target_model: str = "default",
+        max_tokens: Optional[int] = None
+    ) -> str:
+        if not search_results["found"]:
+            return ""
+
+        selected, counters = self.select(search_results, target_model, max_tokens)
+        context = self.SEPARATOR.join(
+            self._format(search_results["documents"][i], search_results["metadatas"][i]) for i in selected
+        )
+
+        context_tokens = TokenCounter.count(context, target_model)
+        legacy_tokens = TokenCounter.count(self.legacy_context(search_results), target_model)
+        self.stats["requests"] += 1
+        self.stats["documents_used"] += len(selected)
+        self.stats["context_tokens"] += context_tokens
+        self.stats["legacy_tokens"] += legacy_tokens
+        for key, value in counters.items():
+            self.stats[key] += value
+
+        logger.info(
+            f"Built context with {len(selected)}/{counters['documents_in']} documents "
+            f"({context_tokens} {target_model} tokens, {legacy_tokens - context_tokens:+d} vs legacy, "
+            f"{counters['duplicates_dropped']} duplicates dropped)"
+        )
+        return context
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Token savings vs the legacy character-capped builder"""
+        requests = self.stats["requests"]
+        saved = self.stats["legacy_tokens"] - self.stats["context_tokens"]
+        return {
+            **self.stats,
+            "tokens_saved": saved,
+            "avg_tokens_saved_per_request": round(saved / requests, 1) if requests else 0.0,
+            "avg_context_tokens": round(self.stats["context_tokens"] / requests, 1) if requests else 0.0,
+            "exact_token_counts": {model: TokenCounter.exact(model) for model in settings.RAG_CONTEXT_TOKEN_BUDGETS},
+            "mmr_lambda": settings.RAG_CONTEXT_MMR_LAMBDA,
+            "dedup_similarity": settings.RAG_CONTEXT_DEDUP_SIMILARITY
+        }
+
+
+# Global instance
+context_builder = ContextBuilder()
@@ -0,0 +1,229 @@
+"""
+Persistent Embedding Cache
+content hash -> float32 vector, scoped by embedding model
+
+Tier 1: in-process LRU (OrderedDict) of recently used vectors
+Tier 2: SQLite file shared by every worker process and batch job, so a
+        re-index or a popular query never pays for the same text twice
+
+Rows written by another model are purged the first time a new model name
+is seen, so changing EmbeddingService.MODEL_NAME invalidates the cache.
+
+Async callers use aget_many / aput_many (and aget / aput): the SQLite I/O
+runs in the default executor, so a locked WAL file never stalls the loop.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import numpy as np
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+from ai_career_advisor.rag.indexer import DEFAULT_PERSIST_DIRECTORY
+from ai_career_advisor.rag.sqlite_utils import in_chunks
+
+
+class EmbeddingCache:
+    """
+    Usage:
+        vectors = await embedding_cache.aget_many(model, texts)   # None where missing
+        await embedding_cache.aput_many(model, missing_texts, new_vectors)
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_memory_entries: int = 10000):
+        self._path = Path(path) if path else None
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._current_model: Optional[str] = None
+
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "invalidated": 0
+        }
+
+    @property
+    def path(self) -> Path:
+        """RAG_EMBED_CACHE_PATH, or embedding_cache.sqlite next to the Chroma data"""
+        if self._path is None:
+            self._path = Path(settings.RAG_EMBED_CACHE_PATH or DEFAULT_PERSIST_DIRECTORY / "embedding_cache.sqlite")
+        return self._path
+
+    @property
+    def enabled(self) -> bool:
+        return settings.RAG_EMBED_CACHE_ENABLED
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    # ================== STORAGE ==================
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (model, hash)
+                ) WITHOUT ROWID
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def _use_model(self, model: str):
+        """Drop vectors from any other model the first time this model is seen"""
+        if model == self._current_model:
+            return
+        conn = self._connection()
+        purged = conn.execute("DELETE FROM embeddings WHERE model != ?", (model,)).rowcount
+        conn.commit()
+        self._memory.clear()
+        self._current_model = model
+        if purged:
+            self.stats["invalidated"] += purged
+            logger.warning(f"♻️ Embedding cache: dropped {purged} vectors from a previous model (now {model})")
+
+    # ================== LOOKUP / STORE ==================
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Cached vectors aligned with texts (None = miss)"""
+        if not self.enabled or not texts:
+            return [None] * len(texts)
+
+        with self._lock:
+            self._use_model(model)
+            hashes = [self.content_hash(t) for t in texts]
+            found: Dict[str, np.ndarray] = {}
+            missing = []
+            for h in hashes:
+                vector = self._memory.get(h)
+                if vector is not None:
+                    self._memory.move_to_end(h)
+                    found[h] = vector
+                elif h not in found:
+                    missing.append(h)
+
+            conn = self._connection()
+            missing = list(dict.fromkeys(missing))
+            from_disk = set()
+            for chunk, placeholders in in_chunks(missing):
+                rows = conn.execute(
+                    f"SELECT hash, vector FROM embeddings WHERE model = ? AND hash IN ({placeholders})",
+                    [model, *chunk]
+                ).fetchall()
+                for h, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float32)
+                    found[h] = vector
+                    from_disk.add(h)
+                    self._remember(h, vector)
+
+            results = []
+            for h in hashes:
+                vector = found.get(h)
+                if vector is None:
+                    self.stats["misses"] += 1
+                elif h in from_disk:
+                    self.stats["disk_hits"] += 1
+                else:
+                    self.stats["memory_hits"] += 1
+                results.append(vector)
+            return results
+
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        return self.get_many(model, [text])[0]
+
+    def put_many(self, model: str, texts: List[str], vectors: np.ndarray):
+        """Store vectors for texts (rows containing NaN are skipped)"""
+        if not self.enabled or not len(texts):
+            return
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            self._use_model(model)
+            rows = []
+            for text, vector in zip(texts, vectors):
+                if np.isnan(vector).any():
+                    continue
+                h = self.content_hash(text)
+                vector = np.ascontiguousarray(vector)
+                self._remember(h, vector)
+                rows.append((model, h, vector.tobytes()))
+
+            conn = self._connection()
+            conn.executemany("INSERT OR REPLACE INTO embeddings (model, hash, vector) VALUES (?, ?, ?)", rows)
+            conn.commit()
+            self.stats["stores"] += len(rows)
+
+    def put(self, model: str, text: str, vector):
+        self.put_many(model, [text], np.asarray([vector], dtype=np.float32))
+
+    # ================== ASYNC (SQLite I/O off the event loop) ==================
+
+    async def aget_many(self, model: str, texts: List[str]) -> List[Optional[np.ndarray]]:
+        if not self.enabled or not texts:
+            return [None] * len(texts)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_many, model, texts)
+
+    async def aget(self, model: str, text: str) -> Optional[np.ndarray]:
+        return (await self.aget_many(model, [text]))[0]
+
+    async def aput_many(self, model: str, texts: List[str], vectors: np.ndarray):
+        if not self.enabled or not len(texts):
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.put_many, model, texts, vectors)
+
+    async def aput(self, model: str, text: str, vector):
+        await self.aput_many(model, [text], np.asarray([vector], dtype=np.float32))
+
+    def _remember(self, h: str, vector: np.ndarray):
+        self._memory[h] = vector
+        self._memory.move_to_end(h)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._connection().execute("DELETE FROM embeddings")
+            self._connection().commit()
+        logger.info("🧹 Embedding cache cleared")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Counters for the admin dashboard"""
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        lookups = hits + self.stats["misses"]
+        stored = None
+        if self.enabled:
+            with self._lock:
+                stored = self._connection().execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {
+            **self.stats,
+            "enabled": self.enabled,
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "max_memory_entries": self.max_memory_entries,
+            "stored_vectors": stored,
+            "model": self._current_model,
+            "path": str(self.path)
+        }
+
+
+# Global instance
+embedding_cache = EmbeddingCache(max_memory_entries=settings.RAG_EMBED_CACHE_MEMORY_ENTRIES)
@@ -1,7 +1,14 @@
 from ai_career_advisor.core.logger import logger
-from typing import List
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.micro_batcher import MicroBatcher
+from typing import List, Dict, Optional, Callable
 import asyncio
+import os
+import time
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from ai_career_advisor.rag.embedding_cache import embedding_cache
 
 
 class EmbeddingService:
@@ -10,6 +17,8 @@ class EmbeddingService:
     - Works offline (after first model download)
     - Free, no API limits
     - Fast embedding generation
+    - Batch jobs: chunked, multi-process, order-preserving float32 arrays
+    - Concurrent chat queries: coalesced into one encode call by a micro-batcher
     """
     
     # Using a lightweight, high-quality model
@@ -17,6 +26,18 @@ class EmbeddingService:
     _model = None
     _lock = asyncio.Lock()
     
+    # Dedicated, bounded pool for the sync SentenceTransformer SDK
+    # (keeps the event loop's default executor free for everything else)
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="embedding")
+    
+    # sentence-transformers multi-process pool (one encode process per core),
+    # started on the first large batch and kept until stop_pool()
+    _pool = None
+    RETRY_BACKOFF_S = 0.5
+    
+    # Groups concurrent generate_query_embedding() calls (created on first use)
+    _query_batcher: Optional[MicroBatcher] = None
+    
     @classmethod
     def _get_model(cls):
         """Lazy load the model (only when first needed)"""
@@ -43,60 +64,235 @@ class EmbeddingService:
             384-dimensional vector (for all-MiniLM-L6-v2)
         """
         try:
-            text = text.strip()
-            if not text:
-                raise ValueError("Empty text provided")
+            text = EmbeddingService._clean_text(text)
             
-            # Truncate if too long
-            if len(text) > 5000:
-                text = text[:5000]
-                logger.warning(f"Text truncated to 5000 chars")
+            cached = await embedding_cache.aget(EmbeddingService.MODEL_NAME, text)
+            if cached is not None:
+                return cached.tolist()
             
             # Run in executor to not block event loop
             loop = asyncio.get_event_loop()
             embedding = await loop.run_in_executor(
-                None,
-                lambda: EmbeddingService._get_model().encode(text).tolist()
+                EmbeddingService._executor,
+                lambda: np.asarray(EmbeddingService._get_model().encode(text), dtype=np.float32)
             )
+            await embedding_cache.aput(EmbeddingService.MODEL_NAME, text, embedding)
             
             logger.debug(f"Generated embedding (dim: {len(embedding)})")
-            return embedding
+            return embedding.tolist()
         
         except Exception as e:
             logger.error(f"❌ Embedding generation error: {str(e)}")
             raise
     
+    @staticmethod
+    def _clean_text(text: str) -> str:
+        text = text.strip()
+        if not text:
+            raise ValueError("Empty text provided")
+        
+        # Truncate if too long
+        if len(text) > 5000:
+            text = text[:5000]
+            logger.warning(f"Text truncated to 5000 chars")
+        return text
+    
     @staticmethod
     async def generate_query_embedding(query: str) -> List[float]:
         """
         Generate embedding for search query
-        Same as generate_embedding but with clear semantics
+        Same vector as generate_embedding, but cache misses from concurrent
+        callers share one encode call through the query micro-batcher
         """
-        return await EmbeddingService.generate_embedding(query)
+        if not settings.RAG_QUERY_BATCH_ENABLED:
+            return await EmbeddingService.generate_embedding(query)
+        
+        try:
+            text = EmbeddingService._clean_text(query)
+            
+            cached = await embedding_cache.aget(EmbeddingService.MODEL_NAME, text)
+            if cached is not None:
+                return cached.tolist()
+            
+            embedding = await EmbeddingService.get_query_batcher().submit(text)
+            await embedding_cache.aput(EmbeddingService.MODEL_NAME, text, embedding)
+            return embedding.tolist()
+        
+        except Exception as e:
+            logger.error(f"❌ Query embedding error: {str(e)}")
+            raise
     
     @staticmethod
-    async def generate_batch_embeddings(texts: List[str]) -> List[List[float]]:
+    def _encode_queries(texts: List[str]) -> List[np.ndarray]:
+        """Batch function for the query micro-batcher: one forward pass per window"""
+        unique = list(dict.fromkeys(texts))
+        vectors = np.asarray(
+            EmbeddingService._get_model().encode(
+                unique, batch_size=len(unique), convert_to_numpy=True, show_progress_bar=False
+            ),
+            dtype=np.float32
+        )
+        by_text = dict(zip(unique, vectors))
+        return [by_text[text] for text in texts]
+    
+    @classmethod
+    def get_query_batcher(cls) -> MicroBatcher:
         """
-        Generate embeddings for multiple texts (batch processing)
-        More efficient than calling generate_embedding multiple times
+        Micro-batcher in front of the query encoder
+        
+        📚 STUDY NOTE - Query Coalescing:
+        - At peak chat traffic many one-sentence encodes arrive together
+        - They wait at most RAG_QUERY_BATCH_MAX_WAIT_MS, then run as ONE encode
+        - The batch runs in the batcher's single worker thread
         """
+        if cls._query_batcher is None:
+            cls._query_batcher = MicroBatcher(
+                cls._encode_queries,
+                max_batch_size=settings.RAG_QUERY_BATCH_MAX_SIZE,
+                max_wait_ms=settings.RAG_QUERY_BATCH_MAX_WAIT_MS,
+                name="query-embedding-batcher"
+            )
+            logger.info(
+                f"🧮 Query embedding micro-batcher ready (batch {settings.RAG_QUERY_BATCH_MAX_SIZE}, "
+                f"wait {settings.RAG_QUERY_BATCH_MAX_WAIT_MS}ms)"
+            )
+        return cls._query_batcher
+    
+    @staticmethod
+    def get_query_batching_stats() -> Optional[Dict]:
+        """Query micro-batcher stats (None until the first batched query)"""
+        batcher = EmbeddingService._query_batcher
+        return batcher.get_stats() if batcher is not None else None
+    
+    @staticmethod
+    def workers() -> int:
+        """Encode processes for batch jobs (RAG_EMBED_WORKERS, 0 = one per CPU core)"""
+        configured = settings.RAG_EMBED_WORKERS
+        return configured if configured > 0 else (os.cpu_count() or 1)
+    
+    @classmethod
+    def _get_pool(cls):
+        if cls._pool is None:
+            workers = cls.workers()
+            logger.info(f"🔄 Starting {workers} embedding worker processes")
+            cls._pool = cls._get_model().start_multi_process_pool(target_devices=["cpu"] * workers)
+        return cls._pool
+    
+    @classmethod
+    def stop_pool(cls):
+        """Terminate the worker processes (call when a batch job is finished)"""
+        if cls._pool is None:
+            return
         try:
-            # Clean texts
-            clean_texts = [t.strip()[:5000] for t in texts if t.strip()]
-            
-            if not clean_texts:
-                return []
-            
-            # Batch encode
-            loop = asyncio.get_event_loop()
-            embeddings = await loop.run_in_executor(
-                None,
-                lambda: EmbeddingService._get_model().encode(clean_texts).tolist()
+            cls._get_model().stop_multi_process_pool(cls._pool)
+            logger.info("🛑 Embedding worker processes stopped")
+        except Exception as e:
+            logger.warning(f"⚠️ Error stopping embedding pool: {e}")
+        finally:
+            cls._pool = None
+    
+    @classmethod
+    def _encode_chunk(cls, texts: List[str], use_pool: bool) -> np.ndarray:
+        model = cls._get_model()
+        if use_pool:
+            vectors = model.encode_multi_process(texts, cls._get_pool(), batch_size=settings.RAG_EMBED_BATCH_SIZE)
+        else:
+            vectors = model.encode(
+                texts, batch_size=settings.RAG_EMBED_BATCH_SIZE, convert_to_numpy=True, show_progress_bar=False
             )
+        return np.asarray(vectors, dtype=np.float32)
+    
+    @staticmethod
+    async def _encode_with_retry(texts: List[str], use_pool: bool) -> Optional[np.ndarray]:
+        """Encode one chunk, retrying with backoff; None once retries are exhausted"""
+        loop = asyncio.get_running_loop()
+        retries = max(0, settings.RAG_EMBED_MAX_RETRIES)
+        for attempt in range(retries + 1):
+            try:
+                return await loop.run_in_executor(
+                    EmbeddingService._executor, EmbeddingService._encode_chunk, texts, use_pool
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Embedding chunk failed (attempt {attempt + 1}/{retries + 1}): {e}")
+                if use_pool:
+                    # A broken worker pool shouldn't sink the job - retry in-process
+                    EmbeddingService.stop_pool()
+                    use_pool = False
+                if attempt < retries:
+                    await asyncio.sleep(EmbeddingService.RETRY_BACKOFF_S * 2 ** attempt)
+        logger.error(f"❌ Embedding chunk of {len(texts)} texts failed after {retries + 1} attempts")
+        return None
+    
+    @staticmethod
+    async def generate_batch_embeddings(
+        texts: List[str],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts (chunked batch processing)
+        
+        Cached texts are served from the embedding cache; the rest are
+        encoded once per unique text in chunks of RAG_EMBED_CHUNK_SIZE (the
+        retry and progress unit); large jobs use a multi-process pool.
+        
+        Returns:
+            float32 array of shape (len(texts), dim), row i = texts[i].
+            Rows for empty texts or chunks that failed after retries are NaN
+            (see valid_rows). Raises if nothing could be embedded.
+        """
+        clean_texts = [t.strip()[:5000] if t else "" for t in texts]
+        todo = [i for i, t in enumerate(clean_texts) if t]
+        if not todo:
+            return np.zeros((len(texts), 0), dtype=np.float32)
+        
+        # Cached vectors first; identical texts are encoded once
+        result = None
+        pending: Dict[str, List[int]] = {}
+        cached = await embedding_cache.aget_many(EmbeddingService.MODEL_NAME, [clean_texts[i] for i in todo])
+        for i, vector in zip(todo, cached):
+            if vector is None:
+                pending.setdefault(clean_texts[i], []).append(i)
+                continue
+            if result is None:
+                result = np.full((len(texts), len(vector)), np.nan, dtype=np.float32)
+            result[i] = vector
+        unique = list(pending)
+        if len(unique) < len(todo):
+            logger.info(f"⚡ Embedding cache: {len(todo) - sum(map(len, pending.values()))}/{len(todo)} texts cached, "
+                        f"{len(unique)} unique texts to encode")
+        
+        chunk_size = max(1, settings.RAG_EMBED_CHUNK_SIZE)
+        use_pool = EmbeddingService.workers() > 1 and len(unique) > settings.RAG_EMBED_BATCH_SIZE
+        done, started = 0, time.perf_counter()
+        
+        for start in range(0, len(unique), chunk_size):
+            chunk = unique[start:start + chunk_size]
+            vectors = await EmbeddingService._encode_with_retry(chunk, use_pool)
+            # A pool torn down after a failure stays off for the rest of this job
+            use_pool = use_pool and EmbeddingService._pool is not None
+            if vectors is not None:
+                if result is None:
+                    result = np.full((len(texts), vectors.shape[1]), np.nan, dtype=np.float32)
+                for text, vector in zip(chunk, vectors):
+                    result[pending[text]] = vector
+                await embedding_cache.aput_many(EmbeddingService.MODEL_NAME, chunk, vectors)
             
-            logger.success(f"✅ Generated {len(embeddings)} embeddings in batch")
-            return embeddings
+            done += len(chunk)
+            rate = done / max(time.perf_counter() - started, 1e-9)
+            logger.info(f"🧮 Embedded {done}/{len(unique)} texts ({done / len(unique):.0%}, {rate:.0f} texts/s)")
+            if progress_callback:
+                progress_callback(done, len(unique))
         
-        except Exception as e:
-            logger.error(f"❌ Batch embedding error: {str(e)}")
-            return []
+        if result is None:
+            raise RuntimeError(f"Batch embedding failed for all {len(todo)} texts")
+        
+        logger.success(f"✅ Generated {int(EmbeddingService.valid_rows(result).sum())}/{len(texts)} embeddings in batch")
+        return result
+    
+    @staticmethod
+    def valid_rows(embeddings: np.ndarray) -> np.ndarray:
+        """Boolean mask of rows that hold a real embedding"""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if embeddings.ndim != 2 or embeddings.shape[1] == 0:
+            return np.zeros(len(embeddings), dtype=bool)
+        return ~np.isnan(embeddings).any(axis=1)
@@ -0,0 +1,92 @@
+"""
+Offline Retrieval Evaluation
+recall@k, precision@k, MRR and latency for any search function over a labelled query set
+
+📚 STUDY NOTES:
+- Labelled query: {"query": "IIT Bombay CSE fees", "relevant_ids": ["college_detail_42"]}
+- recall@k: share of a query's relevant documents found in the top k
+- precision@k: share of the top k that is relevant (what the LLM prompt
+  is actually filled with); with one relevant ID per query it tops out at 1/k
+- MRR (mean reciprocal rank): 1 / rank of the FIRST relevant hit, averaged;
+  1.0 = always first, 0.5 = usually second, 0 = never found
+- Latency is the wall time of each search call (p50 / p95)
+- Compare retrieval modes on the same set before changing defaults
+"""
+
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Awaitable, Sequence
+
+
+class RetrievalEvaluator:
+
+    @staticmethod
+    def load_queries(path: Path) -> List[Dict[str, Any]]:
+        with open(path, encoding="utf-8") as f:
+            queries = json.load(f)
+        return [q for q in queries if q.get("query") and q.get("relevant_ids")]
+
+    @staticmethod
+    def recall_at_k(ranked_ids: List[str], relevant_ids: Sequence[str], k: int) -> float:
+        relevant = set(relevant_ids)
+        return len(relevant.intersection(ranked_ids[:k])) / len(relevant) if relevant else 0.0
+
+    @staticmethod
+    def precision_at_k(ranked_ids: List[str], relevant_ids: Sequence[str], k: int) -> float:
+        return len(set(relevant_ids).intersection(ranked_ids[:k])) / k if k else 0.0
+
+    @staticmethod
+    def reciprocal_rank(ranked_ids: List[str], relevant_ids: Sequence[str]) -> float:
+        relevant = set(relevant_ids)
+        for rank, doc_id in enumerate(ranked_ids, start=1):
+            if doc_id in relevant:
+                return 1 / rank
+        return 0.0
+
+    @staticmethod
+    async def evaluate(
+        search_fn: Callable[[str, int], Awaitable[List[str]]],
+        queries: List[Dict[str, Any]],
+        ks: Sequence[int] = (1, 5, 10)
+    ) -> Dict[str, Any]:
+        """
+        Args:
+            search_fn: (query, top_k) -> ranked document IDs
+            queries: labelled queries (query, relevant_ids)
+            ks: cut-offs for recall@k
+
+        Returns:
+            Mean recall@k and precision@k per k, MRR, search latency
+            percentiles, and the queries that found nothing
+        """
+        depth = max(ks)
+        recalls = {k: 0.0 for k in ks}
+        precisions = {k: 0.0 for k in ks}
+        mrr = 0.0
+        misses = []
+        latencies = []
+
+        for item in queries:
+            started = time.perf_counter()
+            ranked = await search_fn(item["query"], depth)
+            latencies.append(1000 * (time.perf_counter() - started))
+            for k in ks:
+                recalls[k] += RetrievalEvaluator.recall_at_k(ranked, item["relevant_ids"], k)
+                precisions[k] += RetrievalEvaluator.precision_at_k(ranked, item["relevant_ids"], k)
+            rr = RetrievalEvaluator.reciprocal_rank(ranked, item["relevant_ids"])
+            mrr += rr
+            if not rr:
+                misses.append(item["query"])
+
+        n = len(queries) or 1
+        return {
+            "queries": len(queries),
+            **{f"recall@{k}": round(recalls[k] / n, 4) for k in ks},
+            **{f"precision@{k}": round(precisions[k] / n, 4) for k in ks},
+            "mrr": round(mrr / n, 4),
+            "latency_p50_ms": round(statistics.median(latencies), 2) if latencies else 0.0,
+            "latency_p95_ms": round(sorted(latencies)[int(0.95 * (len(latencies) - 1))], 2) if latencies else 0.0,
+            "misses": misses
+        }
@@ -0,0 +1,133 @@
+"""
+Hybrid Retrieval: rank fusion + optional cross-encoder rerank
+
+📚 STUDY NOTES - RECIPROCAL RANK FUSION (RRF)
+=============================================
+- Dense (cosine) and BM25 scores live on different scales, so they are
+  fused by RANK instead: score(d) = sum over retrievers r of w_r / (k + rank_r(d))
+- k (default 60) damps the head of each list: rank 1 vs rank 2 matters,
+  rank 40 vs rank 41 barely does
+- A document found by both retrievers beats one found by only one
+- Scores are divided by the best possible score (rank 1 everywhere), so
+  1.0 = top of every list and build_context can keep a fixed cutoff
+
+📚 STUDY NOTES - CROSS-ENCODER RERANK
+====================================
+- A bi-encoder (MiniLM) embeds query and document separately; a
+  cross-encoder reads them together and is much more precise, but costs
+  one forward pass per (query, document) pair
+- So it only reorders the fused top-N candidates
+"""
+
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+class HybridRanker:
+    """Fuses ranked hit lists: hits are dicts with id, document, metadata, score"""
+
+    @staticmethod
+    def reciprocal_rank_fusion(
+        rankings: Dict[str, List[Dict[str, Any]]],
+        weights: Dict[str, float],
+        k: int = 60,
+        top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Args:
+            rankings: retriever name -> hits, best first
+            weights: retriever name -> fusion weight (0 disables that retriever)
+            k: RRF damping constant
+
+        Returns:
+            Fused hits, best first; each carries its per-retriever score
+            (e.g. "vector_score", "bm25_score", None if not retrieved)
+        """
+        active = {name: hits for name, hits in rankings.items() if weights.get(name, 0) > 0}
+        best_possible = sum(weights[name] for name in active) / (k + 1)
+        fused: Dict[str, Dict[str, Any]] = {}
+
+        for name, hits in active.items():
+            for rank, hit in enumerate(hits, start=1):
+                entry = fused.get(hit["id"])
+                if entry is None:
+                    entry = fused[hit["id"]] = {
+                        "id": hit["id"],
+                        "document": hit["document"],
+                        "metadata": hit["metadata"],
+                        "score": 0.0,
+                        **{f"{other}_score": None for other in rankings}
+                    }
+                entry["score"] += weights[name] / (k + rank)
+                entry[f"{name}_score"] = hit["score"]
+
+        results = sorted(fused.values(), key=lambda hit: -hit["score"])
+        for hit in results:
+            hit["score"] = hit["score"] / best_possible if best_possible else 0.0
+        return results[:top_k] if top_k else results
+
+    @staticmethod
+    def fuse(vector_hits: List[Dict[str, Any]], bm25_hits: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """RRF with the configured weights (RAG_FUSION_*_WEIGHT, RAG_RRF_K)"""
+        return HybridRanker.reciprocal_rank_fusion(
+            {"vector": vector_hits, "bm25": bm25_hits},
+            {"vector": settings.RAG_FUSION_VECTOR_WEIGHT, "bm25": settings.RAG_FUSION_BM25_WEIGHT},
+            k=settings.RAG_RRF_K,
+            top_k=top_k
+        )
+
+
+class CrossEncoderReranker:
+    """
+    Lazy-loaded sentence-transformers CrossEncoder (RAG_RERANK_MODEL)
+    Any load/predict failure disables reranking and keeps the fused order
+    """
+
+    def __init__(self):
+        self._model = None
+        self._failed = False
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reranker")
+
+    @property
+    def available(self) -> bool:
+        return settings.RAG_RERANK_ENABLED and not self._failed
+
+    def _get_model(self):
+        if self._model is None:
+            from sentence_transformers import CrossEncoder
+            logger.info(f"🔄 Loading cross-encoder: {settings.RAG_RERANK_MODEL}")
+            self._model = CrossEncoder(settings.RAG_RERANK_MODEL, max_length=512)
+        return self._model
+
+    def _predict(self, query: str, documents: List[str]) -> List[float]:
+        logits = self._get_model().predict([(query, doc) for doc in documents], show_progress_bar=False)
+        return [1 / (1 + math.exp(-float(logit))) for logit in logits]
+
+    async def rerank(self, query: str, hits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Reorder the first RAG_RERANK_TOP_N hits; score becomes the cross-encoder probability"""
+        if not self.available or not hits:
+            return hits
+
+        head, tail = hits[:settings.RAG_RERANK_TOP_N], hits[settings.RAG_RERANK_TOP_N:]
+        try:
+            loop = asyncio.get_running_loop()
+            probabilities = await loop.run_in_executor(
+                self._executor, self._predict, query, [hit["document"] for hit in head]
+            )
+        except Exception as e:
+            self._failed = True
+            logger.warning(f"⚠️ Cross-encoder rerank disabled: {e}")
+            return hits
+
+        for hit, probability in zip(head, probabilities):
+            hit["fused_score"] = hit["score"]
+            hit["score"] = probability
+        return sorted(head, key=lambda hit: -hit["score"]) + tail
+
+
+# Global instance
+reranker = CrossEncoderReranker()
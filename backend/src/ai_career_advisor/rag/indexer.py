@@ -0,0 +1,540 @@
+"""
+Incremental Knowledge Base Indexer
+Keeps the career_knowledge Chroma collection in sync with the database
+without deleting and re-embedding everything
+
+📚 STUDY NOTES:
+- Every KnowledgeLoader document gets a content hash (content + metadata);
+  a per-collection SQLite manifest records (doc id, hash, embedded_at)
+- Incremental sync: embed + upsert only new/changed docs, delete docs whose
+  source rows vanished. Only manifest-tracked IDs are ever deleted, so
+  llm_generated documents saved by the chatbot are left alone
+- Full rebuild (shadow mode): build a second collection while the live one
+  keeps serving, then flip a pointer file to it (os.replace = atomic) and
+  drop the old one. Readers resolve the pointer, so there is no window
+  where RAG returns nothing
+- Changing the embedding model forces a shadow rebuild (vectors from two
+  models can't share a collection)
+- Streaming: KnowledgeLoader pages feed diff -> embed -> upsert stages
+  through bounded queues. "Seen this run" is a column in the manifest, not
+  an in-memory set, so memory stays flat regardless of corpus size
+- Every collection also gets a BM25 inverted index (<collection>_bm25.sqlite)
+  kept in step with the upserts/deletes, for hybrid retrieval
+- One sync at a time per alias: concurrent calls in a process queue on an
+  asyncio.Lock; another process (index script vs scheduler) holding the
+  <alias>.lock file lock makes sync() raise IndexSyncInProgressError
+- A shadow build with any failed chunk is discarded (the live collection
+  keeps serving) rather than swapped in with documents missing
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable, Awaitable, AsyncIterator, Tuple
+import numpy as np
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+from ai_career_advisor.rag.bm25_index import BM25Index
+from ai_career_advisor.rag.sqlite_utils import in_chunks
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+DEFAULT_PERSIST_DIRECTORY = Path(__file__).resolve().parent.parent.parent / "chroma_db"
+
+
+class IndexSyncInProgressError(RuntimeError):
+    """Another process is already syncing this alias"""
+
+
+class IndexManifest:
+    """
+    SQLite manifest for one physical collection: doc_id -> (hash, embedded_at)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id TEXT PRIMARY KEY,
+                hash TEXT NOT NULL,
+                embedded_at TEXT NOT NULL,
+                seen_run INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS ix_documents_seen_run ON documents (seen_run);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        """)
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+        self.conn.commit()
+
+    def start_run(self) -> int:
+        run = int(self.get_meta("run") or 0) + 1
+        self.set_meta("run", str(run))
+        return run
+
+    def hashes(self, doc_ids: List[str]) -> Dict[str, str]:
+        found = {}
+        for chunk, placeholders in in_chunks(doc_ids):
+            found.update(self.conn.execute(
+                f"SELECT doc_id, hash FROM documents WHERE doc_id IN ({placeholders})", chunk
+            ).fetchall())
+        return found
+
+    def mark_seen(self, doc_ids: List[str], run: int):
+        for chunk, placeholders in in_chunks(doc_ids):
+            self.conn.execute(f"UPDATE documents SET seen_run = ? WHERE doc_id IN ({placeholders})", [run, *chunk])
+        self.conn.commit()
+
+    def record(self, rows: List[Tuple[str, str]], run: int):
+        embedded_at = datetime.now(timezone.utc).isoformat()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO documents (doc_id, hash, embedded_at, seen_run) VALUES (?, ?, ?, ?)",
+            [(doc_id, doc_hash, embedded_at, run) for doc_id, doc_hash in rows]
+        )
+        self.conn.commit()
+
+    def unseen(self, run: int, limit: int) -> List[str]:
+        return [row[0] for row in self.conn.execute(
+            "SELECT doc_id FROM documents WHERE seen_run != ? LIMIT ?", (run, limit)
+        )]
+
+    def remove(self, doc_ids: List[str]):
+        self.conn.executemany("DELETE FROM documents WHERE doc_id = ?", [(doc_id,) for doc_id in doc_ids])
+        self.conn.commit()
+
+    def get(self, doc_id: str) -> Optional[Dict[str, str]]:
+        row = self.conn.execute("SELECT hash, embedded_at FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+        return {"hash": row[0], "embedded_at": row[1]} if row else None
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+class KnowledgeIndexer:
+    """
+    Content-hashed, manifest-driven indexer for one logical collection (alias)
+    """
+
+    SHADOW_SUFFIX = "_shadow"
+    # Copy llm_generated docs into the new collection on a full rebuild
+    PRESERVED_SOURCES = ["llm_generated"]
+
+    def __init__(
+        self,
+        alias: str = "career_knowledge",
+        persist_directory: Optional[Path] = None,
+        vector_store=None,
+        embed_fn: Optional[Callable[[List[str]], Awaitable[np.ndarray]]] = None,
+        embedding_model: Optional[str] = None
+    ):
+        self.alias = alias
+        self.persist_directory = Path(persist_directory or DEFAULT_PERSIST_DIRECTORY)
+        self._vector_store = vector_store
+        self._embed_fn = embed_fn
+        self._embedding_model = embedding_model
+        self._pointer_mtime: Optional[int] = None
+        self._active: Optional[str] = None
+        self._sync_lock = asyncio.Lock()
+        self.last_run: Dict[str, Any] = {}
+
+    # ============================================
+    # DEPENDENCIES (lazy: chromadb / sentence-transformers)
+    # ============================================
+
+    @property
+    def vector_store(self):
+        if self._vector_store is None:
+            from ai_career_advisor.rag.vector_store import vector_store
+            self._vector_store = vector_store
+        return self._vector_store
+
+    @property
+    def embedding_model(self) -> str:
+        if self._embedding_model is None:
+            from ai_career_advisor.rag.embeddings import EmbeddingService
+            self._embedding_model = EmbeddingService.MODEL_NAME
+        return self._embedding_model
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        if self._embed_fn is None:
+            from ai_career_advisor.rag.embeddings import EmbeddingService
+            self._embed_fn = EmbeddingService.generate_batch_embeddings
+        return await self._embed_fn(texts)
+
+    # ============================================
+    # ACTIVE COLLECTION POINTER + MANIFESTS
+    # ============================================
+
+    @property
+    def pointer_path(self) -> Path:
+        return self.persist_directory / f"{self.alias}.active"
+
+    def manifest_path(self, collection_name: str) -> Path:
+        return self.persist_directory / f"{collection_name}_manifest.sqlite"
+
+    def open_manifest(self, collection_name: Optional[str] = None) -> IndexManifest:
+        return IndexManifest(self.manifest_path(collection_name or self.active_collection()))
+
+    def bm25_path(self, collection_name: str) -> Path:
+        return self.persist_directory / f"{collection_name}_bm25.sqlite"
+
+    def open_bm25(self, collection_name: Optional[str] = None) -> BM25Index:
+        return BM25Index(self.bm25_path(collection_name or self.active_collection()))
+
+    def _drop_indexes(self, collection_name: str):
+        """Remove the manifest and BM25 index that belong to a dropped collection"""
+        for path in (self.manifest_path(collection_name), self.bm25_path(collection_name)):
+            for suffix in ("", "-wal", "-shm"):
+                path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+    def active_collection(self) -> str:
+        """Physical collection currently serving the alias (cached by pointer mtime)"""
+        try:
+            mtime = self.pointer_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return self.alias
+        if mtime != self._pointer_mtime:
+            self._active = self.pointer_path.read_text(encoding="utf-8").strip() or self.alias
+            self._pointer_mtime = mtime
+        return self._active
+
+    def _set_active(self, collection_name: str):
+        """Atomic write (tmp file + rename) so readers never see a partial pointer"""
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.pointer_path.with_name(self.pointer_path.name + ".tmp")
+        tmp.write_text(collection_name, encoding="utf-8")
+        os.replace(tmp, self.pointer_path)
+
+    @property
+    def lock_path(self) -> Path:
+        return self.persist_directory / f"{self.alias}.lock"
+
+    @contextmanager
+    def _process_lock(self):
+        """Exclusive, non-blocking lock on <alias>.lock (released by the OS if the process dies)"""
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        handle = open(self.lock_path, "a+")
+        try:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            except OSError:
+                raise IndexSyncInProgressError(f"Another process is already syncing '{self.alias}' ({self.lock_path})")
+            yield
+        finally:
+            handle.close()
+
+    def _shadow_name(self, active: str) -> str:
+        return self.alias + self.SHADOW_SUFFIX if active == self.alias else self.alias
+
+    @staticmethod
+    def content_hash(doc: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"content": doc["content"], "metadata": doc.get("metadata") or {}},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ============================================
+    # SYNC
+    # ============================================
+
+    async def sync(
+        self,
+        documents: Optional[List[Dict[str, Any]]] = None,
+        full_rebuild: bool = False,
+        session_factory: Optional[Callable] = None
+    ) -> Dict[str, Any]:
+        """
+        Bring the collection in line with the database
+
+        Args:
+            documents: KnowledgeLoader-style docs (id, content, metadata);
+                streamed from KnowledgeLoader.stream_all if None
+            full_rebuild: build into a shadow collection and swap it in atomically
+            session_factory: DB session factory for the streaming loader
+
+        Returns:
+            Run stats (embedded / unchanged / deleted / failed counts)
+
+        Raises:
+            IndexSyncInProgressError: another process is syncing this alias
+        """
+        async with self._sync_lock:
+            with self._process_lock():
+                return await self._sync(documents, full_rebuild, session_factory)
+
+    async def _sync(
+        self,
+        documents: Optional[List[Dict[str, Any]]],
+        full_rebuild: bool,
+        session_factory: Optional[Callable]
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        failed_sources: List[str] = []
+        if documents is None:
+            from ai_career_advisor.rag.knowledge_loader import KnowledgeLoader
+            batches = KnowledgeLoader.stream_all(session_factory=session_factory, failed_sources=failed_sources)
+        else:
+            batches = self._as_batches(documents)
+
+        active = self.active_collection()
+        manifest = self.open_manifest(active)
+        previous_model = manifest.get_meta("embedding_model")
+        if previous_model and previous_model != self.embedding_model and not full_rebuild:
+            logger.warning(
+                f"⚠️ Embedding model changed ({previous_model} -> {self.embedding_model}), forcing a full rebuild"
+            )
+            full_rebuild = True
+
+        store = self.vector_store
+        target = active
+        if full_rebuild:
+            manifest.close()
+            target = self._shadow_name(active)
+            store.delete_collection(target)
+            self._drop_indexes(target)
+            manifest = self.open_manifest(target)
+            logger.info(f"🔄 Full rebuild into shadow collection '{target}' (live: '{active}')")
+        collection = store.get_or_create_collection(target)
+        bm25 = self.open_bm25(target)
+
+        # Collections indexed before BM25 existed: fill it from unchanged docs as they stream past
+        backfill_bm25 = bm25.count() == 0 and manifest.count() > 0
+        if backfill_bm25:
+            logger.info(f"🔄 Backfilling BM25 index for '{target}'")
+            self._copy_preserved(target, collection, target, bm25_only=True)
+
+        counters = {"documents": 0, "unchanged": 0, "embedded": 0, "failed": 0, "deleted": 0}
+        try:
+            run = manifest.start_run()
+            await self._run_pipeline(batches, manifest, bm25, run, collection, counters, backfill_bm25)
+
+            if failed_sources:
+                # A partial stream must not be mistaken for deleted rows
+                logger.warning(f"⚠️ Sources failed to load ({', '.join(failed_sources)}), skipping deletions")
+            else:
+                page = max(1, settings.RAG_INDEX_BATCH_SIZE)
+                while removed := manifest.unseen(run, page):
+                    store.delete_documents(collection, removed)
+                    bm25.remove(removed)
+                    manifest.remove(removed)
+                    counters["deleted"] += len(removed)
+
+            manifest.set_meta("embedding_model", self.embedding_model)
+            manifest.set_meta("updated_at", datetime.now(timezone.utc).isoformat())
+        finally:
+            # Every batch is committed as it lands, so an interrupted run keeps its progress
+            manifest.close()
+            bm25.close()
+
+        logger.info(
+            f"📊 Index diff for '{self.alias}': {counters['embedded'] + counters['failed']} new/changed, "
+            f"{counters['unchanged']} unchanged, {counters['deleted']} removed"
+        )
+
+        swapped = False
+        if full_rebuild:
+            if failed_sources or counters["failed"]:
+                logger.error(
+                    f"❌ Shadow build incomplete ({counters['failed']} docs failed to embed, "
+                    f"failed sources: {failed_sources or 'none'}), keeping '{active}' live"
+                )
+                store.delete_collection(target)
+                self._drop_indexes(target)
+            else:
+                preserved = self._copy_preserved(active, collection, target)
+                self._set_active(target)
+                swapped = True
+                logger.success(f"✅ Swapped '{self.alias}' -> '{target}' ({preserved} preserved docs copied)")
+                if active != target:
+                    store.delete_collection(active)
+                    self._drop_indexes(active)
+
+        self.last_run = {
+            "alias": self.alias,
+            "collection": self.active_collection(),
+            "mode": "full_rebuild" if full_rebuild else "incremental",
+            **counters,
+            "failed_sources": failed_sources,
+            "swapped": swapped,
+            "duration_s": round(time.perf_counter() - started, 2),
+            "finished_at": datetime.now(timezone.utc).isoformat()
+        }
+        logger.success(f"✅ Knowledge index sync complete: {self.last_run}")
+        return self.last_run
+
+    @staticmethod
+    async def _as_batches(documents: List[Dict[str, Any]]) -> AsyncIterator[List[Dict[str, Any]]]:
+        batch_size = max(1, settings.RAG_LOADER_BATCH_SIZE)
+        for start in range(0, len(documents), batch_size):
+            yield documents[start:start + batch_size]
+
+    async def _run_pipeline(
+        self,
+        batches: AsyncIterator[List[Dict[str, Any]]],
+        manifest: IndexManifest,
+        bm25: BM25Index,
+        run: int,
+        collection,
+        counters: Dict[str, int],
+        backfill_bm25: bool = False
+    ):
+        """
+        load -> diff -> embed -> upsert, each stage a task joined by bounded queues
+
+        DB paging, embedding and Chroma writes overlap, and at most
+        RAG_INDEX_QUEUE_SIZE batches wait between stages (flat memory).
+        BM25 is written next to every upsert (and gets unchanged docs too
+        when backfilling an index that predates it)
+        """
+        batch_size = max(1, settings.RAG_INDEX_BATCH_SIZE)
+        to_embed: asyncio.Queue = asyncio.Queue(maxsize=max(1, settings.RAG_INDEX_QUEUE_SIZE))
+        to_write: asyncio.Queue = asyncio.Queue(maxsize=max(1, settings.RAG_INDEX_QUEUE_SIZE))
+        loop = asyncio.get_running_loop()
+        store = self.vector_store
+
+        async def diff_stage():
+            pending = []
+            async for docs in batches:
+                # Empty docs can't be embedded; within a page the first occurrence of an ID wins
+                page = {}
+                for doc in docs:
+                    if doc.get("content", "").strip() and doc["id"] not in page:
+                        page[doc["id"]] = doc
+                known = manifest.hashes(list(page))
+                manifest.mark_seen(list(known), run)
+                counters["documents"] += len(page)
+
+                unchanged = []
+                for doc_id, doc in page.items():
+                    doc_hash = self.content_hash(doc)
+                    if known.get(doc_id) == doc_hash:
+                        counters["unchanged"] += 1
+                        unchanged.append(doc)
+                        continue
+                    pending.append((doc, doc_hash))
+                    if len(pending) >= batch_size:
+                        await to_embed.put(pending)
+                        pending = []
+                if backfill_bm25:
+                    bm25.add(unchanged)
+            if pending:
+                await to_embed.put(pending)
+            await to_embed.put(None)
+
+        async def embed_stage():
+            while (batch := await to_embed.get()) is not None:
+                try:
+                    embeddings = np.asarray(await self._embed([doc["content"] for doc, _ in batch]), dtype=np.float32)
+                except Exception as e:
+                    logger.error(f"❌ Embedding batch failed: {e}")
+                    embeddings = np.zeros((0, 0), dtype=np.float32)
+                # NaN rows = texts the embedder gave up on; old hash (if any) stays
+                # in the manifest so they are retried on the next sync
+                valid = (
+                    ~np.isnan(embeddings).any(axis=1)
+                    if embeddings.ndim == 2 and len(embeddings) == len(batch) and embeddings.shape[1]
+                    else np.zeros(len(batch), dtype=bool)
+                )
+                counters["failed"] += int((~valid).sum())
+                if valid.any():
+                    await to_write.put(([item for item, ok in zip(batch, valid) if ok], embeddings[valid]))
+            await to_write.put(None)
+
+        async def write_stage():
+            while (item := await to_write.get()) is not None:
+                batch, embeddings = item
+                await loop.run_in_executor(None, lambda: store.upsert_documents(
+                    collection=collection,
+                    documents=[doc["content"] for doc, _ in batch],
+                    embeddings=embeddings,
+                    metadatas=[doc.get("metadata") or {} for doc, _ in batch],
+                    ids=[doc["id"] for doc, _ in batch]
+                ))
+                bm25.add([doc for doc, _ in batch])
+                manifest.record([(doc["id"], doc_hash) for doc, doc_hash in batch], run)
+                counters["embedded"] += len(batch)
+
+        tasks = [asyncio.create_task(stage()) for stage in (diff_stage, embed_stage, write_stage)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _copy_preserved(self, source_name: str, target_collection, target_name: str, bm25_only: bool = False) -> int:
+        """Carry chatbot-learned documents over to a freshly built collection (and its BM25 index)"""
+        bm25 = self.open_bm25(target_name)
+        try:
+            source = self.vector_store.get_or_create_collection(source_name)
+            copied = 0
+            for source_type in self.PRESERVED_SOURCES:
+                found = self.vector_store.get_documents(source, {"source": source_type})
+                if not found["ids"]:
+                    continue
+                if not bm25_only:
+                    self.vector_store.upsert_documents(
+                        collection=target_collection,
+                        documents=found["documents"],
+                        embeddings=found["embeddings"],
+                        metadatas=found["metadatas"],
+                        ids=found["ids"]
+                    )
+                bm25.add([
+                    {"id": doc_id, "content": content, "metadata": metadata}
+                    for doc_id, content, metadata in zip(found["ids"], found["documents"], found["metadatas"])
+                ])
+                copied += len(found["ids"])
+            return copied
+        except Exception as e:
+            logger.warning(f"⚠️ Could not copy preserved documents from '{source_name}': {e}")
+            return 0
+        finally:
+            bm25.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        manifest = self.open_manifest()
+        bm25 = self.open_bm25()
+        try:
+            return {
+                "alias": self.alias,
+                "active_collection": self.active_collection(),
+                "tracked_documents": manifest.count(),
+                "embedding_model": manifest.get_meta("embedding_model"),
+                "manifest_updated_at": manifest.get_meta("updated_at"),
+                "bm25": bm25.get_stats(),
+                "last_run": self.last_run
+            }
+        finally:
+            manifest.close()
+            bm25.close()
+
+
+knowledge_indexer = KnowledgeIndexer()
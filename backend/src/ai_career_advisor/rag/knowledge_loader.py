@@ -1,375 +1,384 @@
 from sqlalchemy import select
-from ai_career_advisor.core.database import get_db
+from ai_career_advisor.core.database import AsyncSessionLocal
+from ai_career_advisor.core.config import settings
 from ai_career_advisor.models.college import College
 from ai_career_advisor.models.career_template import CareerTemplate
 from ai_career_advisor.models.entrance_exam import EntranceExam
 from ai_career_advisor.models.backward_roadmap import BackwardRoadmap
 from ai_career_advisor.models.college_details import CollegeDetails
 from ai_career_advisor.models.roadmap import Roadmap
-from ai_career_advisor.models.roadmap_step import RoadmapStep
 from ai_career_advisor.models.career import Career
 from ai_career_advisor.models.branch import Branch
 from ai_career_advisor.models.degree import Degree
 from ai_career_advisor.models.career_insight import CareerInsight
 from ai_career_advisor.core.logger import logger
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional, Callable
 
 class KnowledgeLoader:
-    """Loads ALL knowledge from database for RAG indexing"""
+    """
+    Loads ALL knowledge from database for RAG indexing
+    
+    Every source is streamed in keyset-paginated pages (WHERE id > last_id
+    ORDER BY id LIMIT n), so memory stays flat regardless of table size;
+    college details are joined with their college in the same query.
+    """
+    
+    # ============================================
+    # DOCUMENT BUILDERS (one per source)
+    # ============================================
     
     @staticmethod
-    async def load_colleges() -> List[Dict[str, Any]]:
-        """Load college basic info"""
-        documents = []
-        
-        async for db in get_db():
-            try:
-                result = await db.execute(select(College))
-                colleges = result.scalars().all()
+    def _college_doc(college) -> Dict[str, Any]:
+        content_parts = [f"{college.name}"]
+        
+        if hasattr(college, 'state') and college.state:
+            content_parts.append(f"located in {college.state}")
+        if hasattr(college, 'nirf_rank') and college.nirf_rank:
+            content_parts.append(f"NIRF Rank: {college.nirf_rank}")
+        if hasattr(college, 'type') and college.type:
+            content_parts.append(f"Type: {college.type}")
+        
+        return {
+            "id": f"college_{college.id}",
+            "content": ". ".join(content_parts) + ".",
+            "metadata": {
+                "source": "college",
+                "type": "basic_info",
+                "college_id": college.id,
+                "college_name": college.name
+            }
+        }
+    
+    @staticmethod
+    def _college_detail_doc(detail, college_name: str) -> Dict[str, Any]:
+        content_parts = [f"{college_name}"]
+        
+        if hasattr(detail, 'degree') and detail.degree:
+            content_parts.append(f"{detail.degree}")
+        if hasattr(detail, 'branch') and detail.branch:
+            content_parts.append(f"{detail.branch}")
+        
+        details_parts = []
+        if hasattr(detail, 'fees_value') and detail.fees_value:
+            details_parts.append(f"Fees: {detail.fees_value}")
+        if hasattr(detail, 'avg_package_value') and detail.avg_package_value:
+            details_parts.append(f"Average package: {detail.avg_package_value}")
+        if hasattr(detail, 'highest_package_value') and detail.highest_package_value:
+            details_parts.append(f"Highest package: {detail.highest_package_value}")
+        if hasattr(detail, 'entrance_exam_value') and detail.entrance_exam_value:
+            details_parts.append(f"Entrance exam: {detail.entrance_exam_value}")
+        if hasattr(detail, 'cutoff_value') and detail.cutoff_value:
+            details_parts.append(f"Cutoff: {detail.cutoff_value}")
+        
+        return {
+            "id": f"college_detail_{detail.id}",
+            "content": " ".join(content_parts) + ": " + ", ".join(details_parts),
+            "metadata": {
+                "source": "college_detail",
+                "type": "detailed_info",
+                "college_id": detail.college_id,
+                "college_name": college_name
+            }
+        }
+    
+    @staticmethod
+    def _career_doc(career) -> Dict[str, Any]:
+        # Dynamically build content based on available attributes
+        content = f"{getattr(career, 'career_name', getattr(career, 'careername', 'Career'))} career"
+        
+        return {
+            "id": f"career_{career.id}",
+            "content": content,
+            "metadata": {
+                "source": "career",
+                "type": "career_info",
+                "career_id": career.id
+            }
+        }
+    
+    @staticmethod
+    def _career_template_doc(template) -> Dict[str, Any]:
+        career_name = getattr(template, 'career_name', getattr(template, 'careername', 'Career'))
+        description = getattr(template, 'career_description', getattr(template, 'careerdescription', ''))
+        
+        return {
+            "id": f"career_template_{template.id}",
+            "content": f"{career_name} career: {description or 'Career guidance available.'}",
+            "metadata": {
+                "source": "career_template",
+                "type": "career_overview",
+                "career_name": career_name
+            }
+        }
+    
+    @staticmethod
+    def _career_insight_doc(insight) -> Dict[str, Any]:
+        return {
+            "id": f"career_insight_{insight.id}",
+            "content": "Career insight available",
+            "metadata": {
+                "source": "career_insight",
+                "type": "top_1_percent"
+            }
+        }
+    
+    @staticmethod
+    def _branch_doc(branch) -> Dict[str, Any]:
+        branch_name = getattr(branch, 'branch_name', getattr(branch, 'branchname', 'Branch'))
+        
+        return {
+            "id": f"branch_{branch.id}",
+            "content": f"{branch_name} branch",
+            "metadata": {
+                "source": "branch",
+                "type": "branch_info",
+                "branch_name": branch_name
+            }
+        }
+    
+    @staticmethod
+    def _degree_doc(degree) -> Dict[str, Any]:
+        degree_name = getattr(degree, 'degree_name', getattr(degree, 'degreename', 'Degree'))
+        
+        return {
+            "id": f"degree_{degree.id}",
+            "content": f"{degree_name} degree",
+            "metadata": {
+                "source": "degree",
+                "type": "degree_info",
+                "degree_name": degree_name
+            }
+        }
+    
+    @staticmethod
+    def _entrance_exam_doc(exam) -> Dict[str, Any]:
+        exam_name = getattr(exam, 'exam_name', getattr(exam, 'examname', 'Exam'))
+        
+        return {
+            "id": f"exam_{exam.id}",
+            "content": f"{exam_name} entrance exam",
+            "metadata": {
+                "source": "entrance_exam",
+                "type": "exam_info",
+                "exam_name": exam_name
+            }
+        }
+    
+    @staticmethod
+    def _backward_roadmap_doc(roadmap) -> Dict[str, Any]:
+        career_name = getattr(roadmap, 'normalized_career', getattr(roadmap, 'career_goal_input', 'Career'))
+        
+        return {
+            "id": f"backward_roadmap_{roadmap.id}",
+            "content": f"{career_name} career roadmap",
+            "metadata": {
+                "source": "backward_roadmap",
+                "type": "career_roadmap"
+            }
+        }
+    
+    @staticmethod
+    def _guided_roadmap_doc(roadmap) -> Dict[str, Any]:
+        return {
+            "id": f"guided_roadmap_{roadmap.id}",
+            "content": f"Roadmap for {roadmap.class_level} student",
+            "metadata": {
+                "source": "guided_roadmap",
+                "type": "step_by_step",
+                "class_level": roadmap.class_level
+            }
+        }
+    
+    @staticmethod
+    def sources() -> Dict[str, Dict[str, Any]]:
+        """
+        Source name -> (query, keyset column, row -> document builder)
+        Queries select plain columns where a join is needed so no ORM
+        objects pile up in the session identity map.
+        """
+        return {
+            "college": {
+                "label": "colleges",
+                "query": select(College), "key": College.id,
+                "build": lambda row: KnowledgeLoader._college_doc(row[0])
+            },
+            "college_detail": {
+                "label": "college details",
+                # Inner join = details whose college is gone are skipped (no N+1 lookup)
+                "query": select(CollegeDetails, College.name).join(College, College.id == CollegeDetails.college_id),
+                "key": CollegeDetails.id,
+                "build": lambda row: KnowledgeLoader._college_detail_doc(row[0], row[1])
+            },
+            "career": {
+                "label": "careers",
+                "query": select(Career), "key": Career.id,
+                "build": lambda row: KnowledgeLoader._career_doc(row[0])
+            },
+            "career_template": {
+                "label": "career templates",
+                "query": select(CareerTemplate), "key": CareerTemplate.id,
+                "build": lambda row: KnowledgeLoader._career_template_doc(row[0])
+            },
+            "career_insight": {
+                "label": "career insights",
+                "query": select(CareerInsight), "key": CareerInsight.id,
+                "build": lambda row: KnowledgeLoader._career_insight_doc(row[0])
+            },
+            "branch": {
+                "label": "branches",
+                "query": select(Branch), "key": Branch.id,
+                "build": lambda row: KnowledgeLoader._branch_doc(row[0])
+            },
+            "degree": {
+                "label": "degrees",
+                "query": select(Degree), "key": Degree.id,
+                "build": lambda row: KnowledgeLoader._degree_doc(row[0])
+            },
+            "entrance_exam": {
+                "label": "entrance exams",
+                "query": select(EntranceExam), "key": EntranceExam.id,
+                "build": lambda row: KnowledgeLoader._entrance_exam_doc(row[0])
+            },
+            "backward_roadmap": {
+                "label": "backward roadmaps",
+                "query": select(BackwardRoadmap), "key": BackwardRoadmap.id,
+                "build": lambda row: KnowledgeLoader._backward_roadmap_doc(row[0])
+            },
+            "guided_roadmap": {
+                "label": "guided roadmaps",
+                "query": select(Roadmap).where(Roadmap.roadmap_type == "guided"), "key": Roadmap.id,
+                "build": lambda row: KnowledgeLoader._guided_roadmap_doc(row[0])
+            },
+        }
+    
+    # ============================================
+    # STREAMING
+    # ============================================
+    
+    @staticmethod
+    async def stream_source(
+        name: str,
+        batch_size: Optional[int] = None,
+        session_factory: Optional[Callable] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield one source's documents in batches of batch_size
+        
+        Keyset pagination: each page is an index range scan on the primary
+        key, so page 500 costs the same as page 1 (unlike OFFSET)
+        """
+        source = KnowledgeLoader.sources()[name]
+        batch_size = batch_size or settings.RAG_LOADER_BATCH_SIZE
+        session_factory = session_factory or AsyncSessionLocal
+        key = source["key"]
+        last_id = None
+        
+        async with session_factory() as db:
+            while True:
+                query = source["query"].order_by(key).limit(batch_size)
+                if last_id is not None:
+                    query = query.where(key > last_id)
+                rows = (await db.execute(query)).all()
+                if not rows:
+                    break
                 
-                for college in colleges:
-                    content_parts = [f"{college.name}"]
-                    
-                    if hasattr(college, 'state') and college.state:
-                        content_parts.append(f"located in {college.state}")
-                    if hasattr(college, 'nirf_rank') and college.nirf_rank:
-                        content_parts.append(f"NIRF Rank: {college.nirf_rank}")
-                    if hasattr(college, 'type') and college.type:
-                        content_parts.append(f"Type: {college.type}")
-                    
-                    doc = {
-                        "id": f"college_{college.id}",
-                        "content": ". ".join(content_parts) + ".",
-                        "metadata": {
-                            "source": "college",
-                            "type": "basic_info",
-                            "college_id": college.id,
-                            "college_name": college.name
-                        }
-                    }
-                    documents.append(doc)
+                last_id = rows[-1][0].id
+                batch = [source["build"](row) for row in rows]
+                # Drop the page's ORM objects before loading the next one
+                db.expunge_all()
+                yield batch
                 
-                logger.info(f"Loaded {len(documents)} college documents")
-                break
+                if len(rows) < batch_size:
+                    break
+    
+    @staticmethod
+    async def stream_all(
+        batch_size: Optional[int] = None,
+        session_factory: Optional[Callable] = None,
+        failed_sources: Optional[List[str]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield document batches from every source in turn
+        
+        A failing source is logged and skipped; its name is appended to
+        failed_sources so callers (the indexer) know the stream is partial
+        """
+        for name, source in KnowledgeLoader.sources().items():
+            count = 0
+            try:
+                async for batch in KnowledgeLoader.stream_source(name, batch_size, session_factory):
+                    count += len(batch)
+                    yield batch
+                logger.info(f"📚 Streamed {count} {source['label']} documents")
             except Exception as e:
-                logger.error(f"Error loading colleges: {str(e)}")
-        
+                logger.error(f"Error loading {source['label']}: {str(e)}")
+                if failed_sources is not None:
+                    failed_sources.append(name)
+    
+    @staticmethod
+    async def _collect(name: str) -> List[Dict[str, Any]]:
+        documents = []
+        try:
+            async for batch in KnowledgeLoader.stream_source(name):
+                documents.extend(batch)
+            logger.info(f"Loaded {len(documents)} {KnowledgeLoader.sources()[name]['label']} documents")
+        except Exception as e:
+            logger.error(f"Error loading {KnowledgeLoader.sources()[name]['label']}: {str(e)}")
         return documents
     
+    # ============================================
+    # LIST LOADERS (whole table in memory - prefer stream_all for indexing)
+    # ============================================
+    
+    @staticmethod
+    async def load_colleges() -> List[Dict[str, Any]]:
+        """Load college basic info"""
+        return await KnowledgeLoader._collect("college")
+    
     @staticmethod
     async def load_college_details() -> List[Dict[str, Any]]:
         """Load detailed college info"""
-        documents = []
-        
-        async for db in get_db():
-            try:
-                result = await db.execute(select(CollegeDetails))
-                details = result.scalars().all()
-                
-                for detail in details:
-                    # Get college name
-                    college_result = await db.execute(
-                        select(College).where(College.id == detail.college_id)
-                    )
-                    college = college_result.scalar_one_or_none()
-                    
-                    if college:
-                        content_parts = [f"{college.name}"]
-                        
-                        if hasattr(detail, 'degree') and detail.degree:
-                            content_parts.append(f"{detail.degree}")
-                        if hasattr(detail, 'branch') and detail.branch:
-                            content_parts.append(f"{detail.branch}")
-                        
-                        details_parts = []
-                        if hasattr(detail, 'fees_value') and detail.fees_value:
-                            details_parts.append(f"Fees: {detail.fees_value}")
-                        if hasattr(detail, 'avg_package_value') and detail.avg_package_value:
-                            details_parts.append(f"Average package: {detail.avg_package_value}")
-                        if hasattr(detail, 'highest_package_value') and detail.highest_package_value:
-                            details_parts.append(f"Highest package: {detail.highest_package_value}")
-                        if hasattr(detail, 'entrance_exam_value') and detail.entrance_exam_value:
-                            details_parts.append(f"Entrance exam: {detail.entrance_exam_value}")
-                        if hasattr(detail, 'cutoff_value') and detail.cutoff_value:
-                            details_parts.append(f"Cutoff: {detail.cutoff_value}")
-                        
-                        content = " ".join(content_parts) + ": " + ", ".join(details_parts)
-                        
-                        doc = {
-                            "id": f"college_detail_{detail.id}",
-                            "content": content,
-                            "metadata": {
-                                "source": "college_detail",
-                                "type": "detailed_info",
-                                "college_id": detail.college_id,
-                                "college_name": college.name
-                            }
-                        }
-                        documents.append(doc)
-                
-                logger.info(f"Loaded {len(documents)} college detail documents")
-                break
-            except Exception as e:
-                logger.error(f"Error loading college details: {str(e)}")
-        
-        return documents
+        return await KnowledgeLoader._collect("college_detail")
     
     @staticmethod
     async def load_careers() -> List[Dict[str, Any]]:
         """Load career information"""
-        documents = []
-        
-        async for db in get_db():
-            try:
-                result = await db.execute(select(Career))
-                careers = result.scalars().all()
-                
-                for career in careers:
-                    # Dynamically build content based on available attributes
-                    content = f"{getattr(career, 'career_name', getattr(career, 'careername', 'Career'))} career"
-                    
-                    doc = {
-                        "id": f"career_{career.id}",
-                        "content": content,
-                        "metadata": {
-                            "source": "career",
-                            "type": "career_info",
-                            "career_id": career.id
-                        }
-                    }
-                    documents.append(doc)
-                
-                logger.info(f"Loaded {len(documents)} career documents")
-                break
-            except Exception as e:
-                logger.error(f"Error loading careers: {str(e)}")
-        
-        return documents
+        return await KnowledgeLoader._collect("career")
     
     @staticmethod
     async def load_career_templates() -> List[Dict[str, Any]]:
         """Load pre-built career templates"""
-        documents = []
-        
-        async for db in get_db():
-            try:
-                # Try without is_active filter first
-                result = await db.execute(select(CareerTemplate))
-                templates = result.scalars().all()
-                
-                for template in templates:
-                    career_name = getattr(template, 'career_name', getattr(template, 'careername', 'Career'))
-                    description = getattr(template, 'career_description', getattr(template, 'careerdescription', ''))
-                    
-                    content = f"{career_name} career: {description or 'Career guidance available.'}"
-                    
-                    doc = {
-                        "id": f"career_template_{template.id}",
-                        "content": content,
-                        "metadata": {
-                            "source": "career_template",
-                            "type": "career_overview",
-                            "career_name": career_name
-                        }
-                    }
-                    documents.append(doc)
-                
-                logger.info(f"Loaded {len(documents)} career template documents")
-                break
-            except Exception as e:
-                logger.error(f"Error loading career templates: {str(e)}")
-        
-        return documents
+        return await KnowledgeLoader._collect("career_template")
     
     @staticmethod
     async def load_career_insights() -> List[Dict[str, Any]]:
         """Load career insights"""
-        documents = []
-        
-        async for db in get_db():
-            try:
-                result = await db.execute(select(CareerInsight))
-                insights = result.scalars().all()
-                
-                for insight in insights:
-                    content = "Career insight available"
-                    
-                    doc = {
-                        "id": f"career_insight_{insight.id}",
-                        "content": content,
-                        "metadata": {
-                            "source": "career_insight",
-                            "type": "top_1_percent"
-                        }
-                    }
-                    documents.append(doc)
-                
-                logger.info(f"Loaded {len(documents)} career insight documents")
-                break
-            except Exception as e:
-                logger.error(f"Error loading career insights: {str(e)}")
-        
-        return documents
+        return await KnowledgeLoader._collect("career_insight")
     
     @staticmethod
     async def load_branches() -> List[Dict[str, Any]]:
         """Load branch information"""
-        documents = []
-        
-        async for db in get_db():
-            try:
-                result = await db.execute(select(Branch))
-                branches = result.scalars().all()
-                
-                for branch in branches:
-                    branch_name = getattr(branch, 'branch_name', getattr(branch, 'branchname', 'Branch'))
-                    content = f"{branch_name} branch"
-                    
-                    doc = {
-                        "id": f"branch_{branch.id}",
-                        "content": content,
-                        "metadata": {
-                            "source": "branch",
-                            "type": "branch_info",
-                            "branch_name": branch_name
-                        }
-                    }
-                    documents.append(doc)
-                
-                logger.info(f"Loaded {len(documents)} branch documents")
-                break
-            except Exception as e:
-                logger.error(f"Error loading branches: {str(e)}")
-        
-        return documents
+        return await KnowledgeLoader._collect("branch")
     
     @staticmethod
     async def load_degrees() -> List[Dict[str, Any]]:
         """Load degree information"""
-        documents = []
-        
-        async for db in get_db():
-            try:
-                result = await db.execute(select(Degree))
-                degrees = result.scalars().all()
-                
-                for degree in degrees:
-                    degree_name = getattr(degree, 'degree_name', getattr(degree, 'degreename', 'Degree'))
-                    content = f"{degree_name} degree"
-                    
-                    doc = {
-                        "id": f"degree_{degree.id}",
-                        "content": content,
-                        "metadata": {
-                            "source": "degree",
-                            "type": "degree_info",
-                            "degree_name": degree_name
-                        }
-                    }
-                    documents.append(doc)
-                
-                logger.info(f"Loaded {len(documents)} degree documents")
-                break
-            except Exception as e:
-                logger.error(f"Error loading degrees: {str(e)}")
-        
-        return documents
+        return await KnowledgeLoader._collect("degree")
     
     @staticmethod
     async def load_entrance_exams() -> List[Dict[str, Any]]:
         """Load entrance exam information"""
-        documents = []
-        
-        async for db in get_db():
-            try:
-                result = await db.execute(select(EntranceExam))
-                exams = result.scalars().all()
-                
-                for exam in exams:
-                    exam_name = getattr(exam, 'exam_name', getattr(exam, 'examname', 'Exam'))
-                    content = f"{exam_name} entrance exam"
-                    
-                    doc = {
-                        "id": f"exam_{exam.id}",
-                        "content": content,
-                        "metadata": {
-                            "source": "entrance_exam",
-                            "type": "exam_info",
-                            "exam_name": exam_name
-                        }
-                    }
-                    documents.append(doc)
-                
-                logger.info(f"Loaded {len(documents)} entrance exam documents")
-                break
-            except Exception as e:
-                logger.error(f"Error loading entrance exams: {str(e)}")
-        
-        return documents
+        return await KnowledgeLoader._collect("entrance_exam")
     
     @staticmethod
     async def load_backward_roadmaps() -> List[Dict[str, Any]]:
         """Load backward career roadmaps"""
-        documents = []
-        
-        async for db in get_db():
-            try:
-                result = await db.execute(select(BackwardRoadmap))
-                roadmaps = result.scalars().all()
-                
-                for roadmap in roadmaps:
-                    career_name = getattr(roadmap, 'normalized_career', getattr(roadmap, 'career_goal_input', 'Career'))
-                    content = f"{career_name} career roadmap"
-                    
-                    doc = {
-                        "id": f"backward_roadmap_{roadmap.id}",
-                        "content": content,
-                        "metadata": {
-                            "source": "backward_roadmap",
-                            "type": "career_roadmap"
-                        }
-                    }
-                    documents.append(doc)
-                
-                logger.info(f"Loaded {len(documents)} backward roadmap documents")
-                break
-            except Exception as e:
-                logger.error(f"Error loading backward roadmaps: {str(e)}")
-        
-        return documents
+        return await KnowledgeLoader._collect("backward_roadmap")
     
     @staticmethod
     async def load_guided_roadmaps() -> List[Dict[str, Any]]:
         """Load guided roadmaps"""
-        documents = []
-        
-        async for db in get_db():
-            try:
-                result = await db.execute(
-                    select(Roadmap).where(Roadmap.roadmap_type == "guided")
-                )
-                roadmaps = result.scalars().all()
-                
-                for roadmap in roadmaps:
-                    content = f"Roadmap for {roadmap.class_level} student"
-                    
-                    doc = {
-                        "id": f"guided_roadmap_{roadmap.id}",
-                        "content": content,
-                        "metadata": {
-                            "source": "guided_roadmap",
-                            "type": "step_by_step",
-                            "class_level": roadmap.class_level
-                        }
-                    }
-                    documents.append(doc)
-                
-                logger.info(f"Loaded {len(documents)} guided roadmap documents")
-                break
-            except Exception as e:
-                logger.error(f"Error loading guided roadmaps: {str(e)}")
-        
-        return documents
+        return await KnowledgeLoader._collect("guided_roadmap")
     
     @staticmethod
     async def load_all() -> List[Dict[str, Any]]:
@@ -379,47 +388,8 @@ class KnowledgeLoader:
         logger.info("=" * 60)
         
         all_docs = []
-        
-        # Load each category
-        logger.info("\n📚 Loading colleges...")
-        colleges = await KnowledgeLoader.load_colleges()
-        all_docs.extend(colleges)
-        
-        logger.info("📚 Loading college details...")
-        college_details = await KnowledgeLoader.load_college_details()
-        all_docs.extend(college_details)
-        
-        logger.info("📚 Loading careers...")
-        careers = await KnowledgeLoader.load_careers()
-        all_docs.extend(careers)
-        
-        logger.info("📚 Loading career templates...")
-        templates = await KnowledgeLoader.load_career_templates()
-        all_docs.extend(templates)
-        
-        logger.info("📚 Loading career insights...")
-        insights = await KnowledgeLoader.load_career_insights()
-        all_docs.extend(insights)
-        
-        logger.info("📚 Loading branches...")
-        branches = await KnowledgeLoader.load_branches()
-        all_docs.extend(branches)
-        
-        logger.info("📚 Loading degrees...")
-        degrees = await KnowledgeLoader.load_degrees()
-        all_docs.extend(degrees)
-        
-        logger.info("📚 Loading entrance exams...")
-        exams = await KnowledgeLoader.load_entrance_exams()
-        all_docs.extend(exams)
-        
-        logger.info("📚 Loading backward roadmaps...")
-        backward = await KnowledgeLoader.load_backward_roadmaps()
-        all_docs.extend(backward)
-        
-        logger.info("📚 Loading guided roadmaps...")
-        guided = await KnowledgeLoader.load_guided_roadmaps()
-        all_docs.extend(guided)
+        async for batch in KnowledgeLoader.stream_all():
+            all_docs.extend(batch)
         
         logger.info("=" * 60)
         logger.success(f"✅ Total documents loaded: {len(all_docs)}")
@@ -0,0 +1,575 @@
+"""
+Memory-Mapped Vector Store
+Read-only .npy vectors shared by every worker through the OS page cache
+(RAG_VECTOR_BACKEND=mmap, drop-in for the Chroma VectorStore)
+
+📚 STUDY NOTES - WHY MMAP + BRUTE FORCE?
+=======================================
+- Each gunicorn worker opening chromadb.PersistentClient loads its own copy
+  of the HNSW index plus SQLite handles and caches; with N workers the same
+  vectors sit in RAM N times
+- np.load(mmap_mode="r") maps the file instead of reading it: the pages live
+  in the kernel page cache ONCE and every worker's mapping points at them
+  (RSS counts them in each process, PSS splits them between processes)
+- Tens of thousands of 384-d float32 vectors are ~15 MB per 10k; one BLAS
+  matrix-vector product over all of them takes a few milliseconds, so exact
+  search needs no ANN index, and metadata filters are just boolean masks
+- Distances are squared L2 like Chroma's default space:
+      |q - x|^2 = |q|^2 + |x|^2 - 2 q.x   (|x|^2 precomputed in norms.npy)
+  so RAGRetriever's score = 1 - distance means the same on both backends
+
+📚 STUDY NOTES - ON-DISK LAYOUT (one directory per collection):
+==============================================================
+    CURRENT                  -> name of the live manifest (swapped with os.replace)
+    manifest-000012.json     -> {"dim": 384, "segments": [{"name", "dead"}]}
+    seg-000003/              -> immutable segment
+        vectors.npy          float32 (n, dim)
+        norms.npy            float32 (n,) squared L2 norms
+        ids.*, documents.*   UTF-8 blob + int64 offsets (columnar strings)
+        meta_<i>.*           one JSON-encoded column per metadata key
+        columns.json         metadata key order
+        dead-000012.npy      rows deleted/overwritten as of generation 12
+- A write never touches live files: new rows go to a new segment, replaced
+  or deleted rows are listed in a new dead-*.npy, then a new manifest is
+  written and CURRENT is atomically replaced. Readers notice the new
+  CURRENT (inode changes) and remap; a half-written update is never visible
+- Too many segments or dead rows -> the write merges everything into one
+  segment (RAG_MMAP_MAX_SEGMENTS / RAG_MMAP_MAX_DEAD_RATIO)
+- Files no longer referenced are deleted right away; workers still mapping
+  them keep valid pages until they remap (POSIX unlink semantics)
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+from ai_career_advisor.rag.vector_store import VectorStore
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines: writes are only serialised within the process
+    fcntl = None
+
+
+DEFAULT_PERSIST_DIRECTORY = Path(__file__).resolve().parent.parent.parent / "vector_store_mmap"
+
+
+def _load(path: Path) -> np.ndarray:
+    """Read-only mapping, viewed as a plain ndarray (np.memmap wraps every slice and result)"""
+    try:
+        return np.asarray(np.load(path, mmap_mode="r"))
+    except ValueError:
+        # Older NumPy refuses to map zero-length arrays
+        return np.load(path)
+
+
+def _json_value(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+
+
+class StringColumn:
+    """Strings stored as one UTF-8 blob + offsets, decoded on access"""
+
+    def __init__(self, directory: Path, name: str):
+        self.offsets = _load(directory / f"{name}.offsets.npy")
+        self.blob = _load(directory / f"{name}.blob.npy")
+        self._bytes = memoryview(self.blob)
+
+    @staticmethod
+    def write(directory: Path, name: str, values: List[str]):
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        np.save(directory / f"{name}.offsets.npy", offsets)
+        np.save(directory / f"{name}.blob.npy", np.frombuffer(b"".join(encoded), dtype=np.uint8))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> str:
+        return str(self._bytes[int(self.offsets[row]):int(self.offsets[row + 1])], "utf-8")
+
+    def take(self, rows: Optional[np.ndarray] = None) -> List[str]:
+        """All values, or the given rows, decoded in one pass"""
+        data, offsets = self.blob.tobytes(), self.offsets.tolist()
+        rows = range(len(offsets) - 1) if rows is None else rows.tolist()
+        return [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in rows]
+
+
+class Segment:
+    """One immutable block of rows plus the dead-row mask of the current generation"""
+
+    def __init__(self, directory: Path, dead: Optional[str] = None):
+        self.directory = directory
+        self.name = directory.name
+        self.dead_file = dead
+        self.vectors = _load(directory / "vectors.npy")
+        self.norms = _load(directory / "norms.npy")
+        self.ids = StringColumn(directory, "ids")
+        self.documents = StringColumn(directory, "documents")
+        keys = json.loads((directory / "columns.json").read_text(encoding="utf-8"))["metadata_keys"]
+        self.metadata = {key: StringColumn(directory, f"meta_{i}") for i, key in enumerate(keys)}
+
+        self.alive = np.ones(len(self.vectors), dtype=bool)
+        if dead:
+            self.alive[np.load(directory.parent / dead)] = False
+        # metadata key -> (JSON value -> code, per-row codes), built on the first filter
+        self._categories: Dict[str, Tuple[Dict[str, int], np.ndarray]] = {}
+
+    @staticmethod
+    def encode_metadata(metadatas: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Metadata dicts -> one JSON-encoded column per key ("" = key missing)"""
+        keys = sorted({key for metadata in metadatas for key in metadata})
+        return {
+            key: [_json_value(metadata[key]) if key in metadata else "" for metadata in metadatas]
+            for key in keys
+        }
+
+    def columns(self, rows: np.ndarray) -> Dict[str, List[str]]:
+        """Encoded metadata columns of the given rows (for merging without decoding)"""
+        return {key: column.take(rows) for key, column in self.metadata.items()}
+
+    @staticmethod
+    def write(directory: Path, vectors: np.ndarray, ids: List[str], documents: List[str], columns: Dict[str, List[str]]):
+        tmp = directory.with_name(directory.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        np.save(tmp / "vectors.npy", vectors)
+        np.save(tmp / "norms.npy", np.einsum("ij,ij->i", vectors, vectors))
+        StringColumn.write(tmp, "ids", ids)
+        StringColumn.write(tmp, "documents", documents)
+        keys = sorted(columns)
+        for i, key in enumerate(keys):
+            StringColumn.write(tmp, f"meta_{i}", columns[key])
+        (tmp / "columns.json").write_text(json.dumps({"metadata_keys": keys, "rows": len(ids)}), encoding="utf-8")
+        # Left over from a write that failed before its manifest went live
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp, directory)
+
+    def row_metadata(self, row: int) -> Dict[str, Any]:
+        metadata = {}
+        for key, column in self.metadata.items():
+            value = column[row]
+            if value:
+                metadata[key] = json.loads(value)
+        return metadata
+
+    def _codes(self, key: str) -> Tuple[Dict[str, int], np.ndarray]:
+        if key not in self._categories:
+            lookup: Dict[str, int] = {}
+            column = self.metadata.get(key)
+            values = column.take() if column is not None else [""] * len(self.vectors)
+            codes = np.fromiter((lookup.setdefault(v, len(lookup)) for v in values), dtype=np.int32, count=len(values))
+            self._categories[key] = (lookup, codes)
+        return self._categories[key]
+
+    def _match(self, key: str, condition: Any) -> np.ndarray:
+        lookup, codes = self._codes(key)
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        mask = np.ones(len(codes), dtype=bool)
+        for op, value in condition.items():
+            if op in ("$eq", "$ne"):
+                hit = codes == lookup.get(_json_value(value), -1)
+                mask &= hit if op == "$eq" else (~hit & (codes != lookup.get("", -1)))
+            elif op in ("$in", "$nin"):
+                hit = np.isin(codes, [lookup[v] for v in map(_json_value, value) if v in lookup])
+                mask &= hit if op == "$in" else (~hit & (codes != lookup.get("", -1)))
+            else:
+                raise ValueError(f"Unsupported metadata filter operator: {op}")
+        return mask
+
+    def mask(self, where: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Alive rows matching a Chroma-style where filter ($and/$or, $eq/$ne/$in/$nin)"""
+        return self.alive & self._where(where) if where else self.alive
+
+    def _where(self, where: Dict[str, Any]) -> np.ndarray:
+        mask = np.ones(len(self.vectors), dtype=bool)
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self._where(clause)
+            elif key == "$or":
+                mask &= np.logical_or.reduce([self._where(clause) for clause in condition])
+            else:
+                mask &= self._match(key, condition)
+        return mask
+
+
+class MmapCollection:
+    """
+    Chroma Collection surface (add / upsert / delete / get / query / count)
+    over memory-mapped segments
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.name = self.directory.name
+        self._lock = threading.RLock()
+        self._pointer: Optional[Tuple[int, int]] = None
+        self._manifest: Dict[str, Any] = {"generation": 0, "dim": None, "segments": []}
+        self._segments: List[Segment] = []
+        # ID -> (segment name, row) of the live generation, built on first lookup
+        self._locations: Optional[Dict[str, Tuple[str, int]]] = None
+
+    # ================== READ SIDE ==================
+
+    @property
+    def current_path(self) -> Path:
+        return self.directory / "CURRENT"
+
+    def _pointer_key(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.current_path.stat()
+        except FileNotFoundError:
+            return None
+        # os.replace gives CURRENT a new inode on every swap
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _refresh(self) -> List[Segment]:
+        """Segments of the live generation, remapped if another process swapped CURRENT"""
+        pointer = self._pointer_key()
+        if pointer == self._pointer:
+            return self._segments
+        with self._lock:
+            for attempt in range(5):
+                pointer = self._pointer_key()
+                try:
+                    self._load(pointer)
+                    break
+                except FileNotFoundError:
+                    # A writer swapped and cleaned up between our read of CURRENT and the mapping
+                    time.sleep(0.01 * (attempt + 1))
+            else:
+                raise RuntimeError(f"Could not map a consistent generation of '{self.name}'")
+        return self._segments
+
+    def _load(self, pointer: Optional[Tuple[int, int]], locations: Optional[Dict[str, Tuple[str, int]]] = None):
+        if pointer is None:
+            manifest = {"generation": 0, "dim": None, "segments": []}
+        else:
+            manifest_name = self.current_path.read_text(encoding="utf-8").strip()
+            manifest = json.loads((self.directory / manifest_name).read_text(encoding="utf-8"))
+
+        # Unchanged segments keep their mapping and filter caches
+        previous = {(s.name, s.dead_file): s for s in self._segments}
+        self._segments = [
+            previous.get((entry["name"], entry["dead"])) or Segment(self.directory / entry["name"], entry["dead"])
+            for entry in manifest["segments"]
+        ]
+        self._manifest = manifest
+        self._locations = locations
+        self._pointer = pointer
+
+    def _index(self) -> Dict[str, Tuple[str, int]]:
+        """ID -> (segment name, row) of every live row"""
+        segments = self._refresh()
+        with self._lock:
+            if self._locations is None:
+                self._locations = {}
+                for segment in segments:
+                    rows = np.flatnonzero(segment.alive)
+                    self._locations.update(zip(segment.ids.take(rows), ((segment.name, row) for row in rows.tolist())))
+            return self._locations
+
+    def count(self) -> int:
+        return int(sum(segment.alive.sum() for segment in self._refresh()))
+
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        include = include or ["documents", "metadatas"]
+        if ids is not None:
+            locations = self._index()
+            by_name = {segment.name: segment for segment in self._segments}
+            rows = [
+                (by_name[locations[doc_id][0]], locations[doc_id][1])
+                for doc_id in dict.fromkeys(ids) if doc_id in locations
+            ]
+            if where:
+                rows = [(segment, row) for segment, row in rows if segment.mask(where)[row]]
+        else:
+            rows = [
+                (segment, int(row)) for segment in self._refresh() for row in np.flatnonzero(segment.mask(where))
+            ]
+        return self._rows_result(rows, include)
+
+    def query(
+        self,
+        query_embeddings: List[List[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Exact top-n by squared L2 distance (one matrix-vector product per segment)"""
+        include = include or ["documents", "metadatas", "distances"]
+        segments = self._refresh()
+        masks = [segment.mask(where) for segment in segments]
+        results = {key: [] for key in ("ids", "documents", "metadatas", "distances", "embeddings")}
+
+        for query in query_embeddings:
+            query = np.asarray(query, dtype=np.float32).ravel()
+            query_norm = float(query @ query)
+            candidates: List[Tuple[float, int, int]] = []
+            for s, (segment, mask) in enumerate(zip(segments, masks)):
+                rows = np.flatnonzero(mask)
+                if not len(rows):
+                    continue
+                if len(rows) == len(mask):
+                    distances = segment.norms + query_norm - 2 * (segment.vectors @ query)
+                elif len(rows) * 2 < len(mask):
+                    # Selective filter: only the matching rows are multiplied
+                    distances = segment.norms[rows] + query_norm - 2 * (segment.vectors[rows] @ query)
+                else:
+                    distances = (segment.norms + query_norm - 2 * (segment.vectors @ query))[rows]
+                k = min(n_results, len(rows))
+                top = np.argpartition(distances, k - 1)[:k] if k < len(rows) else np.arange(len(rows))
+                candidates += [(float(distances[i]), s, int(rows[i])) for i in top]
+
+            candidates.sort(key=lambda c: c[0])
+            hits = [(segments[s], row) for _, s, row in candidates[:n_results]]
+            found = self._rows_result(hits, include)
+            for key in ("ids", "documents", "metadatas", "embeddings"):
+                results[key].append(found.get(key))
+            results["distances"].append([max(0.0, d) for d, _, _ in candidates[:n_results]])
+
+        return {key: (value if key == "ids" or key in include else None) for key, value in results.items()}
+
+    @staticmethod
+    def _rows_result(rows: List[Tuple[Segment, int]], include: List[str]) -> Dict[str, Any]:
+        result = {"ids": [segment.ids[row] for segment, row in rows]}
+        if "documents" in include:
+            result["documents"] = [segment.documents[row] for segment, row in rows]
+        if "metadatas" in include:
+            result["metadatas"] = [segment.row_metadata(row) for segment, row in rows]
+        if "embeddings" in include:
+            result["embeddings"] = [np.array(segment.vectors[row]) for segment, row in rows]
+        return result
+
+    # ================== WRITE SIDE ==================
+
+    def add(self, ids, embeddings, documents=None, metadatas=None):
+        """Insert new IDs; existing IDs are left as they are (Chroma add semantics)"""
+        self._write(ids, embeddings, documents, metadatas, overwrite=False)
+
+    def upsert(self, ids, embeddings, documents=None, metadatas=None):
+        self._write(ids, embeddings, documents, metadatas, overwrite=True)
+
+    def delete(self, ids: List[str]):
+        self._commit(new_rows=None, remove=set(ids))
+
+    def _write(self, ids, embeddings, documents, metadatas, overwrite: bool):
+        if not len(ids):
+            return
+        # Last occurrence of a repeated ID wins
+        latest = {doc_id: i for i, doc_id in enumerate(ids)}
+        order = sorted(latest.values())
+        rows = {
+            "ids": [ids[i] for i in order],
+            "vectors": np.asarray(embeddings, dtype=np.float32)[order],
+            "documents": [(documents[i] if documents else None) or "" for i in order],
+            "metadatas": [dict(metadatas[i] or {}) if metadatas else {} for i in order]
+        }
+        self._commit(new_rows=rows, remove=set(latest) if overwrite else set(), skip_existing=not overwrite)
+
+    def _file_lock(self):
+        """Serialise writers across worker processes"""
+        handle = open(self.directory / "LOCK", "a")
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        return handle
+
+    def _commit(self, new_rows: Optional[Dict[str, Any]], remove: set, skip_existing: bool = False):
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            lock = self._file_lock()
+            try:
+                # Always start from the newest generation on disk
+                self._load(self._pointer_key())
+                segments, manifest = self._segments, self._manifest
+                generation = manifest["generation"] + 1
+                locations = self._index()
+                position = {segment.name: s for s, segment in enumerate(segments)}
+
+                if new_rows is not None:
+                    dim = manifest["dim"]
+                    if new_rows["vectors"].ndim != 2 or (dim is not None and new_rows["vectors"].shape[1] != dim):
+                        raise ValueError(f"Embedding dimension {new_rows['vectors'].shape[-1]} does not match collection ({dim})")
+                    if skip_existing:
+                        keep = [i for i, doc_id in enumerate(new_rows["ids"]) if doc_id not in locations]
+                        new_rows = {
+                            "ids": [new_rows["ids"][i] for i in keep],
+                            "vectors": new_rows["vectors"][keep],
+                            "documents": [new_rows["documents"][i] for i in keep],
+                            "metadatas": [new_rows["metadatas"][i] for i in keep]
+                        }
+                    if not new_rows["ids"]:
+                        new_rows = None
+
+                dead: Dict[int, List[int]] = {}
+                for doc_id in remove:
+                    if doc_id in locations:
+                        name, row = locations[doc_id]
+                        dead.setdefault(position[name], []).append(row)
+                if new_rows is None and not dead:
+                    return
+
+                entries, merged = self._next_entries(segments, dead, new_rows, generation)
+                manifest = {
+                    "generation": generation,
+                    "dim": manifest["dim"] if new_rows is None else int(new_rows["vectors"].shape[1]),
+                    "segments": entries
+                }
+                manifest_name = f"manifest-{generation:06d}.json"
+                (self.directory / manifest_name).write_text(json.dumps(manifest), encoding="utf-8")
+                tmp = self.directory / "CURRENT.tmp"
+                tmp.write_text(manifest_name, encoding="utf-8")
+                os.replace(tmp, self.current_path)
+
+                self._cleanup(manifest)
+
+                # Our own write: patch the ID index instead of rebuilding it (unless everything was merged)
+                carried = None
+                if not merged:
+                    carried = {doc_id: location for doc_id, location in locations.items() if doc_id not in remove}
+                    if new_rows is not None:
+                        name = f"seg-{generation:06d}"
+                        carried.update((doc_id, (name, row)) for row, doc_id in enumerate(new_rows["ids"]))
+                self._load(self._pointer_key(), locations=carried)
+            finally:
+                lock.close()
+
+    def _next_entries(
+        self,
+        segments: List[Segment],
+        dead: Dict[int, List[int]],
+        new_rows: Optional[Dict[str, Any]],
+        generation: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Segment list of the next generation: new dead masks + a segment for
+        the new rows, or everything merged into one segment (merged=True)
+        """
+        alive = [segment.alive.copy() for segment in segments]
+        for s, rows in dead.items():
+            alive[s][rows] = False
+
+        total = sum(len(mask) for mask in alive) + (len(new_rows["ids"]) if new_rows else 0)
+        dead_total = sum(int((~mask).sum()) for mask in alive)
+        if len(segments) + 1 > settings.RAG_MMAP_MAX_SEGMENTS or (total and dead_total / total > settings.RAG_MMAP_MAX_DEAD_RATIO):
+            return self._merge(segments, alive, new_rows, generation), True
+
+        entries = []
+        for s, segment in enumerate(segments):
+            if not alive[s].any():
+                continue
+            dead_file = segment.dead_file
+            if s in dead:
+                dead_file = f"{segment.name}/dead-{generation:06d}.npy"
+                np.save(self.directory / dead_file, np.flatnonzero(~alive[s]).astype(np.int64))
+            entries.append({"name": segment.name, "dead": dead_file})
+
+        if new_rows is not None:
+            name = f"seg-{generation:06d}"
+            Segment.write(
+                self.directory / name, new_rows["vectors"], new_rows["ids"], new_rows["documents"],
+                Segment.encode_metadata(new_rows["metadatas"])
+            )
+            entries.append({"name": name, "dead": None})
+        return entries, False
+
+    def _merge(
+        self,
+        segments: List[Segment],
+        alive: List[np.ndarray],
+        new_rows: Optional[Dict[str, Any]],
+        generation: int
+    ) -> List[Dict[str, Any]]:
+        parts = []
+        for segment, mask in zip(segments, alive):
+            rows = np.flatnonzero(mask)
+            if len(rows):
+                parts.append((segment.vectors[rows], segment.ids.take(rows), segment.documents.take(rows), segment.columns(rows)))
+        if new_rows is not None:
+            parts.append((new_rows["vectors"], new_rows["ids"], new_rows["documents"], Segment.encode_metadata(new_rows["metadatas"])))
+        if not parts:
+            return []
+
+        ids = [doc_id for part in parts for doc_id in part[1]]
+        keys = sorted({key for part in parts for key in part[3]})
+        columns = {key: [value for part in parts for value in part[3].get(key, [""] * len(part[1]))] for key in keys}
+        name = f"seg-{generation:06d}"
+        Segment.write(
+            self.directory / name, np.concatenate([part[0] for part in parts]),
+            ids, [document for part in parts for document in part[2]], columns
+        )
+        logger.debug(f"Merged '{self.name}' into one segment ({len(ids)} rows)")
+        return [{"name": name, "dead": None}]
+
+    def _cleanup(self, manifest: Dict[str, Any]):
+        """Delete files the live manifest no longer references"""
+        live_segments = {entry["name"] for entry in manifest["segments"]}
+        live_dead = {entry["dead"] for entry in manifest["segments"] if entry["dead"]}
+        live_manifest = f"manifest-{manifest['generation']:06d}.json"
+        for path in self.directory.iterdir():
+            if path.name.startswith("manifest-") and path.name != live_manifest:
+                path.unlink(missing_ok=True)
+            elif path.name.startswith("seg-") and path.is_dir():
+                if path.name not in live_segments:
+                    shutil.rmtree(path, ignore_errors=True)
+                    continue
+                for dead_file in path.glob("dead-*.npy"):
+                    if f"{path.name}/{dead_file.name}" not in live_dead:
+                        dead_file.unlink(missing_ok=True)
+
+
+class MmapVectorStore(VectorStore):
+    """
+    VectorStore backed by memory-mapped .npy segments instead of ChromaDB
+
+    Same methods as VectorStore; the collections it hands out implement the
+    Chroma Collection calls VectorStore makes.
+    """
+
+    def __init__(self, persist_directory: Optional[str] = None):
+        self.persist_directory = str(persist_directory or settings.RAG_MMAP_DIR or DEFAULT_PERSIST_DIRECTORY)
+        os.makedirs(self.persist_directory, exist_ok=True)
+        self._collections: Dict[str, MmapCollection] = {}
+        self._collections_lock = threading.Lock()
+        logger.info(f"Memory-mapped vector store at: {self.persist_directory}")
+
+    def get_or_create_collection(self, collection_name: str = "career_knowledge") -> MmapCollection:
+        """One MmapCollection per name per process, so each file is mapped once"""
+        with self._collections_lock:
+            if collection_name not in self._collections:
+                collection = MmapCollection(Path(self.persist_directory) / collection_name)
+                collection.directory.mkdir(parents=True, exist_ok=True)
+                self._collections[collection_name] = collection
+                logger.info(f"Collection '{collection_name}' loaded ({collection.count()} documents)")
+            return self._collections[collection_name]
+
+    def delete_collection(self, collection_name: str = "career_knowledge"):
+        with self._collections_lock:
+            self._collections.pop(collection_name, None)
+        directory = Path(self.persist_directory) / collection_name
+        if directory.exists():
+            # Rename first so no reader maps a half-deleted collection
+            trash = directory.with_name(f".{collection_name}.deleted-{time.time_ns()}")
+            os.replace(directory, trash)
+            shutil.rmtree(trash, ignore_errors=True)
+            logger.warning(f"Collection '{collection_name}' deleted")
+
+    def reset_database(self):
+        for name in list(os.listdir(self.persist_directory)):
+            self.delete_collection(name)
+        logger.warning("Memory-mapped vector store reset - all data deleted!")
@@ -1,100 +1,232 @@
-from ai_career_advisor.RAG.vector_store import VectorStore
-from ai_career_advisor.RAG.embeddings import EmbeddingService
+from ai_career_advisor.rag.embeddings import EmbeddingService
+from ai_career_advisor.rag.indexer import KnowledgeIndexer, knowledge_indexer
+from ai_career_advisor.rag.bm25_index import BM25Index
+from ai_career_advisor.rag.hybrid import HybridRanker, reranker
+from ai_career_advisor.rag.context_builder import context_builder
+from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from collections import Counter
+import asyncio
+import numpy as np
 
 
 class RAGRetriever:
     
-    def __init__(self):
-        self.vector_store = VectorStore()
-        self.collection = self.vector_store.get_or_create_collection("career_knowledge")
+    def __init__(self, indexer: Optional[KnowledgeIndexer] = None):
+        self.indexer = indexer or knowledge_indexer
+        self._collection = None
+        self._collection_name = None
+        self._bm25 = None
+        self._bm25_name = None
+        # route -> searches ("routed", "fallback", "global")
+        self._routes = Counter()
     
-    async def search(self, query: str, top_k: int = 5) -> Dict[str, Any]:
+    @property
+    def vector_store(self):
+        """Shared with the indexer: one client / one set of mappings per worker"""
+        return self.indexer.vector_store
+    
+    @property
+    def collection(self):
+        """Collection currently behind the career_knowledge alias (switches after a shadow rebuild)"""
+        name = self.indexer.active_collection()
+        if self._collection is None or name != self._collection_name:
+            self._collection = self.vector_store.get_or_create_collection(name)
+            self._collection_name = name
+        return self._collection
+    
+    @property
+    def bm25(self) -> BM25Index:
+        """BM25 index built by the indexer for the active collection"""
+        name = self.indexer.active_collection()
+        if self._bm25 is None or name != self._bm25_name:
+            if self._bm25 is not None:
+                self._bm25.close()
+            self._bm25 = self.indexer.open_bm25(name)
+            self._bm25_name = name
+        return self._bm25
+    
+    @staticmethod
+    def _no_results() -> Dict[str, Any]:
+        return {
+            "found": False,
+            "ids": [],
+            "documents": [],
+            "metadatas": [],
+            "scores": []
+        }
+    
+    @staticmethod
+    def sources_for_intent(intent: Optional[str]) -> Optional[List[str]]:
+        """Knowledge sources an intent is routed to (None = search everything)"""
+        if not settings.RAG_ROUTING_ENABLED or not intent:
+            return None
+        return settings.RAG_ROUTING_SOURCES.get(intent) or None
+    
+    def _vector_hits(self, query_embedding: List[float], top_k: int, sources: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        results = self.vector_store.search(
+            collection=self.collection,
+            query_embedding=query_embedding,
+            top_k=top_k,
+            filter_metadata={"source": {"$in": sources}} if sources else None,
+            include_embeddings=True
+        )
+        embeddings = results.get('embeddings')
+        embeddings = embeddings[0] if embeddings else [None] * len(results['ids'][0])
+        return [
+            {"id": doc_id, "document": doc, "metadata": metadata or {}, "score": 1 - dist, "embedding": embedding}
+            for doc_id, doc, metadata, dist, embedding in zip(
+                results['ids'][0], results['documents'][0], results['metadatas'][0], results['distances'][0], embeddings
+            )
+        ]
+    
+    def _start_bm25(self, query: str, top_k: int, sources: Optional[List[str]] = None) -> Optional[asyncio.Future]:
+        """Submit the BM25 search to a worker thread now, so it overlaps the Chroma query"""
+        try:
+            return asyncio.get_running_loop().run_in_executor(None, self.bm25.search, query, top_k, sources)
+        except Exception as e:
+            logger.warning(f"BM25 index unavailable, using vector results only: {str(e)}")
+            return None
+    
+    @staticmethod
+    async def _bm25_hits(future: Optional[asyncio.Future]) -> List[Dict[str, Any]]:
+        if future is None:
+            return []
+        try:
+            return await future
+        except Exception as e:
+            logger.warning(f"BM25 search failed, using vector results only: {str(e)}")
+            return []
+    
+    def _fill_similarity(self, hits: List[Dict[str, Any]], query_embedding: List[float]):
+        """
+        BM25-only hits get the same similarity the vector search reports
+        (1 - squared L2 distance), so build_context's cutoff means one thing,
+        and their stored vector for near-duplicate detection
+        """
+        missing = [hit["id"] for hit in hits if hit["vector_score"] is None]
+        stored = self.vector_store.get_embeddings(self.collection, missing)
+        query = np.asarray(query_embedding, dtype=np.float32)
+        for hit in hits:
+            if hit["vector_score"] is None and hit["id"] in stored:
+                hit["embedding"] = stored[hit["id"]]
+                vector = np.asarray(hit["embedding"], dtype=np.float32)
+                hit["vector_score"] = float(1 - np.sum((vector - query) ** 2))
+    
+    async def _ranked_hits(
+        self,
+        query: str,
+        query_embedding: List[float],
+        top_k: int,
+        sources: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Final-ranked hits, restricted to the given knowledge sources if any"""
+        if not settings.RAG_HYBRID_ENABLED:
+            hits = self._vector_hits(query_embedding, top_k, sources)
+            for hit in hits:
+                hit["vector_score"] = hit["score"]
+            return hits
+        
+        candidates = max(top_k, settings.RAG_HYBRID_CANDIDATES)
+        bm25_future = self._start_bm25(query, candidates, sources)
+        vector_hits = self._vector_hits(query_embedding, candidates, sources)
+        hits = HybridRanker.fuse(vector_hits, await self._bm25_hits(bm25_future))
+        hits = (await reranker.rerank(query, hits))[:top_k]
+        self._fill_similarity(hits, query_embedding)
+        return hits
+    
+    @staticmethod
+    def _low_recall(hits: List[Dict[str, Any]], top_k: int) -> bool:
+        """Too few routed hits would survive build_context's score cutoff"""
+        relevant = sum(
+            1 for hit in hits
+            if hit["vector_score"] is not None and hit["vector_score"] >= settings.RAG_CONTEXT_MIN_SCORE
+        )
+        return relevant < min(settings.RAG_ROUTING_MIN_HITS, top_k)
+    
+    async def search(self, query: str, top_k: int = 5, intent: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Hybrid search: dense + BM25 fused with RRF, optionally cross-encoder
+        reranked (RAG_HYBRID_ENABLED=False = dense only)
+        
+        With a classifier intent (college_query, exam_query, ...) both
+        retrievers only search the intent's sources (RAG_ROUTING_SOURCES);
+        if that finds fewer than RAG_ROUTING_MIN_HITS usable hits, the
+        search is repeated over the whole collection
+        
+        Results are in final rank order; "scores" is always the vector
+        similarity, "fused_scores" the rank-fusion / rerank score,
+        "route" how the results were found (routed / fallback / global)
+        """
         try:
             logger.info(f"RAG search for: {query}")
             
             query_embedding = await EmbeddingService.generate_query_embedding(query)
             
-            results = self.vector_store.search(
-                collection=self.collection,
-                query_embedding=query_embedding,
-                top_k=top_k
-            )
+            sources = self.sources_for_intent(intent)
+            route = "global"
+            if sources:
+                hits = await self._ranked_hits(query, query_embedding, top_k, sources)
+                route = "routed"
+                if self._low_recall(hits, top_k):
+                    logger.info(f"🔀 Routed search ({intent}) found too few relevant hits, falling back to global search")
+                    route = "fallback"
+            if route != "routed":
+                hits = await self._ranked_hits(query, query_embedding, top_k)
+            self._routes[route] += 1
             
-            if not results['documents'][0]:
+            if not hits:
                 logger.warning("No results found in RAG")
-                return {
-                    "found": False,
-                    "documents": [],
-                    "metadatas": [],
-                    "scores": []
-                }
+                return self._no_results()
             
-            documents = results['documents'][0]
-            metadatas = results['metadatas'][0]
-            distances = results['distances'][0]
-            
-            scores = [1 - dist for dist in distances]
-            
-            logger.success(f"Found {len(documents)} relevant documents")
+            logger.success(f"Found {len(hits)} relevant documents ({route})")
             
             return {
                 "found": True,
-                "documents": documents,
-                "metadatas": metadatas,
-                "scores": scores
+                "ids": [hit["id"] for hit in hits],
+                "documents": [hit["document"] for hit in hits],
+                "metadatas": [hit["metadata"] for hit in hits],
+                "scores": [hit["vector_score"] if hit["vector_score"] is not None else 0.0 for hit in hits],
+                "fused_scores": [hit["score"] for hit in hits],
+                "embeddings": [hit.get("embedding") for hit in hits],
+                "route": route
             }
         
         except Exception as e:
             logger.error(f"RAG search error: {str(e)}")
-            return {
-                "found": False,
-                "documents": [],
-                "metadatas": [],
-                "scores": []
-            }
+            return self._no_results()
     
-    def build_context(self, search_results: Dict[str, Any], max_length: int = 2000) -> str:
-        if not search_results["found"]:
-            return ""
-        
-        context_parts = []
-        current_length = 0
-        
-        for doc, metadata, score in zip(
-            search_results["documents"],
-            search_results["metadatas"],
-            search_results["scores"]
-        ):
-            if score < 0.3:
-                continue
-            
-            source_type = metadata.get("source", "unknown")
-            doc_text = f"[Source: {source_type}] {doc}"
-            
-            if current_length + len(doc_text) > max_length:
-                break
-            
-            context_parts.append(doc_text)
-            current_length += len(doc_text)
-        
-        context = "\n\n".join(context_parts)
-        
-        logger.info(f"Built context with {len(context_parts)} documents ({current_length} chars)")
-        
-        return context
+    def get_routing_stats(self) -> Dict[str, Any]:
+        """Searches per route since startup; a high fallback share means the partitions are too narrow"""
+        routed = self._routes["routed"] + self._routes["fallback"]
+        return {
+            "enabled": settings.RAG_ROUTING_ENABLED,
+            **{route: self._routes[route] for route in ("routed", "fallback", "global")},
+            "fallback_rate": round(self._routes["fallback"] / routed, 4) if routed else 0.0
+        }
+    
+    def build_context(self, search_results: Dict[str, Any], target_model: str = "default") -> str:
+        """Deduplicated, MMR-ordered context within target_model's token budget"""
+        return context_builder.build(search_results, target_model=target_model)
     
-    async def search_and_build_context(self, query: str, top_k: int = 5) -> Dict[str, Any]:
-        search_results = await self.search(query, top_k)
-        context = self.build_context(search_results)
+    async def search_and_build_context(
+        self,
+        query: str,
+        top_k: int = 5,
+        target_model: str = "default",
+        intent: Optional[str] = None
+    ) -> Dict[str, Any]:
+        search_results = await self.search(query, top_k, intent=intent)
+        context = self.build_context(search_results, target_model)
         
         return {
             "context": context,
             "found": search_results["found"],
             "num_documents": len(search_results["documents"]),
             "sources": [m.get("source", "unknown") for m in search_results["metadatas"]],
-            "scores": search_results["scores"]
+            "scores": search_results["scores"],
+            "route": search_results.get("route")
         }
     
     async def add_to_knowledge_base(
@@ -107,38 +239,74 @@ class RAGRetriever:
         Save LLM-generated response to RAG for future use
         This allows chatbot to LEARN from new queries
         """
+        saved = await self.add_many_to_knowledge_base([
+            {"query": query, "response": response, "metadata": metadata}
+        ])
+        return saved == 1
+    
+    async def add_many_to_knowledge_base(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Save a batch of LLM-generated responses (write-behind flush)
+        
+        One batched embedding call, one collection add and one BM25 write
+        for the whole batch instead of one of each per answer.
+        
+        Args:
+            items: [{"query": ..., "response": ..., "metadata": {...}}]
+        
+        Returns:
+            Number of responses saved
+        """
         try:
-            logger.info(f"Saving to RAG: {query[:50]}...")
-            
-            
-            response_embedding = await EmbeddingService.generate_query_embedding(response)
+            items = [item for item in items if (item.get("response") or "").strip()]
+            if not items:
+                return 0
+            logger.info(f"Saving {len(items)} responses to RAG: {items[0]['query'][:50]}...")
             
             
-            if metadata is None:
-                metadata = {}
+            embeddings = await EmbeddingService.generate_batch_embeddings([item["response"] for item in items])
+            valid = EmbeddingService.valid_rows(embeddings)
             
-            metadata.update({
-                "source": "llm_generated",
-                "original_query": query
-            })
             
             import uuid
-            doc_id = f"llm_{str(uuid.uuid4())}"
+            ids, vectors, documents, metadatas = [], [], [], []
+            for item, vector, ok in zip(items, embeddings, valid):
+                if not ok:
+                    continue
+                metadata = dict(item.get("metadata") or {})
+                metadata.update({
+                    "source": "llm_generated",
+                    "original_query": item["query"]
+                })
+                ids.append(f"llm_{str(uuid.uuid4())}")
+                vectors.append(vector.tolist())
+                documents.append(item["response"])
+                metadatas.append(metadata)
             
-            self.collection.add(
-                ids=[doc_id],
-                embeddings=[response_embedding],
-                documents=[response],
-                metadatas=[metadata]
-            )
+            if not ids:
+                return 0
+            
+            # Chroma and SQLite writes block: run them off the event loop
+            loop = asyncio.get_running_loop()
+            collection, bm25 = self.collection, self.bm25
+            await loop.run_in_executor(None, lambda: self.vector_store.add_documents(
+                collection=collection,
+                documents=documents,
+                embeddings=vectors,
+                metadatas=metadatas,
+                ids=ids
+            ))
+            await loop.run_in_executor(None, bm25.add, [
+                {"id": doc_id, "content": document, "metadata": metadata}
+                for doc_id, document, metadata in zip(ids, documents, metadatas)
+            ])
             
-            logger.success(f"Saved to RAG with ID: {doc_id}")
-            return True
+            logger.success(f"Saved {len(ids)} responses to RAG")
+            return len(ids)
             
         except Exception as e:
             logger.error(f"Failed to save to RAG: {str(e)}")
-            return False
-
+            return 0
 
 
 retriever = RAGRetriever()
@@ -0,0 +1,22 @@
+"""
+SQLite helpers shared by the RAG side stores
+(index manifest, BM25 index, embedding cache)
+"""
+
+from typing import Iterator, List, Sequence, Tuple
+
+
+# Stay below SQLite's bound-parameter limit (999 on older builds)
+IN_CHUNK = 900
+
+
+def in_chunks(values: Sequence, size: int = IN_CHUNK) -> Iterator[Tuple[List, str]]:
+    """
+    (chunk, placeholders) pairs for `... IN ({placeholders})` queries over
+    any number of values, e.g.
+        for chunk, placeholders in in_chunks(doc_ids):
+            conn.execute(f"DELETE FROM docs WHERE doc_id IN ({placeholders})", chunk)
+    """
+    for start in range(0, len(values), size):
+        chunk = list(values[start:start + size])
+        yield chunk, ",".join("?" * len(chunk))
@@ -1,7 +1,7 @@
-import chromadb
-from chromadb.config import Settings
+from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import numpy as np
 import os
 
 class VectorStore:
@@ -10,10 +10,12 @@ class VectorStore:
     Stores and retrieves document embeddings
     """
     
-    def __init__(self):
+    def __init__(self, persist_directory: Optional[str] = None):
         """Initialize ChromaDB client"""
+        import chromadb
+        from chromadb.config import Settings
         
-        self.persist_directory = os.path.join(
+        self.persist_directory = persist_directory or os.path.join(
             os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
             "chroma_db"
         )
@@ -58,6 +60,13 @@ class VectorStore:
             logger.success(f"Collection '{collection_name}' created")
             return collection
     
+    @staticmethod
+    def _as_lists(embeddings) -> List[List[float]]:
+        """Chroma 0.4 only accepts nested lists (batch embeddings are float32 arrays)"""
+        if isinstance(embeddings, np.ndarray):
+            return embeddings.tolist()
+        return [e.tolist() if isinstance(e, np.ndarray) else list(e) for e in embeddings]
+    
     def add_documents(
         self,
         collection,
@@ -78,10 +87,11 @@ class VectorStore:
         """
         try:
             
+            # None (legacy) or NaN rows (EmbeddingService batch) = not embedded
             valid_items = [
                 (doc, emb, meta, id_)
                 for doc, emb, meta, id_ in zip(documents, embeddings, metadatas, ids)
-                if emb is not None
+                if emb is not None and len(emb) and not np.isnan(np.asarray(emb, dtype=np.float32)).any()
             ]
             
             if not valid_items:
@@ -92,7 +102,7 @@ class VectorStore:
             
             collection.add(
                 documents=list(docs),
-                embeddings=list(embs),
+                embeddings=self._as_lists(embs),
                 metadatas=list(metas),
                 ids=list(ids_)
             )
@@ -103,12 +113,65 @@ class VectorStore:
             logger.error(f"Error adding documents: {str(e)}")
             raise
     
+    def upsert_documents(
+        self,
+        collection,
+        documents: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str]
+    ):
+        """Insert new documents or overwrite existing ones with the same IDs"""
+        try:
+            collection.upsert(
+                documents=documents,
+                embeddings=self._as_lists(embeddings),
+                metadatas=metadatas,
+                ids=ids
+            )
+            logger.debug(f"Upserted {len(ids)} documents")
+        
+        except Exception as e:
+            logger.error(f"Error upserting documents: {str(e)}")
+            raise
+    
+    def delete_documents(self, collection, ids: List[str]):
+        """Delete documents by ID"""
+        if not ids:
+            return
+        try:
+            collection.delete(ids=ids)
+            logger.debug(f"Deleted {len(ids)} documents")
+        
+        except Exception as e:
+            logger.error(f"Error deleting documents: {str(e)}")
+            raise
+    
+    def get_documents(self, collection, filter_metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Fetch stored documents (with embeddings) matching a metadata filter"""
+        return collection.get(
+            where=filter_metadata,
+            include=["documents", "metadatas", "embeddings"]
+        )
+    
+    def count(self, collection) -> int:
+        """Number of documents in a collection"""
+        return collection.count()
+    
+    def get_embeddings(self, collection, ids: List[str]) -> Dict[str, List[float]]:
+        """Stored vectors by document ID (missing IDs are left out)"""
+        if not ids:
+            return {}
+        found = collection.get(ids=ids, include=["embeddings"])
+        return dict(zip(found["ids"], found["embeddings"]))
+    
     def search(
         self,
         collection,
         query_embedding: List[float],
         top_k: int = 5,
-        filter_metadata: Dict[str, Any] = None
+        filter_metadata: Dict[str, Any] = None,
+        include_embeddings: bool = False
     ) -> Dict[str, Any]:
         """
         Search for similar documents
@@ -118,15 +181,20 @@ class VectorStore:
             query_embedding: Query vector
             top_k: Number of results to return
             filter_metadata: Optional metadata filters
+            include_embeddings: Also return the stored vectors
         
         Returns:
-            Search results with documents, metadatas, distances
+            Search results with documents, metadatas, distances (+ embeddings)
         """
         try:
+            include = ["documents", "metadatas", "distances"]
+            if include_embeddings:
+                include.append("embeddings")
             results = collection.query(
                 query_embeddings=[query_embedding],
                 n_results=top_k,
-                where=filter_metadata 
+                where=filter_metadata,
+                include=include
             )
             
             logger.debug(f"Search returned {len(results['ids'][0])} results")
@@ -151,4 +219,18 @@ class VectorStore:
 
 
 
-vector_store = VectorStore()
+def create_vector_store(backend: Optional[str] = None) -> VectorStore:
+    """VectorStore for RAG_VECTOR_BACKEND: chroma (default) | mmap"""
+    backend = backend or settings.RAG_VECTOR_BACKEND
+    if backend == "mmap":
+        from ai_career_advisor.rag.mmap_store import MmapVectorStore
+        return MmapVectorStore()
+    return VectorStore()
+
+
+def __getattr__(name: str):
+    """`vector_store` is created on first use, so importing VectorStore opens no client"""
+    if name == "vector_store":
+        globals()["vector_store"] = create_vector_store()
+        return globals()["vector_store"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,6 +13,7 @@ from ai_career_advisor.core.database import engine, Base
 from ai_career_advisor.models.user_preferences import UserPreferences
 from ai_career_advisor.models.career_attributes import CareerAttributes
 from ai_career_advisor.models.user_career_interaction import UserCareerInteraction
+from ai_career_advisor.models.user_recommendation import UserRecommendation
 
 
 async def create_tables():
@@ -30,6 +31,7 @@ async def create_tables():
     print("   - user_preferences")
     print("   - career_attributes") 
     print("   - user_career_interactions")
+    print("   - user_recommendations")
 
 
 if __name__ == "__main__":
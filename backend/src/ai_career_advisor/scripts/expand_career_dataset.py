@@ -6,6 +6,7 @@ from sqlalchemy import select
 from ai_career_advisor.core.database import get_db, AsyncSessionLocal as async_session_factory
 from ai_career_advisor.models.career_attributes import CareerAttributes
 from ai_career_advisor.core.model_manager import ModelManager
+from ai_career_advisor.services.profile_embedding import profile_embeddings
 from ai_career_advisor.core.logger import logger
 
 # Industry categories to expand
@@ -67,7 +68,7 @@ async def expand_dataset():
             
             try:
                 # Generate careers using LLM
-                response_text = await ModelManager.generate_smart(prompt)
+                response_text = await ModelManager.generate_smart(prompt, use_cache=False)
                 
                 # Clean JSON
                 if "```json" in response_text:
@@ -96,7 +97,8 @@ async def expand_dataset():
                     text_for_embedding = f"{data['career_name']}. {data['short_description']}. Skills: {', '.join(data['required_skills'])}. Interests: {', '.join(data['interest_tags'])}"
                     
                     try:
-                        vector = await ModelManager.get_embedding(text_for_embedding)
+                        # Same embedding space as user profile vectors
+                        vector = await profile_embeddings.embed(text_for_embedding)
                         data["semantic_vector"] = vector
                     except Exception as ve:
                         logger.error(f"   ❌ Vector error for {data['career_name']}: {ve}")
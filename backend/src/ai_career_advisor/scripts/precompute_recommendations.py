@@ -0,0 +1,39 @@
+"""
+Offline job: precompute recommendations into user_recommendations
+Run: python -m ai_career_advisor.scripts.precompute_recommendations [--emails-file cohort.txt] [--top-k 10]
+
+Without --emails-file every user with saved preferences is scored.
+The online /recommendations/careers endpoint serves these rows while they
+are fresh (RECOMMENDATION_PRECOMPUTE_TTL_MINUTES, unchanged preferences
+and careers) and falls back to live scoring otherwise.
+"""
+import argparse
+import asyncio
+from pathlib import Path
+from ai_career_advisor.core.database import AsyncSessionLocal
+from ai_career_advisor.services.recommendation_service import RecommendationService
+from ai_career_advisor.core.logger import logger
+
+
+async def precompute(emails_file: str = None, top_k: int = 10, page_size: int = 1000):
+    user_emails = None
+    if emails_file:
+        lines = Path(emails_file).read_text(encoding="utf-8").splitlines()
+        user_emails = [line.strip() for line in lines if line.strip()]
+        logger.info(f"📋 Scoring cohort of {len(user_emails)} users from {emails_file}")
+
+    async with AsyncSessionLocal() as db:
+        stats = await RecommendationService.precompute_recommendations(
+            db, user_emails=user_emails, top_k=top_k, page_size=page_size
+        )
+    logger.success(f"🎊 Precompute complete: {stats}")
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute career recommendations")
+    parser.add_argument("--emails-file", help="One user email per line (default: all users)")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--page-size", type=int, default=1000, help="Users loaded and written per transaction")
+    args = parser.parse_args()
+    asyncio.run(precompute(args.emails_file, args.top_k, args.page_size))
@@ -237,7 +237,10 @@ IMPORTANT RULES:
                 
                 # Call ModelManager with smart fallback
                 logger.info(f"   📤 Calling AI model with smart fallback...")
-                text = await ModelManager.generate_smart(prompt)
+                text = await ModelManager.generate_smart(
+                    prompt,
+                    cache_ttl=24 * 3600
+                )
                 text = text.strip()
                 
                 # Clean markdown
@@ -249,6 +252,7 @@ IMPORTANT RULES:
                     roadmap = json.loads(text)
                 except json.JSONDecodeError as e:
                     logger.error(f"   🔴 JSON parse error: {str(e)[:100]}")
+                    ModelManager.invalidate_cached(prompt)
                     if attempt < MAX_RETRIES:
                         await asyncio.sleep(base_delay * attempt)
                         continue
@@ -316,6 +320,7 @@ IMPORTANT RULES:
                     
                 else:
                     logger.warning(f"   ⚠️ INCOMPLETE: Missing mandatory fields → {missing}")
+                    ModelManager.invalidate_cached(prompt)
                     
                     if attempt < MAX_RETRIES:
                         retry_delay = base_delay * (attempt + 1)
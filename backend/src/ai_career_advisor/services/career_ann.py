@@ -0,0 +1,458 @@
+"""
+Approximate Nearest Neighbour Indexes for Careers
+Pure-NumPy IVF (inverted file) indexes, persisted next to the database
+
+📚 STUDY NOTES:
+- IVF: k-means splits the vectors into ~sqrt(n) clusters ("inverted lists");
+  a query scans only the n_probe closest lists instead of every career
+- Two indexes:
+  * semantic:  career semantic_vector (cosine)        -> user -> career path
+  * attribute: hashed projection of skills + interests + personality sets
+    (each term = fixed random unit vector, career = normalized sum, so
+     cosine ~ |A ∩ B| / sqrt(|A||B|)) -> similar careers
+- ANN only generates candidates; they are re-ranked with the exact formulas
+  (cosine blend / Jaccard) from CareerMatrix
+- Incremental: every career has a content fingerprint, so a sync only
+  re-adds careers whose vector/terms changed; lists are retrained when
+  the index has drifted too far from the trained snapshot
+- Copy-on-write: a sync works on a copy of the live index and the new
+  object is swapped in afterwards, so requests searching the old one never
+  see a half-updated index; each CareerMatrix keeps the indexes built for
+  it (weak keys), so requests holding different matrices don't re-sync
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+import weakref
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable
+import numpy as np
+from scipy import sparse
+from ai_career_advisor.services.career_matrix import CareerMatrix
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+def _fingerprint(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+class IVFIndex:
+    """
+    Inner-product IVF index over L2-normalized float32 vectors, keyed by string id
+    """
+
+    # Retrain the lists when this share of the rows changed since the last training
+    RETRAIN_RATIO = 0.5
+    KMEANS_ITERATIONS = 10
+    KMEANS_SAMPLE_PER_LIST = 64
+
+    def __init__(self, dim: int, n_probe: int = 8, seed: int = 0):
+        self.dim = dim
+        self.n_probe = n_probe
+        self.seed = seed
+        self.ids: List[str] = []
+        self.fingerprints: List[str] = []
+        self.row_of: Dict[str, int] = {}
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.alive = np.zeros(0, dtype=bool)
+        self.assign = np.zeros(0, dtype=np.int32)
+        self.centroids = np.zeros((0, dim), dtype=np.float32)
+        self.lists: List[np.ndarray] = []
+        self.trained_size = 0
+        self.changed_since_train = 0
+
+    def __len__(self) -> int:
+        return len(self.row_of)
+
+    def copy(self) -> "IVFIndex":
+        """
+        Copy that can be synced without touching this index. Arrays are only
+        ever replaced, never written in place (except alive), so they are shared
+        """
+        index = IVFIndex(self.dim, self.n_probe, self.seed)
+        index.__dict__.update(self.__dict__)
+        index.ids = list(self.ids)
+        index.fingerprints = list(self.fingerprints)
+        index.row_of = dict(self.row_of)
+        index.alive = self.alive.copy()
+        return index
+
+    # ================== TRAINING ==================
+
+    def _kmeans(self, data: np.ndarray, n_lists: int) -> np.ndarray:
+        """Spherical k-means on a sample (centroids stay unit length)"""
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(len(data), n_lists * self.KMEANS_SAMPLE_PER_LIST)
+        sample = data[rng.choice(len(data), sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(self.KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            members = sparse.csr_matrix(
+                (np.ones(sample_size, dtype=np.float32), (labels, np.arange(sample_size))),
+                shape=(n_lists, sample_size)
+            )
+            sums = np.asarray(members @ sample)
+            empty = np.asarray(members.sum(axis=1)).ravel() == 0
+            # Re-seed empty lists with random points so none stay unused
+            sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+            centroids = _normalize_rows(sums).astype(np.float32)
+        return centroids
+
+    def _assign_rows(self, vectors: np.ndarray, chunk: int = 8192) -> np.ndarray:
+        labels = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), chunk):
+            labels[start:start + chunk] = np.argmax(vectors[start:start + chunk] @ self.centroids.T, axis=1)
+        return labels
+
+    def _build_lists(self):
+        live = np.flatnonzero(self.alive)
+        order = live[np.argsort(self.assign[live], kind="stable")]
+        bounds = np.searchsorted(self.assign[order], np.arange(len(self.centroids) + 1))
+        self.lists = [order[bounds[i]:bounds[i + 1]] for i in range(len(self.centroids))]
+
+    def rebuild(self):
+        """Drop deleted rows and retrain the inverted lists from scratch"""
+        live = np.flatnonzero(self.alive)
+        self.ids = [self.ids[r] for r in live]
+        self.fingerprints = [self.fingerprints[r] for r in live]
+        self.row_of = {career_id: row for row, career_id in enumerate(self.ids)}
+        self.vectors = self.vectors[live]
+        self.alive = np.ones(len(live), dtype=bool)
+
+        if len(live):
+            n_lists = int(np.clip(round(np.sqrt(len(live))), 1, 4096))
+            self.centroids = self._kmeans(self.vectors, n_lists)
+            self.assign = self._assign_rows(self.vectors)
+        else:
+            self.centroids = np.zeros((0, self.dim), dtype=np.float32)
+            self.assign = np.zeros(0, dtype=np.int32)
+        self._build_lists()
+        self.trained_size = len(live)
+        self.changed_since_train = 0
+
+    # ================== UPDATES ==================
+
+    def sync(
+        self,
+        ids: List[str],
+        fingerprints: List[str],
+        vector_fn: Callable[[np.ndarray], np.ndarray]
+    ) -> Dict[str, int]:
+        """
+        Make the index hold exactly ids; vector_fn(positions) returns the
+        normalized vectors for the given positions of ids (called only for
+        new or changed entries)
+        """
+        wanted = dict(zip(ids, fingerprints))
+        removed = [career_id for career_id in self.row_of if career_id not in wanted]
+        changed = [
+            position for position, (career_id, fp) in enumerate(zip(ids, fingerprints))
+            if career_id not in self.row_of or self.fingerprints[self.row_of[career_id]] != fp
+        ]
+
+        for career_id in removed + [ids[p] for p in changed if ids[p] in self.row_of]:
+            self.alive[self.row_of.pop(career_id)] = False
+
+        if changed:
+            positions = np.array(changed, dtype=np.int64)
+            start = len(self.ids)
+            self.ids.extend(ids[p] for p in changed)
+            self.fingerprints.extend(fingerprints[p] for p in changed)
+            self.row_of.update((ids[p], start + i) for i, p in enumerate(changed))
+            self.vectors = np.vstack([self.vectors, np.asarray(vector_fn(positions), dtype=np.float32)])
+            self.alive = np.concatenate([self.alive, np.ones(len(changed), dtype=bool)])
+            self.assign = np.concatenate([
+                self.assign,
+                self._assign_rows(self.vectors[start:]) if len(self.centroids) else np.zeros(len(changed), dtype=np.int32)
+            ])
+
+        self.changed_since_train += len(removed) + len(changed)
+        retrain = (
+            len(self.centroids) == 0 or
+            self.changed_since_train > self.RETRAIN_RATIO * max(self.trained_size, 1)
+        )
+        if retrain:
+            self.rebuild()
+        elif removed or changed:
+            self._build_lists()
+
+        return {"added": len(changed), "removed": len(removed), "retrained": int(retrain)}
+
+    # ================== SEARCH ==================
+
+    def _probe(self, query: np.ndarray, n_probe: Optional[int] = None) -> np.ndarray:
+        """Rows in the n_probe lists whose centroids are closest to the query"""
+        n_probe = min(n_probe or self.n_probe, len(self.centroids))
+        centroid_scores = self.centroids @ query
+        probe = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+        return np.concatenate([self.lists[p] for p in probe])
+
+    def search(self, query: np.ndarray, k: int, n_probe: Optional[int] = None) -> Tuple[List[str], np.ndarray]:
+        """Approximate top-k ids by inner product, best first"""
+        if not len(self) or k <= 0:
+            return [], np.zeros(0, dtype=np.float32)
+        rows = self._probe(query, n_probe)
+        return self._top(rows, self.vectors[rows] @ query, k)
+
+    def neighbourhood(self, query: np.ndarray, n_probe: Optional[int] = None) -> List[str]:
+        """Every id in the probed lists (for callers that re-rank with their own formula)"""
+        if not len(self):
+            return []
+        return [self.ids[r] for r in self._probe(query, n_probe)]
+
+    def exact_search(self, query: np.ndarray, k: int) -> Tuple[List[str], np.ndarray]:
+        """Brute-force top-k (ground truth for recall)"""
+        rows = np.flatnonzero(self.alive)
+        return self._top(rows, self.vectors[rows] @ query, k)
+
+    def _top(self, rows: np.ndarray, scores: np.ndarray, k: int) -> Tuple[List[str], np.ndarray]:
+        best = CareerMatrix.top_k(scores, k)
+        return [self.ids[r] for r in rows[best]], scores[best]
+
+    def vector(self, career_id: str) -> Optional[np.ndarray]:
+        row = self.row_of.get(career_id)
+        return None if row is None else self.vectors[row]
+
+    # ================== PERSISTENCE ==================
+
+    def save(self, path: Path):
+        """Atomic write (tmp file + rename) so readers never see a partial index"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp,
+            dim=self.dim, n_probe=self.n_probe, seed=self.seed,
+            ids=np.array(self.ids, dtype=str), fingerprints=np.array(self.fingerprints, dtype=str),
+            vectors=self.vectors, alive=self.alive, assign=self.assign, centroids=self.centroids,
+            trained_size=self.trained_size, changed_since_train=self.changed_since_train
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "IVFIndex":
+        with np.load(path, allow_pickle=False) as data:
+            index = cls(int(data["dim"]), int(data["n_probe"]), int(data["seed"]))
+            index.ids = data["ids"].tolist()
+            index.fingerprints = data["fingerprints"].tolist()
+            index.vectors = data["vectors"]
+            index.alive = data["alive"]
+            index.assign = data["assign"]
+            index.centroids = data["centroids"]
+            index.trained_size = int(data["trained_size"])
+            index.changed_since_train = int(data["changed_since_train"])
+        index.row_of = {index.ids[r]: int(r) for r in np.flatnonzero(index.alive)}
+        index._build_lists()
+        return index
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self),
+            "dim": self.dim,
+            "lists": len(self.centroids),
+            "n_probe": self.n_probe,
+            "deleted_rows": int((~self.alive).sum()),
+            "changed_since_train": self.changed_since_train
+        }
+
+
+class CareerANNService:
+    """
+    Keeps the semantic and attribute IVF indexes in sync with the current
+    CareerMatrix and serves candidate generation for recommendations
+    """
+
+    def __init__(self, index_dir: Optional[Path] = None):
+        self._index_dir = index_dir
+        self._semantic: Optional[IVFIndex] = None
+        self._attribute: Optional[IVFIndex] = None
+        # matrix -> (semantic, attribute) built from it
+        self._snapshots: "weakref.WeakKeyDictionary[CareerMatrix, Tuple[Optional[IVFIndex], IVFIndex]]" = \
+            weakref.WeakKeyDictionary()
+        self._term_vectors: Dict[str, np.ndarray] = {}
+        self._lock = asyncio.Lock()
+        self.syncs = 0
+        self.last_sync: Dict[str, Any] = {}
+
+    @property
+    def index_dir(self) -> Path:
+        """ANN_INDEX_DIR, or ann_index/ next to the SQLite database file"""
+        if self._index_dir is None:
+            if settings.ANN_INDEX_DIR:
+                self._index_dir = Path(settings.ANN_INDEX_DIR)
+            else:
+                from ai_career_advisor.core.database import DATABASE_URL, BASE_DIR
+                if DATABASE_URL.startswith("sqlite") and ":memory:" not in DATABASE_URL:
+                    self._index_dir = Path(DATABASE_URL.split("///", 1)[-1]).resolve().parent / "ann_index"
+                else:
+                    self._index_dir = BASE_DIR / "ann_index"
+        return self._index_dir
+
+    @staticmethod
+    def is_enabled(matrix: CareerMatrix) -> bool:
+        return settings.ANN_ENABLED and matrix.size >= settings.ANN_MIN_CAREERS
+
+    # ================== VECTORS ==================
+
+    def _term_vector(self, term: str) -> np.ndarray:
+        """Fixed random unit vector per term (seeded by the term, stable across rebuilds)"""
+        vector = self._term_vectors.get(term)
+        if vector is None:
+            seed = int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest(), "little")
+            vector = np.random.default_rng(seed).standard_normal(settings.ANN_ATTRIBUTE_DIM).astype(np.float32)
+            vector /= np.linalg.norm(vector)
+            self._term_vectors[term] = vector
+        return vector
+
+    def _attribute_vectors(self, matrix: CareerMatrix, rows: np.ndarray) -> np.ndarray:
+        terms = np.stack([self._term_vector(t) for t in matrix.attribute_vocab]) if matrix.attribute_vocab \
+            else np.zeros((1, settings.ANN_ATTRIBUTE_DIM), dtype=np.float32)
+        return _normalize_rows(np.asarray(matrix.attributes[rows] @ terms, dtype=np.float32))
+
+    # ================== SYNC ==================
+
+    def _load_or_create(self, name: str, dim: int) -> IVFIndex:
+        path = self.index_dir / f"{name}.npz"
+        if path.exists():
+            try:
+                index = IVFIndex.load(path)
+                if index.dim == dim:
+                    index.n_probe = settings.ANN_N_PROBE
+                    return index
+                logger.warning(f"⚠️ ANN index {name} has dim {index.dim}, expected {dim}; rebuilding")
+            except Exception as e:
+                logger.warning(f"⚠️ Could not load ANN index {path}: {e}; rebuilding")
+        return IVFIndex(dim, n_probe=settings.ANN_N_PROBE)
+
+    def _sync(self, matrix: CareerMatrix) -> Tuple[Optional[IVFIndex], IVFIndex, Dict[str, Any]]:
+        """CPU-bound: runs in an executor. Syncs copies of the live indexes and returns them"""
+        started = time.perf_counter()
+        stats = {}
+        semantic, attribute = None, None
+
+        # Semantic: careers with a vector of the matrix dimension
+        if matrix.dim:
+            if self._semantic is None or self._semantic.dim != matrix.dim:
+                semantic = self._load_or_create("semantic", matrix.dim)
+            else:
+                semantic = self._semantic.copy()
+            positions = np.flatnonzero(matrix.has_vector & (np.linalg.norm(matrix.vectors, axis=1) > 0))
+            stats["semantic"] = semantic.sync(
+                [matrix.names[i] for i in positions],
+                [_fingerprint(matrix.vectors[i].tobytes()) for i in positions],
+                lambda p: matrix.vectors[positions[p]]
+            )
+
+        # Attribute: careers with at least one skill / interest / personality term
+        attribute = self._load_or_create("attribute", settings.ANN_ATTRIBUTE_DIM) if self._attribute is None \
+            else self._attribute.copy()
+        positions = np.flatnonzero(matrix.attribute_counts > 0)
+        stats["attribute"] = attribute.sync(
+            [matrix.names[i] for i in positions],
+            [_fingerprint("\x1f".join(sorted(matrix.attribute_sets[i])).encode("utf-8")) for i in positions],
+            lambda p: self._attribute_vectors(matrix, positions[p])
+        )
+
+        for name, index in (("semantic", semantic), ("attribute", attribute)):
+            if index is not None and (stats[name]["added"] or stats[name]["removed"]):
+                index.save(self.index_dir / f"{name}.npz")
+
+        stats["seconds"] = round(time.perf_counter() - started, 3)
+        return semantic, attribute, stats
+
+    async def ensure(self, matrix: CareerMatrix) -> Tuple[Optional[IVFIndex], IVFIndex]:
+        """(semantic, attribute) indexes up to date with this matrix (synced once per matrix)"""
+        snapshot = self._snapshots.get(matrix)
+        if snapshot is not None:
+            return snapshot
+        async with self._lock:
+            snapshot = self._snapshots.get(matrix)
+            if snapshot is not None:
+                return snapshot
+            loop = asyncio.get_running_loop()
+            semantic, attribute, self.last_sync = await loop.run_in_executor(None, self._sync, matrix)
+            # Swap: the next sync starts from these, older snapshots stay untouched
+            self._semantic, self._attribute = semantic or self._semantic, attribute
+            snapshot = self._snapshots[matrix] = (semantic, attribute)
+            self.syncs += 1
+            logger.info(f"🧭 Career ANN indexes synced: {self.last_sync}")
+            return snapshot
+
+    # ================== QUERIES ==================
+
+    @staticmethod
+    def candidate_count(top_k: int) -> int:
+        return max(top_k * settings.ANN_CANDIDATE_FACTOR, 100)
+
+    async def recommendation_candidates(
+        self,
+        matrix: CareerMatrix,
+        user_prefs: Any,
+        user_vector: Optional[List[float]],
+        top_k: int
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        (rows, literal): matrix rows worth scoring exactly - every career in the
+        probed semantic lists + the best literal (keyword) matches - and the
+        literal scores of every career. None = score everything.
+
+        Whole lists are re-ranked rather than the top-k by cosine alone: within
+        one neighbourhood cosines are close and the literal score decides.
+        """
+        if not self.is_enabled(matrix) or not user_vector or len(user_vector) != matrix.dim:
+            return None
+        query = np.asarray(user_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None
+        semantic, _ = await self.ensure(matrix)
+
+        neighbour_ids = semantic.neighbourhood(query / norm)
+        literal = matrix.literal_scores(
+            user_prefs.skills, user_prefs.interests,
+            user_prefs.education_level, user_prefs.preferred_work_style
+        )
+        rows = np.union1d(
+            np.array([matrix.index[name] for name in neighbour_ids], dtype=np.int64),
+            CareerMatrix.top_k(literal, self.candidate_count(top_k))
+        )
+        return rows, literal
+
+    async def similar_candidates(self, matrix: CareerMatrix, career_name: str, top_k: int) -> Optional[np.ndarray]:
+        """Matrix rows of the attribute-ANN neighbours of career_name (None = search exactly)"""
+        if not self.is_enabled(matrix) or career_name not in matrix.index:
+            return None
+        _, attribute = await self.ensure(matrix)
+
+        query = attribute.vector(career_name)
+        if query is None:
+            return None
+        neighbour_ids, _ = attribute.search(query, self.candidate_count(top_k) + 1)
+        return np.array(
+            [matrix.index[name] for name in neighbour_ids if name != career_name],
+            dtype=np.int64
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": settings.ANN_ENABLED,
+            "min_careers": settings.ANN_MIN_CAREERS,
+            "index_dir": str(self.index_dir),
+            "syncs": self.syncs,
+            "last_sync": self.last_sync,
+            "semantic": self._semantic.get_stats() if self._semantic else None,
+            "attribute": self._attribute.get_stats() if self._attribute else None
+        }
+
+
+# Global instance
+career_ann = CareerANNService()
@@ -68,7 +68,10 @@ Rules:
 
     try:
         logger.info("📤 Using ModelManager with smart fallback...")
-        raw_text = await ModelManager.generate_smart(prompt)
+        raw_text = await ModelManager.generate_smart(
+            prompt,
+            cache_ttl=24 * 3600
+        )
         
         logger.info(f"📦 Raw LLM Response: {raw_text[:200]}...")
 
@@ -94,9 +97,11 @@ Rules:
         return data
 
     except json.JSONDecodeError as e:
+        ModelManager.invalidate_cached(prompt)
         logger.error(f"❌ JSON parsing failed for {career_name}: {e}")
         logger.error(f"Raw response was: {raw_text if 'raw_text' in locals() else 'No response'}")
         raise
     except Exception as e:
+        ModelManager.invalidate_cached(prompt)
         logger.error(f"❌ LLM failed for {career_name}: {e}")
         raise
@@ -42,13 +42,17 @@ Rules:
 
     try:
         # Use ModelManager with smart fallback
-        raw_text = await ModelManager.generate_smart(prompt)
+        raw_text = await ModelManager.generate_smart(
+            prompt,
+            cache_ttl=24 * 3600
+        )
         data = json.loads(raw_text)
 
         logger.success(f"✅ Career data generated: {career_name}")
         return data
 
     except Exception as e:
+        ModelManager.invalidate_cached(prompt)
         logger.error(f"❌ Failed to generate career data for {career_name}: {str(e)}")
         raise
 
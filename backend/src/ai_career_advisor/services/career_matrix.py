@@ -0,0 +1,381 @@
+"""
+Vectorized Career Scoring Engine
+In-memory matrices over all CareerAttributes rows, rebuilt when the table changes
+
+- semantic_vectors: L2-normalized float32 (n_careers x dim) -> cosine = one mat-vec
+- skill / interest / attribute matrices: sparse binary CSR (n_careers x vocab)
+  -> Jaccard for every career from one sparse column-sum
+- education level and work style encoded as int arrays
+- top-k with argpartition instead of sorting every career
+
+Scores match RecommendationService's original per-career formulas.
+"""
+
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple, Iterable
+import numpy as np
+from scipy import sparse
+from sqlalchemy import select, func, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from ai_career_advisor.models.career_attributes import CareerAttributes
+from ai_career_advisor.core.logger import logger
+
+
+# Education levels in ascending order (same table as RecommendationService)
+EDUCATION_LEVELS = {
+    "10th": 1, "12th": 2,
+    "graduate": 3, "diploma": 3, "btech": 3, "bca": 3,
+    "postgraduate": 4, "mtech": 4, "mba": 4, "mca": 4,
+    "phd": 5
+}
+DEFAULT_EDUCATION_LEVEL = 2
+NO_REQUIREMENT = 0
+
+# Content score weights
+SKILL_WEIGHT = 0.50
+INTEREST_WEIGHT = 0.30
+EDUCATION_WEIGHT = 0.15
+WORK_STYLE_WEIGHT = 0.05
+SEMANTIC_WEIGHT = 0.7
+LITERAL_WEIGHT = 0.3
+
+
+def _normalize_terms(terms: Optional[Iterable[str]]) -> set:
+    return {t.lower().strip() for t in (terms or []) if isinstance(t, str)}
+
+
+def _binary_matrix(rows: List[set], vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+    """Sparse 0/1 matrix with one row per career"""
+    indptr = [0]
+    indices = []
+    for terms in rows:
+        indices.extend(sorted(vocabulary[t] for t in terms))
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.float32)
+    return sparse.csr_matrix(
+        (data, np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+        shape=(len(rows), max(len(vocabulary), 1))
+    )
+
+
+class CareerMatrix:
+    """Immutable snapshot of all careers in matrix form"""
+
+    def __init__(self, careers: List[CareerAttributes], signature: Any = None):
+        self.signature = signature
+        self.size = len(careers)
+        self.names = [c.career_name for c in careers]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.career_dicts = [c.to_dict() for c in careers]
+
+        # ---- Skill / interest / attribute sets -> sparse binary matrices ----
+        skills = [_normalize_terms(c.required_skills) for c in careers]
+        interests = [_normalize_terms(c.interest_tags) for c in careers]
+        attributes = [
+            _normalize_terms((c.required_skills or []) + (c.interest_tags or []) + (c.personality_fit or []))
+            for c in careers
+        ]
+
+        self.skill_vocab = {t: i for i, t in enumerate(sorted(set().union(*skills)))}
+        self.interest_vocab = {t: i for i, t in enumerate(sorted(set().union(*interests)))}
+        self.attribute_vocab = {t: i for i, t in enumerate(sorted(set().union(*attributes)))}
+
+        self.attribute_sets = attributes
+        self.skills = _binary_matrix(skills, self.skill_vocab)
+        self.interests = _binary_matrix(interests, self.interest_vocab)
+        self.attributes = _binary_matrix(attributes, self.attribute_vocab)
+        self.skill_counts = np.array([len(s) for s in skills], dtype=np.float32)
+        self.interest_counts = np.array([len(s) for s in interests], dtype=np.float32)
+        self.attribute_counts = np.array([len(s) for s in attributes], dtype=np.float32)
+
+        # ---- Education / work style ----
+        self.education = np.array([
+            EDUCATION_LEVELS.get(c.min_education.lower(), DEFAULT_EDUCATION_LEVEL) if c.min_education else NO_REQUIREMENT
+            for c in careers
+        ], dtype=np.int8)
+        self.work_styles = np.array([c.work_style or "" for c in careers], dtype=object)
+
+        # ---- Semantic vectors -> normalized float32 matrix ----
+        dims = [len(c.semantic_vector) for c in careers if c.semantic_vector]
+        self.dim = max(set(dims), key=dims.count) if dims else 0
+        self.has_vector = np.array([bool(c.semantic_vector) for c in careers], dtype=bool)
+        self.vectors = np.zeros((self.size, self.dim), dtype=np.float32)
+        for i, career in enumerate(careers):
+            if career.semantic_vector and len(career.semantic_vector) == self.dim:
+                self.vectors[i] = career.semantic_vector
+        norms = np.linalg.norm(self.vectors, axis=1, keepdims=True)
+        np.divide(self.vectors, norms, out=self.vectors, where=norms > 0)
+
+    # ================== SCORING ==================
+
+    @staticmethod
+    def _jaccard(matrix: sparse.csr_matrix, counts: np.ndarray, vocabulary: Dict[str, int], terms: set) -> np.ndarray:
+        """J(user, career) for every career: |A ∩ B| / (|A| + |B| - |A ∩ B|)"""
+        if not terms:
+            return np.zeros(matrix.shape[0], dtype=np.float32)
+        columns = [vocabulary[t] for t in terms if t in vocabulary]
+        if columns:
+            intersection = np.asarray(matrix[:, columns].sum(axis=1)).ravel()
+        else:
+            intersection = np.zeros(matrix.shape[0], dtype=np.float32)
+        union = len(terms) + counts - intersection
+        # Careers with no terms score 0 (union > 0 always holds when terms is non-empty)
+        return np.where(counts > 0, intersection / union, 0.0).astype(np.float32)
+
+    def literal_scores(
+        self,
+        skills: Optional[List[str]],
+        interests: Optional[List[str]],
+        education_level: Optional[str],
+        preferred_work_style: Optional[str]
+    ) -> np.ndarray:
+        """Weighted Jaccard content score for every career"""
+        skill = self._jaccard(self.skills, self.skill_counts, self.skill_vocab, _normalize_terms(skills))
+        interest = self._jaccard(self.interests, self.interest_counts, self.interest_vocab, _normalize_terms(interests))
+
+        if education_level:
+            user_level = EDUCATION_LEVELS.get(education_level.lower(), DEFAULT_EDUCATION_LEVEL)
+            education = np.select(
+                [self.education == NO_REQUIREMENT, user_level >= self.education, user_level == self.education - 1],
+                [1.0, 1.0, 0.7],
+                default=0.3
+            )
+        else:
+            education = np.ones(self.size)
+
+        if preferred_work_style:
+            work_style = np.where(
+                (self.work_styles == "") | (self.work_styles == preferred_work_style), 1.0, 0.5
+            )
+        else:
+            work_style = np.ones(self.size)
+
+        score = (
+            SKILL_WEIGHT * skill + INTEREST_WEIGHT * interest +
+            EDUCATION_WEIGHT * education + WORK_STYLE_WEIGHT * work_style
+        )
+        return np.clip(score, 0.0, 1.0).astype(np.float32)
+
+    def semantic_scores(
+        self,
+        user_vector: Optional[List[float]],
+        rows: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
+        """Cosine similarity to every career, or only to rows (0 where the career has no usable vector)"""
+        if not user_vector or len(user_vector) != self.dim:
+            return None
+        vectors = self.vectors if rows is None else self.vectors[rows]
+        query = np.asarray(user_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return np.zeros(vectors.shape[0], dtype=np.float32)
+        return vectors @ (query / norm)
+
+    def content_scores(
+        self,
+        user_prefs: Any,
+        user_vector: Optional[List[float]],
+        rows: Optional[np.ndarray] = None,
+        literal: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Semantic + literal blend, exactly like the per-career loop it replaces
+        rows: only score these careers (ANN candidates); default is every career
+        literal: precomputed literal_scores() for every career
+        """
+        if literal is None:
+            literal = self.literal_scores(
+                user_prefs.skills, user_prefs.interests,
+                user_prefs.education_level, user_prefs.preferred_work_style
+            )
+        has_vector = self.has_vector
+        if rows is not None:
+            literal, has_vector = literal[rows], has_vector[rows]
+        if not user_vector:
+            return literal
+
+        cosine = self.semantic_scores(user_vector, rows)
+        if cosine is None:
+            # Dimension mismatch -> cosine counts as 0 for careers that have vectors
+            cosine = np.zeros(len(literal), dtype=np.float32)
+        blended = SEMANTIC_WEIGHT * cosine + LITERAL_WEIGHT * literal
+        return np.where(has_vector, blended, literal)
+
+    # ================== BATCH SCORING (many users at once) ==================
+
+    @staticmethod
+    def _batch_jaccard(
+        matrix: sparse.csr_matrix,
+        counts: np.ndarray,
+        vocabulary: Dict[str, int],
+        term_sets: List[set]
+    ) -> np.ndarray:
+        """(n_users x n_careers) Jaccard from ONE sparse matrix-matrix product"""
+        users = _binary_matrix([{t for t in terms if t in vocabulary} for terms in term_sets], vocabulary)
+        intersection = (users @ matrix.T).toarray()
+        sizes = np.array([len(terms) for terms in term_sets], dtype=np.float32)[:, None]
+        union = sizes + counts[None, :] - intersection
+        valid = (sizes > 0) & (counts[None, :] > 0)
+        return np.divide(intersection, union, out=np.zeros_like(intersection), where=valid).astype(np.float32)
+
+    def batch_literal_scores(self, users: List[Any]) -> np.ndarray:
+        """literal_scores() for many users: (n_users x n_careers)"""
+        skill = self._batch_jaccard(
+            self.skills, self.skill_counts, self.skill_vocab,
+            [_normalize_terms(u.skills) for u in users]
+        )
+        interest = self._batch_jaccard(
+            self.interests, self.interest_counts, self.interest_vocab,
+            [_normalize_terms(u.interests) for u in users]
+        )
+
+        levels = np.array([
+            EDUCATION_LEVELS.get(u.education_level.lower(), DEFAULT_EDUCATION_LEVEL) if u.education_level else -1
+            for u in users
+        ])[:, None]
+        education = np.select(
+            [self.education == NO_REQUIREMENT, levels >= self.education, levels == self.education - 1],
+            [1.0, 1.0, 0.7],
+            default=0.3
+        )
+        education[levels[:, 0] < 0] = 1.0  # no education given -> full match
+
+        styles = np.array([u.preferred_work_style or "" for u in users], dtype=object)[:, None]
+        work_style = np.where((styles == "") | (self.work_styles == "") | (self.work_styles == styles), 1.0, 0.5)
+
+        score = (
+            SKILL_WEIGHT * skill + INTEREST_WEIGHT * interest +
+            EDUCATION_WEIGHT * education + WORK_STYLE_WEIGHT * work_style
+        )
+        return np.clip(score, 0.0, 1.0).astype(np.float32)
+
+    def batch_content_scores(self, users: List[Any], user_vectors: List[Optional[List[float]]]) -> np.ndarray:
+        """content_scores() for many users: literal + ONE (n_users x dim) @ (dim x n_careers) product"""
+        literal = self.batch_literal_scores(users)
+
+        has_user_vector = np.array([bool(v) for v in user_vectors], dtype=bool)
+        queries = np.zeros((len(users), self.dim), dtype=np.float32)
+        for i, vector in enumerate(user_vectors):
+            if vector and len(vector) == self.dim:
+                queries[i] = vector
+        # Dimension mismatch / zero vector -> cosine 0, like content_scores()
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        np.divide(queries, norms, out=queries, where=norms > 0)
+        cosine = queries @ self.vectors.T
+
+        blended = SEMANTIC_WEIGHT * cosine + LITERAL_WEIGHT * literal
+        return np.where(has_user_vector[:, None] & self.has_vector[None, :], blended, literal)
+
+    def attribute_similarity(self, career_name: str, rows: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Jaccard over skills + interests + personality between one career and all others
+        (or only the careers in rows)
+        """
+        i = self.index.get(career_name)
+        if i is None:
+            return None
+        attributes = self.attributes if rows is None else self.attributes[rows]
+        counts = self.attribute_counts if rows is None else self.attribute_counts[rows]
+        terms = set(self.attributes[i].indices)
+        if not terms:
+            return np.zeros(attributes.shape[0], dtype=np.float32)
+        intersection = np.asarray(attributes[:, sorted(terms)].sum(axis=1)).ravel()
+        union = len(terms) + counts - intersection
+        return np.where(counts > 0, intersection / union, 0.0).astype(np.float32)
+
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int, exclude: Optional[int] = None) -> np.ndarray:
+        """Indices of the k highest scores, best first (ties keep table order)"""
+        if exclude is not None:
+            scores = scores.copy()
+            scores[exclude] = -np.inf
+            k = min(k, len(scores) - 1)
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.array([], dtype=np.int64)
+        candidates = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+class CareerMatrixEngine:
+    """
+    Holds the current CareerMatrix and rebuilds it when career_attributes changes
+
+    Staleness is detected two ways:
+    - ORM insert/update/delete of CareerAttributes in this process marks it dirty
+    - every request compares (row count, max(updated_at)) with the snapshot,
+      which also catches seed scripts / other workers writing to the table
+    """
+
+    # Bumped by ORM events on CareerAttributes; shared by every engine in the process
+    _generation = 0
+
+    def __init__(self):
+        self._matrix: Optional[CareerMatrix] = None
+        self._built_generation = -1
+        self._lock = asyncio.Lock()
+        self.builds = 0
+
+    @classmethod
+    def invalidate(cls, *args):
+        cls._generation += 1
+
+    def _is_fresh(self, signature: Any) -> bool:
+        return (
+            self._matrix is not None and
+            self._built_generation == CareerMatrixEngine._generation and
+            self._matrix.signature == signature
+        )
+
+    @staticmethod
+    async def signature(db: AsyncSession) -> Tuple[int, Any]:
+        result = await db.execute(
+            select(func.count(CareerAttributes.id), func.max(CareerAttributes.updated_at))
+        )
+        count, last_update = result.one()
+        return count, str(last_update)
+
+    async def get_matrix(self, db: AsyncSession) -> CareerMatrix:
+        signature = await self.signature(db)
+        if self._is_fresh(signature):
+            return self._matrix
+
+        async with self._lock:
+            if self._is_fresh(signature):
+                return self._matrix
+
+            # Changes that land while building bump the generation again -> rebuilt next time
+            generation = CareerMatrixEngine._generation
+            result = await db.execute(select(CareerAttributes).order_by(CareerAttributes.career_name))
+            careers = result.scalars().all()
+
+            # Matrix construction is CPU-bound; keep it off the event loop
+            loop = asyncio.get_running_loop()
+            self._matrix = await loop.run_in_executor(None, CareerMatrix, careers, signature)
+            self._built_generation = generation
+            self.builds += 1
+            logger.info(
+                f"🧮 Career matrix built: {self._matrix.size} careers, dim {self._matrix.dim}, "
+                f"{len(self._matrix.skill_vocab)} skills, {len(self._matrix.interest_vocab)} interests"
+            )
+            return self._matrix
+
+    def get_stats(self) -> Dict[str, Any]:
+        matrix = self._matrix
+        return {
+            "built": matrix is not None,
+            "builds": self.builds,
+            "stale": self._built_generation != CareerMatrixEngine._generation,
+            "careers": matrix.size if matrix else 0,
+            "vector_dim": matrix.dim if matrix else 0,
+            "vector_mb": round(matrix.vectors.nbytes / 1e6, 2) if matrix else 0.0,
+            "skill_vocab": len(matrix.skill_vocab) if matrix else 0,
+            "interest_vocab": len(matrix.interest_vocab) if matrix else 0
+        }
+
+
+# Global instance
+career_matrix_engine = CareerMatrixEngine()
+
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(CareerAttributes, _event, CareerMatrixEngine.invalidate)
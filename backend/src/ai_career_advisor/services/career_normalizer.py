@@ -1,16 +1,11 @@
 import json
-import google.generativeai as genai
 from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
+from ai_career_advisor.core.model_manager import ModelManager
 import asyncio
-from functools import partial
 from google.api_core.exceptions import ResourceExhausted, GoogleAPIError
 
 
-genai.configure(api_key=settings.GEMINI_API_KEY)
-model = genai.GenerativeModel("gemini-2.5-flash-lite")
-
-
 class CareerNormalizerService:
     """
     Normalizes and validates user career input
@@ -107,17 +102,13 @@ NOW PROCESS: "{user_input}"
 """
         
         try:
-            # Call Gemini API
-            loop = asyncio.get_event_loop()
-            response = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    partial(model.generate_content, prompt)
-                ),
+            # Call Gemini API (native async, per-key client)
+            text = await asyncio.wait_for(
+                ModelManager.generate_with_gemini(prompt, model="gemini-2.5-flash-lite"),
                 timeout=30.0
             )
             
-            text = response.text.strip()
+            text = text.strip()
             
             # Clean markdown
             if text.startswith("```"):
@@ -166,7 +157,7 @@ NOW PROCESS: "{user_input}"
         Fallback normalization using Perplexity (Sonar)
         """
         try:
-            import httpx
+            from ai_career_advisor.core.http_client import http_clients
             
             PERPLEXITY_API_KEY = settings.PERPLEXITY_API_KEY
             if not PERPLEXITY_API_KEY:
@@ -195,47 +186,48 @@ NOW PROCESS: "{user_input}"
             }}
             """
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "sonar",
-                        "messages": [
-                            {"role": "system", "content": "You are a helpful JSON-only assistant."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.1
-                    }
-                )
+            client = http_clients.get("perplexity")
+            response = await client.post(
+                "https://api.perplexity.ai/chat/completions",
+                timeout=30.0,
+                headers={
+                    "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": "sonar",
+                    "messages": [
+                        {"role": "system", "content": "You are a helpful JSON-only assistant."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.1
+                }
+            )
+            
+            if response.status_code == 200:
+                content = response.json()["choices"][0]["message"]["content"]
+                # Clean markdown
+                if "```" in content:
+                    content = content.replace("```json", "").replace("```", "").strip()
                 
-                if response.status_code == 200:
-                    content = response.json()["choices"][0]["message"]["content"]
-                    # Clean markdown
-                    if "```" in content:
-                        content = content.replace("```json", "").replace("```", "").strip()
-                    
-                    result = json.loads(content)
-                    
-                    if result.get("is_valid"):
-                        logger.success(f"   ✅ Normalized (Sonar): '{user_input}' → '{result['normalized_career']}'")
-                    else:
-                        logger.warning(f"   ❌ Invalid career (Sonar): {result.get('reason')}")
-                        
-                    return result
+                result = json.loads(content)
+                
+                if result.get("is_valid"):
+                    logger.success(f"   ✅ Normalized (Sonar): '{user_input}' → '{result['normalized_career']}'")
                 else:
-                    logger.error(f"    ❌ Sonar API Error: {response.text}")
-                    return {
-                        "is_valid": False,
-                        "normalized_career": None,
-                        "category": None,
-                        "confidence": 0.0,
-                        "reason": "Both primary and fallback services failed."
-                    }
+                    logger.warning(f"   ❌ Invalid career (Sonar): {result.get('reason')}")
                     
+                return result
+            else:
+                logger.error(f"    ❌ Sonar API Error: {response.text}")
+                return {
+                    "is_valid": False,
+                    "normalized_career": None,
+                    "category": None,
+                    "confidence": 0.0,
+                    "reason": "Both primary and fallback services failed."
+                }
+                
         except Exception as e:
             logger.error(f"    ❌ Fallback Error: {e}")
             return {
@@ -1,10 +1,12 @@
 from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
 from ai_career_advisor.services.intentfilter import IntentFilter
-from ai_career_advisor.models.chatconversation import ChatConversation
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict, Any, List, Tuple
-import httpx
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+from ai_career_advisor.core.http_client import http_clients
+from ai_career_advisor.core.database import AsyncSessionLocal
+from ai_career_advisor.services.write_behind import write_behind
+import asyncio
 import time
 import uuid
 import re
@@ -51,6 +53,11 @@ class ChatbotService:
         }
     }
     
+    WEB_DISCLAIMER = "\n\n💡 *Please verify from official sources before making decisions.*"
+    
+    # Persistence tasks started after a streamed answer (kept referenced until done)
+    _background_tasks: set = set()
+    
     # Hindi detection patterns
     HINDI_PATTERNS = [
         r'[\u0900-\u097F]',  # Devanagari script
@@ -154,7 +161,7 @@ class ChatbotService:
         
         try:
             # Step 1: Check intent (greetings, career, or blocked)
-            intent_result = IntentFilter.is_career_related(query)
+            intent_result = await IntentFilter.is_career_related_async(query)
             
             # Handle greetings instantly (no API calls)
             if intent_result.get("is_greeting"):
@@ -170,20 +177,7 @@ class ChatbotService:
             
             # Step 2: FEATURE ROUTING - Check if intent matches a feature
             # For roadmap requests, query existing roadmaps from BackwardPlanner feature
-            detected_intent = intent_result.get("intent", "")
-            
-            # KEYWORD OVERRIDE: Force roadmap routing for "I want to become X" queries
-            # (ML model sometimes classifies these as career_query instead of roadmap_request)
-            query_lower = query.lower()
-            roadmap_keywords = [
-                "want to become", "wanna become", "become a ", "become an ",
-                "how to become", "kaise bane", "kaise banu", "banna hai",
-                "banna chahta", "banna chahti", "roadmap for", "path to become",
-                "steps to become", "guide to become"
-            ]
-            if any(kw in query_lower for kw in roadmap_keywords):
-                detected_intent = "roadmap_request"
-                logger.info(f"🔀 Keyword override: treating as roadmap_request")
+            detected_intent = ChatbotService._resolve_intent(query, intent_result)
             
             if detected_intent == "roadmap_request":
                 feature_response = await ChatbotService._handle_roadmap_request(
@@ -193,7 +187,7 @@ class ChatbotService:
                     return feature_response
             
             # Step 3: Try RAG for other queries (with error handling)
-            rag_result = await ChatbotService._safe_rag_search(query)
+            rag_result = await ChatbotService._safe_rag_search(query, detected_intent)
             
             # Step 3: Generate response with sources
             if rag_result["found"] and rag_result.get("context"):
@@ -209,7 +203,7 @@ class ChatbotService:
                 response_type = "perplexity_search"
                 confidence = 0.8
                 
-                # Try to save to RAG for future (non-blocking)
+                # Queue for the RAG knowledge base (written behind the response)
                 await ChatbotService._save_to_rag(query, response_text, session_id)
             
             # Step 4: Detect features and add redirect links
@@ -255,6 +249,254 @@ class ChatbotService:
                 "response_time": time.time() - start_time
             }
     
+    @staticmethod
+    async def ask_stream(
+        query: str,
+        session_id: str = None,
+        user_email: str = None,
+        model_preference: str = "auto"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of ask() - yields events as the answer is generated:
+        - start:   {"session_id", "query"}
+        - token:   {"text"} (many)
+        - sources: {"sources", "appendix"} - appendix is the feature links +
+                   references markdown to append after the streamed text
+        - done:    {"response_type", "confidence", "response_time"}
+        - error:   {"message"} if generation breaks after tokens were sent
+        The conversation is saved after the stream completes, off the response path
+        """
+        start_time = time.time()
+        
+        if not session_id:
+            session_id = str(uuid.uuid4())
+        
+        logger.info(f"💬 Chatbot stream query: {query} (session: {session_id})")
+        use_hindi = ChatbotService._is_hindi_query(query)
+        
+        yield {"event": "start", "data": {"session_id": session_id, "query": query}}
+        
+        parts: List[str] = []
+        outcome = None
+        
+        async with AsyncSessionLocal() as db:
+            try:
+                if USE_AGENT_GRAPH:
+                    try:
+                        from ai_career_advisor.agents.career_agent import CareerAgent
+                        
+                        agent = CareerAgent(db=db)
+                        async for event in agent.stream(
+                            query=query,
+                            user_email=user_email or "anonymous",
+                            session_id=session_id,
+                            language="hi" if use_hindi else "en",
+                            model_preference=model_preference
+                        ):
+                            if event["type"] == "token":
+                                parts.append(event["text"])
+                                yield {"event": "token", "data": {"text": event["text"]}}
+                            else:
+                                outcome = event
+                    except Exception as e:
+                        if parts:
+                            raise
+                        logger.warning(f"Agent stream failed, falling back to legacy: {e}")
+                
+                if outcome is not None:
+                    sources = outcome["tool_outputs"].get("extra_sources", ["AI Agent - Career Pilot"])
+                    appendix = outcome["references"] + ChatbotService._detect_features(query)
+                    if "**References:**" not in outcome["response"] + appendix:
+                        appendix += ChatbotService._format_sources(sources, "agent")
+                    response_type, confidence = "agent", 0.9
+                else:
+                    legacy = ChatbotService._stream_legacy(query, session_id, user_email, db, start_time, use_hindi)
+                    async for event in legacy:
+                        if event["type"] == "token":
+                            parts.append(event["text"])
+                            yield {"event": "token", "data": {"text": event["text"]}}
+                        else:
+                            outcome = event
+                    sources = outcome["sources"]
+                    response_type, confidence = outcome["response_type"], outcome["confidence"]
+                    appendix = outcome["appendix"]
+            
+            except Exception as e:
+                logger.error(f"❌ Stream failed after {len(parts)} tokens: {e}")
+                yield {"event": "error", "data": {"message": "I'm having technical difficulties. Please try again in a moment."}}
+                return
+        
+        response_time = time.time() - start_time
+        yield {"event": "sources", "data": {"sources": sources, "appendix": appendix}}
+        yield {"event": "done", "data": {
+            "response_type": response_type,
+            "confidence": confidence,
+            "response_time": response_time
+        }}
+        
+        logger.success(f"✅ Streamed response in {response_time:.2f}s ({response_type})")
+        ChatbotService._persist_in_background(
+            session_id, user_email, query, "".join(parts) + appendix,
+            response_type, confidence, response_time, sources,
+            rag_response="".join(parts) if outcome.get("save_to_rag") else None
+        )
+    
+    @staticmethod
+    async def _stream_legacy(
+        query: str, session_id: str, user_email: str,
+        db: AsyncSession, start_time: float, use_hindi: bool
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Legacy pipeline (intent -> roadmap DB -> RAG / web) as a token stream
+        Yields {"type": "token"} events and a final {"type": "result", ...}
+        """
+        intent_result = await IntentFilter.is_career_related_async(query)
+        
+        detected_intent = ChatbotService._resolve_intent(query, intent_result) if intent_result["is_career"] else None
+        
+        instant = None
+        if intent_result.get("is_greeting"):
+            instant = await ChatbotService._handle_greeting(query, session_id, user_email, None, start_time, use_hindi)
+        elif not intent_result["is_career"]:
+            instant = await ChatbotService._handle_rejection(query, session_id, user_email, None, start_time, use_hindi)
+        elif detected_intent == "roadmap_request":
+            instant = await ChatbotService._handle_roadmap_request(
+                query, session_id, user_email, db, start_time, use_hindi, persist=False
+            )
+        
+        if instant:
+            yield {"type": "token", "text": instant["response"]}
+            yield {
+                "type": "result",
+                "sources": instant["sources"],
+                "response_type": instant["response_type"],
+                "confidence": instant["confidence"],
+                "appendix": ""
+            }
+            return
+        
+        # Nothing else needs the DB; release the connection before streaming
+        await db.close()
+        
+        rag_result = await ChatbotService._safe_rag_search(query, detected_intent)
+        streamed = False
+        
+        if rag_result["found"] and rag_result.get("context"):
+            system_prompt, prompt = ChatbotService._rag_prompt(query, rag_result["context"], use_hindi)
+            try:
+                async for chunk in ChatbotService._stream_perplexity(system_prompt, prompt, timeout=30.0):
+                    if chunk.get("content"):
+                        streamed = True
+                        yield {"type": "token", "text": chunk["content"]}
+                
+                sources = rag_result.get("sources") or ["Knowledge Base - Verified Data"]
+                response_type = "rag_verified"
+                yield {
+                    "type": "result",
+                    "sources": sources,
+                    "response_type": response_type,
+                    "confidence": max(rag_result.get("scores", [0.5])),
+                    "appendix": ChatbotService._detect_features(query) + ChatbotService._format_sources(sources, response_type)
+                }
+                return
+            except Exception as e:
+                if streamed:
+                    raise
+                logger.error(f"RAG generation error: {e}")
+        
+        # Perplexity Sonar with web search
+        system_prompt, prompt = ChatbotService._web_prompt(query, use_hindi)
+        citations: List[str] = []
+        try:
+            async for chunk in ChatbotService._stream_perplexity(system_prompt, prompt, timeout=45.0):
+                if chunk.get("content"):
+                    streamed = True
+                    yield {"type": "token", "text": chunk["content"]}
+                citations = chunk.get("citations", citations)
+            yield {"type": "token", "text": ChatbotService.WEB_DISCLAIMER}
+            sources = citations[:5] if citations else ["Web Search - Official Sources"]
+            save_to_rag = True
+        except Exception as e:
+            if streamed:
+                raise
+            logger.error(f"Perplexity error: {e}")
+            yield {"type": "token", "text": "I'm having trouble connecting. Please try again."}
+            sources = ["Connection Error"]
+            save_to_rag = False
+        
+        response_type = "perplexity_search"
+        yield {
+            "type": "result",
+            "sources": sources,
+            "response_type": response_type,
+            "confidence": 0.8,
+            "appendix": ChatbotService._detect_features(query) + ChatbotService._format_sources(sources, response_type),
+            "save_to_rag": save_to_rag
+        }
+    
+    @staticmethod
+    async def _stream_perplexity(system_prompt: str, prompt: str, timeout: float) -> AsyncIterator[Dict[str, Any]]:
+        """Stream Perplexity Sonar (same model and prompts as the non-streaming path)"""
+        if not settings.PERPLEXITY_API_KEY:
+            raise ValueError("PERPLEXITY_API_KEY not configured")
+        
+        from ai_career_advisor.core.model_manager import ModelManager
+        async for chunk in ModelManager.get_perplexity_client().stream_chat(
+            prompt, model="sonar", timeout=timeout, system_prompt=system_prompt
+        ):
+            yield chunk
+    
+    @staticmethod
+    def _persist_in_background(
+        session_id: str,
+        user_email: str,
+        query: str,
+        response: str,
+        response_type: str,
+        confidence: float,
+        response_time: float,
+        sources: list,
+        rag_response: str = None
+    ):
+        """Queue a streamed conversation (and web answers for RAG) without holding the response"""
+        async def persist():
+            if rag_response:
+                await ChatbotService._save_to_rag(query, rag_response, session_id)
+            await write_behind.save_conversation(
+                sessionid=session_id,
+                useremail=user_email,
+                userquery=query,
+                botresponse=response,
+                sources=sources,
+                confidence=confidence,
+                responsetype=response_type,
+                responsetime=response_time
+            )
+        
+        task = asyncio.create_task(persist())
+        ChatbotService._background_tasks.add(task)
+        task.add_done_callback(ChatbotService._background_tasks.discard)
+    
+    @staticmethod
+    def _resolve_intent(query: str, intent_result: Dict[str, Any]) -> str:
+        """Intent from the filter, with a keyword override for roadmap requests"""
+        detected_intent = intent_result.get("intent", "")
+        
+        # KEYWORD OVERRIDE: Force roadmap routing for "I want to become X" queries
+        # (ML model sometimes classifies these as career_query instead of roadmap_request)
+        query_lower = query.lower()
+        roadmap_keywords = [
+            "want to become", "wanna become", "become a ", "become an ",
+            "how to become", "kaise bane", "kaise banu", "banna hai",
+            "banna chahta", "banna chahti", "roadmap for", "path to become",
+            "steps to become", "guide to become"
+        ]
+        if any(kw in query_lower for kw in roadmap_keywords):
+            detected_intent = "roadmap_request"
+            logger.info(f"🔀 Keyword override: treating as roadmap_request")
+        
+        return detected_intent
+    
     @staticmethod
     def _format_sources(sources: List[str], response_type: str = "") -> str:
         """Format sources into a readable string with clickable links"""
@@ -390,7 +632,8 @@ Please ask a career or education-related question! 😊"""
     @staticmethod
     async def _handle_roadmap_request(
         query: str, session_id: str, user_email: str,
-        db: AsyncSession, start_time: float, use_hindi: bool
+        db: AsyncSession, start_time: float, use_hindi: bool,
+        persist: bool = True
     ) -> Dict[str, Any]:
         """
         Handle roadmap requests by checking existing BackwardPlanner data first.
@@ -446,10 +689,11 @@ Please ask a career or education-related question! 😊"""
             
             response_time = time.time() - start_time
             
-            await ChatbotService._save_conversation(
-                db, session_id, user_email, query, response_text,
-                "feature_db", 1.0, response_time, ["Career Roadmap Database"]
-            )
+            if persist:
+                await ChatbotService._save_conversation(
+                    db, session_id, user_email, query, response_text,
+                    "feature_db", 1.0, response_time, ["Career Roadmap Database"]
+                )
             
             return {
                 "session_id": session_id,
@@ -496,15 +740,16 @@ Please ask a career or education-related question! 😊"""
 
     
     @staticmethod
-    async def _safe_rag_search(query: str) -> Dict[str, Any]:
+    async def _safe_rag_search(query: str, intent: Optional[str] = None) -> Dict[str, Any]:
         """
-        RAG search with full error handling
+        RAG search with full error handling, routed to the intent's sources
         Never raises exceptions - returns empty result on failure
         """
         try:
-            from ai_career_advisor.RAG.retriever import retriever
+            from ai_career_advisor.rag.retriever import retriever
             logger.info("🔍 Searching RAG database...")
-            result = await retriever.search_and_build_context(query, top_k=5)
+            # RAG answers are generated by Perplexity (sonar), so budget its tokens
+            result = await retriever.search_and_build_context(query, top_k=5, target_model="perplexity", intent=intent)
             
             if result["found"]:
                 logger.success(f"✅ RAG found {result.get('num_documents', 0)} documents")
@@ -531,6 +776,42 @@ Please ask a career or education-related question! 😊"""
         if not PERPLEXITY_API_KEY:
             return ("Configuration error. Please contact support.", ["System Error"])
         
+        system_prompt, prompt = ChatbotService._rag_prompt(query, context, use_hindi)
+
+        try:
+            client = http_clients.get("perplexity")
+            response = await client.post(
+                "https://api.perplexity.ai/chat/completions",
+                timeout=30.0,
+                headers={
+                    "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": "sonar",
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ]
+                }
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                answer = data["choices"][0]["message"]["content"].strip()
+                sources = rag_sources if rag_sources else ["Knowledge Base - Verified Data"]
+                return (answer, sources)
+            else:
+                logger.error(f"Perplexity API error: {response.status_code}")
+                return await ChatbotService._generate_with_perplexity(query, use_hindi)
+        
+        except Exception as e:
+            logger.error(f"RAG generation error: {e}")
+            return await ChatbotService._generate_with_perplexity(query, use_hindi)
+    
+    @staticmethod
+    def _rag_prompt(query: str, context: str, use_hindi: bool) -> Tuple[str, str]:
+        """(system prompt, user prompt) for answering from RAG context"""
         lang_instruction = "Answer in Hindi/Hinglish." if use_hindi else "Answer in English only."
         
         prompt = f"""You are an AI Career Counselor for Indian students. Answer using the verified context below.
@@ -546,36 +827,9 @@ RULES:
 - Be concise, under 200 words
 - Include specific details (fees, dates, etc.) if available
 - Do NOT mix languages unless user asked in mixed language"""
-
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "sonar",
-                        "messages": [
-                            {"role": "system", "content": f"You are a helpful career counselor. {lang_instruction} Use only the provided context."},
-                            {"role": "user", "content": prompt}
-                        ]
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    answer = data["choices"][0]["message"]["content"].strip()
-                    sources = rag_sources if rag_sources else ["Knowledge Base - Verified Data"]
-                    return (answer, sources)
-                else:
-                    logger.error(f"Perplexity API error: {response.status_code}")
-                    return await ChatbotService._generate_with_perplexity(query, use_hindi)
         
-        except Exception as e:
-            logger.error(f"RAG generation error: {e}")
-            return await ChatbotService._generate_with_perplexity(query, use_hindi)
+        system_prompt = f"You are a helpful career counselor. {lang_instruction} Use only the provided context."
+        return (system_prompt, prompt)
     
     @staticmethod
     async def _generate_with_perplexity(query: str, use_hindi: bool) -> Tuple[str, List[str]]:
@@ -585,6 +839,52 @@ RULES:
         if not PERPLEXITY_API_KEY:
             return ("Configuration error. Please contact support.", ["System Error"])
         
+        system_prompt, prompt = ChatbotService._web_prompt(query, use_hindi)
+
+        try:
+            client = http_clients.get("perplexity")
+            response = await client.post(
+                "https://api.perplexity.ai/chat/completions",
+                timeout=45.0,
+                headers={
+                    "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": "sonar",
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ]
+                }
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                answer = data["choices"][0]["message"]["content"].strip()
+                
+                # Extract citations from Perplexity response
+                citations = data.get("citations", [])
+                if citations:
+                    sources = citations[:5]
+                else:
+                    sources = ["Web Search - Official Sources"]
+                
+                # Add disclaimer
+                answer += ChatbotService.WEB_DISCLAIMER
+                
+                return (answer, sources)
+            else:
+                logger.error(f"Perplexity API error: {response.status_code}")
+                return ("I'm having trouble connecting. Please try again.", ["Connection Error"])
+        
+        except Exception as e:
+            logger.error(f"Perplexity error: {e}")
+            return ("I'm experiencing technical difficulties. Please try again.", ["Technical Error"])
+    
+    @staticmethod
+    def _web_prompt(query: str, use_hindi: bool) -> Tuple[str, str]:
+        """(system prompt, user prompt) for answering with Perplexity web search"""
         lang_instruction = "Answer in Hindi/Hinglish." if use_hindi else "Answer in English only. Do not use Hindi words."
         
         prompt = f"""You are an AI Career Counselor for Indian students.
@@ -597,46 +897,9 @@ INSTRUCTIONS:
 - Provide specific details: fees, eligibility, dates, salary ranges
 - Keep response under 250 words
 - Be factual and cite official sources with links"""
-
-        try:
-            async with httpx.AsyncClient(timeout=45.0) as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "sonar",
-                        "messages": [
-                            {"role": "system", "content": f"You are an expert Indian education and career counselor. {lang_instruction} Always cite your sources."},
-                            {"role": "user", "content": prompt}
-                        ]
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    answer = data["choices"][0]["message"]["content"].strip()
-                    
-                    # Extract citations from Perplexity response
-                    citations = data.get("citations", [])
-                    if citations:
-                        sources = citations[:5]
-                    else:
-                        sources = ["Web Search - Official Sources"]
-                    
-                    # Add disclaimer
-                    answer += "\n\n💡 *Please verify from official sources before making decisions.*"
-                    
-                    return (answer, sources)
-                else:
-                    logger.error(f"Perplexity API error: {response.status_code}")
-                    return ("I'm having trouble connecting. Please try again.", ["Connection Error"])
         
-        except Exception as e:
-            logger.error(f"Perplexity error: {e}")
-            return ("I'm experiencing technical difficulties. Please try again.", ["Technical Error"])
+        system_prompt = f"You are an expert Indian education and career counselor. {lang_instruction} Always cite your sources."
+        return (system_prompt, prompt)
     
     @staticmethod
     def _detect_features(query: str) -> str:
@@ -653,21 +916,16 @@ INSTRUCTIONS:
     
     @staticmethod
     async def _save_to_rag(query: str, response: str, session_id: str):
-        """Try to save response to RAG for future use (non-blocking)"""
-        try:
-            from ai_career_advisor.RAG.retriever import retriever
-            await retriever.add_to_knowledge_base(
-                query=query,
-                response=response,
-                metadata={
-                    "source": "perplexity_sonar",
-                    "session_id": session_id,
-                    "timestamp": time.time()
-                }
-            )
-            logger.success("💾 Response saved to RAG")
-        except Exception as e:
-            logger.warning(f"Could not save to RAG: {e}")
+        """Queue response for the RAG knowledge base (embedded + written in batches by write_behind)"""
+        await write_behind.save_to_rag(
+            query=query,
+            response=response,
+            metadata={
+                "source": "perplexity_sonar",
+                "session_id": session_id,
+                "timestamp": time.time()
+            }
+        )
     
     @staticmethod
     async def _save_conversation(
@@ -681,29 +939,22 @@ INSTRUCTIONS:
         response_time: float,
         sources: list
     ):
-        """Save conversation to database (non-blocking)"""
+        """
+        Queue conversation for the database (bulk-inserted by write_behind)
+        
+        db=None skips persistence; the row is written on the flusher's own
+        session since the request's session is closed by then.
+        """
         if not db:
             return
         
-        try:
-            conversation = ChatConversation(
-                sessionid=session_id,
-                useremail=user_email,
-                userquery=query,
-                botresponse=response,
-                sources=sources,
-                confidence=confidence,
-                responsetype=response_type,
-                responsetime=response_time
-            )
-            
-            db.add(conversation)
-            await db.commit()
-            logger.debug(f"💾 Conversation saved")
-        
-        except Exception as e:
-            logger.warning(f"Could not save conversation: {e}")
-            try:
-                await db.rollback()
-            except:
-                pass
+        await write_behind.save_conversation(
+            sessionid=session_id,
+            useremail=user_email,
+            userquery=query,
+            botresponse=response,
+            sources=sources,
+            confidence=confidence,
+            responsetype=response_type,
+            responsetime=response_time
+        )
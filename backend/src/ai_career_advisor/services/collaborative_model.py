@@ -0,0 +1,255 @@
+"""
+Item-Item Collaborative Filtering Model
+Precomputed from user_career_interactions, refreshed on a schedule
+
+📚 STUDY NOTES:
+- R = sparse user x career matrix of implicit ratings (mean interaction score)
+- S = item-item cosine similarity: normalize R's columns, S = Rn^T Rn
+  (only the top-N neighbours per career are kept)
+- Online: score(c) = Σ_j S[c, j] * r_uj / (Σ_j |S[c, j]| + shrinkage)
+  -> ONE sparse mat-vec over the user's own interactions, no per-career SQL
+- Shrinkage pulls weakly supported careers towards neutral (0.5)
+"""
+
+import time
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple, Iterable
+import numpy as np
+from scipy import sparse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ai_career_advisor.models.user_career_interaction import UserCareerInteraction
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+NEUTRAL_SCORE = 0.5
+
+
+class ItemItemModel:
+    """Immutable item-item similarity snapshot"""
+
+    def __init__(
+        self,
+        rows: Iterable[Tuple[str, str, float]],
+        neighbors: int = 50,
+        shrinkage: float = 0.5
+    ):
+        self.shrinkage = shrinkage
+        self.built_at = time.time()
+
+        user_index: Dict[str, int] = {}
+        career_index: Dict[str, int] = {}
+        users, careers, scores = [], [], []
+        for user_email, career_name, score in rows:
+            users.append(user_index.setdefault(user_email, len(user_index)))
+            careers.append(career_index.setdefault(career_name, len(career_index)))
+            scores.append(NEUTRAL_SCORE if score is None else score)
+
+        self.career_index = career_index
+        self.num_users = len(user_index)
+        self.num_interactions = len(scores)
+        shape = (max(len(user_index), 1), max(len(career_index), 1))
+
+        # Mean score per (user, career): duplicates are summed by COO -> CSR, then divided by counts
+        users = np.array(users, dtype=np.int64)
+        careers = np.array(careers, dtype=np.int64)
+        totals = sparse.coo_matrix((np.array(scores, dtype=np.float32), (users, careers)), shape=shape).tocsr()
+        counts = sparse.coo_matrix((np.ones(len(scores), dtype=np.float32), (users, careers)), shape=shape).tocsr()
+        ratings = totals.multiply(counts.power(-1)).tocsr()
+
+        # Column-normalize -> cosine similarity between careers
+        norms = np.sqrt(np.asarray(ratings.multiply(ratings).sum(axis=0))).ravel()
+        normalized = ratings @ sparse.diags(np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0))
+        similarity = (normalized.T @ normalized).tocsr()
+        similarity.setdiag(0)
+        similarity.eliminate_zeros()
+
+        self.similarity = self._keep_top_neighbors(similarity, neighbors).astype(np.float32)
+
+    @staticmethod
+    def _keep_top_neighbors(similarity: sparse.csr_matrix, k: int) -> sparse.csr_matrix:
+        """Keep the k strongest (|s|) neighbours in every row"""
+        indptr, indices, data = [0], [], []
+        for row in range(similarity.shape[0]):
+            start, end = similarity.indptr[row], similarity.indptr[row + 1]
+            row_data = similarity.data[start:end]
+            row_indices = similarity.indices[start:end]
+            if len(row_data) > k:
+                keep = np.argpartition(-np.abs(row_data), k - 1)[:k]
+                row_data, row_indices = row_data[keep], row_indices[keep]
+            indices.extend(row_indices)
+            data.extend(row_data)
+            indptr.append(len(indices))
+        return sparse.csr_matrix((data, indices, indptr), shape=similarity.shape)
+
+    def score(self, user_ratings: Dict[str, float], career_names: List[str]) -> np.ndarray:
+        """
+        Collaborative score in [0, 1] for each of career_names
+        (0.5 = no evidence either way, like the old neutral score)
+        """
+        return self.score_many([user_ratings], career_names)[0]
+
+    def score_many(self, users_ratings: List[Dict[str, float]], career_names: List[str]) -> np.ndarray:
+        """(n_users x len(career_names)) scores from two sparse matrix-matrix products"""
+        result = np.full((len(users_ratings), len(career_names)), NEUTRAL_SCORE, dtype=np.float32)
+
+        rows, columns, ratings = [], [], []
+        for u, user_ratings in enumerate(users_ratings):
+            for career, rating in user_ratings.items():
+                j = self.career_index.get(career)
+                if j is not None:
+                    rows.append(u)
+                    columns.append(j)
+                    ratings.append(rating)
+        if not rows:
+            return result
+
+        shape = (len(users_ratings), self.similarity.shape[1])
+        user_matrix = sparse.csr_matrix((np.array(ratings, dtype=np.float32), (rows, columns)), shape=shape)
+        support = sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, columns)), shape=shape)
+
+        weighted = (user_matrix @ self.similarity.T).toarray()
+        weights = (support @ abs(self.similarity).T).toarray()
+        prediction = weighted / (weights + self.shrinkage)  # roughly in [-1, 1]
+
+        positions = np.array([self.career_index.get(c, -1) for c in career_names])
+        found = positions >= 0
+        # Users without any known career keep the neutral row
+        known = np.zeros(len(users_ratings), dtype=bool)
+        known[rows] = True
+        result[np.ix_(known, found)] = np.clip(
+            NEUTRAL_SCORE + NEUTRAL_SCORE * prediction[np.ix_(known, positions[found])], 0.0, 1.0
+        )
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "users": self.num_users,
+            "careers": len(self.career_index),
+            "interactions": self.num_interactions,
+            "similarity_nnz": int(self.similarity.nnz),
+            "age_s": round(time.time() - self.built_at, 1)
+        }
+
+
+class CollaborativeModelService:
+    """
+    Owns the current ItemItemModel
+
+    - refresh(): full rebuild from user_career_interactions (scheduled job)
+    - score_user(): the user's OWN interactions are read live, so new
+      clicks count immediately; similarities catch up on the next refresh
+    """
+
+    def __init__(self):
+        self._model: Optional[ItemItemModel] = None
+        self._lock = asyncio.Lock()
+        self.refreshes = 0
+        self.last_refresh_seconds = 0.0
+
+    @property
+    def model(self) -> Optional[ItemItemModel]:
+        return self._model
+
+    async def refresh(self, db: Optional[AsyncSession] = None, if_missing: bool = False) -> ItemItemModel:
+        """Rebuild the similarity model from every interaction"""
+        async with self._lock:
+            if if_missing and self._model is not None:
+                return self._model
+            
+            started = time.perf_counter()
+
+            if db is None:
+                from ai_career_advisor.core.database import AsyncSessionLocal
+                async with AsyncSessionLocal() as session:
+                    rows = await self._load_rows(session)
+            else:
+                rows = await self._load_rows(db)
+
+            loop = asyncio.get_running_loop()
+            self._model = await loop.run_in_executor(
+                None, ItemItemModel, rows,
+                settings.COLLAB_MODEL_NEIGHBORS, settings.COLLAB_MODEL_SHRINKAGE
+            )
+
+            self.refreshes += 1
+            self.last_refresh_seconds = time.perf_counter() - started
+            stats = self._model.get_stats()
+            logger.success(
+                f"🤝 Collaborative model refreshed: {stats['users']} users, {stats['careers']} careers, "
+                f"{stats['similarity_nnz']} similarities in {self.last_refresh_seconds:.1f}s"
+            )
+            return self._model
+
+    @staticmethod
+    async def _load_rows(db: AsyncSession) -> List[Tuple[str, str, float]]:
+        result = await db.execute(
+            select(
+                UserCareerInteraction.user_email,
+                UserCareerInteraction.career_name,
+                UserCareerInteraction.score
+            )
+        )
+        return result.all()
+
+    @staticmethod
+    def _mean_ratings(user_interactions: List[UserCareerInteraction]) -> Dict[str, float]:
+        """Mean score per career for one user (same aggregation as the model)"""
+        totals: Dict[str, List[float]] = {}
+        for interaction in user_interactions:
+            score = NEUTRAL_SCORE if interaction.score is None else interaction.score
+            totals.setdefault(interaction.career_name, []).append(score)
+        return {career: sum(s) / len(s) for career, s in totals.items()}
+
+    async def _ensure_model(self, db: AsyncSession) -> Optional[ItemItemModel]:
+        """Build the model on first use; None (neutral scores) if that fails"""
+        if self._model is None:
+            try:
+                await self.refresh(db, if_missing=True)
+            except Exception as e:
+                logger.error(f"❌ Collaborative model refresh failed, using neutral scores: {e}")
+        return self._model
+
+    async def score_user(
+        self,
+        db: AsyncSession,
+        user_interactions: List[UserCareerInteraction],
+        career_names: List[str]
+    ) -> np.ndarray:
+        """Vectorized collaborative scores aligned with career_names (neutral 0.5 on failure)"""
+        model = await self._ensure_model(db)
+        try:
+            if model is not None:
+                return model.score(self._mean_ratings(user_interactions), career_names)
+        except Exception as e:
+            logger.error(f"❌ Collaborative scoring failed, using neutral scores: {e}")
+        return np.full(len(career_names), NEUTRAL_SCORE, dtype=np.float32)
+
+    async def score_users(
+        self,
+        db: AsyncSession,
+        users_interactions: List[List[UserCareerInteraction]],
+        career_names: List[str]
+    ) -> np.ndarray:
+        """(n_users x n_careers) collaborative scores for a batch of users (neutral 0.5 on failure)"""
+        model = await self._ensure_model(db)
+        try:
+            if model is not None:
+                return model.score_many([self._mean_ratings(i) for i in users_interactions], career_names)
+        except Exception as e:
+            logger.error(f"❌ Collaborative scoring failed, using neutral scores: {e}")
+        return np.full((len(users_interactions), len(career_names)), NEUTRAL_SCORE, dtype=np.float32)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "built": self._model is not None,
+            "refreshes": self.refreshes,
+            "last_refresh_s": round(self.last_refresh_seconds, 2),
+            "refresh_interval_minutes": settings.COLLAB_MODEL_REFRESH_MINUTES,
+            **(self._model.get_stats() if self._model else {})
+        }
+
+
+# Global instance
+collaborative_model = CollaborativeModelService()
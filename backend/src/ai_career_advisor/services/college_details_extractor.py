@@ -149,66 +149,67 @@ IMPORTANT: Return ONLY the JSON object, no additional text.
 
 
         try:
-            import httpx
-
-
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": PERPLEXITY_MODEL,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are a precise data extraction assistant. Return ONLY valid JSON."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ]
-                    }
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"❌ Perplexity API error: {response.status_code} - {response.text}")
-                    return {"error": f"perplexity_api_error_{response.status_code}"}
-
-
-                data = response.json()
-                text = data["choices"][0]["message"]["content"].strip()
-                
-                # Clean markdown
-                if text.startswith("```"):
-                    text = text.replace("```json", "").replace("```", "").strip()
-
-
-                try:
-                    extracted = json.loads(text)
-                except json.JSONDecodeError:
-                    logger.error(f"❌ JSON parse failed for {college_name}")
-                    return {"error": "invalid_json_after_retries", "partial_data": {}}
-
-
-                # Validate completeness
-                is_complete, missing = CollegeStrictGeminiExtractor._is_data_complete(extracted)
-                
-                # Always return data, even if incomplete
-                if not is_complete:
-                    logger.warning(f"⚠️ Missing fields: {missing}")
-                    return {
-                        "warning": "incomplete_data",
-                        "missing_fields": missing, 
-                        "partial_data": extracted
-                    }
-
-
-                logger.success(f"✅ Success: Extracted all details for {college_name}")
-                return extracted
+            from ai_career_advisor.core.http_client import http_clients
+
+
+            client = http_clients.get("perplexity")
+            response = await client.post(
+                "https://api.perplexity.ai/chat/completions",
+                timeout=60.0,
+                headers={
+                    "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": PERPLEXITY_MODEL,
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": "You are a precise data extraction assistant. Return ONLY valid JSON."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ]
+                }
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"❌ Perplexity API error: {response.status_code} - {response.text}")
+                return {"error": f"perplexity_api_error_{response.status_code}"}
+
+
+            data = response.json()
+            text = data["choices"][0]["message"]["content"].strip()
+            
+            # Clean markdown
+            if text.startswith("```"):
+                text = text.replace("```json", "").replace("```", "").strip()
+
+
+            try:
+                extracted = json.loads(text)
+            except json.JSONDecodeError:
+                logger.error(f"❌ JSON parse failed for {college_name}")
+                return {"error": "invalid_json_after_retries", "partial_data": {}}
+
+
+            # Validate completeness
+            is_complete, missing = CollegeStrictGeminiExtractor._is_data_complete(extracted)
+            
+            # Always return data, even if incomplete
+            if not is_complete:
+                logger.warning(f"⚠️ Missing fields: {missing}")
+                return {
+                    "warning": "incomplete_data",
+                    "missing_fields": missing, 
+                    "partial_data": extracted
+                }
+
+
+            logger.success(f"✅ Success: Extracted all details for {college_name}")
+            return extracted
 
 
         except Exception as e:
@@ -5,7 +5,7 @@ from functools import partial
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from ai_career_advisor.models.college_program_cache import CollegeProgramCache
-import httpx
+from ai_career_advisor.core.http_client import http_clients
 import os
 
 
@@ -108,38 +108,39 @@ Answer:"""
             return None
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {cls.PERPLEXITY_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": cls.PERPLEXITY_MODEL,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are a helpful assistant. Answer only with 'true' or 'false'."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ]
-                    }
-                )
+            client = http_clients.get("perplexity")
+            response = await client.post(
+                "https://api.perplexity.ai/chat/completions",
+                timeout=30.0,
+                headers={
+                    "Authorization": f"Bearer {cls.PERPLEXITY_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": cls.PERPLEXITY_MODEL,
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": "You are a helpful assistant. Answer only with 'true' or 'false'."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ]
+                }
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                answer = data["choices"][0]["message"]["content"].strip().lower()
+                result = "true" in answer
+                logger.debug(f"✅ Perplexity Sonar Pro: {result}")
+                return result
+            else:
+                logger.error(f"❌ Perplexity API error: {response.status_code}")
+                return None
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    answer = data["choices"][0]["message"]["content"].strip().lower()
-                    result = "true" in answer
-                    logger.debug(f"✅ Perplexity Sonar Pro: {result}")
-                    return result
-                else:
-                    logger.error(f"❌ Perplexity API error: {response.status_code}")
-                    return None
-                    
         except Exception as e:
             logger.error(f"❌ Perplexity error: {e}")
             return None
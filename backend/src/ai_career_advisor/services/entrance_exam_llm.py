@@ -1,7 +1,7 @@
 import json
 from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
-import httpx
+from ai_career_advisor.core.http_client import http_clients
 from datetime import datetime
 
 
@@ -74,42 +74,43 @@ RULES:
 """
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": PERPLEXITY_MODEL,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are a precise data extraction assistant. Return ONLY valid JSON."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ]
-                    }
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"❌ Perplexity API error: {response.status_code}")
-                    return {"error": f"api_error_{response.status_code}"}
-                
-                data = response.json()
-                text = data["choices"][0]["message"]["content"].strip()
-                
-                # Clean markdown
-                if text.startswith("```"):
-                    text = text.replace("```json", "").replace("```", "").strip()
-                
-                exam_data = json.loads(text)
-                logger.success(f"Found exam: {exam_data.get('exam_name')}")
-                return exam_data
+            client = http_clients.get("perplexity")
+            response = await client.post(
+                "https://api.perplexity.ai/chat/completions",
+                timeout=60.0,
+                headers={
+                    "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": PERPLEXITY_MODEL,
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": "You are a precise data extraction assistant. Return ONLY valid JSON."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ]
+                }
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"❌ Perplexity API error: {response.status_code}")
+                return {"error": f"api_error_{response.status_code}"}
+            
+            data = response.json()
+            text = data["choices"][0]["message"]["content"].strip()
+            
+            # Clean markdown
+            if text.startswith("```"):
+                text = text.replace("```json", "").replace("```", "").strip()
+            
+            exam_data = json.loads(text)
+            logger.success(f"Found exam: {exam_data.get('exam_name')}")
+            return exam_data
         
         except Exception as e:
             logger.error(f"Error fetching exam data: {e}")
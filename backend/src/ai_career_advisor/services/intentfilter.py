@@ -24,8 +24,12 @@ are understood as similar queries even though they use different words."
 
 from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
-from typing import Dict, Any, Optional
+from ai_career_advisor.services.monitoring_service import monitor
+from typing import Dict, Any, Optional, Iterable, Tuple
+from collections import OrderedDict
 import os
+import re
+import threading
 from pathlib import Path
 
 
@@ -47,12 +51,12 @@ def _load_ml_model():
     global _ml_model_available, _intent_classifier
     
     try:
-        from ai_career_advisor.ml_models.intent_classifier import get_intent_classifier
-        model_path = Path(__file__).parent.parent / "models" / "intent_classifier"
+        from ai_career_advisor.ml_models.intent_loader import get_intent_classifier, resolve_backend
         
-        if model_path.exists():
+        if resolve_backend() is not None:
             _intent_classifier = get_intent_classifier()
             _ml_model_available = True
+            IntentFilterML.clear_cache()
             logger.info("✅ ML Intent Classifier loaded successfully")
         else:
             logger.warning("⚠️ No trained ML model found, using rule-based fallback")
@@ -62,6 +66,74 @@ def _load_ml_model():
         _ml_model_available = False
 
 
+def _trie_regex(words: Iterable[str]) -> str:
+    """
+    Build a regex from a prefix trie of words
+    
+    📚 STUDY NOTE:
+    ["ca", "cat", "cds"] -> "c(?:a(?:t)?|ds)"
+    Shared prefixes are matched once, so the regex engine does the work of
+    an Aho-Corasick automaton instead of trying every keyword separately.
+    The optional suffix groups are greedy, so the longest keyword wins.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of a word
+    
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return "(?:" + pattern + ")?" if "" in node else pattern
+    
+    return build(trie)
+
+
+class LexicalMatcher:
+    """
+    Single-pass matcher for greetings, blacklist and career keywords
+    
+    Replaces three linear substring scans over Python lists:
+    - greetings: anchored at the start ("hi" or "hi there", not "history")
+    - blacklist + career keywords: ONE scan of the query, finding every
+      position where any keyword starts (substring semantics, as before)
+    """
+    
+    def __init__(self, greetings: Iterable[str], blacklist: Iterable[str], career_keywords: Iterable[str]):
+        self.blacklist = set(blacklist)
+        keywords = self.blacklist | set(career_keywords)
+        
+        self.greeting_re = re.compile(r"^(" + _trie_regex(greetings) + r")(?: |$)")
+        # Zero-width lookahead -> a match attempt at every position (overlaps included)
+        self.keyword_re = re.compile(r"(?=(" + _trie_regex(keywords) + r"))")
+        
+        # A blacklisted word hidden inside a longer keyword still counts as blocked
+        self.blocked_prefix = {
+            word: next((b for b in self.blacklist if word.startswith(b)), None)
+            for word in keywords
+        }
+    
+    def match_greeting(self, text: str) -> Optional[str]:
+        match = self.greeting_re.match(text)
+        return match.group(1) if match else None
+    
+    def scan(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return (first blacklisted keyword, first career keyword) in one pass"""
+        career = None
+        for match in self.keyword_re.finditer(text):
+            word = match.group(1)
+            blocked = self.blocked_prefix[word]
+            if blocked:
+                return blocked, career
+            if career is None:
+                career = word
+        return None, career
+
+
 class IntentFilterML:
     """
     Hybrid Intent Filter with ML and Rule-based fallback
@@ -114,6 +186,25 @@ class IntentFilterML:
     
     NON_CAREER_INTENTS = ["off_topic"]
     
+    # Rule-based fallback keywords (substring match)
+    CAREER_KEYWORDS = [
+        "college", "university", "iit", "nit", "aiims", "school", "degree",
+        "btech", "bsc", "mba", "mbbs", "engineering", "medical", "commerce",
+        "science", "arts", "diploma", "phd", "masters", "bachelor",
+        "jee", "neet", "gate", "cat", "upsc", "ssc", "exam", "entrance",
+        "cuet", "clat", "nda", "cds", "ias", "ips", "test", "cutoff",
+        "career", "job", "salary", "placement", "package", "internship",
+        "engineer", "doctor", "teacher", "lawyer", "ca", "cs", "software",
+        "developer", "data scientist", "analyst", "manager", "consultant",
+        "course", "stream", "branch", "admission", "eligibility", "fees",
+        "scholarship", "counseling", "guidance", "roadmap", "preparation",
+        "study", "skill", "training", "certification", "after 10th", "after 12th"
+    ]
+    
+    # Normalized query -> (intent, confidence), in front of the model
+    _cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    
     @staticmethod
     def is_career_related(query: str) -> Dict[str, Any]:
         """
@@ -127,10 +218,81 @@ class IntentFilterML:
             "intent": str (optional, only with ML)
         }
         """
-        global _ml_model_available, _intent_classifier
+        query_lower = query.lower().strip()
         
+        # STEP 1-2: Validation, greetings, blacklist (one lexical pass)
+        early, keyword = IntentFilterML._pre_check(query_lower)
+        if early is not None:
+            return early
+        
+        # STEP 3: Try ML classification (prediction cache first)
+        if IntentFilterML._ensure_model():
+            try:
+                prediction = IntentFilterML._cache_get(query_lower)
+                if prediction is None:
+                    prediction = _intent_classifier.predict(query)
+                    IntentFilterML._cache_put(query_lower, prediction)
+                
+                result = IntentFilterML._from_ml(*prediction)
+                if result is not None:
+                    return result
+            except Exception as e:
+                logger.error(f"❌ ML prediction failed: {e}")
+        
+        # STEP 4: Rule-based fallback (same as original IntentFilter)
+        return IntentFilterML._rule_based_check(keyword)
+    
+    @staticmethod
+    async def is_career_related_async(query: str) -> Dict[str, Any]:
+        """
+        Same as is_career_related, but the ML step goes through the micro-batcher
+        
+        📚 STUDY NOTE:
+        - Concurrent requests share one DistilBERT forward pass
+        - The event loop is never blocked by model inference
+        """
         query_lower = query.lower().strip()
         
+        early, keyword = IntentFilterML._pre_check(query_lower)
+        if early is not None:
+            return early
+        
+        if IntentFilterML._ensure_model():
+            try:
+                prediction = IntentFilterML._cache_get(query_lower)
+                if prediction is None:
+                    from ai_career_advisor.ml_models.intent_loader import get_intent_batcher
+                    prediction = await get_intent_batcher().submit(query)
+                    IntentFilterML._cache_put(query_lower, prediction)
+                
+                result = IntentFilterML._from_ml(*prediction)
+                if result is not None:
+                    return result
+            except Exception as e:
+                logger.error(f"❌ ML prediction failed: {e}")
+        
+        return IntentFilterML._rule_based_check(keyword)
+    
+    @staticmethod
+    def _ensure_model() -> bool:
+        """Lazy-load the model once; True if ML classification is available"""
+        if not _ml_model_available and _intent_classifier is None:
+            _load_ml_model()
+        return _ml_model_available and _intent_classifier is not None
+    
+    @staticmethod
+    def _pre_check(query_lower: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Cheap checks that run before the model
+        
+        Returns (result or None to keep going, first career keyword found)
+        """
+        early, keyword = IntentFilterML._lexical_check(query_lower)
+        monitor.log_intent_lookup(short_circuited=early is not None)
+        return early, keyword
+    
+    @staticmethod
+    def _lexical_check(query_lower: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         # Basic validation
         if len(query_lower) < 2:
             return {
@@ -138,96 +300,121 @@ class IntentFilterML:
                 "confidence": 1.0,
                 "method": "validation",
                 "reason": "Query too short"
-            }
+            }, None
         
         # STEP 1: Check for greetings (quick check before ML)
-        for greeting in IntentFilterML.GREETINGS:
-            if query_lower == greeting or query_lower.startswith(greeting + " "):
-                logger.info(f"✋ Greeting detected: {greeting}")
-                return {
-                    "is_career": True,
-                    "confidence": 1.0,
-                    "method": "greeting",
-                    "reason": "Greeting detected",
-                    "is_greeting": True,
-                    "intent": "greeting"
-                }
+        greeting = _lexicon.match_greeting(query_lower)
+        if greeting:
+            logger.info(f"✋ Greeting detected: {greeting}")
+            return {
+                "is_career": True,
+                "confidence": 1.0,
+                "method": "greeting",
+                "reason": "Greeting detected",
+                "is_greeting": True,
+                "intent": "greeting"
+            }, None
         
-        # STEP 2: Check blacklist (safety check)
-        for keyword in IntentFilterML.BLACKLIST_KEYWORDS:
-            if keyword in query_lower:
-                logger.warning(f"🚫 Blacklist keyword found: {keyword}")
-                return {
-                    "is_career": False,
-                    "confidence": 1.0,
-                    "method": "blacklist",
-                    "reason": f"Blocked keyword: {keyword}",
-                    "intent": "blocked"
-                }
+        # STEP 2: Check blacklist (safety check) - same pass finds career keywords
+        blocked, keyword = _lexicon.scan(query_lower)
+        if blocked:
+            logger.warning(f"🚫 Blacklist keyword found: {blocked}")
+            return {
+                "is_career": False,
+                "confidence": 1.0,
+                "method": "blacklist",
+                "reason": f"Blocked keyword: {blocked}",
+                "intent": "blocked"
+            }, None
         
-        # STEP 3: Try ML classification
-        if not _ml_model_available and _intent_classifier is None:
-            _load_ml_model()
+        return None, keyword
+    
+    @staticmethod
+    def _normalize(query_lower: str) -> str:
+        """Cache key: the uncased model can't tell these apart anyway"""
+        return " ".join(query_lower.split())
+    
+    @staticmethod
+    def _cache_get(query_lower: str) -> Optional[Tuple[str, float]]:
+        key = IntentFilterML._normalize(query_lower)
+        with IntentFilterML._cache_lock:
+            prediction = IntentFilterML._cache.get(key)
+            if prediction is not None:
+                IntentFilterML._cache.move_to_end(key)
+        monitor.log_intent_cache(hit=prediction is not None)
+        return prediction
+    
+    @staticmethod
+    def _cache_put(query_lower: str, prediction: Tuple[str, float]):
+        if settings.INTENT_CACHE_MAX_ENTRIES <= 0:
+            return
+        key = IntentFilterML._normalize(query_lower)
+        with IntentFilterML._cache_lock:
+            IntentFilterML._cache[key] = prediction
+            IntentFilterML._cache.move_to_end(key)
+            while len(IntentFilterML._cache) > settings.INTENT_CACHE_MAX_ENTRIES:
+                IntentFilterML._cache.popitem(last=False)
+    
+    @staticmethod
+    def clear_cache():
+        """Drop cached predictions (call after swapping the model)"""
+        with IntentFilterML._cache_lock:
+            IntentFilterML._cache.clear()
+    
+    @staticmethod
+    def get_cache_stats() -> Dict[str, Any]:
+        return {
+            "size": len(IntentFilterML._cache),
+            "max_entries": settings.INTENT_CACHE_MAX_ENTRIES,
+            **monitor.get_intent_fast_path_metrics()
+        }
+    
+    @staticmethod
+    def _from_ml(intent: str, confidence: float) -> Optional[Dict[str, Any]]:
+        """Turn an ML prediction into a result (None = confidence too low)"""
+        logger.info(f"🤖 ML prediction: {intent} ({confidence:.2%})")
         
-        if _ml_model_available and _intent_classifier is not None:
-            try:
-                intent, confidence = _intent_classifier.predict(query)
-                
-                logger.info(f"🤖 ML prediction: {intent} ({confidence:.2%})")
-                
-                # High confidence ML prediction
-                if confidence >= 0.7:
-                    is_career = intent in IntentFilterML.CAREER_INTENTS
-                    is_greeting = intent == "greeting"
-                    is_farewell = intent == "farewell"
-                    
-                    return {
-                        "is_career": is_career or is_greeting or is_farewell,
-                        "confidence": confidence,
-                        "method": "ml",
-                        "reason": f"ML classified as {intent}",
-                        "intent": intent,
-                        "is_greeting": is_greeting,
-                        "is_farewell": is_farewell
-                    }
-                else:
-                    # Low confidence - fall through to rule-based
-                    logger.info(f"⚠️ ML confidence low ({confidence:.2%}), using rules")
-                    
-            except Exception as e:
-                logger.error(f"❌ ML prediction failed: {e}")
+        # High confidence ML prediction
+        if confidence >= 0.7:
+            is_career = intent in IntentFilterML.CAREER_INTENTS
+            is_greeting = intent == "greeting"
+            is_farewell = intent == "farewell"
+            
+            return {
+                "is_career": is_career or is_greeting or is_farewell,
+                "confidence": confidence,
+                "method": "ml",
+                "reason": f"ML classified as {intent}",
+                "intent": intent,
+                "is_greeting": is_greeting,
+                "is_farewell": is_farewell
+            }
         
-        # STEP 4: Rule-based fallback (same as original IntentFilter)
-        return IntentFilterML._rule_based_check(query_lower)
+        # Low confidence - fall through to rule-based
+        logger.info(f"⚠️ ML confidence low ({confidence:.2%}), using rules")
+        return None
     
     @staticmethod
-    def _rule_based_check(query_lower: str) -> Dict[str, Any]:
-        """Rule-based fallback classification"""
-        
-        CAREER_KEYWORDS = [
-            "college", "university", "iit", "nit", "aiims", "school", "degree",
-            "btech", "bsc", "mba", "mbbs", "engineering", "medical", "commerce",
-            "science", "arts", "diploma", "phd", "masters", "bachelor",
-            "jee", "neet", "gate", "cat", "upsc", "ssc", "exam", "entrance",
-            "cuet", "clat", "nda", "cds", "ias", "ips", "test", "cutoff",
-            "career", "job", "salary", "placement", "package", "internship",
-            "engineer", "doctor", "teacher", "lawyer", "ca", "cs", "software",
-            "developer", "data scientist", "analyst", "manager", "consultant",
-            "course", "stream", "branch", "admission", "eligibility", "fees",
-            "scholarship", "counseling", "guidance", "roadmap", "preparation",
-            "study", "skill", "training", "certification", "after 10th", "after 12th"
-        ]
+    def get_batching_stats() -> Optional[Dict[str, Any]]:
+        """Micro-batcher stats (None until the ML model has been used)"""
+        if not _ml_model_available:
+            return None
+        from ai_career_advisor.ml_models.intent_loader import get_intent_batcher
+        return get_intent_batcher().get_stats()
+    
+    @staticmethod
+    def _rule_based_check(keyword: Optional[str]) -> Dict[str, Any]:
+        """Rule-based fallback classification (keyword comes from the lexical pass)"""
         
-        for keyword in CAREER_KEYWORDS:
-            if keyword in query_lower:
-                logger.info(f"✅ Rule matched keyword: {keyword}")
-                return {
-                    "is_career": True,
-                    "confidence": 0.85,
-                    "method": "keyword",
-                    "reason": f"Career keyword: {keyword}",
-                    "intent": "career_query"
-                }
+        if keyword:
+            logger.info(f"✅ Rule matched keyword: {keyword}")
+            return {
+                "is_career": True,
+                "confidence": 0.85,
+                "method": "keyword",
+                "reason": f"Career keyword: {keyword}",
+                "intent": "career_query"
+            }
         
         # Default - allow (better to answer than reject)
         logger.info(f"🤔 No clear match, allowing as potential career query")
@@ -324,5 +511,12 @@ I help Indian students with career and education guidance.
 Ask your question! 😊"""
 
 
+_lexicon = LexicalMatcher(
+    IntentFilterML.GREETINGS,
+    IntentFilterML.BLACKLIST_KEYWORDS,
+    IntentFilterML.CAREER_KEYWORDS
+)
+
+
 # Backward compatibility alias
 IntentFilter = IntentFilterML
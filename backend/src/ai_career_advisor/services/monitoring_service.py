@@ -2,7 +2,6 @@ import statistics
 from typing import List, Deque
 from collections import deque
 from ai_career_advisor.core.logger import logger
-import mlflow
 
 class ModelMonitor:
     """
@@ -28,6 +27,12 @@ class ModelMonitor:
         self.CONFIDENCE_THRESHOLD = 0.75
         self.UNKNOWN_RATIO_THRESHOLD = 0.15
         
+        # Intent fast path: lexical short-circuits + prediction cache
+        self.intent_lookups = 0
+        self.intent_short_circuits = 0
+        self.intent_cache_lookups = 0
+        self.intent_cache_hits = 0
+        
         logger.info("🛡️ Model Monitor Service Initialized")
 
     def log_prediction(self, intent: str, confidence: float, query_length: int):
@@ -41,6 +46,31 @@ class ModelMonitor:
         if len(self.confidence_window) % 10 == 0:
             self._check_for_drift()
             
+    def log_intent_lookup(self, short_circuited: bool):
+        """
+        Count one intent lookup; short_circuited = answered by the lexical
+        pre-check (validation / greeting / blacklist) without the model
+        """
+        self.intent_lookups += 1
+        if short_circuited:
+            self.intent_short_circuits += 1
+    
+    def log_intent_cache(self, hit: bool):
+        """Count one prediction-cache lookup in front of the intent model"""
+        self.intent_cache_lookups += 1
+        if hit:
+            self.intent_cache_hits += 1
+    
+    def get_intent_fast_path_metrics(self):
+        """How often the intent model was skipped"""
+        skipped = self.intent_short_circuits + self.intent_cache_hits
+        return {
+            "lookups": self.intent_lookups,
+            "short_circuit_ratio": self.intent_short_circuits / self.intent_lookups if self.intent_lookups else 0.0,
+            "cache_hit_ratio": self.intent_cache_hits / self.intent_cache_lookups if self.intent_cache_lookups else 0.0,
+            "model_skipped_ratio": skipped / self.intent_lookups if self.intent_lookups else 0.0
+        }
+            
     def _check_for_drift(self):
         """
         Analyze windows for performance degradation
@@ -71,12 +101,13 @@ class ModelMonitor:
     def get_metrics(self):
         """Get current metrics for admin dashboard"""
         if not self.confidence_window:
-            return {"status": "waiting_for_data"}
+            return {"status": "waiting_for_data", "intent_fast_path": self.get_intent_fast_path_metrics()}
             
         return {
             "avg_confidence": statistics.mean(self.confidence_window),
             "sample_size": len(self.confidence_window),
-            "unknown_ratio": (self.intent_window.count("unknown") / len(self.intent_window)) if self.intent_window else 0
+            "unknown_ratio": (self.intent_window.count("unknown") / len(self.intent_window)) if self.intent_window else 0,
+            "intent_fast_path": self.get_intent_fast_path_metrics()
         }
 
 # Global instance
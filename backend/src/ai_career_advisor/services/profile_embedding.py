@@ -0,0 +1,214 @@
+"""
+Profile Embedding Service
+User profile vectors persisted on UserPreferences, keyed by a hash of the profile text
+
+- save_user_preferences() recomputes the vector only when the profile text
+  (or the embedding backend) changed
+- get_recommendations() reuses the stored vector -> no embedding call per request
+- Batch scoring backfills every stale profile of a page with one
+  embed_many() call and one commit
+- Career semantic_vector and user vectors must come from the SAME embedding
+  space: both go through embed(), and vectors whose dimension doesn't match
+  the career matrix are rejected instead of scored against the wrong space
+
+Backends (RECOMMENDATION_EMBEDDING_BACKEND):
+- "gemini": ModelManager.get_embedding (remote)
+- "local":  rag.EmbeddingService (sentence-transformers, works offline)
+"""
+
+import asyncio
+import hashlib
+from typing import List, Dict, Any, Optional
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from ai_career_advisor.models.user_preferences import UserPreferences
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+class ProfileEmbeddingService:
+    """Embeds user profiles (and careers) in the configured embedding space"""
+
+    BACKENDS = ("gemini", "local")
+    # Concurrent remote calls in embed_many (the key scheduler still rate-limits them)
+    EMBED_CONCURRENCY = 8
+
+    def __init__(self):
+        self.hits = 0
+        self.computed = 0
+        self.failures = 0
+        self.dimension_mismatches = 0
+
+    # ================== EMBEDDING SPACE ==================
+
+    @staticmethod
+    def backend() -> str:
+        backend = settings.RECOMMENDATION_EMBEDDING_BACKEND.lower()
+        if backend not in ProfileEmbeddingService.BACKENDS:
+            raise ValueError(f"Unknown RECOMMENDATION_EMBEDDING_BACKEND: {backend}")
+        return backend
+
+    @staticmethod
+    def model_id() -> str:
+        """Identifies the embedding space, e.g. 'gemini:gemini-embedding-001'"""
+        if ProfileEmbeddingService.backend() == "local":
+            from ai_career_advisor.rag.embeddings import EmbeddingService
+            return f"local:{EmbeddingService.MODEL_NAME}"
+        from ai_career_advisor.core.model_manager import ModelManager
+        return f"gemini:{ModelManager.EMBEDDING_MODEL}"
+
+    @staticmethod
+    async def embed(text: str) -> List[float]:
+        """Embed any text (profile or career) with the configured backend"""
+        if ProfileEmbeddingService.backend() == "local":
+            from ai_career_advisor.rag.embeddings import EmbeddingService
+            return await EmbeddingService.generate_embedding(text)
+        from ai_career_advisor.core.model_manager import ModelManager
+        return await ModelManager.get_embedding(text)
+
+    @staticmethod
+    async def embed_many(texts: List[str]) -> List[Optional[List[float]]]:
+        """Embed many texts at once; None for the texts that failed"""
+        if ProfileEmbeddingService.backend() == "local":
+            from ai_career_advisor.rag.embeddings import EmbeddingService
+            vectors = await EmbeddingService.generate_batch_embeddings(texts)
+            return [None if not len(v) or np.isnan(v).any() else v.tolist() for v in vectors]
+
+        semaphore = asyncio.Semaphore(ProfileEmbeddingService.EMBED_CONCURRENCY)
+
+        async def embed_one(text: str) -> List[float]:
+            async with semaphore:
+                return await ProfileEmbeddingService.embed(text)
+
+        results = await asyncio.gather(*(embed_one(t) for t in texts), return_exceptions=True)
+        return [None if isinstance(r, BaseException) else r for r in results]
+
+    # ================== PROFILE VECTORS ==================
+
+    @staticmethod
+    def build_profile_text(prefs: UserPreferences) -> str:
+        return (
+            f"Skills: {', '.join(prefs.skills or [])}. "
+            f"Interests: {', '.join(prefs.interests or [])}. "
+            f"Personality: {', '.join(prefs.personality_traits or [])}. "
+            f"Education: {prefs.education_level or 'Not specified'}."
+        )
+
+    @staticmethod
+    def profile_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_fresh(prefs: UserPreferences) -> bool:
+        """Stored vector matches the current profile text and embedding space"""
+        return (
+            bool(prefs.profile_vector) and
+            prefs.profile_vector_hash == ProfileEmbeddingService.profile_hash(
+                ProfileEmbeddingService.build_profile_text(prefs)
+            ) and
+            prefs.profile_vector_model == ProfileEmbeddingService.model_id()
+        )
+
+    async def refresh(self, prefs: UserPreferences) -> Optional[List[float]]:
+        """
+        Recompute the stored vector if the profile changed (caller commits)
+        On failure the stale vector is cleared so it is never used for the new profile
+        """
+        if self.is_fresh(prefs):
+            return prefs.profile_vector
+
+        text = self.build_profile_text(prefs)
+        try:
+            vector = await self.embed(text)
+        except Exception as e:
+            logger.error(f"❌ Could not generate profile embedding for {prefs.user_email}: {e}")
+            vector = None
+
+        self._store(prefs, text, vector)
+        if vector is not None:
+            logger.info(f"🧠 Profile embedding updated for {prefs.user_email} (dim {len(vector)})")
+        return vector
+
+    def _store(self, prefs: UserPreferences, text: str, vector: Optional[List[float]]):
+        """Persist a freshly computed vector, or clear the stale one when embedding failed"""
+        if vector is None:
+            self.failures += 1
+            prefs.profile_vector = None
+            prefs.profile_vector_hash = None
+            prefs.profile_vector_model = None
+            return
+        prefs.profile_vector = vector
+        prefs.profile_vector_hash = self.profile_hash(text)
+        prefs.profile_vector_model = self.model_id()
+        self.computed += 1
+
+    def _check_dim(self, prefs: UserPreferences, vector: Optional[List[float]], expected_dim: Optional[int]):
+        if vector and expected_dim and len(vector) != expected_dim:
+            self.dimension_mismatches += 1
+            logger.warning(
+                f"⚠️ Profile vector dim {len(vector)} ({prefs.profile_vector_model}) != career vector dim "
+                f"{expected_dim}; re-embed careers with the same backend. Falling back to keyword match"
+            )
+            return None
+        return vector
+
+    async def get_user_vector(
+        self,
+        db: AsyncSession,
+        prefs: UserPreferences,
+        expected_dim: Optional[int] = None
+    ) -> Optional[List[float]]:
+        """
+        Stored profile vector for recommendations
+
+        Profiles saved before vectors were persisted (or after a backend
+        switch) are backfilled once here and committed.
+        """
+        if self.is_fresh(prefs):
+            self.hits += 1
+            vector = prefs.profile_vector
+        else:
+            vector = await self.refresh(prefs)
+            if vector is not None:
+                await db.commit()
+        return self._check_dim(prefs, vector, expected_dim)
+
+    async def get_user_vectors(
+        self,
+        db: AsyncSession,
+        users: List[UserPreferences],
+        expected_dim: Optional[int] = None
+    ) -> List[Optional[List[float]]]:
+        """
+        get_user_vector for many users: stale profiles are embedded in one
+        embed_many() call and committed once. Users whose embedding failed
+        get None (keyword match) and are retried on the next run.
+        """
+        stale = [prefs for prefs in users if not self.is_fresh(prefs)]
+        self.hits += len(users) - len(stale)
+        if stale:
+            texts = [self.build_profile_text(prefs) for prefs in stale]
+            try:
+                vectors = await self.embed_many(texts)
+            except Exception as e:
+                logger.error(f"❌ Could not generate {len(stale)} profile embeddings: {e}")
+                vectors = [None] * len(stale)
+            for prefs, text, vector in zip(stale, texts, vectors):
+                self._store(prefs, text, vector)
+            if any(vector is not None for vector in vectors):
+                await db.commit()
+            logger.info(f"🧠 Backfilled {sum(v is not None for v in vectors)}/{len(stale)} profile embeddings")
+        return [self._check_dim(prefs, prefs.profile_vector, expected_dim) for prefs in users]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": settings.RECOMMENDATION_EMBEDDING_BACKEND,
+            "hits": self.hits,
+            "computed": self.computed,
+            "failures": self.failures,
+            "dimension_mismatches": self.dimension_mismatches
+        }
+
+
+# Global instance
+profile_embeddings = ProfileEmbeddingService()
@@ -5,11 +5,21 @@ Implements hybrid recommendation engine with content-based and collaborative fil
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timezone, timedelta
 from ai_career_advisor.models.user_preferences import UserPreferences
+from ai_career_advisor.models.user_recommendation import UserRecommendation
 from ai_career_advisor.models.career_attributes import CareerAttributes
 from ai_career_advisor.models.user_career_interaction import UserCareerInteraction, INTERACTION_SCORES
+from ai_career_advisor.services.career_matrix import CareerMatrix, career_matrix_engine
+from ai_career_advisor.services.collaborative_model import collaborative_model
+from ai_career_advisor.services.profile_embedding import profile_embeddings
+from ai_career_advisor.services.career_ann import career_ann
+from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
-import math
+import asyncio
+import hashlib
+import json
+import numpy as np
 
 
 class RecommendationService:
@@ -18,7 +28,9 @@ class RecommendationService:
     
     Algorithms:
     1. Content-Based: Jaccard similarity between user profile and career attributes
-    2. Collaborative: User-user similarity based on career interactions
+    2. Collaborative: Item-item cosine similarity over career interactions, with
+       shrinkage towards neutral (services/collaborative_model.py); 0.5 for every
+       career when the model is missing or fails
     3. Hybrid: Weighted combination of both
     """
     
@@ -29,6 +41,9 @@ class RecommendationService:
     # Minimum interactions needed for collaborative filtering
     MIN_INTERACTIONS_FOR_COLLAB = 3
     
+    # interactions_key of users without any interaction (precomputed freshness)
+    NO_INTERACTIONS_KEY = "0"
+    
     # ================== CORE RECOMMENDATION API ==================
     
     @staticmethod
@@ -49,246 +64,287 @@ class RecommendationService:
             logger.warning(f"No preferences found for {user_email}, using popularity-based fallback")
             return await RecommendationService._get_popular_careers(db, top_k)
         
-        # Phase 4 Upgrade: Generate User Embedding Vector
-        logger.info("🧠 Generating User Semantic Vector...")
-        user_profile_text = (
-            f"Skills: {', '.join(user_prefs.skills or [])}. "
-            f"Interests: {', '.join(user_prefs.interests or [])}. "
-            f"Personality: {', '.join(user_prefs.personality_traits or [])}. "
-            f"Education: {user_prefs.education_level or 'Not specified'}."
-        )
+        # Fresh row from the batch precompute job -> no scoring at all
+        precomputed = await RecommendationService._get_precomputed(db, user_prefs, top_k)
+        if precomputed is not None:
+            logger.info(f"⚡ Serving precomputed recommendations for: {user_email}")
+            return precomputed
         
-        try:
-            from ai_career_advisor.core.model_manager import ModelManager
-            user_vector = await ModelManager.get_embedding(user_profile_text)
-        except Exception as e:
-            logger.error(f"❌ Could not generate user embedding: {e}")
-            user_vector = None
-
-        # Step 2: Get all careers
-        careers = await RecommendationService._get_all_careers(db)
+        # Step 2: Career matrix (rebuilt only when career_attributes changes)
+        matrix = await career_matrix_engine.get_matrix(db)
         
-        if not careers:
+        if not matrix.size:
             logger.error("No careers in database!")
             return []
         
-        # Step 3: Interaction Check
-        interaction_count = await RecommendationService._get_user_interaction_count(db, user_email)
-        use_collaborative = interaction_count >= RecommendationService.MIN_INTERACTIONS_FOR_COLLAB
-        
-        # Step 4: Calculate scores
-        scored_careers = []
-        for career in careers:
-            # Phase 4: Semantic Content Score
-            if user_vector and career.semantic_vector:
-                # Use Cosine Similarity (Semantic)
-                content_score = RecommendationService._cosine_similarity(user_vector, career.semantic_vector)
-                # Boost by basic Jaccard for literal matches
-                literal_boost = RecommendationService._calculate_content_score(user_prefs, career)
-                content_score = (content_score * 0.7) + (literal_boost * 0.3)
-            else:
-                # Fallback to pure keyword matching
-                content_score = RecommendationService._calculate_content_score(user_prefs, career)
-            
-            if use_collaborative:
-                collab_score = await RecommendationService._calculate_collaborative_score(
-                    db, user_email, career.career_name
-                )
-                final_score = (
-                    RecommendationService.CONTENT_WEIGHT * content_score +
-                    RecommendationService.COLLABORATIVE_WEIGHT * collab_score
-                )
-            else:
-                final_score = content_score
-            
-            scored_careers.append({
-                "career": career.to_dict(),
-                "match_score": round(final_score * 100, 1),
-                "content_score": round(content_score * 100, 1),
-                "recommendation_type": "semantic_hybrid" if user_vector else "keyword_match"
-            })
-        
-        # Step 5: Sort
-        scored_careers.sort(key=lambda x: x["match_score"], reverse=True)
-        
-        logger.success(f"✅ Generated {len(scored_careers[:top_k])} recommendations")
-        return scored_careers[:top_k]
-
-    @staticmethod
-    def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity between two vectors"""
-        if not vec1 or not vec2 or len(vec1) != len(vec2):
-            return 0.0
+        # Phase 4 Upgrade: User Embedding Vector (persisted, recomputed only when the profile changes)
+        user_vector = await profile_embeddings.get_user_vector(db, user_prefs, expected_dim=matrix.dim)
+        
+        # Step 3: Interaction Check (the user's own history, read once)
+        user_interactions = await RecommendationService._get_user_interactions(db, user_email)
+        use_collaborative = len(user_interactions) >= RecommendationService.MIN_INTERACTIONS_FOR_COLLAB
+        
+        # Step 4: Score every career at once (semantic mat-vec + vectorized Jaccard)
+        # Large catalogues: only ANN + keyword candidates are scored exactly
+        candidates = await career_ann.recommendation_candidates(matrix, user_prefs, user_vector, top_k)
+        rows, literal = candidates if candidates else (None, None)
+        content_scores = matrix.content_scores(user_prefs, user_vector, rows, literal)
+        
+        if use_collaborative:
+            # Precomputed item-item similarities -> one sparse lookup, no per-career SQL
+            names = matrix.names if rows is None else [matrix.names[i] for i in rows]
+            collab_scores = await collaborative_model.score_user(db, user_interactions, names)
+            final_scores = (
+                RecommendationService.CONTENT_WEIGHT * content_scores +
+                RecommendationService.COLLABORATIVE_WEIGHT * collab_scores
+            )
+        else:
+            final_scores = content_scores
         
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
+        # Step 5: Top-K without sorting every career
+        recommendation_type = "semantic_hybrid" if user_vector else "keyword_match"
+        scored_careers = RecommendationService._format_results(
+            matrix, final_scores, content_scores, top_k, recommendation_type, rows
+        )
         
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-            
-        return dot_product / (norm1 * norm2)
+        logger.success(f"✅ Generated {len(scored_careers)} recommendations")
+        return scored_careers
+
+    @staticmethod
+    def _format_results(
+        matrix: CareerMatrix,
+        final_scores: np.ndarray,
+        content_scores: np.ndarray,
+        top_k: int,
+        recommendation_type: str,
+        rows: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """Top-K result dicts (scores may cover only `rows` of the matrix)"""
+        return [
+            {
+                "career": dict(matrix.career_dicts[i if rows is None else rows[i]]),
+                "match_score": round(float(final_scores[i]) * 100, 1),
+                "content_score": round(float(content_scores[i]) * 100, 1),
+                "recommendation_type": recommendation_type
+            }
+            for i in CareerMatrix.top_k(final_scores, top_k)
+        ]
+
+    # ================== BATCH / PRECOMPUTED RECOMMENDATIONS ==================
     
-    # ================== CONTENT-BASED FILTERING ==================
+    @staticmethod
+    def preferences_hash(prefs: UserPreferences) -> str:
+        """Everything get_recommendations reads from the preferences (incl. the stored vector)"""
+        payload = json.dumps([
+            prefs.skills or [], prefs.interests or [], prefs.personality_traits or [],
+            prefs.education_level, prefs.preferred_work_style, prefs.profile_vector_hash
+        ])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
     
     @staticmethod
-    def _calculate_content_score(user_prefs: UserPreferences, career: CareerAttributes) -> float:
+    async def get_batch_recommendations(
+        db: AsyncSession,
+        user_emails: List[str],
+        top_k: int = 5,
+        persist: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Calculate content-based similarity score using weighted Jaccard similarity.
-        
-        Components:
-        - Skill match (50%): How many user skills match career requirements
-        - Interest match (30%): How many user interests match career tags
-        - Education match (15%): Does user meet education requirements
-        - Work style match (5%): Does work style preference match
+        Recommendations for a whole cohort in one pass.
+        Same results as calling get_recommendations for each user (without the cache).
+        persist=True also writes them to user_recommendations for the online endpoint.
         """
-        scores = []
-        weights = []
-        
-        # 1. Skill match (50% weight)
-        skill_similarity = RecommendationService._jaccard_similarity(
-            user_prefs.skills or [],
-            career.required_skills or []
-        )
-        scores.append(skill_similarity)
-        weights.append(0.50)
-        
-        # 2. Interest match (30% weight)
-        interest_similarity = RecommendationService._jaccard_similarity(
-            user_prefs.interests or [],
-            career.interest_tags or []
-        )
-        scores.append(interest_similarity)
-        weights.append(0.30)
-        
-        # 3. Education match (15% weight)
-        education_score = RecommendationService._calculate_education_match(
-            user_prefs.education_level,
-            career.min_education
-        )
-        scores.append(education_score)
-        weights.append(0.15)
-        
-        # 4. Work style match (5% weight)
-        work_style_score = 1.0 if (
-            not career.work_style or
-            not user_prefs.preferred_work_style or
-            career.work_style == user_prefs.preferred_work_style
-        ) else 0.5
-        scores.append(work_style_score)
-        weights.append(0.05)
-        
-        # Weighted average
-        final_score = sum(s * w for s, w in zip(scores, weights))
-        
-        return min(1.0, max(0.0, final_score))
+        prefs_by_email = await RecommendationService._get_preferences_many(db, user_emails)
+        # Read before scoring: interactions tracked meanwhile make the stored rows stale
+        interaction_keys = await RecommendationService._interaction_keys(db, list(prefs_by_email)) if persist else {}
+        
+        # Users without a quiz get the popularity fallback, same as the online path
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        if len(prefs_by_email) < len(set(user_emails)):
+            popular = await RecommendationService._get_popular_careers(db, top_k)
+            results.update({email: popular for email in user_emails if email not in prefs_by_email})
+        
+        scored = await RecommendationService._score_users(db, list(prefs_by_email.values()), top_k)
+        if persist and scored:
+            await RecommendationService._store_precomputed(db, prefs_by_email, scored, top_k, interaction_keys)
+        
+        results.update(scored)
+        return results
     
     @staticmethod
-    def _jaccard_similarity(set_a: List[str], set_b: List[str]) -> float:
+    async def _score_users(
+        db: AsyncSession,
+        users: List[UserPreferences],
+        top_k: int
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Calculate Jaccard similarity between two sets.
-        
-        J(A,B) = |A ∩ B| / |A ∪ B|
-        
-        Returns value between 0 and 1.
+        Score many users at once: one (users x careers) matrix product per chunk
+        instead of one full scoring pass per user
         """
-        if not set_a or not set_b:
-            return 0.0
+        if not users:
+            return {}
         
-        # Normalize to lowercase for matching
-        set_a_normalized = set(s.lower().strip() for s in set_a)
-        set_b_normalized = set(s.lower().strip() for s in set_b)
+        matrix = await career_matrix_engine.get_matrix(db)
+        if not matrix.size:
+            logger.error("No careers in database!")
+            return {u.user_email: [] for u in users}
         
-        intersection = len(set_a_normalized & set_b_normalized)
-        union = len(set_a_normalized | set_b_normalized)
+        # Stale profiles embedded in one batch, committed once
+        vectors = await profile_embeddings.get_user_vectors(db, users, expected_dim=matrix.dim)
         
-        if union == 0:
-            return 0.0
+        # Every user's interactions in one query
+        result = await db.execute(
+            select(UserCareerInteraction).where(UserCareerInteraction.user_email.in_([u.user_email for u in users]))
+        )
+        interactions: Dict[str, List[UserCareerInteraction]] = {}
+        for interaction in result.scalars().all():
+            interactions.setdefault(interaction.user_email, []).append(interaction)
+        
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        loop = asyncio.get_running_loop()
+        chunk = settings.RECOMMENDATION_BATCH_CHUNK
+        for start in range(0, len(users), chunk):
+            chunk_users = users[start:start + chunk]
+            chunk_vectors = vectors[start:start + chunk]
+            
+            # CPU-bound matrix products off the event loop
+            content = await loop.run_in_executor(None, matrix.batch_content_scores, chunk_users, chunk_vectors)
+            final = content
+            
+            history = [interactions.get(u.user_email, []) for u in chunk_users]
+            use_collaborative = np.array([
+                len(h) >= RecommendationService.MIN_INTERACTIONS_FOR_COLLAB for h in history
+            ])
+            if use_collaborative.any():
+                collab = await collaborative_model.score_users(db, history, matrix.names)
+                final = np.where(
+                    use_collaborative[:, None],
+                    RecommendationService.CONTENT_WEIGHT * content + RecommendationService.COLLABORATIVE_WEIGHT * collab,
+                    content
+                )
+            
+            for i, (prefs, vector) in enumerate(zip(chunk_users, chunk_vectors)):
+                results[prefs.user_email] = RecommendationService._format_results(
+                    matrix, final[i], content[i], top_k,
+                    "semantic_hybrid" if vector else "keyword_match"
+                )
         
-        return intersection / union
+        logger.success(f"✅ Batch-scored {len(users)} users against {matrix.size} careers")
+        return results
     
     @staticmethod
-    def _calculate_education_match(user_education: Optional[str], career_min: Optional[str]) -> float:
+    async def precompute_recommendations(
+        db: AsyncSession,
+        user_emails: Optional[List[str]] = None,
+        top_k: int = 10,
+        page_size: int = 1000
+    ) -> Dict[str, Any]:
         """
-        Calculate education compatibility score.
-        
-        Returns:
-        - 1.0: User meets or exceeds requirement
-        - 0.7: User is close (one level below)
-        - 0.3: User needs significant upgrade
+        Materialize top-K recommendations into user_recommendations
+        (every user with saved preferences when user_emails is None)
         """
-        if not career_min or not user_education:
-            return 1.0  # No requirement or no data = assume compatible
-        
-        # Education levels in ascending order
-        EDUCATION_LEVELS = {
-            "10th": 1, "12th": 2, 
-            "graduate": 3, "diploma": 3, "btech": 3, "bca": 3,
-            "postgraduate": 4, "mtech": 4, "mba": 4, "mca": 4,
-            "phd": 5
-        }
-        
-        user_level = EDUCATION_LEVELS.get(user_education.lower(), 2)
-        career_level = EDUCATION_LEVELS.get(career_min.lower(), 2)
-        
-        if user_level >= career_level:
-            return 1.0
-        elif user_level == career_level - 1:
-            return 0.7  # Close enough
-        else:
-            return 0.3  # Significant gap
-    
-    # ================== COLLABORATIVE FILTERING ==================
+        if user_emails is None:
+            result = await db.execute(
+                select(UserPreferences.user_email).order_by(UserPreferences.user_email)
+            )
+            user_emails = [row[0] for row in result.all()]
+        
+        started = datetime.now(timezone.utc)
+        written = 0
+        for start in range(0, len(user_emails), page_size):
+            page = user_emails[start:start + page_size]
+            prefs_by_email = await RecommendationService._get_preferences_many(db, page)
+            interaction_keys = await RecommendationService._interaction_keys(db, list(prefs_by_email))
+            scored = await RecommendationService._score_users(db, list(prefs_by_email.values()), top_k)
+            await RecommendationService._store_precomputed(db, prefs_by_email, scored, top_k, interaction_keys)
+            written += len(scored)
+        
+        seconds = (datetime.now(timezone.utc) - started).total_seconds()
+        logger.success(f"✅ Precomputed recommendations for {written} users in {seconds:.1f}s")
+        return {"users": written, "top_k": top_k, "seconds": round(seconds, 2)}
     
     @staticmethod
-    async def _calculate_collaborative_score(
+    async def _store_precomputed(
         db: AsyncSession,
-        user_email: str,
-        career_name: str
-    ) -> float:
-        """
-        Calculate collaborative filtering score.
-        
-        Based on: "Users similar to you liked this career"
-        
-        Steps:
-        1. Find users who interacted with similar careers
-        2. Check if those users interacted with target career
-        3. Weight by similarity and interaction score
-        """
-        try:
-            # Get current user's career interactions
-            user_interactions = await RecommendationService._get_user_interactions(db, user_email)
-            user_careers = {i.career_name for i in user_interactions}
-            
-            if not user_careers:
-                return 0.5  # Neutral score if no history
-            
-            # Find other users who interacted with same careers
-            similar_users = await db.execute(
-                select(UserCareerInteraction.user_email)
-                .where(UserCareerInteraction.career_name.in_(user_careers))
-                .where(UserCareerInteraction.user_email != user_email)
-                .distinct()
+        prefs_by_email: Dict[str, UserPreferences],
+        scored: Dict[str, List[Dict[str, Any]]],
+        top_k: int,
+        interaction_keys: Dict[str, str]
+    ):
+        """Replace these users' user_recommendations rows (portable upsert) and commit"""
+        signature = str(await career_matrix_engine.signature(db))
+        
+        existing = await db.execute(
+            select(UserRecommendation).where(UserRecommendation.user_email.in_(list(scored)))
+        )
+        for row in existing.scalars().all():
+            await db.delete(row)
+        await db.flush()
+        
+        generated_at = datetime.now(timezone.utc)
+        db.add_all([
+            UserRecommendation(
+                user_email=email,
+                recommendations=recommendations,
+                top_k=top_k,
+                preferences_hash=RecommendationService.preferences_hash(prefs_by_email[email]),
+                career_signature=signature,
+                interactions_key=interaction_keys.get(email, RecommendationService.NO_INTERACTIONS_KEY),
+                generated_at=generated_at
             )
-            similar_user_emails = [row[0] for row in similar_users.fetchall()]
-            
-            if not similar_user_emails:
-                return 0.5  # No similar users found
-            
-            # Check how many similar users interacted with target career
-            positive_interactions = await db.execute(
-                select(func.avg(UserCareerInteraction.score))
-                .where(UserCareerInteraction.user_email.in_(similar_user_emails))
-                .where(UserCareerInteraction.career_name == career_name)
+            for email, recommendations in scored.items()
+        ])
+        await db.commit()
+    
+    @staticmethod
+    async def _get_precomputed(
+        db: AsyncSession,
+        user_prefs: UserPreferences,
+        top_k: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Materialized recommendations if still fresh, else None (-> live scoring)"""
+        result = await db.execute(
+            select(UserRecommendation).where(UserRecommendation.user_email == user_prefs.user_email)
+        )
+        row = result.scalars().first()
+        if row is None or row.top_k < top_k:
+            return None
+        
+        generated_at = row.generated_at
+        if generated_at.tzinfo is None:
+            generated_at = generated_at.replace(tzinfo=timezone.utc)  # SQLite drops the offset
+        ttl = timedelta(minutes=settings.RECOMMENDATION_PRECOMPUTE_TTL_MINUTES)
+        if datetime.now(timezone.utc) - generated_at > ttl:
+            return None
+        
+        if row.preferences_hash != RecommendationService.preferences_hash(user_prefs):
+            return None
+        if row.career_signature != str(await career_matrix_engine.signature(db)):
+            return None
+        interaction_keys = await RecommendationService._interaction_keys(db, [user_prefs.user_email])
+        if row.interactions_key != interaction_keys.get(user_prefs.user_email, RecommendationService.NO_INTERACTIONS_KEY):
+            return None
+        
+        return row.recommendations[:top_k]
+    
+    @staticmethod
+    async def _interaction_keys(db: AsyncSession, user_emails: List[str]) -> Dict[str, str]:
+        """'count:latest' of each user's interactions (users without any are left out)"""
+        if not user_emails:
+            return {}
+        result = await db.execute(
+            select(
+                UserCareerInteraction.user_email,
+                func.count(UserCareerInteraction.id),
+                func.max(UserCareerInteraction.created_at)
             )
-            avg_score = positive_interactions.scalar() or 0.5
-            
-            return min(1.0, max(0.0, avg_score))
-            
-        except Exception as e:
-            logger.error(f"Collaborative scoring error: {e}")
-            return 0.5  # Neutral on error
+            .where(UserCareerInteraction.user_email.in_(user_emails))
+            .group_by(UserCareerInteraction.user_email)
+        )
+        return {email: f"{count}:{latest}" for email, count, latest in result.all()}
+
+    # ================== COLLABORATIVE FILTERING ==================
+    
+    # Item-item model lives in services/collaborative_model.py (refreshed by the scheduler)
     
     # ================== DATABASE HELPERS ==================
     
@@ -301,10 +357,12 @@ class RecommendationService:
         return result.scalars().first()
     
     @staticmethod
-    async def _get_all_careers(db: AsyncSession) -> List[CareerAttributes]:
-        """Get all career attributes from database"""
-        result = await db.execute(select(CareerAttributes))
-        return result.scalars().all()
+    async def _get_preferences_many(db: AsyncSession, user_emails: List[str]) -> Dict[str, UserPreferences]:
+        """Preferences for many users in one query, keyed by email"""
+        result = await db.execute(
+            select(UserPreferences).where(UserPreferences.user_email.in_(user_emails))
+        )
+        return {p.user_email: p for p in result.scalars().all()}
     
     @staticmethod
     async def _get_user_interactions(db: AsyncSession, user_email: str) -> List[UserCareerInteraction]:
@@ -315,15 +373,6 @@ class RecommendationService:
         )
         return result.scalars().all()
     
-    @staticmethod
-    async def _get_user_interaction_count(db: AsyncSession, user_email: str) -> int:
-        """Count user's career interactions"""
-        result = await db.execute(
-            select(func.count(UserCareerInteraction.id))
-            .where(UserCareerInteraction.user_email == user_email)
-        )
-        return result.scalar() or 0
-    
     @staticmethod
     async def _get_popular_careers(db: AsyncSession, top_k: int = 5) -> List[Dict[str, Any]]:
         """
@@ -376,6 +425,9 @@ class RecommendationService:
             )
             db.add(existing)
         
+        # Re-embed only if the profile text changed since the last save
+        await profile_embeddings.refresh(existing)
+        
         await db.commit()
         await db.refresh(existing)
         
@@ -426,35 +478,21 @@ class RecommendationService:
         Get careers similar to a given career.
         Uses content similarity between career attributes.
         """
-        # Get target career
-        result = await db.execute(
-            select(CareerAttributes).where(CareerAttributes.career_name == career_name)
-        )
-        target_career = result.scalars().first()
-        
-        if not target_career:
-            return []
+        matrix = await career_matrix_engine.get_matrix(db)
         
-        # Get all other careers
-        result = await db.execute(
-            select(CareerAttributes).where(CareerAttributes.career_name != career_name)
-        )
-        other_careers = result.scalars().all()
+        # Large catalogues: Jaccard only over the attribute-ANN neighbours
+        rows = await career_ann.similar_candidates(matrix, career_name, top_k)
+        similarity = matrix.attribute_similarity(career_name, rows)
         
-        # Calculate similarity for each
-        similarities = []
-        target_vector = target_career.get_attribute_vector()
+        if similarity is None:
+            return []
         
-        for career in other_careers:
-            similarity = RecommendationService._jaccard_similarity(
-                target_vector,
-                career.get_attribute_vector()
-            )
-            similarities.append({
-                "career": career.to_dict(),
-                "similarity_score": round(similarity * 100, 1)
-            })
-        
-        # Sort and return top-K
-        similarities.sort(key=lambda x: x["similarity_score"], reverse=True)
-        return similarities[:top_k]
+        # ANN candidates never include the target itself
+        target = matrix.index[career_name] if rows is None else None
+        return [
+            {
+                "career": dict(matrix.career_dicts[i if rows is None else rows[i]]),
+                "similarity_score": round(float(similarity[i]) * 100, 1)
+            }
+            for i in CareerMatrix.top_k(similarity, top_k, exclude=target)
+        ]
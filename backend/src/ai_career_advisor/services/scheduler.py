@@ -1,5 +1,7 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
 import asyncio
 from datetime import datetime
@@ -14,64 +16,37 @@ class KnowledgeBaseScheduler:
         self.scheduler = AsyncIOScheduler(timezone="Asia/Kolkata")
         self.is_running = False
     
-    async def reindex_knowledge_base(self):
-        """Re-index entire knowledge base with latest data"""
+    async def reindex_knowledge_base(self, full_rebuild: bool = False):
+        """
+        Sync the knowledge base with the latest data
+        
+        Incremental by default (only new/changed docs are embedded);
+        full_rebuild builds a shadow collection and swaps it in atomically
+        """
         try:
             logger.info("=" * 60)
             logger.info(" SCHEDULED RE-INDEXING STARTED")
             logger.info(f" Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S IST')}")
+            logger.info(f" Mode: {'full rebuild (shadow swap)' if full_rebuild else 'incremental'}")
             logger.info("=" * 60)
             
             
-            from ai_career_advisor.RAG.knowledge_loader import KnowledgeLoader
-            from ai_career_advisor.RAG.embeddings import EmbeddingService
-            from ai_career_advisor.RAG.vector_store import VectorStore
+            from ai_career_advisor.rag.indexer import knowledge_indexer
+            from ai_career_advisor.rag.embeddings import EmbeddingService
             
-            logger.info("\n  Deleting old index...")
-            vs = VectorStore()
             try:
-                vs.delete_collection("career_knowledge")
-                logger.success(" Old index deleted")
-            except:
-                logger.info(" No old index found")
-            
+                stats = await knowledge_indexer.sync(full_rebuild=full_rebuild)
+            finally:
+                EmbeddingService.stop_pool()
             
-            logger.info("\n Loading latest data from database...")
-            documents = await KnowledgeLoader.load_all()
-            
-            if not documents:
+            if not stats["documents"]:
                 logger.error(" No documents found!")
                 return
             
-            logger.success(f" Loaded {len(documents)} documents")
-            
-            
-            logger.info("\n Generating embeddings...")
-            texts = [doc["content"] for doc in documents]
-            embeddings = await EmbeddingService.generate_batch_embeddings(texts)
-            
-            valid_count = len([e for e in embeddings if e is not None])
-            logger.success(f" Generated {valid_count}/{len(texts)} embeddings")
-            
-            
-            logger.info("\n Storing in ChromaDB...")
-            collection = vs.get_or_create_collection("career_knowledge")
-            
-            ids = [doc["id"] for doc in documents]
-            metadatas = [doc["metadata"] for doc in documents]
-            
-            vs.add_documents(
-                collection=collection,
-                documents=texts,
-                embeddings=embeddings,
-                metadatas=metadatas,
-                ids=ids
-            )
-            
-            logger.success(f" Stored {valid_count} documents")
-            
             
             logger.info("\n Testing...")
+            vs = knowledge_indexer.vector_store
+            collection = vs.get_or_create_collection(knowledge_indexer.active_collection())
             test_query = "IIT Bombay fees"
             query_emb = await EmbeddingService.generate_query_embedding(test_query)
             results = vs.search(collection, query_emb, top_k=1)
@@ -82,7 +57,7 @@ class KnowledgeBaseScheduler:
             logger.info("\n" + "=" * 60)
             logger.success(" SCHEDULED RE-INDEXING COMPLETE!")
             logger.info("=" * 60)
-            logger.info(f" Documents indexed: {valid_count}")
+            logger.info(f" Embedded: {stats['embedded']}, unchanged: {stats['unchanged']}, deleted: {stats['deleted']}")
             logger.info(f" Next re-index: Next Sunday 2:00 AM IST")
             logger.info("=" * 60)
         
@@ -90,6 +65,24 @@ class KnowledgeBaseScheduler:
             logger.error(f" Re-indexing failed: {str(e)}")
             logger.exception(e)
     
+    async def refresh_collaborative_model(self):
+        """Rebuild the item-item similarity model from all interactions"""
+        try:
+            from ai_career_advisor.services.collaborative_model import collaborative_model
+            await collaborative_model.refresh()
+        except Exception as e:
+            logger.error(f" Collaborative model refresh failed: {str(e)}")
+            logger.exception(e)
+    
+    async def compact_knowledge_base(self, dry_run: bool = False):
+        """Evict expired / duplicate / over-cap chatbot-learned RAG documents"""
+        try:
+            from ai_career_advisor.rag.compaction import knowledge_compactor
+            await knowledge_compactor.compact(dry_run=dry_run)
+        except Exception as e:
+            logger.error(f" Knowledge compaction failed: {str(e)}")
+            logger.exception(e)
+    
     def start(self):
         """Start the scheduler"""
         if self.is_running:
@@ -110,6 +103,28 @@ class KnowledgeBaseScheduler:
             replace_existing=True
         )
         
+        self.scheduler.add_job(
+            self.refresh_collaborative_model,
+            trigger=IntervalTrigger(minutes=settings.COLLAB_MODEL_REFRESH_MINUTES),
+            id='collaborative_model_refresh',
+            name='Collaborative Filtering Model Refresh',
+            replace_existing=True,
+            next_run_time=datetime.now()
+        )
+        
+        if settings.RAG_COMPACTION_ENABLED:
+            self.scheduler.add_job(
+                self.compact_knowledge_base,
+                trigger=CronTrigger(
+                    hour=3,
+                    minute=30,
+                    timezone='Asia/Kolkata'
+                ),
+                id='daily_knowledge_compaction',
+                name='Daily RAG Knowledge Compaction',
+                replace_existing=True
+            )
+        
         self.scheduler.start()
         self.is_running = True
         
@@ -129,9 +144,14 @@ class KnowledgeBaseScheduler:
             self.is_running = False
             logger.info("Scheduler stopped")
     
-    def trigger_manual_reindex(self):
+    def trigger_manual_reindex(self, full_rebuild: bool = False):
         """Manual trigger (for admin)"""
         logger.info(" Manual re-index triggered")
-        asyncio.create_task(self.reindex_knowledge_base())
+        asyncio.create_task(self.reindex_knowledge_base(full_rebuild=full_rebuild))
+    
+    def trigger_manual_compaction(self, dry_run: bool = False):
+        """Manual compaction trigger (for admin)"""
+        logger.info(" Manual knowledge compaction triggered")
+        asyncio.create_task(self.compact_knowledge_base(dry_run=dry_run))
 
 scheduler = KnowledgeBaseScheduler()
@@ -1,5 +1,5 @@
 from typing import List, Dict
-import httpx
+from ai_career_advisor.core.http_client import http_clients
 from bs4 import BeautifulSoup
 
 
@@ -20,31 +20,31 @@ class WebFetchService:
 
         results = []
 
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            for url in urls:
-                try:
-                    response = await client.get(url)
+        client = http_clients.get("web")
+        for url in urls:
+            try:
+                response = await client.get(url, timeout=10.0, follow_redirects=True)
 
-                    if response.status_code != 200:
-                        continue
+                if response.status_code != 200:
+                    continue
 
-                    soup = BeautifulSoup(response.text, "html.parser")
+                soup = BeautifulSoup(response.text, "html.parser")
 
-                    # remove scripts & styles
-                    for tag in soup(["script", "style", "noscript"]):
-                        tag.decompose()
+                # remove scripts & styles
+                for tag in soup(["script", "style", "noscript"]):
+                    tag.decompose()
 
-                    text = soup.get_text(separator=" ", strip=True)
+                text = soup.get_text(separator=" ", strip=True)
 
-                    if len(text) < 300:
-                        continue  # skip useless pages
+                if len(text) < 300:
+                    continue  # skip useless pages
 
-                    results.append({
-                        "url": url,
-                        "text": text[:8000]  # limit size for LLM
-                    })
+                results.append({
+                    "url": url,
+                    "text": text[:8000]  # limit size for LLM
+                })
 
-                except Exception:
-                    continue  # fail-safe, never crash
+            except Exception:
+                continue  # fail-safe, never crash
 
         return results
@@ -0,0 +1,251 @@
+"""
+Write-Behind Persistence for the Chatbot
+Conversation rows and RAG self-learning saves leave the request path
+
+📚 STUDY NOTES - WHY WRITE-BEHIND?
+=================================
+- ChatbotService.ask used to await an INSERT + COMMIT per answer, and for web
+  answers also an embedding of the full answer + a Chroma add, before it
+  returned. The user waited for bookkeeping they never see
+- Now the request only puts the write on a bounded asyncio.Queue; one flusher
+  task takes up to WRITE_BEHIND_BATCH_SIZE writes (or whatever arrived within
+  WRITE_BEHIND_FLUSH_MS) and writes them together:
+    conversations -> one session, add_all, ONE commit
+    RAG saves     -> one batched embedding call, one collection add, one BM25 write
+- Backpressure: when the queue is full (database down, flusher behind) the
+  producer waits up to WRITE_BEHIND_ENQUEUE_TIMEOUT, then the write is dropped
+  and counted, so memory stays bounded and requests never hang
+- drain() on shutdown flushes what is queued (bounded by WRITE_BEHIND_DRAIN_TIMEOUT)
+- Trade-off: a crash loses the writes still in the queue (at most
+  WRITE_BEHIND_QUEUE_SIZE); analytics rows and cached answers can afford that
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Tuple
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+from ai_career_advisor.models.chatconversation import ChatConversation
+
+
+class ChatWriteBehind:
+    """
+    Usage:
+        await write_behind.save_conversation(sessionid=..., userquery=..., botresponse=..., ...)
+        await write_behind.save_to_rag(query, response, metadata)
+        await write_behind.drain()  # app shutdown
+    """
+
+    CONVERSATION = "conversation"
+    RAG = "rag"
+    # Flush latencies kept for the percentiles in get_metrics
+    LATENCY_WINDOW = 512
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        rag_writer: Optional[Callable[[List[Dict[str, Any]]], Awaitable[int]]] = None
+    ):
+        # Defaults resolved on first use: AsyncSessionLocal and retriever.add_many_to_knowledge_base
+        self._session_factory = session_factory
+        self._rag_writer = rag_writer
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.stats = {
+            "enqueued": {self.CONVERSATION: 0, self.RAG: 0},
+            "written": {self.CONVERSATION: 0, self.RAG: 0},
+            "failed": {self.CONVERSATION: 0, self.RAG: 0},
+            "dropped": 0,
+            "backpressure_waits": 0,
+            "inline_writes": 0,
+            "flushes": 0,
+            "max_queue_depth": 0
+        }
+        self._flush_ms: deque = deque(maxlen=self.LATENCY_WINDOW)
+
+    # ================== PRODUCERS ==================
+
+    async def save_conversation(self, **row) -> bool:
+        """Queue one ChatConversation row (column name -> value)"""
+        return await self.submit(self.CONVERSATION, row)
+
+    async def save_to_rag(self, query: str, response: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Queue one LLM answer for the knowledge base"""
+        return await self.submit(self.RAG, {"query": query, "response": response, "metadata": metadata})
+
+    async def submit(self, kind: str, payload: Dict[str, Any]) -> bool:
+        """
+        Queue a write; returns False if it was dropped
+
+        Waits at most WRITE_BEHIND_ENQUEUE_TIMEOUT when the queue is full.
+        With WRITE_BEHIND_ENABLED=False the write happens inline.
+        """
+        self.stats["enqueued"][kind] += 1
+        if not settings.WRITE_BEHIND_ENABLED:
+            self.stats["inline_writes"] += 1
+            await self._write(kind, [payload])
+            return True
+
+        self._ensure_worker()
+        item = (kind, payload)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.stats["backpressure_waits"] += 1
+            try:
+                await asyncio.wait_for(self._queue.put(item), timeout=settings.WRITE_BEHIND_ENQUEUE_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.stats["dropped"] += 1
+                logger.warning(f"⚠️ Write-behind queue full ({self._queue.maxsize}), dropped a {kind} write")
+                return False
+
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self._queue.qsize())
+        return True
+
+    # ================== FLUSHER ==================
+
+    def _ensure_worker(self):
+        """Start the flusher task lazily on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=max(1, settings.WRITE_BEHIND_QUEUE_SIZE))
+            self._worker = loop.create_task(self._collect())
+
+    async def _collect(self):
+        """Gather up to WRITE_BEHIND_BATCH_SIZE writes or until the flush interval expires, then flush"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + settings.WRITE_BEHIND_FLUSH_MS / 1000
+
+            while len(batch) < max(1, settings.WRITE_BEHIND_BATCH_SIZE):
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        started = time.perf_counter()
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for kind, payload in batch:
+            grouped.setdefault(kind, []).append(payload)
+
+        for kind, payloads in grouped.items():
+            await self._write(kind, payloads)
+
+        self.stats["flushes"] += 1
+        self._flush_ms.append(1000 * (time.perf_counter() - started))
+        logger.debug(f"💾 Write-behind flushed {len(batch)} writes ({', '.join(f'{len(v)} {k}' for k, v in grouped.items())})")
+
+    async def _write(self, kind: str, payloads: List[Dict[str, Any]]):
+        """Write one kind of payloads; failures are counted, never raised"""
+        try:
+            if kind == self.CONVERSATION:
+                written = await self._write_conversations(payloads)
+            else:
+                written = await self._write_rag(payloads)
+        except Exception as e:
+            logger.warning(f"Could not write {len(payloads)} {kind} records: {e}")
+            written = 0
+        self.stats["written"][kind] += written
+        self.stats["failed"][kind] += len(payloads) - written
+
+    async def _write_conversations(self, rows: List[Dict[str, Any]]) -> int:
+        """One bulk insert; if it fails, row by row so one bad row doesn't lose the batch"""
+        session_factory = self._session_factory
+        if session_factory is None:
+            from ai_career_advisor.core.database import AsyncSessionLocal
+            session_factory = AsyncSessionLocal
+
+        async with session_factory() as db:
+            try:
+                db.add_all([ChatConversation(**row) for row in rows])
+                await db.commit()
+                return len(rows)
+            except Exception as e:
+                await db.rollback()
+                if len(rows) == 1:
+                    raise
+                logger.warning(f"Bulk insert of {len(rows)} conversations failed ({e}), retrying row by row")
+
+            written = 0
+            for row in rows:
+                try:
+                    db.add(ChatConversation(**row))
+                    await db.commit()
+                    written += 1
+                except Exception as e:
+                    await db.rollback()
+                    logger.warning(f"Could not save conversation: {e}")
+            return written
+
+    async def _write_rag(self, items: List[Dict[str, Any]]) -> int:
+        rag_writer = self._rag_writer
+        if rag_writer is None:
+            from ai_career_advisor.rag.retriever import retriever
+            rag_writer = retriever.add_many_to_knowledge_base
+        return await rag_writer(items)
+
+    # ================== LIFECYCLE ==================
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Flush everything queued and stop the flusher (app shutdown)"""
+        if self._worker is None or self._worker.done():
+            return True
+
+        timeout = settings.WRITE_BEHIND_DRAIN_TIMEOUT if timeout is None else timeout
+        pending = self._queue.qsize()
+        drained = True
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            drained = False
+            lost = self._queue.qsize()
+            self.stats["dropped"] += lost
+            logger.error(f"❌ Write-behind drain timed out after {timeout}s, {lost} writes lost")
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        if drained and pending:
+            logger.info(f"💾 Write-behind drained {pending} pending writes")
+        return drained
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth, flush latency and write outcomes for monitoring"""
+        latencies = sorted(self._flush_ms)
+
+        def percentile(p: float) -> float:
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 2) if latencies else 0.0
+
+        return {
+            **self.stats,
+            "enabled": settings.WRITE_BEHIND_ENABLED,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_capacity": settings.WRITE_BEHIND_QUEUE_SIZE,
+            "avg_flush_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "p50_flush_ms": percentile(0.5),
+            "p95_flush_ms": percentile(0.95),
+            "max_flush_ms": round(latencies[-1], 2) if latencies else 0.0,
+            "batch_size": settings.WRITE_BEHIND_BATCH_SIZE,
+            "flush_ms": settings.WRITE_BEHIND_FLUSH_MS
+        }
+
+
+# Global instance
+write_behind = ChatWriteBehind()
@@ -0,0 +1,152 @@
+"""
+Tests for batch recommendations and the user_recommendations materialized table
+
+Batch scores must match the per-user path exactly; the online endpoint must
+serve a fresh materialized row and fall back to live scoring otherwise.
+
+Run from backend directory: pytest test/test_batch_recommendations.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from test_career_matrix import make_careers, make_user, DIM
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.models.career_attributes import CareerAttributes
+from ai_career_advisor.models.user_preferences import UserPreferences
+from ai_career_advisor.models.user_career_interaction import UserCareerInteraction
+from ai_career_advisor.models.user_recommendation import UserRecommendation
+from ai_career_advisor.services.career_matrix import CareerMatrix
+from ai_career_advisor.services.collaborative_model import ItemItemModel, collaborative_model
+from ai_career_advisor.services.profile_embedding import ProfileEmbeddingService
+from ai_career_advisor.services.recommendation_service import RecommendationService
+
+
+def test_batch_content_scores_match_per_user_scores():
+    matrix = CareerMatrix(make_careers(300))
+    rng = np.random.default_rng(0)
+    users = [make_user(seed) for seed in range(40)]
+    vectors = [
+        None if i % 5 == 0 else ([1.0] * (DIM + 1) if i % 7 == 0 else rng.standard_normal(DIM).tolist())
+        for i in range(len(users))
+    ]
+
+    batch = matrix.batch_content_scores(users, vectors)
+    for i, (user, vector) in enumerate(zip(users, vectors)):
+        np.testing.assert_allclose(batch[i], matrix.content_scores(user, vector), atol=1e-5)
+
+
+def test_score_many_matches_single_user_scores():
+    rows = [(f"u{u}", f"Career {c}", (u * c) % 3 / 2) for u in range(30) for c in range(u % 7, 20, 3)]
+    model = ItemItemModel(rows, neighbors=5)
+    names = [f"Career {c}" for c in range(25)]
+    users = [{}, {"Career 1": 1.0}, {"Career 2": 0.5, "Career 9": -0.5}, {"Unknown": 1.0}]
+
+    batch = model.score_many(users, names)
+    for i, ratings in enumerate(users):
+        np.testing.assert_allclose(batch[i], model.score(ratings, names), atol=1e-6)
+
+
+@pytest.fixture(autouse=True)
+def fake_embeddings(monkeypatch):
+    async def fake_embed(text):
+        rng = np.random.default_rng(abs(hash(text)) % 2**32)
+        return rng.standard_normal(DIM).tolist()
+
+    monkeypatch.setattr(ProfileEmbeddingService, "embed", staticmethod(fake_embed))
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    tables = [
+        UserPreferences.__table__, CareerAttributes.__table__,
+        UserCareerInteraction.__table__, UserRecommendation.__table__
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(UserPreferences.metadata.create_all, tables=tables)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as db:
+        careers = make_careers(120)
+        db.add_all(careers)
+        for seed in range(12):
+            user = make_user(seed)
+            await RecommendationService.save_user_preferences(db, user.user_email, {
+                "skills": user.skills, "interests": user.interests,
+                "education_level": user.education_level, "preferred_work_style": user.preferred_work_style
+            })
+        # Half the users have enough history for collaborative filtering
+        db.add_all([
+            UserCareerInteraction(user_email=f"user{seed}@example.com", career_name=careers[(seed * c) % 120].career_name,
+                                  interaction_type="saved", score=0.7)
+            for seed in range(0, 12, 2) for c in range(1, 5)
+        ])
+        await db.commit()
+        await collaborative_model.refresh(db)
+        yield db
+    await engine.dispose()
+
+
+EMAILS = [f"user{seed}@example.com" for seed in range(12)]
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_online_recommendations(session):
+    batch = await RecommendationService.get_batch_recommendations(
+        session, EMAILS + ["nobody@example.com"], top_k=5, persist=False
+    )
+    assert batch["nobody@example.com"][0]["recommendation_type"] == "popularity"
+
+    for email in EMAILS:
+        online = await RecommendationService.get_recommendations(session, email, top_k=5)
+        assert [r["career"]["career_name"] for r in batch[email]] == [r["career"]["career_name"] for r in online]
+        assert [r["match_score"] for r in batch[email]] == pytest.approx([r["match_score"] for r in online], abs=0.11)
+
+
+@pytest.mark.asyncio
+async def test_online_serves_fresh_precomputed_rows(session, monkeypatch):
+    stats = await RecommendationService.precompute_recommendations(session, top_k=8, page_size=5)
+    assert stats["users"] == len(EMAILS)
+
+    live_calls = []
+    original = CareerMatrix.content_scores
+    monkeypatch.setattr(CareerMatrix, "content_scores", lambda *a, **k: live_calls.append(1) or original(*a, **k))
+
+    served = await RecommendationService.get_recommendations(session, EMAILS[0], top_k=5)
+    assert len(served) == 5 and not live_calls
+
+    # Asking for more than was materialized -> live
+    await RecommendationService.get_recommendations(session, EMAILS[0], top_k=9)
+    assert len(live_calls) == 1
+
+    # Changed preferences -> live
+    await RecommendationService.save_user_preferences(session, EMAILS[1], {"skills": ["law"]})
+    await RecommendationService.get_recommendations(session, EMAILS[1], top_k=5)
+    assert len(live_calls) == 2
+
+    # New interaction (user without any history so far) -> live
+    await RecommendationService.get_recommendations(session, EMAILS[3], top_k=5)
+    assert len(live_calls) == 2
+    await RecommendationService.track_interaction(session, EMAILS[3], "Career 1", "saved")
+    await RecommendationService.get_recommendations(session, EMAILS[3], top_k=5)
+    assert len(live_calls) == 3
+
+    # Changed careers -> live
+    session.add(CareerAttributes(career_name="Brand New Career", required_skills=["python"]))
+    await session.commit()
+    await RecommendationService.get_recommendations(session, EMAILS[2], top_k=5)
+    assert len(live_calls) == 4
+
+    # Expired -> live
+    monkeypatch.setattr(settings, "RECOMMENDATION_PRECOMPUTE_TTL_MINUTES", 0)
+    await RecommendationService.get_recommendations(session, EMAILS[5], top_k=5)
+    assert len(live_calls) == 5
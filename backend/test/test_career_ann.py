@@ -0,0 +1,172 @@
+"""
+Tests for the career ANN (IVF) indexes
+
+Recall@k is measured against exact search on clustered synthetic careers,
+the same shape as real data (careers group by industry).
+
+Run from backend directory: pytest test/test_career_ann.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.models.career_attributes import CareerAttributes
+from ai_career_advisor.models.user_preferences import UserPreferences
+from ai_career_advisor.services.career_matrix import CareerMatrix
+from ai_career_advisor.services.career_ann import IVFIndex, CareerANNService
+
+
+DIM = 32
+CLUSTERS = 40
+
+
+def clustered_vectors(n, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((CLUSTERS, DIM))
+    vectors = centers[rng.integers(0, CLUSTERS, n)] + 0.5 * rng.standard_normal((n, DIM))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def make_careers(n, seed=0):
+    """Each industry has its own term pool; careers mix mostly in-industry terms"""
+    rng = random.Random(seed)
+    vectors = clustered_vectors(n, seed)
+    pools = [[f"term-{c}-{t}" for t in range(12)] for c in range(CLUSTERS)]
+    careers = []
+    for i in range(n):
+        pool = pools[i % CLUSTERS]
+        terms = rng.sample(pool, rng.randint(3, 7)) + rng.sample(pools[rng.randrange(CLUSTERS)], 1)
+        careers.append(CareerAttributes(
+            id=str(i),
+            career_name=f"Career {i:05d}",
+            required_skills=terms[:len(terms) // 2],
+            interest_tags=terms[len(terms) // 2:],
+            semantic_vector=vectors[i].tolist()
+        ))
+    return careers
+
+
+def recall(approx, exact):
+    return len(set(approx) & set(exact)) / len(exact)
+
+
+def score_recall(approx, exact, scores):
+    """Tie-aware recall@k: share of approx results scoring at least the exact k-th best"""
+    return float(np.mean(scores[approx] >= scores[exact[-1]] - 1e-6))
+
+
+@pytest.fixture
+def ann_settings(monkeypatch):
+    monkeypatch.setattr(settings, "ANN_MIN_CAREERS", 0)
+    monkeypatch.setattr(settings, "ANN_N_PROBE", 8)
+
+
+def test_ivf_recall_at_10():
+    vectors = clustered_vectors(5000)
+    ids = [str(i) for i in range(len(vectors))]
+    index = IVFIndex(DIM, n_probe=8)
+    index.sync(ids, ids, lambda p: vectors[p])
+
+    queries = clustered_vectors(200, seed=1)
+    recalls = [recall(index.search(q, 10)[0], index.exact_search(q, 10)[0]) for q in queries]
+    assert np.mean(recalls) >= 0.9
+
+
+def test_incremental_sync_readds_only_changed_and_persists(tmp_path):
+    vectors = clustered_vectors(2000)
+    ids = [str(i) for i in range(len(vectors))]
+    fingerprints = list(ids)
+    index = IVFIndex(DIM)
+    index.sync(ids, fingerprints, lambda p: vectors[p])
+
+    moved = vectors[0] * -1
+    vectors[0] = moved
+    fingerprints[0] = "changed"
+    stats = index.sync(ids[:-5], fingerprints[:-5], lambda p: vectors[p])
+    assert stats == {"added": 1, "removed": 5, "retrained": 0}
+    assert len(index) == 1995
+    assert index.search(moved, 1)[0] == ["0"]
+    assert "1999" not in index.exact_search(vectors[1999], 5)[0]
+
+    index.save(tmp_path / "semantic.npz")
+    loaded = IVFIndex.load(tmp_path / "semantic.npz")
+    assert loaded.sync(ids[:-5], fingerprints[:-5], lambda p: vectors[p])["added"] == 0
+    query = clustered_vectors(1, seed=3)[0]
+    assert loaded.search(query, 10)[0] == index.search(query, 10)[0]
+
+
+@pytest.mark.asyncio
+async def test_similar_careers_recall_against_exact_jaccard(tmp_path, ann_settings):
+    matrix = CareerMatrix(make_careers(3000))
+    service = CareerANNService(tmp_path)
+
+    recalls = []
+    for name in matrix.names[:100]:
+        similarity = matrix.attribute_similarity(name)
+        exact = CareerMatrix.top_k(similarity, 5, exclude=matrix.index[name])
+        rows = await service.similar_candidates(matrix, name, 5)
+        approx = rows[CareerMatrix.top_k(matrix.attribute_similarity(name, rows), 5)]
+        recalls.append(score_recall(approx, exact, similarity))
+    assert np.mean(recalls) >= 0.9
+    assert (tmp_path / "attribute.npz").exists()
+
+
+@pytest.mark.asyncio
+async def test_recommendation_candidates_recall_against_full_scoring(tmp_path, ann_settings):
+    careers = make_careers(3000)
+    matrix = CareerMatrix(careers)
+    service = CareerANNService(tmp_path)
+
+    recalls = []
+    for seed, user_vector in enumerate(clustered_vectors(50, seed=2)):
+        user = UserPreferences(
+            user_email=f"user{seed}@example.com",
+            skills=list(careers[seed].required_skills),
+            interests=list(careers[seed * 7].interest_tags)
+        )
+        scores = matrix.content_scores(user, user_vector.tolist())
+        exact = CareerMatrix.top_k(scores, 5)
+        rows, literal = await service.recommendation_candidates(matrix, user, user_vector.tolist(), 5)
+        approx = rows[CareerMatrix.top_k(matrix.content_scores(user, user_vector.tolist(), rows, literal), 5)]
+        recalls.append(score_recall(approx, exact, scores))
+    assert np.mean(recalls) >= 0.95
+
+
+@pytest.mark.asyncio
+async def test_small_catalogue_uses_exact_search(tmp_path):
+    matrix = CareerMatrix(make_careers(100))
+    service = CareerANNService(tmp_path)
+    assert await service.similar_candidates(matrix, matrix.names[0], 3) is None
+    assert await service.recommendation_candidates(matrix, UserPreferences(), [1.0] * DIM, 3) is None
+
+
+@pytest.mark.asyncio
+async def test_sync_swaps_new_indexes_and_keeps_each_matrix_snapshot(tmp_path, ann_settings):
+    careers = make_careers(600)
+    old = CareerMatrix(careers)
+    service = CareerANNService(tmp_path)
+    old_semantic, old_attribute = await service.ensure(old)
+
+    new = CareerMatrix(careers[:-50])
+    new_semantic, new_attribute = await service.ensure(new)
+    # The indexes requests on the old matrix are searching were not mutated
+    assert new_semantic is not old_semantic and new_attribute is not old_attribute
+    assert (len(old_semantic), len(new_semantic)) == (600, 550)
+    assert careers[-1].career_name in old_attribute.row_of
+
+    # Requests holding either matrix reuse its indexes instead of re-syncing
+    assert await service.ensure(old) == (old_semantic, old_attribute)
+    assert await service.ensure(new) == (new_semantic, new_attribute)
+    assert service.syncs == 2
+
+    # Persisted without pickled object arrays
+    with np.load(tmp_path / "semantic.npz", allow_pickle=False) as data:
+        assert data["ids"].dtype.kind == "U" and data["fingerprints"].dtype.kind == "U"
@@ -0,0 +1,203 @@
+"""
+Tests for the vectorized career scoring engine
+
+Scores are checked against RecommendationService's original per-career
+formulas; invalidation runs against an in-memory SQLite database.
+
+Run from backend directory: pytest test/test_career_matrix.py
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.models.career_attributes import CareerAttributes
+from ai_career_advisor.models.user_preferences import UserPreferences
+from ai_career_advisor.services.career_matrix import CareerMatrix, CareerMatrixEngine
+
+
+SKILLS = ["python", "sql", "Java", "communication", "biology", "accounting", "design", "law"]
+INTERESTS = ["technology", "data", "healthcare", "finance", "art", "justice"]
+EDUCATION = [None, "10th", "12th", "graduate", "postgraduate", "phd", "Unknown"]
+WORK_STYLES = [None, "remote", "office", "hybrid"]
+DIM = 16
+
+
+def make_careers(n, seed=0):
+    rng = random.Random(seed)
+    careers = []
+    for i in range(n):
+        vector = [rng.uniform(-1, 1) for _ in range(DIM)] if rng.random() > 0.2 else None
+        careers.append(CareerAttributes(
+            id=str(i),
+            career_name=f"Career {i:04d}",
+            required_skills=rng.sample(SKILLS, rng.randint(0, 4)),
+            interest_tags=rng.sample(INTERESTS, rng.randint(0, 3)),
+            personality_fit=rng.sample(["analytical", "creative", "social"], rng.randint(0, 2)),
+            min_education=rng.choice(EDUCATION),
+            work_style=rng.choice(WORK_STYLES),
+            popularity_score=rng.random(),
+            semantic_vector=vector
+        ))
+    return careers
+
+
+def make_user(seed):
+    rng = random.Random(seed)
+    return UserPreferences(
+        user_email=f"user{seed}@example.com",
+        skills=[s.upper() if rng.random() < 0.3 else s for s in rng.sample(SKILLS, rng.randint(0, 4))] + ["unknown skill"],
+        interests=rng.sample(INTERESTS, rng.randint(0, 3)),
+        education_level=rng.choice(EDUCATION),
+        preferred_work_style=rng.choice(WORK_STYLES)
+    )
+
+
+# ================== LEGACY PER-CAREER FORMULAS ==================
+# RecommendationService's scoring before vectorization, kept as the oracle
+# for CareerMatrix (also timed by Scripts/benchmark_recommendations.py)
+
+EDUCATION_LEVELS = {
+    "10th": 1, "12th": 2,
+    "graduate": 3, "diploma": 3, "btech": 3, "bca": 3,
+    "postgraduate": 4, "mtech": 4, "mba": 4, "mca": 4,
+    "phd": 5
+}
+
+
+def legacy_cosine_similarity(vec1, vec2):
+    if not vec1 or not vec2 or len(vec1) != len(vec2):
+        return 0.0
+    dot_product = sum(a * b for a, b in zip(vec1, vec2))
+    norm1 = math.sqrt(sum(a * a for a in vec1))
+    norm2 = math.sqrt(sum(b * b for b in vec2))
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return dot_product / (norm1 * norm2)
+
+
+def legacy_jaccard_similarity(set_a, set_b):
+    if not set_a or not set_b:
+        return 0.0
+    set_a = set(s.lower().strip() for s in set_a)
+    set_b = set(s.lower().strip() for s in set_b)
+    union = len(set_a | set_b)
+    return len(set_a & set_b) / union if union else 0.0
+
+
+def legacy_education_match(user_education, career_min):
+    if not career_min or not user_education:
+        return 1.0
+    user_level = EDUCATION_LEVELS.get(user_education.lower(), 2)
+    career_level = EDUCATION_LEVELS.get(career_min.lower(), 2)
+    if user_level >= career_level:
+        return 1.0
+    return 0.7 if user_level == career_level - 1 else 0.3
+
+
+def legacy_literal_score(user, career):
+    """Skills 50%, interests 30%, education 15%, work style 5%"""
+    work_style = 1.0 if (
+        not career.work_style or not user.preferred_work_style or career.work_style == user.preferred_work_style
+    ) else 0.5
+    score = (
+        0.50 * legacy_jaccard_similarity(user.skills or [], career.required_skills or [])
+        + 0.30 * legacy_jaccard_similarity(user.interests or [], career.interest_tags or [])
+        + 0.15 * legacy_education_match(user.education_level, career.min_education)
+        + 0.05 * work_style
+    )
+    return min(1.0, max(0.0, score))
+
+
+def reference_content_score(user, career, user_vector):
+    """The original loop body from RecommendationService.get_recommendations"""
+    if user_vector and career.semantic_vector:
+        cosine = legacy_cosine_similarity(user_vector, career.semantic_vector)
+        return cosine * 0.7 + legacy_literal_score(user, career) * 0.3
+    return legacy_literal_score(user, career)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_content_scores_match_per_career_formulas(seed):
+    careers = make_careers(200, seed)
+    matrix = CareerMatrix(careers)
+    user = make_user(seed)
+    rng = np.random.default_rng(seed)
+
+    for user_vector in (None, list(rng.uniform(-1, 1, DIM))):
+        expected = [reference_content_score(user, c, user_vector) for c in careers]
+        np.testing.assert_allclose(matrix.content_scores(user, user_vector), expected, atol=1e-5)
+
+
+def test_attribute_similarity_matches_jaccard():
+    careers = make_careers(100)
+    matrix = CareerMatrix(careers)
+    target = careers[7]
+
+    expected = [
+        legacy_jaccard_similarity(target.get_attribute_vector(), c.get_attribute_vector())
+        for c in careers
+    ]
+    np.testing.assert_allclose(matrix.attribute_similarity(target.career_name), expected, atol=1e-6)
+    assert matrix.attribute_similarity("No Such Career") is None
+
+
+def test_top_k_orders_best_first_and_excludes_target():
+    scores = np.array([0.2, 0.9, 0.5, 0.9, 0.1], dtype=np.float32)
+
+    assert CareerMatrix.top_k(scores, 3).tolist() == [1, 3, 2]
+    assert CareerMatrix.top_k(scores, 10).tolist() == [1, 3, 2, 0, 4]
+    assert CareerMatrix.top_k(scores, 2, exclude=1).tolist() == [3, 2]
+
+
+def test_vectors_are_normalized_float32():
+    matrix = CareerMatrix(make_careers(50))
+    norms = np.linalg.norm(matrix.vectors[matrix.has_vector], axis=1)
+
+    assert matrix.vectors.dtype == np.float32
+    np.testing.assert_allclose(norms, 1.0, atol=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_engine_rebuilds_only_when_careers_change():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(CareerAttributes.metadata.create_all, tables=[CareerAttributes.__table__])
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    matrix_engine = CareerMatrixEngine()
+
+    async with Session() as db:
+        db.add_all(make_careers(10))
+        await db.commit()
+
+        first = await matrix_engine.get_matrix(db)
+        assert await matrix_engine.get_matrix(db) is first
+        assert matrix_engine.builds == 1
+
+        # ORM update in this process -> dirty flag
+        career = await db.get(CareerAttributes, "3")
+        career.required_skills = ["python", "rust"]
+        await db.commit()
+        second = await matrix_engine.get_matrix(db)
+        assert second is not first
+        assert "rust" in second.skill_vocab
+
+        # Write from "another process" (Core insert, no ORM events) -> signature check
+        await db.execute(CareerAttributes.__table__.insert().values(
+            id="new", career_name="Career New", required_skills=[], interest_tags=[], popularity_score=0.5
+        ))
+        await db.commit()
+        third = await matrix_engine.get_matrix(db)
+        assert third.size == 11
+        assert matrix_engine.builds == 3
+
+    await engine.dispose()
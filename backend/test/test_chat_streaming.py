@@ -0,0 +1,114 @@
+"""
+Tests for streamed chatbot answers (ModelManager.stream_generate + ChatbotService.ask_stream)
+
+Upstreams are in-memory fakes; no API keys or network needed.
+
+Run from backend directory: pytest test/test_chat_streaming.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core import model_manager as model_manager_module
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.llm_providers import GeminiClient
+from ai_career_advisor.core.model_manager import ModelManager
+from ai_career_advisor.core.response_cache import ResponseCache
+from ai_career_advisor.services import chatbot_service as chatbot_module
+from ai_career_advisor.services.chatbot_service import ChatbotService
+
+
+KEY = "key-stream-0000"
+
+
+def _gemini_handler(request: httpx.Request) -> httpx.Response:
+    """Flash is rate-limited, Flash-Lite streams two chunks over SSE"""
+    if "gemini-2.5-flash-lite" not in request.url.path:
+        return httpx.Response(429, json={"error": {"message": "Quota exceeded"}})
+
+    body = "".join(
+        f"data: {json.dumps({'candidates': [{'content': {'parts': [{'text': text}]}}]})}\r\n\r\n"
+        for text in ["Hel", "lo"]
+    )
+    return httpx.Response(200, content=body.encode(), headers={"content-type": "text/event-stream"})
+
+
+@pytest.mark.asyncio
+async def test_stream_generate_falls_back_before_first_token_and_caches(monkeypatch):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_gemini_handler)) as http:
+        monkeypatch.setattr(ModelManager, "GEMINI_API_KEYS", [KEY])
+        monkeypatch.setattr(ModelManager, "_scheduler", None)
+        monkeypatch.setattr(ModelManager, "_gemini_clients", {KEY: GeminiClient(KEY, http_client=http)})
+        monkeypatch.setattr(settings, "REDIS_URL", None)
+        monkeypatch.setattr(settings, "PERPLEXITY_API_KEY", None)
+        monkeypatch.setattr(model_manager_module, "response_cache", ResponseCache())
+
+        events = [event async for event in ModelManager.stream_generate("Explain CUET")]
+        assert [e["text"] for e in events if e["type"] == "token"] == ["Hel", "lo"]
+        assert events[-1] == {"type": "done", "content": "Hello", "citations": [], "model": "gemini-2.5-flash-lite"}
+
+        cached = [event async for event in ModelManager.stream_generate("explain  cuet")]
+        assert cached[0] == {"type": "token", "text": "Hello"}
+        assert cached[-1]["model"] == "gemini-2.5-flash-lite"
+
+
+@pytest.fixture
+def legacy_stream(monkeypatch):
+    persisted = []
+
+    async def no_rag(query, intent=None):
+        return {"found": False, "context": "", "sources": [], "scores": [], "num_documents": 0}
+
+    async def fake_perplexity(system_prompt, prompt, timeout):
+        for text in ["JEE Main ", "fees are ", "₹1000."]:
+            yield {"content": text}
+        yield {"citations": ["https://jeemain.nta.ac.in/"]}
+
+    monkeypatch.setattr(chatbot_module, "USE_AGENT_GRAPH", False)
+    monkeypatch.setattr(ChatbotService, "_safe_rag_search", staticmethod(no_rag))
+    monkeypatch.setattr(ChatbotService, "_stream_perplexity", staticmethod(fake_perplexity))
+    monkeypatch.setattr(
+        ChatbotService, "_persist_in_background",
+        staticmethod(lambda *args, **kwargs: persisted.append((args, kwargs)))
+    )
+    return persisted
+
+
+@pytest.mark.asyncio
+async def test_ask_stream_emits_tokens_then_trailing_sources(legacy_stream):
+    events = [e async for e in ChatbotService.ask_stream("What are the JEE Main exam fees?", user_email="a@b.c")]
+    names = [e["event"] for e in events]
+
+    assert names[0] == "start"
+    assert names[-2:] == ["sources", "done"]
+    tokens = [e["data"]["text"] for e in events if e["event"] == "token"]
+    assert tokens[:3] == ["JEE Main ", "fees are ", "₹1000."]
+    assert tokens[-1] == ChatbotService.WEB_DISCLAIMER
+
+    sources = events[-2]["data"]
+    assert sources["sources"] == ["https://jeemain.nta.ac.in/"]
+    assert "**References:**" in sources["appendix"]
+    assert events[-1]["data"]["response_type"] == "perplexity_search"
+
+    # Saved once, after the stream, with the same text the client rendered
+    (args, kwargs), = legacy_stream
+    assert args[3] == "".join(tokens) + sources["appendix"]
+    assert kwargs["rag_response"] == "".join(tokens)
+
+
+@pytest.mark.asyncio
+async def test_ask_stream_greeting_is_a_single_token(legacy_stream):
+    events = [e async for e in ChatbotService.ask_stream("hi")]
+
+    tokens = [e for e in events if e["event"] == "token"]
+    assert len(tokens) == 1
+    assert "Career Counselor" in tokens[0]["data"]["text"]
+    assert events[-1]["data"]["response_type"] == "greeting"
+    assert legacy_stream[0][1]["rag_response"] is None
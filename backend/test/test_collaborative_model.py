@@ -0,0 +1,91 @@
+"""
+Tests for the precomputed item-item collaborative filtering model
+
+Run from backend directory: pytest test/test_collaborative_model.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.models.user_career_interaction import UserCareerInteraction
+from ai_career_advisor.services.collaborative_model import ItemItemModel, CollaborativeModelService
+
+
+# Engineers like Software + Data; doctors like Doctor + Nurse
+ROWS = (
+    [(f"eng{i}", "Software Engineer", 1.0) for i in range(10)] +
+    [(f"eng{i}", "Data Scientist", 0.7) for i in range(10)] +
+    [(f"med{i}", "Doctor", 1.0) for i in range(10)] +
+    [(f"med{i}", "Nurse", 0.7) for i in range(10)] +
+    [("med0", "Software Engineer", -0.5)]
+)
+CAREERS = ["Software Engineer", "Data Scientist", "Doctor", "Nurse", "Unseen Career"]
+
+
+def test_similar_careers_score_above_neutral_and_dismissals_below():
+    model = ItemItemModel(ROWS)
+    scores = model.score({"Software Engineer": 1.0}, CAREERS)
+
+    assert scores[1] > 0.8          # Data Scientist co-occurs with Software Engineer
+    assert 0.4 < scores[3] < 0.5    # Only link to Nurse is med0's dismissal of Software Engineer
+    assert scores[4] == 0.5         # Unknown career -> neutral
+    assert model.score({}, CAREERS).tolist() == [0.5] * len(CAREERS)
+
+
+def test_duplicate_interactions_are_averaged():
+    model = ItemItemModel([("u", "A", 1.0), ("u", "A", 0.0), ("v", "A", 0.5), ("v", "B", 1.0)])
+    assert model.num_users == 2
+    assert model.num_interactions == 4
+    assert model.similarity.shape == (2, 2)
+    assert model.similarity.diagonal().tolist() == [0.0, 0.0]
+
+
+def test_neighbour_pruning_keeps_top_k():
+    rows = [(f"u{i}", f"C{j}", 1.0) for i in range(20) for j in range(i % 5, i % 5 + 6)]
+    model = ItemItemModel(rows, neighbors=2)
+    assert np.diff(model.similarity.indptr).max() <= 2
+
+
+@pytest.mark.asyncio
+async def test_service_builds_lazily_and_scores_from_live_interactions():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(UserCareerInteraction.metadata.create_all, tables=[UserCareerInteraction.__table__])
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    service = CollaborativeModelService()
+
+    async with Session() as db:
+        db.add_all(UserCareerInteraction(user_email=u, career_name=c, interaction_type="saved", score=s) for u, c, s in ROWS)
+        await db.commit()
+
+        mine = [UserCareerInteraction(user_email="me", career_name="Doctor", interaction_type="saved", score=1.0)]
+        scores = await service.score_user(db, mine, CAREERS)
+
+    assert service.refreshes == 1
+    assert scores[3] > 0.8 and scores[1] == 0.5
+    assert service.get_stats()["users"] == 20
+
+    await engine.dispose()
+
+
+class BrokenSession:
+    async def execute(self, *args, **kwargs):
+        raise RuntimeError("database unavailable")
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_returns_neutral_scores():
+    service = CollaborativeModelService()
+    mine = [UserCareerInteraction(user_email="me", career_name="Doctor", interaction_type="saved", score=1.0)]
+
+    assert (await service.score_user(BrokenSession(), mine, CAREERS)).tolist() == [0.5] * len(CAREERS)
+    batch = await service.score_users(BrokenSession(), [mine, []], CAREERS)
+    assert batch.shape == (2, len(CAREERS)) and np.all(batch == 0.5)
+    assert service.refreshes == 0 and not service.get_stats()["built"]
@@ -0,0 +1,106 @@
+"""
+Tests for the deduplicating, MMR-ordered, token-budgeted RAG context builder
+
+Run from backend directory: pytest test/test_context_builder.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.rag.context_builder import ContextBuilder, TokenCounter
+
+ANSWER = "To become a software engineer, take PCM in 12th, clear JEE Main and study B.Tech in Computer Science. " * 6
+
+
+def results(rows):
+    """rows: (document, source, score, embedding)"""
+    return {
+        "found": True,
+        "documents": [r[0] for r in rows],
+        "metadatas": [{"source": r[1]} for r in rows],
+        "scores": [r[2] for r in rows],
+        "fused_scores": [r[2] for r in rows],
+        "embeddings": [r[3] for r in rows]
+    }
+
+
+@pytest.fixture
+def builder(monkeypatch):
+    monkeypatch.setattr(TokenCounter, "_tokenizers", {})
+    monkeypatch.setattr(settings, "RAG_CONTEXT_TOKENIZERS", {})
+    monkeypatch.setattr(settings, "RAG_CONTEXT_TOKEN_BUDGETS", {"default": 500})
+    monkeypatch.setattr(settings, "RAG_CONTEXT_MIN_SCORE", 0.3)
+    return ContextBuilder()
+
+
+def test_near_duplicate_answers_do_not_crowd_out_facts(builder):
+    search = results([
+        (ANSWER, "llm_generated", 0.90, [1.0, 0.0, 0.0]),
+        (ANSWER + " All the best!", "llm_generated", 0.89, [0.99, 0.05, 0.0]),
+        (ANSWER.replace("B.Tech", "BTech"), "llm_generated", 0.88, [0.98, 0.0, 0.08]),
+        ("IIT Bombay B.Tech Computer Science: Fees: 8 L, Average package: 21 LPA", "college_detail", 0.80, [0.6, 0.8, 0.0]),
+        ("JEE Main entrance exam", "entrance_exam", 0.75, [0.5, 0.0, 0.86]),
+        ("Unrelated", "branch", 0.1, [0.0, 1.0, 0.0]),
+    ])
+
+    context = builder.build(search)
+    assert context.count("[Source: llm_generated]") == 1
+    assert "[Source: college_detail]" in context and "[Source: entrance_exam]" in context
+    assert "Unrelated" not in context
+
+    # The legacy builder fills its 2000 chars with the three answers
+    legacy = builder.legacy_context(search)
+    assert legacy.count("[Source: llm_generated]") == 3 and "college_detail" not in legacy
+
+    metrics = builder.get_metrics()
+    assert metrics["duplicates_dropped"] == 2 and metrics["documents_used"] == 3
+    assert metrics["tokens_saved"] > 0 and metrics["avg_tokens_saved_per_request"] == metrics["tokens_saved"]
+
+
+def test_mmr_prefers_new_information(builder, monkeypatch):
+    monkeypatch.setattr(settings, "RAG_CONTEXT_DEDUP_SIMILARITY", 0.99)
+    search = results([
+        ("a1", "career", 0.9, [1.0, 0.0]),
+        ("a2", "career", 0.85, [0.9, 0.436]),
+        ("b", "college", 0.8, [0.0, 1.0]),
+    ])
+    order, _ = builder.select(search)
+    assert order == [0, 2, 1]
+
+    monkeypatch.setattr(settings, "RAG_CONTEXT_MMR_LAMBDA", 1.0)
+    assert builder.select(search)[0] == [0, 1, 2]
+
+
+def test_token_budget_skips_documents_that_do_not_fit(builder):
+    search = results([
+        ("x" * 400, "career", 0.9, None),
+        ("y" * 2000, "college", 0.8, None),
+        ("z" * 300, "exam", 0.7, None),
+    ])
+    order, counters = builder.select(search, max_tokens=250)
+    assert order == [0, 2] and counters["over_budget_dropped"] == 1
+    assert TokenCounter.count(builder.build(search, max_tokens=250)) <= 250
+
+    # Identical text is a duplicate even without embeddings
+    twins = results([("same  text", "career", 0.9, None), ("Same text", "career", 0.8, None)])
+    assert builder.select(twins)[0] == [0]
+
+
+def test_exact_counts_with_a_configured_tokenizer(builder, monkeypatch, tmp_path):
+    from tokenizers import BertWordPieceTokenizer
+    vocab = Path(__file__).parent.parent / "models" / "intent_classifier" / "vocab.txt"
+    tokenizer = BertWordPieceTokenizer(str(vocab), lowercase=True)
+    tokenizer.save(str(tmp_path / "tokenizer.json"))
+
+    monkeypatch.setattr(settings, "RAG_CONTEXT_TOKENIZERS", {"bert": str(tmp_path / "tokenizer.json"), "broken": "missing.json"})
+    text = "IIT Bombay B.Tech fees"
+    assert TokenCounter.exact("bert") and not TokenCounter.exact("broken")
+    assert TokenCounter.count(text, "bert") == len(tokenizer.encode(text, add_special_tokens=False).ids)
+    assert TokenCounter.count_many([text, "jee"], "bert") == [TokenCounter.count(text, "bert"), TokenCounter.count("jee", "bert")]
+    assert TokenCounter.count(text, "broken") == int(len(text) / TokenCounter.CHARS_PER_TOKEN) + 1
@@ -0,0 +1,140 @@
+"""
+Tests for the chunked, multi-process batch embedding pipeline
+
+A small fake stands in for the SentenceTransformer model (encode /
+encode_multi_process / pool lifecycle), so no model download is needed.
+
+Run from backend directory: pytest test/test_embedding_batch.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.rag.embeddings import EmbeddingService
+
+
+def vector_for(text):
+    return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+
+class FakeModel:
+    def __init__(self):
+        self.encode_calls = []
+        self.pool_calls = []
+        self.pools_started = 0
+        self.failures = {}  # text -> remaining failures
+        self.pool_broken = False
+
+    def _vectors(self, texts):
+        for text in texts:
+            if self.failures.get(text, 0):
+                self.failures[text] -= 1
+                raise RuntimeError(f"boom on {text}")
+        return np.array([vector_for(t) for t in texts], dtype=np.float64)
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, show_progress_bar=None):
+        self.encode_calls.append(list(texts))
+        return self._vectors(texts)
+
+    def start_multi_process_pool(self, target_devices=None):
+        self.pools_started += 1
+        return {"devices": target_devices}
+
+    def encode_multi_process(self, texts, pool, batch_size=32):
+        self.pool_calls.append(list(texts))
+        if self.pool_broken:
+            raise BrokenPipeError("worker died")
+        return self._vectors(texts)
+
+    @staticmethod
+    def stop_multi_process_pool(pool):
+        pass
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = FakeModel()
+    monkeypatch.setattr(EmbeddingService, "_model", fake)
+    monkeypatch.setattr(EmbeddingService, "_pool", None)
+    monkeypatch.setattr(EmbeddingService, "RETRY_BACKOFF_S", 0)
+    monkeypatch.setattr(settings, "RAG_EMBED_WORKERS", 1)
+    monkeypatch.setattr(settings, "RAG_EMBED_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "RAG_EMBED_CHUNK_SIZE", 3)
+    monkeypatch.setattr(settings, "RAG_EMBED_MAX_RETRIES", 1)
+    # Cache behaviour is covered in test_embedding_cache.py
+    monkeypatch.setattr(settings, "RAG_EMBED_CACHE_ENABLED", False)
+    yield fake
+    EmbeddingService._pool = None
+
+
+@pytest.mark.asyncio
+async def test_order_alignment_and_float32(model):
+    texts = ["alpha", "", "beta", "   ", "gamma", "delta", "epsilon", None, "zeta"]
+    progress = []
+    result = await EmbeddingService.generate_batch_embeddings(texts, lambda done, total: progress.append((done, total)))
+
+    assert result.dtype == np.float32 and result.shape == (len(texts), 3)
+    valid = EmbeddingService.valid_rows(result)
+    assert valid.tolist() == [bool(t and t.strip()) for t in texts]
+    for i, text in enumerate(texts):
+        if valid[i]:
+            np.testing.assert_allclose(result[i], vector_for(text))
+
+    # Only non-empty texts are encoded, in chunks of RAG_EMBED_CHUNK_SIZE
+    assert model.encode_calls == [["alpha", "beta", "gamma"], ["delta", "epsilon", "zeta"]]
+    assert progress == [(3, 6), (6, 6)]
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_is_retried_then_isolated(model):
+    texts = [f"text {i}" for i in range(7)]
+    model.failures = {"text 1": 1, "text 4": 5}
+
+    result = await EmbeddingService.generate_batch_embeddings(texts)
+    valid = EmbeddingService.valid_rows(result)
+
+    # Chunk 0 recovered on retry; chunk 1 (text 3-5) exhausted its retries
+    assert valid.tolist() == [True, True, True, False, False, False, True]
+    assert model.encode_calls.count(["text 3", "text 4", "text 5"]) == 2
+    np.testing.assert_allclose(result[6], vector_for("text 6"))
+
+
+@pytest.mark.asyncio
+async def test_everything_failing_raises(model):
+    model.failures = {"only": 10}
+    with pytest.raises(RuntimeError):
+        await EmbeddingService.generate_batch_embeddings(["only"])
+    assert (await EmbeddingService.generate_batch_embeddings(["", " "])).shape == (2, 0)
+
+
+@pytest.mark.asyncio
+async def test_multi_process_pool_reused_and_falls_back(model, monkeypatch):
+    monkeypatch.setattr(settings, "RAG_EMBED_WORKERS", 4)
+    texts = [f"doc {i}" for i in range(5)]
+
+    first = await EmbeddingService.generate_batch_embeddings(texts)
+    second = await EmbeddingService.generate_batch_embeddings(texts)
+    assert model.pools_started == 1 and not model.encode_calls
+    assert model.pool_calls == [texts[:3], texts[3:]] * 2
+    np.testing.assert_array_equal(first, second)
+
+    # Below one forward batch the pool isn't worth the IPC
+    await EmbeddingService.generate_batch_embeddings(["a", "b"])
+    assert model.encode_calls == [["a", "b"]]
+
+    # A dead worker pool is torn down and the chunk retried in-process
+    model.pool_broken = True
+    result = await EmbeddingService.generate_batch_embeddings(texts)
+    assert EmbeddingService.valid_rows(result).all()
+    assert EmbeddingService._pool is None and model.pools_started == 1
+    assert model.encode_calls[-2:] == [texts[:3], texts[3:]]
+
+    EmbeddingService.stop_pool()
+    assert EmbeddingService._pool is None
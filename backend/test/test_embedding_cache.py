@@ -0,0 +1,130 @@
+"""
+Tests for the persistent, model-scoped embedding cache and its use by
+EmbeddingService (single and batch entry points)
+
+Run from backend directory: pytest test/test_embedding_cache.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+import ai_career_advisor.rag.embeddings as embeddings_module
+from ai_career_advisor.rag.embedding_cache import EmbeddingCache
+from ai_career_advisor.rag.embeddings import EmbeddingService
+
+
+def vector_for(text):
+    return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+
+class FakeModel:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, show_progress_bar=None):
+        if isinstance(texts, str):
+            self.encoded.append(texts)
+            return np.array(vector_for(texts))
+        self.encoded += list(texts)
+        return np.array([vector_for(t) for t in texts])
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "RAG_EMBED_CACHE_ENABLED", True)
+    cache = EmbeddingCache(path=tmp_path / "cache.sqlite", max_memory_entries=2)
+    monkeypatch.setattr(embeddings_module, "embedding_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def model(monkeypatch, cache):
+    fake = FakeModel()
+    monkeypatch.setattr(EmbeddingService, "_model", fake)
+    monkeypatch.setattr(EmbeddingService, "_pool", None)
+    monkeypatch.setattr(settings, "RAG_EMBED_WORKERS", 1)
+    monkeypatch.setattr(settings, "RAG_EMBED_CHUNK_SIZE", 2)
+    return fake
+
+
+def test_memory_and_disk_tiers(cache, tmp_path):
+    vectors = np.arange(9, dtype=np.float32).reshape(3, 3)
+    cache.put_many("m", ["a", "b", "c"], vectors)
+
+    # Memory holds the 2 most recent; "a" comes back from SQLite
+    assert [v.tolist() for v in cache.get_many("m", ["c", "a", "x"])[:2]] == [[6, 7, 8], [0, 1, 2]]
+    metrics = cache.get_metrics()
+    assert (metrics["memory_hits"], metrics["disk_hits"], metrics["misses"]) == (1, 1, 1)
+    assert metrics["hit_ratio"] == round(2 / 3, 3) and metrics["stored_vectors"] == 3
+
+    # Another process (fresh instance) reuses the file
+    other = EmbeddingCache(path=tmp_path / "cache.sqlite")
+    assert other.get("m", "b").tolist() == [3, 4, 5] and other.stats["disk_hits"] == 1
+
+
+def test_nan_rows_are_not_stored(cache):
+    cache.put_many("m", ["ok", "bad"], np.array([[1, 2], [np.nan, 0]], dtype=np.float32))
+    assert cache.get("m", "bad") is None and cache.get_metrics()["stored_vectors"] == 1
+
+
+def test_model_change_invalidates(cache):
+    cache.put("old-model", "text", [1.0, 2.0])
+    assert cache.get("new-model", "text") is None
+    assert cache.stats["invalidated"] == 1 and cache.get_metrics()["stored_vectors"] == 0
+    assert cache.get("old-model", "text") is None
+
+
+def test_disabled_cache_is_bypassed(cache, monkeypatch):
+    monkeypatch.setattr(settings, "RAG_EMBED_CACHE_ENABLED", False)
+    cache.put("m", "text", [1.0])
+    assert cache.get("m", "text") is None and not cache.stats["stores"]
+
+
+@pytest.mark.asyncio
+async def test_single_embedding_served_from_cache(model, cache):
+    first = await EmbeddingService.generate_embedding("  career in data science ")
+    second = await EmbeddingService.generate_query_embedding("career in data science")
+    assert first == second == vector_for("career in data science")
+    assert model.encoded == ["career in data science"]
+    assert cache.get_metrics()["hit_ratio"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_batch_encodes_only_unique_misses(model, cache):
+    await EmbeddingService.generate_embedding("alpha")
+    texts = ["alpha", "beta", "beta", "", "gamma", "alpha", "delta"]
+
+    result = await EmbeddingService.generate_batch_embeddings(texts)
+    assert model.encoded == ["alpha", "beta", "gamma", "delta"]
+    assert EmbeddingService.valid_rows(result).tolist() == [True, True, True, False, True, True, True]
+    for i, text in enumerate(texts):
+        if text:
+            np.testing.assert_allclose(result[i], vector_for(text))
+
+    # Second pass: nothing left to encode
+    again = await EmbeddingService.generate_batch_embeddings(texts)
+    assert len(model.encoded) == 4
+    np.testing.assert_array_equal(again, result)
+
+
+@pytest.mark.asyncio
+async def test_async_lookups_do_not_block_the_event_loop(cache):
+    import asyncio
+    cache.put("m", "alpha", vector_for("alpha"))
+
+    # A blocked lookup (e.g. another writer holding the file) waits in the executor
+    cache._lock.acquire()
+    try:
+        lookup = asyncio.create_task(cache.aget("m", "alpha"))
+        await asyncio.sleep(0.05)
+        assert not lookup.done()
+    finally:
+        cache._lock.release()
+    np.testing.assert_allclose(await lookup, vector_for("alpha"))
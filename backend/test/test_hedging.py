@@ -0,0 +1,113 @@
+"""
+Tests for hedged generation over the provider chain
+
+Run from backend directory: pytest test/test_hedging.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.hedging import HedgedGenerator
+
+
+def provider(name, delay, fail=False, log=None):
+    async def call():
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(f"{name} cancelled")
+            raise
+        if fail:
+            raise RuntimeError(f"{name} down")
+        return {"content": f"from {name}", "citations": [], "model": name}
+    return name, call
+
+
+@pytest.fixture(autouse=True)
+def fast_deadlines(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_HEDGE_DEFAULT_DELAY", 0.05)
+    monkeypatch.setattr(settings, "LLM_HEDGE_MIN_DELAY", 0.01)
+    monkeypatch.setattr(settings, "LLM_HEDGE_MIN_SAMPLES", 3)
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    generator = HedgedGenerator()
+    log = []
+
+    started = time.perf_counter()
+    result = await generator.run(
+        [provider("flash", 1.0, log=log), provider("lite", 0.02)],
+        mode="hedged"
+    )
+    elapsed = time.perf_counter() - started
+
+    assert result["model"] == "lite"
+    assert elapsed < 0.5
+    await asyncio.sleep(0)
+    assert log == ["flash cancelled"]
+
+    metrics = generator.get_metrics()
+    assert metrics["hedges_fired"] == 1
+    assert metrics["hedge_wins"] == 1
+    assert metrics["providers"]["flash"]["cancelled"] == 1
+    assert metrics["providers"]["lite"]["win_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_never_hedges():
+    generator = HedgedGenerator()
+    result = await generator.run([provider("flash", 0.0), provider("lite", 0.0)], mode="hedged")
+
+    assert result["model"] == "flash"
+    assert "lite" not in generator.providers
+    assert generator.hedges_fired == 0
+
+
+@pytest.mark.asyncio
+async def test_failure_moves_down_the_chain_without_waiting():
+    generator = HedgedGenerator()
+
+    started = time.perf_counter()
+    result = await generator.run(
+        [provider("flash", 0.0, fail=True), provider("lite", 0.0, fail=True), provider("sonar", 0.0)],
+        mode="hedged"
+    )
+
+    assert result["model"] == "sonar"
+    assert time.perf_counter() - started < 0.05
+    assert generator.providers["flash"]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_race_mode_fires_everything_and_all_failures_raise():
+    generator = HedgedGenerator()
+    result = await generator.run(
+        [provider("flash", 0.2), provider("lite", 0.0), provider("sonar", 0.2)],
+        mode="race"
+    )
+    assert result["model"] == "lite"
+    assert generator.providers["flash"]["cancelled"] == 1
+    assert generator.providers["sonar"]["cancelled"] == 1
+
+    with pytest.raises(Exception, match="All models failed"):
+        await generator.run([provider("flash", 0.0, fail=True), provider("lite", 0.0, fail=True)])
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_tracks_p95():
+    generator = HedgedGenerator()
+    for latency in [0.1, 0.1, 0.1, 0.1, 0.3]:
+        generator._provider("flash")
+        generator.latency["flash"].record(latency)
+
+    assert 0.1 < generator.hedge_delay("flash") <= 0.3
@@ -0,0 +1,102 @@
+"""
+Tests for the shared HTTP client registry (core/http_client.py)
+
+A local keep-alive HTTP/1.1 server counts the TCP connections it accepts,
+so connection reuse can be checked against the pool stats.
+
+Run from backend directory: pytest test/test_http_client.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.http_client import HTTPClientRegistry
+
+
+@pytest_asyncio.fixture
+async def server():
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head:
+                    break
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    srv = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = srv.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/", connections
+    srv.close()
+    await srv.wait_closed()
+
+
+@pytest_asyncio.fixture
+async def registry(monkeypatch):
+    monkeypatch.setattr(settings, "HTTP2_ENABLED", False)
+    registry = HTTPClientRegistry()
+    yield registry
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_is_shared_and_connections_reused(server, registry):
+    url, connections = server
+    client = registry.get("web")
+    assert registry.get("web") is client and registry.get("brevo") is not client
+
+    for _ in range(3):
+        response = await registry.get("web").get(url)
+        assert response.text == "ok"
+
+    stats = registry.get_metrics()["pools"]["web"]
+    assert len(connections) == 1
+    assert (stats["requests"], stats["new_connections"], stats["reused_connections"]) == (3, 1, 2)
+    assert stats["open_connections"] == 1 and stats["errors"] == 0
+    assert registry.get_metrics()["pools"]["brevo"]["max_connections"] == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_counted(registry):
+    client = registry.get("web")
+    with pytest.raises(Exception):
+        # Nothing listens on port 9 (discard) locally
+        await client.get("http://127.0.0.1:9/", timeout=2.0)
+    assert registry.get_metrics()["pools"]["web"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_connect_retries_configurable(registry, monkeypatch):
+    monkeypatch.setattr(settings, "HTTP_CONNECT_RETRIES", 0)
+    assert registry.get("web")._transport._pool._retries == 0
+    monkeypatch.setitem(HTTPClientRegistry.UPSTREAMS, "custom", {"retries": 3})
+    assert registry.get("custom")._transport._pool._retries == 3
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_pools_and_get_reopens(server, registry):
+    url, _ = server
+    client = registry.get("web")
+    await client.get(url)
+
+    await registry.aclose()
+    assert client.is_closed
+    # Stats survive shutdown, a later get() builds a fresh pool
+    assert registry.get_metrics()["pools"]["web"]["requests"] == 1
+    reopened = registry.get("web")
+    assert reopened is not client and (await reopened.get(url)).text == "ok"
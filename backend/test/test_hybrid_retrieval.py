@@ -0,0 +1,174 @@
+"""
+Tests for hybrid retrieval: the BM25 inverted index, reciprocal rank
+fusion, the optional cross-encoder rerank, indexer-maintained BM25 files
+and the offline recall@k / MRR harness
+
+Run from backend directory: pytest test/test_hybrid_retrieval.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.rag.bm25_index import BM25Index
+from ai_career_advisor.rag.evaluation import RetrievalEvaluator
+from ai_career_advisor.rag.hybrid import HybridRanker, CrossEncoderReranker
+from ai_career_advisor.rag.indexer import KnowledgeIndexer
+from test_knowledge_indexer import MemoryStore, CountingEmbedder, make_docs
+
+COLLEGE_DOCS = [
+    {"id": "cd_1", "content": "IIT Bombay B.Tech Computer Science: Fees: 8 L, Average package: 21 LPA", "metadata": {"source": "college_detail"}},
+    {"id": "cd_2", "content": "IIT Delhi B.Tech Computer Science: Fees: 9 L, Average package: 20 LPA", "metadata": {"source": "college_detail"}},
+    {"id": "cd_3", "content": "NIT Trichy B.Tech Computer Science: Fees: 5 L, Average package: 12 LPA", "metadata": {"source": "college_detail"}},
+    {"id": "cd_4", "content": "IIT Bombay B.Tech Mechanical: Fees: 8 L, Average package: 14 LPA", "metadata": {"source": "college_detail"}},
+]
+
+
+def hit(doc_id, score=1.0):
+    return {"id": doc_id, "document": f"doc {doc_id}", "metadata": {}, "score": score}
+
+
+@pytest.fixture
+def bm25(tmp_path):
+    index = BM25Index(tmp_path / "test_bm25.sqlite")
+    index.add(COLLEGE_DOCS)
+    yield index
+    index.close()
+
+
+def test_bm25_ranks_exact_names(bm25):
+    hits = bm25.search("IIT Bombay computer science fees", top_k=3)
+    assert [h["id"] for h in hits] == ["cd_1", "cd_4", "cd_2"]
+    assert hits[0]["document"] == COLLEGE_DOCS[0]["content"] and hits[0]["metadata"] == {"source": "college_detail"}
+    assert bm25.search("what is the", top_k=3) == [] and bm25.search("unknownword") == []
+
+
+def test_bm25_updates_are_incremental_and_persisted(bm25):
+    bm25.add([{"id": "cd_2", "content": "IIT Delhi B.Tech Electrical: Fees: 9 L", "metadata": {}}])
+    bm25.remove(["cd_3", "missing"])
+    assert bm25.count() == 3
+    assert "cd_3" not in [h["id"] for h in bm25.search("trichy computer")]
+    assert [h["id"] for h in bm25.search("electrical")] == ["cd_2"]
+
+    reopened = BM25Index(bm25.path)
+    df = dict(reopened.conn.execute("SELECT term, df FROM terms").fetchall())
+    assert df["computer"] == 1 and df["iit"] == 3 and "trichy" not in df
+    assert reopened.get_stats()["documents"] == 3
+    reopened.close()
+
+
+def test_reciprocal_rank_fusion():
+    fused = HybridRanker.reciprocal_rank_fusion(
+        {"vector": [hit("a", 0.9), hit("b", 0.8)], "bm25": [hit("b", 12.0), hit("c", 3.0)]},
+        {"vector": 1.0, "bm25": 1.0}, k=60
+    )
+    assert [h["id"] for h in fused] == ["b", "a", "c"]
+    assert fused[0]["vector_score"] == 0.8 and fused[0]["bm25_score"] == 12.0
+    assert fused[1]["bm25_score"] is None
+    assert 0 < fused[-1]["score"] < fused[0]["score"] <= 1.0
+
+    # A zero weight switches a retriever off; rank 1 of the rest scores 1.0
+    only_bm25 = HybridRanker.reciprocal_rank_fusion(
+        {"vector": [hit("a")], "bm25": [hit("c")]}, {"vector": 0.0, "bm25": 1.0}, top_k=5
+    )
+    assert [(h["id"], h["score"]) for h in only_bm25] == [("c", 1.0)]
+
+
+class FakeCrossEncoder:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def predict(self, pairs, show_progress_bar=False):
+        if self.fail:
+            raise RuntimeError("model missing")
+        return [5.0 if doc.endswith(" c") else -5.0 for _, doc in pairs]
+
+
+@pytest.mark.asyncio
+async def test_reranker_reorders_head_and_degrades(monkeypatch):
+    monkeypatch.setattr(settings, "RAG_RERANK_TOP_N", 2)
+    hits = [hit("a", 1.0), hit("c", 0.9), hit("d", 0.5)]
+    reranker = CrossEncoderReranker()
+    reranker._model = FakeCrossEncoder()
+
+    monkeypatch.setattr(settings, "RAG_RERANK_ENABLED", False)
+    assert [h["id"] for h in await reranker.rerank("q", [dict(h) for h in hits])] == ["a", "c", "d"]
+
+    monkeypatch.setattr(settings, "RAG_RERANK_ENABLED", True)
+    reranked = await reranker.rerank("q", [dict(h) for h in hits])
+    assert [h["id"] for h in reranked] == ["c", "a", "d"]
+    assert reranked[0]["score"] > 0.99 and reranked[0]["fused_score"] == 0.9
+
+    reranker._model = FakeCrossEncoder(fail=True)
+    assert [h["id"] for h in await reranker.rerank("q", [dict(h) for h in hits])] == ["a", "c", "d"]
+    assert not reranker.available
+
+
+@pytest.fixture
+def indexer(tmp_path):
+    return KnowledgeIndexer(
+        persist_directory=tmp_path, vector_store=MemoryStore(),
+        embed_fn=CountingEmbedder(), embedding_model="test-model"
+    )
+
+
+def bm25_ids(indexer, query, collection=None):
+    index = indexer.open_bm25(collection)
+    try:
+        return [h["id"] for h in index.search(query, top_k=50)]
+    finally:
+        index.close()
+
+
+@pytest.mark.asyncio
+async def test_indexer_keeps_bm25_in_step(indexer):
+    await indexer.sync(make_docs(5))
+    assert sorted(bm25_ids(indexer, "college")) == [f"college_{i}" for i in range(5)]
+
+    docs = make_docs(4)
+    docs[0]["content"] = "College 0 Pune"
+    await indexer.sync(docs)
+    assert bm25_ids(indexer, "pune") == ["college_0"] and "college_4" not in bm25_ids(indexer, "college")
+    assert indexer.get_stats()["bm25"]["documents"] == 4
+
+    # Full rebuild: the new collection's index includes chatbot-learned docs, the old one is dropped
+    indexer.vector_store.collections["career_knowledge"]["llm_1"] = ("MBBS answer", [0.0, 1.0], {"source": "llm_generated"})
+    await indexer.sync(docs, full_rebuild=True)
+    assert indexer.active_collection() == "career_knowledge_shadow"
+    assert bm25_ids(indexer, "mbbs") == ["llm_1"]
+    assert not indexer.bm25_path("career_knowledge").exists()
+
+
+@pytest.mark.asyncio
+async def test_bm25_backfilled_for_existing_collections(indexer):
+    await indexer.sync(make_docs(3))
+    indexer.vector_store.collections["career_knowledge"]["llm_1"] = ("MBBS answer", [0.0, 1.0], {"source": "llm_generated"})
+    indexer.bm25_path("career_knowledge").unlink()
+
+    stats = await indexer.sync(make_docs(3))
+    assert stats["embedded"] == 0 and not indexer._embed_fn.texts[3:]
+    assert sorted(bm25_ids(indexer, "college mbbs")) == ["college_0", "college_1", "college_2", "llm_1"]
+
+
+@pytest.mark.asyncio
+async def test_recall_and_mrr():
+    ranked = {"q1": ["a", "b", "c"], "q2": ["x", "y", "z"], "q3": ["m", "n"]}
+
+    async def search(query, top_k):
+        return ranked[query][:top_k]
+
+    queries = [
+        {"query": "q1", "relevant_ids": ["a"]},
+        {"query": "q2", "relevant_ids": ["z", "w"]},
+        {"query": "q3", "relevant_ids": ["nope"]}
+    ]
+    result = await RetrievalEvaluator.evaluate(search, queries, ks=(1, 3))
+    assert result["recall@1"] == round(1 / 3, 4) and result["recall@3"] == round(1.5 / 3, 4)
+    assert result["mrr"] == round((1 + 1 / 3) / 3, 4) and result["misses"] == ["q3"]
+    assert result["precision@1"] == round(1 / 3, 4) and result["precision@3"] == round((1 / 3 + 1 / 3) / 3, 4)
+    assert 0 <= result["latency_p50_ms"] <= result["latency_p95_ms"]
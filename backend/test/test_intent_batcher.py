@@ -0,0 +1,90 @@
+"""
+Tests for the async micro-batcher used by the intent classifier
+
+A fake classifier stands in for DistilBERT; no torch needed.
+
+Run from backend directory: pytest test/test_intent_batcher.py
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.micro_batcher import MicroBatcher
+from ai_career_advisor.services import intentfilter as intentfilter_module
+from ai_career_advisor.services.intentfilter import IntentFilterML
+
+
+class FakeClassifier:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.threads = set()
+        self.fail = fail
+
+    def predict_batch(self, texts):
+        self.calls.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return [("career_query" if "career" in t else "off_topic", 0.9) for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_batches_and_get_their_own_result():
+    classifier = FakeClassifier()
+    batcher = MicroBatcher(classifier.predict_batch, max_batch_size=8, max_wait_ms=50, name="test-batcher")
+
+    texts = [f"career {i}" if i % 2 else f"movie {i}" for i in range(20)]
+    results = await asyncio.gather(*(batcher.submit(t) for t in texts))
+
+    assert results == [("career_query" if i % 2 else "off_topic", 0.9) for i in range(20)]
+    assert [len(c) for c in classifier.calls] == [8, 8, 4]
+    assert classifier.threads == {"test-batcher_0"}
+
+    stats = batcher.get_stats()
+    assert stats["batches"] == 3
+    assert stats["max_batch_size_seen"] == 8
+    batcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_lone_request_is_flushed_after_max_wait():
+    classifier = FakeClassifier()
+    batcher = MicroBatcher(classifier.predict_batch, max_batch_size=32, max_wait_ms=5)
+
+    assert await asyncio.wait_for(batcher.submit("career help"), timeout=1) == ("career_query", 0.9)
+    assert classifier.calls == [["career help"]]
+    batcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller_and_batcher_keeps_running():
+    classifier = FakeClassifier(fail=True)
+    batcher = MicroBatcher(classifier.predict_batch, max_batch_size=4, max_wait_ms=20)
+
+    results = await asyncio.gather(*(batcher.submit(t) for t in ["a", "b", "c"]), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    classifier.fail = False
+    assert await batcher.submit("career") == ("career_query", 0.9)
+    assert batcher.get_stats()["errors"] == 1
+    batcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_async_filter_uses_rules_when_model_unavailable(monkeypatch):
+    monkeypatch.setattr(intentfilter_module, "_ml_model_available", False)
+    monkeypatch.setattr(intentfilter_module, "_load_ml_model", lambda: None)
+
+    greeting = await IntentFilterML.is_career_related_async("hello there")
+    assert greeting["method"] == "greeting"
+
+    result = await IntentFilterML.is_career_related_async("jee cutoff for nit trichy")
+    assert result == IntentFilterML.is_career_related("jee cutoff for nit trichy")
+    assert result["method"] == "keyword"
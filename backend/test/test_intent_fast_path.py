@@ -0,0 +1,123 @@
+"""
+Tests for the intent fast path: lexical pre-classifier + prediction cache
+
+Run from backend directory: pytest test/test_intent_fast_path.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.services import intentfilter as intentfilter_module
+from ai_career_advisor.services.intentfilter import IntentFilterML, LexicalMatcher, _trie_regex
+from ai_career_advisor.services.monitoring_service import monitor
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def linear_scan(query_lower):
+    """The original list-based checks, kept as the reference behaviour"""
+    if len(query_lower) < 2:
+        return "validation", False
+    for greeting in IntentFilterML.GREETINGS:
+        if query_lower == greeting or query_lower.startswith(greeting + " "):
+            return "greeting", True
+    for keyword in IntentFilterML.BLACKLIST_KEYWORDS:
+        if keyword in query_lower:
+            return "blacklist", False
+    for keyword in IntentFilterML.CAREER_KEYWORDS:
+        if keyword in query_lower:
+            return "keyword", True
+    return "default", True
+
+
+def dataset_queries():
+    queries = []
+    for name in ("intent_training_data_augmented.json", "intent_training_data_expanded.json"):
+        with open(DATA_DIR / name, encoding="utf-8") as f:
+            queries += [row["text"] for row in json.load(f)["training_data"]]
+    return queries + ["", "a", "hi", "hii there", "history of iit", "essex university", "sussex", "catering", "hey!"]
+
+
+class FakeClassifier:
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, text):
+        self.calls += 1
+        return "college_query", 0.95
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    classifier = FakeClassifier()
+    monkeypatch.setattr(intentfilter_module, "_ml_model_available", True)
+    monkeypatch.setattr(intentfilter_module, "_intent_classifier", classifier)
+    IntentFilterML.clear_cache()
+    yield classifier
+    IntentFilterML.clear_cache()
+
+
+def test_trie_regex_prefers_longest_keyword():
+    import re
+    pattern = re.compile(_trie_regex(["ca", "cat", "cds"]))
+    assert pattern.fullmatch("cat") and pattern.fullmatch("ca") and pattern.fullmatch("cds")
+    assert pattern.match("cats").group(0) == "cat"
+
+
+def test_lexical_pass_matches_linear_scans_on_datasets(monkeypatch):
+    monkeypatch.setattr(intentfilter_module, "_ml_model_available", False)
+    monkeypatch.setattr(intentfilter_module, "_load_ml_model", lambda: None)
+
+    for query in dataset_queries():
+        query_lower = query.lower().strip()
+        result = IntentFilterML.is_career_related(query)
+        assert (result["method"], result["is_career"]) == linear_scan(query_lower), query
+
+
+def test_blacklisted_word_inside_longer_keyword_is_still_blocked():
+    matcher = LexicalMatcher(["hi"], ["sex"], ["sexology", "iit"])
+    assert matcher.scan("iit sexology course") == ("sex", "iit")
+    assert matcher.match_greeting("history") is None
+    assert matcher.match_greeting("hi there") == "hi"
+
+
+def test_cache_skips_model_for_repeated_normalized_queries(fake_model):
+    before = monitor.get_intent_fast_path_metrics()
+
+    first = IntentFilterML.is_career_related("Best  IIT colleges")
+    second = IntentFilterML.is_career_related("best iit colleges ")
+    IntentFilterML.is_career_related("hello")
+
+    assert first == second
+    assert first["method"] == "ml"
+    assert fake_model.calls == 1
+
+    after = monitor.get_intent_fast_path_metrics()
+    assert after["lookups"] - before["lookups"] == 3
+    assert monitor.intent_cache_hits >= 1
+    assert 0 < after["short_circuit_ratio"] <= 1
+    assert IntentFilterML.get_cache_stats()["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_path_shares_the_cache(fake_model):
+    IntentFilterML.is_career_related("after 12th options")
+
+    result = await IntentFilterML.is_career_related_async("after 12th   options")
+    assert result["intent"] == "college_query"
+    assert fake_model.calls == 1
+
+
+def test_cache_is_bounded(fake_model, monkeypatch):
+    monkeypatch.setattr(intentfilter_module.settings, "INTENT_CACHE_MAX_ENTRIES", 2)
+    for query in ["what is btech", "what is mbbs", "what is bcom"]:
+        IntentFilterML.is_career_related(query)
+
+    assert list(IntentFilterML._cache) == ["what is mbbs", "what is bcom"]
@@ -0,0 +1,136 @@
+"""
+Tests for the ONNX Runtime intent classifier backend
+
+- Export + parity on a tiny randomly initialised DistilBERT (always runs)
+- Accuracy parity of the real exported model on the augmented dataset
+  (skipped unless models/intent_classifier holds trained weights)
+
+Run from backend directory: pytest test/test_intent_onnx.py
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("onnxruntime")
+pytest.importorskip("onnx")
+
+from transformers import DistilBertConfig, DistilBertForSequenceClassification
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.ml_models import intent_loader
+from ai_career_advisor.ml_models.export_intent_onnx import export_intent_onnx
+from ai_career_advisor.ml_models.intent_classifier import IntentClassifier
+from ai_career_advisor.ml_models.onnx_intent_classifier import OnnxIntentClassifier
+
+
+BACKEND_DIR = Path(__file__).parent.parent
+DATA_PATH = BACKEND_DIR / "data" / "intent_training_data_augmented.json"
+
+# INT8 may flip a label on near-ties; this is the accuracy budget for the real model
+MAX_ACCURACY_DROP = 0.01
+
+
+def load_dataset():
+    with open(DATA_PATH, encoding="utf-8") as f:
+        data = json.load(f)["training_data"]
+    return [row["text"] for row in data], [row["label"] for row in data]
+
+
+@pytest.fixture(scope="module")
+def tiny_export(tmp_path_factory):
+    """A 2-layer DistilBERT with the real vocab, saved and exported like a trained model"""
+    torch.manual_seed(0)
+    model_dir = tmp_path_factory.mktemp("intent_torch")
+    onnx_dir = tmp_path_factory.mktemp("intent_onnx")
+
+    for name in ("vocab.txt", "tokenizer_config.json", "special_tokens_map.json", "label_mapping.json"):
+        shutil.copy(intent_loader.TORCH_MODEL_DIR / name, model_dir / name)
+
+    config = DistilBertConfig(vocab_size=30522, dim=64, hidden_dim=128, n_layers=2, n_heads=2, num_labels=9)
+    DistilBertForSequenceClassification(config).save_pretrained(str(model_dir))
+
+    export_intent_onnx(str(model_dir), str(onnx_dir))
+    return model_dir, onnx_dir
+
+
+def test_export_writes_self_contained_dir(tiny_export):
+    _, onnx_dir = tiny_export
+    for name in ("model.onnx", "model.int8.onnx", "vocab.txt", "label_mapping.json"):
+        assert (onnx_dir / name).exists()
+    assert (onnx_dir / "model.int8.onnx").stat().st_size < (onnx_dir / "model.onnx").stat().st_size
+
+
+def test_onnx_matches_torch_probabilities(tiny_export):
+    model_dir, onnx_dir = tiny_export
+    texts, _ = load_dataset()
+    texts = texts[:128]
+
+    reference = IntentClassifier(model_path=str(model_dir), device="cpu")
+    fp32 = OnnxIntentClassifier(str(onnx_dir), quantized=False)
+
+    expected = reference.predict_batch(texts)
+    actual = fp32.predict_batch(texts)
+
+    assert [a[0] for a in actual] == [e[0] for e in expected]
+    np.testing.assert_allclose([a[1] for a in actual], [e[1] for e in expected], atol=1e-4)
+
+    detailed = fp32.get_detailed_prediction(texts[0])
+    assert detailed["predicted_intent"] == expected[0][0]
+    assert set(detailed["all_probabilities"]) == set(reference.label2id)
+
+
+def test_dynamic_padding_does_not_change_predictions(tiny_export):
+    _, onnx_dir = tiny_export
+    int8 = OnnxIntentClassifier(str(onnx_dir))
+
+    texts = ["hi", "what are the eligibility criteria for the jee advanced exam after 12th"]
+    alone = [int8.predict(t) for t in texts]
+    together = int8.predict_batch(texts)
+
+    assert [a[0] for a in alone] == [t[0] for t in together]
+    np.testing.assert_allclose([a[1] for a in alone], [t[1] for t in together], atol=1e-4)
+
+
+def test_auto_backend_prefers_onnx_export(tiny_export, monkeypatch):
+    _, onnx_dir = tiny_export
+    monkeypatch.setattr(intent_loader, "ONNX_MODEL_DIR", onnx_dir)
+    monkeypatch.setattr(intent_loader, "has_onnx_export", lambda model_dir=onnx_dir: True)
+    monkeypatch.setattr(intent_loader, "_classifier_instance", None)
+    monkeypatch.setattr(settings, "INTENT_MODEL_BACKEND", "auto")
+
+    assert intent_loader.resolve_backend() == "onnx"
+    assert isinstance(intent_loader.get_intent_classifier(), OnnxIntentClassifier)
+
+    monkeypatch.setattr(settings, "INTENT_MODEL_BACKEND", "torch")
+    assert intent_loader.resolve_backend() == ("torch" if intent_loader.has_trained_weights() else None)
+
+
+@pytest.mark.skipif(not intent_loader.has_trained_weights(), reason="trained intent model weights not present")
+def test_int8_accuracy_parity_on_augmented_dataset(tmp_path):
+    texts, labels = load_dataset()
+
+    export_intent_onnx(str(intent_loader.TORCH_MODEL_DIR), str(tmp_path))
+    reference = IntentClassifier(model_path=str(intent_loader.TORCH_MODEL_DIR), device="cpu")
+    int8 = OnnxIntentClassifier(str(tmp_path))
+
+    def accuracy(classifier):
+        predictions = []
+        for start in range(0, len(texts), 64):
+            predictions += [p[0] for p in classifier.predict_batch(texts[start:start + 64])]
+        return np.mean([p == label for p, label in zip(predictions, labels)])
+
+    torch_accuracy = accuracy(reference)
+    onnx_accuracy = accuracy(int8)
+    print(f"torch accuracy {torch_accuracy:.4f}, onnx int8 accuracy {onnx_accuracy:.4f}")
+
+    assert torch_accuracy - onnx_accuracy <= MAX_ACCURACY_DROP
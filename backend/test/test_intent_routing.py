@@ -0,0 +1,161 @@
+"""
+Tests for intent-routed retrieval (RAGRetriever.search(intent=...))
+
+Runs the real retriever over the memory-mapped store and BM25 index, with a
+hashed bag-of-words embedder standing in for MiniLM.
+
+Run from backend directory: pytest test/test_intent_routing.py
+"""
+
+import sys
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.rag.bm25_index import BM25Index
+from ai_career_advisor.rag.embeddings import EmbeddingService
+from ai_career_advisor.rag.evaluation import RetrievalEvaluator
+from ai_career_advisor.rag.indexer import KnowledgeIndexer
+from ai_career_advisor.rag.mmap_store import MmapVectorStore
+from ai_career_advisor.rag.retriever import RAGRetriever
+
+
+DIM = 64
+
+DOCS = [
+    ("college_detail_1", "college_detail", "IIT Bombay B.Tech CSE fees 8 L placements 21 LPA"),
+    ("college_detail_2", "college_detail", "IIT Delhi B.Tech CSE fees 9 L placements 20 LPA"),
+    ("college_detail_3", "college_detail", "NIT Trichy B.Tech CSE fees 5 L placements 12 LPA"),
+    ("college_1", "college", "IIT Bombay Powai Mumbai college NIRF rank 3"),
+    ("career_1", "career", "Software engineer career after IIT Bombay CSE fees and placements"),
+    ("career_2", "career", "Data scientist career salary 12 LPA"),
+    ("llm_1", "llm_generated", "IIT Bombay CSE fees are about 8 L and placements 21 LPA"),
+    ("llm_2", "llm_generated", "IIT Delhi CSE fees placements LPA"),
+]
+
+
+def embed_one(text):
+    vector = np.zeros(DIM, dtype=np.float32)
+    for token in BM25Index.tokenize(text):
+        vector[zlib.crc32(token.encode()) % DIM] += 1.0
+    return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+
+async def embed(texts):
+    return np.stack([embed_one(t) for t in texts])
+
+
+@pytest_asyncio.fixture
+async def retriever(tmp_path, monkeypatch):
+    async def query_embedding(query):
+        return embed_one(query).tolist()
+
+    monkeypatch.setattr(EmbeddingService, "generate_query_embedding", staticmethod(query_embedding))
+    monkeypatch.setattr(settings, "RAG_RERANK_ENABLED", False)
+    monkeypatch.setattr(settings, "RAG_ROUTING_ENABLED", True)
+    monkeypatch.setattr(settings, "RAG_ROUTING_MIN_HITS", 2)
+    # Hashed bag-of-words similarities run lower than MiniLM's
+    monkeypatch.setattr(settings, "RAG_CONTEXT_MIN_SCORE", 0.0)
+
+    indexer = KnowledgeIndexer(
+        persist_directory=tmp_path, vector_store=MmapVectorStore(tmp_path / "vectors"),
+        embed_fn=embed, embedding_model="test"
+    )
+    await indexer.sync([
+        {"id": doc_id, "content": content, "metadata": {"source": source}}
+        for doc_id, source, content in DOCS
+    ])
+    rag = RAGRetriever(indexer=indexer)
+    yield rag
+    rag.bm25.close()
+
+
+def test_bm25_source_filter(tmp_path):
+    index = BM25Index(tmp_path / "bm25.sqlite")
+    index.add([{"id": doc_id, "content": content, "metadata": {"source": source}} for doc_id, source, content in DOCS])
+    hits = index.search("IIT Bombay CSE fees", top_k=10, sources=["college_detail", "college"])
+    assert {h["id"] for h in hits} == {"college_detail_1", "college_detail_2", "college_detail_3", "college_1"}
+    # Same scores as the unfiltered search: idf is corpus-wide
+    unfiltered = {h["id"]: h["score"] for h in index.search("IIT Bombay CSE fees", top_k=10)}
+    assert all(h["score"] == pytest.approx(unfiltered[h["id"]]) for h in hits)
+    index.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("hybrid", [True, False])
+async def test_intent_routes_to_sources(retriever, monkeypatch, hybrid):
+    monkeypatch.setattr(settings, "RAG_HYBRID_ENABLED", hybrid)
+
+    unrouted = await retriever.search("IIT Bombay CSE fees", top_k=4)
+    assert unrouted["route"] == "global"
+    assert {"career", "llm_generated"} & {m["source"] for m in unrouted["metadatas"]}
+
+    routed = await retriever.search("IIT Bombay CSE fees", top_k=4, intent="college_query")
+    assert routed["route"] == "routed" and "college_detail_1" in routed["ids"]
+    # Chatbot-learned answers stay reachable; career documents are filtered out
+    sources = {m["source"] for m in routed["metadatas"]}
+    assert "llm_generated" in sources and sources <= {"college", "college_detail", "branch", "llm_generated"}
+
+    # Intents without partitions search everything
+    assert (await retriever.search("IIT Bombay CSE fees", top_k=4, intent="recommendation_request"))["route"] == "global"
+
+
+@pytest.mark.asyncio
+async def test_low_recall_falls_back_to_global(retriever, monkeypatch):
+    # No entrance_exam documents at all, only the two llm_generated ones in the partition
+    monkeypatch.setattr(settings, "RAG_ROUTING_MIN_HITS", 3)
+    result = await retriever.search("IIT Bombay CSE fees", top_k=4, intent="exam_query")
+    assert result["route"] == "fallback" and result["found"]
+    assert result["ids"] == (await retriever.search("IIT Bombay CSE fees", top_k=4))["ids"]
+
+    stats = retriever.get_routing_stats()
+    assert (stats["routed"], stats["fallback"], stats["global"]) == (0, 1, 1)
+    assert stats["fallback_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_routing_improves_precision(retriever):
+    queries = [
+        {"query": "IIT Bombay CSE fees placements", "relevant_ids": ["college_detail_1", "college_1"], "intent": "college_query"},
+        {"query": "IIT Delhi CSE fees placements", "relevant_ids": ["college_detail_2"], "intent": "college_query"}
+    ]
+    intents = {q["query"]: q["intent"] for q in queries}
+
+    async def global_ids(query, top_k):
+        return (await retriever.search(query, top_k=top_k))["ids"]
+
+    async def routed_ids(query, top_k):
+        return (await retriever.search(query, top_k=top_k, intent=intents[query]))["ids"]
+
+    baseline = await RetrievalEvaluator.evaluate(global_ids, queries, ks=(1, 3))
+    routed = await RetrievalEvaluator.evaluate(routed_ids, queries, ks=(1, 3))
+    assert routed["precision@3"] > baseline["precision@3"]
+    assert routed["mrr"] >= baseline["mrr"] and routed["latency_p50_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_saved_answers_written_off_the_event_loop(retriever, monkeypatch):
+    import threading
+    monkeypatch.setattr(EmbeddingService, "generate_batch_embeddings", staticmethod(embed))
+    writer_threads = []
+    original_add = BM25Index.add
+
+    def recording_add(self, docs):
+        writer_threads.append(threading.current_thread())
+        return original_add(self, docs)
+
+    monkeypatch.setattr(BM25Index, "add", recording_add)
+    saved = await retriever.add_many_to_knowledge_base([
+        {"query": "NIT Warangal fees?", "response": "NIT Warangal CSE fees 6 L", "metadata": {}}
+    ])
+    assert saved == 1 and writer_threads and threading.main_thread() not in writer_threads
+
+    result = await retriever.search("NIT Warangal CSE fees", top_k=2, intent="college_query")
+    assert result["metadatas"][0]["source"] == "llm_generated"
@@ -0,0 +1,185 @@
+"""
+Tests for the Gemini (key, model) scheduler
+
+Run from backend directory: pytest test/test_key_scheduler.py
+"""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from google.api_core.exceptions import ResourceExhausted
+from ai_career_advisor.core import key_scheduler as key_scheduler_module
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.key_scheduler import KeyScheduler, parse_retry_after
+from ai_career_advisor.core.llm_providers import GeminiClient
+from ai_career_advisor.core.model_manager import ModelManager
+
+
+KEYS = ["key-alpha-1111", "key-bravo-2222"]
+MODELS = ["gemini-2.5-flash", "gemini-2.5-flash-lite"]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(key_scheduler_module.time, "time", clock.time)
+    monkeypatch.setattr(key_scheduler_module.time, "monotonic", clock.monotonic)
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_and_refills(clock):
+    scheduler = KeyScheduler(KEYS[:1], MODELS[:1], requests_per_minute=60, burst=2, max_wait=0)
+
+    await scheduler.acquire()
+    await scheduler.acquire()
+    with pytest.raises(ResourceExhausted):
+        await scheduler.acquire()
+
+    clock.now += 1.0  # 60 rpm -> one token per second
+    pair = await scheduler.acquire()
+    assert pair.api_key == KEYS[0]
+
+
+@pytest.mark.asyncio
+async def test_cooldown_expires_and_fails_over_to_other_key(clock):
+    scheduler = KeyScheduler(KEYS, MODELS[:1], requests_per_minute=600, burst=10, max_wait=0)
+
+    first = await scheduler.acquire()
+    await scheduler.release(first, success=False, retry_after=30)
+
+    # The cooled-down key is skipped while the cooldown lasts
+    for _ in range(3):
+        pair = await scheduler.acquire()
+        assert pair.api_key != first.api_key
+        await scheduler.release(pair, latency=0.5, success=True)
+
+    clock.now += 31
+    status = await scheduler.get_status()
+    assert status["pairs"][first.id]["healthy"] is True
+
+
+@pytest.mark.asyncio
+async def test_prefers_faster_pair_and_higher_priority_model(clock):
+    scheduler = KeyScheduler(KEYS, MODELS, requests_per_minute=600, burst=10)
+
+    flash_pairs = [p for p in scheduler.pairs.values() if p.model == MODELS[0]]
+    slow, fast = flash_pairs
+    await scheduler.release(slow, latency=8.0, success=True)
+    await scheduler.release(fast, latency=0.4, success=True)
+
+    pair = await scheduler.acquire()
+    assert pair is fast
+
+    # Flash-Lite is only used once every Flash pair is unavailable
+    await scheduler.cooldown_model(MODELS[0], 60)
+    pair = await scheduler.acquire()
+    assert pair.model == MODELS[1]
+
+
+@pytest.mark.asyncio
+async def test_repeated_errors_trigger_failure_cooldown(clock):
+    scheduler = KeyScheduler(KEYS[:1], MODELS[:1], requests_per_minute=600, burst=10, max_wait=0)
+
+    for _ in range(settings.LLM_SCHEDULER_FAILURE_THRESHOLD):
+        pair = await scheduler.acquire()
+        await scheduler.release(pair, latency=1.0, success=False)
+
+    with pytest.raises(ResourceExhausted):
+        await scheduler.acquire()
+
+    clock.now += settings.LLM_SCHEDULER_FAILURE_COOLDOWN + 1
+    await scheduler.acquire()
+
+
+@pytest.mark.asyncio
+async def test_any_model_never_reserves_dedicated_embedding_model(clock):
+    embedding = ModelManager.EMBEDDING_MODEL
+    scheduler = KeyScheduler(KEYS, [embedding] + MODELS, requests_per_minute=600, burst=10, dedicated_models=[embedding])
+    # Make the embedding pairs look the cheapest by far
+    for pair in scheduler.pairs.values():
+        await scheduler.release(pair, latency=0.01 if pair.model == embedding else 5.0, success=True)
+
+    for _ in range(40):
+        pair = await scheduler.acquire()
+        assert pair.model != embedding
+        await scheduler.release(pair, latency=5.0, success=True)
+    assert (await scheduler.acquire(model=embedding)).model == embedding
+
+
+@pytest.mark.asyncio
+async def test_default_limits_wait_for_refill_past_the_burst(clock, monkeypatch):
+    async def sleep(seconds):
+        clock.now += seconds
+
+    monkeypatch.setattr(key_scheduler_module.asyncio, "sleep", sleep)
+    scheduler = KeyScheduler(
+        KEYS[:1], MODELS[:1],
+        requests_per_minute=settings.GEMINI_REQUESTS_PER_MINUTE,
+        burst=settings.GEMINI_BURST,
+        max_wait=settings.LLM_SCHEDULER_MAX_WAIT
+    )
+    assert settings.LLM_SCHEDULER_MAX_WAIT >= 60 / settings.GEMINI_REQUESTS_PER_MINUTE
+
+    started = clock.now
+    for _ in range(int(settings.GEMINI_BURST) + 1):
+        await scheduler.acquire()
+    # The call past the burst waited one refill instead of failing
+    assert clock.now - started == pytest.approx(60 / settings.GEMINI_REQUESTS_PER_MINUTE, abs=0.1)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("37s") == 37.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+
+
+@pytest.mark.asyncio
+async def test_model_manager_moves_to_next_key_on_429(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.headers["x-goog-api-key"]
+        calls.append(key)
+        if key == KEYS[0]:
+            return httpx.Response(429, json={"error": {
+                "message": "Quota exceeded",
+                "details": [{"retryDelay": "40s"}]
+            }})
+        return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": "ok"}]}}]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        monkeypatch.setattr(ModelManager, "GEMINI_API_KEYS", KEYS)
+        monkeypatch.setattr(ModelManager, "_scheduler", None)
+        monkeypatch.setattr(settings, "REDIS_URL", None)
+        monkeypatch.setattr(ModelManager, "_gemini_clients", {k: GeminiClient(k, http_client=http) for k in KEYS})
+
+        # Make the first key look fastest so it is tried first
+        scheduler = ModelManager.get_scheduler()
+        first = next(p for p in scheduler.pairs.values() if p.api_key == KEYS[0] and p.model == MODELS[0])
+        await scheduler.release(first, latency=0.1, success=True)
+
+        text = await ModelManager.generate_with_gemini("hello", model=MODELS[0])
+
+    assert text == "ok"
+    assert calls == [KEYS[0], KEYS[1]]
+    status = await scheduler.get_status()
+    assert status["pairs"][first.id]["cooldown_remaining_s"] > 30
@@ -0,0 +1,146 @@
+"""
+Tests for compaction of the chatbot-learned (llm_generated) RAG documents
+
+Uses the in-memory VectorStore stand-in from test_knowledge_indexer and an
+in-memory SQLite database for the ChatConversation ratings.
+
+Run from backend directory: pytest test/test_knowledge_compaction.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.models.chatconversation import ChatConversation
+from ai_career_advisor.rag.compaction import KnowledgeCompactor
+from ai_career_advisor.rag.indexer import KnowledgeIndexer
+from test_knowledge_indexer import MemoryStore, CountingEmbedder, make_docs
+
+
+DAY = 86400
+NOW = time.time()
+
+
+class SearchableStore(MemoryStore):
+    def count(self, collection):
+        return len(collection)
+
+    def search(self, collection, query_embedding, top_k=5):
+        query = np.asarray(query_embedding, dtype=np.float32)
+        return sorted(collection, key=lambda id_: -float(np.dot(query, collection[id_][1])))[:top_k]
+
+
+def llm_doc(doc_id, vector, age_days, session_id=None, query="jee fees"):
+    metadata = {"source": "llm_generated", "original_query": query, "timestamp": NOW - age_days * DAY}
+    if session_id:
+        metadata["session_id"] = session_id
+    return doc_id, (f"answer {doc_id} about {query}", vector, metadata)
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    monkeypatch.setattr(settings, "RAG_COMPACTION_TTL_DAYS", 30)
+    monkeypatch.setattr(settings, "RAG_COMPACTION_SIMILARITY", 0.95)
+    monkeypatch.setattr(settings, "RAG_COMPACTION_MAX_DOCUMENTS", 0)
+
+
+def test_select_evictions_ttl_duplicates_and_cap(limits, monkeypatch):
+    ids = ["old", "fresh", "fresh_dup", "rated_dup", "other", "no_vector"]
+    embeddings = [[1.0, 0.0], [1.0, 0.0], [0.99, 0.01], [1.0, 0.02], [0.0, 1.0], None]
+    timestamps = [NOW - 60 * DAY, NOW - 1 * DAY, NOW - 2 * DAY, NOW - 10 * DAY, NOW - 5 * DAY, None]
+    ratings = [None, None, None, True, False, None]
+
+    evictions = KnowledgeCompactor.select_evictions(ids, embeddings, timestamps, ratings, NOW)
+    # The upvoted answer represents the cluster even though it is older
+    assert evictions == {"expired": ["old"], "duplicates": ["fresh", "fresh_dup"], "over_cap": []}
+
+    monkeypatch.setattr(settings, "RAG_COMPACTION_MAX_DOCUMENTS", 2)
+    evictions = KnowledgeCompactor.select_evictions(ids, embeddings, timestamps, ratings, NOW)
+    # Kept in rank order: rated_dup, no_vector (unrated, undated), other (downvoted)
+    assert evictions["over_cap"] == ["other"]
+
+
+@pytest_asyncio.fixture
+async def Session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(ChatConversation.metadata.create_all, tables=[ChatConversation.__table__])
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def compactor(tmp_path, Session, limits):
+    indexer = KnowledgeIndexer(
+        persist_directory=tmp_path, vector_store=SearchableStore(),
+        embed_fn=CountingEmbedder(), embedding_model="test-model"
+    )
+    await indexer.sync(make_docs(5))
+    live = indexer.vector_store.collections["career_knowledge"]
+    learned = dict([
+        llm_doc("llm_a", [1.0, 0.0], 3, session_id="s1"),
+        llm_doc("llm_b", [1.0, 0.01], 1, session_id="s2"),
+        llm_doc("llm_c", [0.0, 1.0], 2, query="neet cutoff"),
+        llm_doc("llm_old", [0.5, 0.5], 45, query="cuet dates")
+    ])
+    live.update(learned)
+    bm25 = indexer.open_bm25()
+    bm25.add([{"id": k, "content": v[0], "metadata": v[2]} for k, v in learned.items()])
+    bm25.close()
+
+    async with Session() as db:
+        db.add_all([
+            ChatConversation(sessionid="s1", userquery="jee fees", botresponse="answer a",
+                             responsetype="perplexity_search", upvoted=True),
+            ChatConversation(sessionid="s2", userquery="jee fees", botresponse="answer b",
+                             responsetype="perplexity_search")
+        ])
+        await db.commit()
+    return KnowledgeCompactor(indexer=indexer, session_factory=Session)
+
+
+def bm25_ids(indexer, query):
+    bm25 = indexer.open_bm25()
+    try:
+        return {hit["id"] for hit in bm25.search(query)}
+    finally:
+        bm25.close()
+
+
+@pytest.mark.asyncio
+async def test_dry_run_reports_without_deleting(compactor):
+    report = await compactor.compact(dry_run=True)
+
+    assert report["dry_run"] and report["llm_documents"] == 4
+    assert report["expired"] == 1 and report["duplicates"] == 1 and report["evicted"] == 2
+    assert report["collection_size_before"] == report["collection_size_after"] == 9
+    assert len(compactor.indexer.vector_store.collections["career_knowledge"]) == 9
+
+
+@pytest.mark.asyncio
+async def test_compaction_evicts_from_collection_and_bm25(compactor):
+    report = await compactor.compact()
+
+    live = compactor.indexer.vector_store.collections["career_knowledge"]
+    # Upvoted llm_a beats the newer, unrated llm_b; source documents are untouched
+    assert sorted(id_ for id_ in live if id_.startswith("llm_")) == ["llm_a", "llm_c"]
+    assert all(f"college_{i}" in live for i in range(5))
+    assert bm25_ids(compactor.indexer, "jee fees cuet dates") == {"llm_a"}
+
+    assert report["rated"] == 1
+    assert (report["collection_size_before"], report["collection_size_after"]) == (9, 7)
+    assert report["probe_queries"] == 3
+    assert set(report["latency_before"]) == set(report["latency_after"]) == {"vector_p50_ms", "bm25_p50_ms"}
+    assert compactor.get_stats()["last_run"] is report
+
+    # Nothing left to do on a second run
+    assert (await compactor.compact())["evicted"] == 0
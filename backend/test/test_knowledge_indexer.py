@@ -0,0 +1,218 @@
+"""
+Tests for the incremental, manifest-driven knowledge base indexer
+
+Uses an in-memory stand-in for the Chroma VectorStore and a counting
+embedder, so only the diffing / manifest / shadow-swap logic is exercised.
+
+Run from backend directory: pytest test/test_knowledge_indexer.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.rag.indexer import KnowledgeIndexer
+
+
+class MemoryStore:
+    """Just the VectorStore surface the indexer uses, backed by dicts"""
+
+    def __init__(self):
+        self.collections = {}
+
+    def get_or_create_collection(self, name):
+        return self.collections.setdefault(name, {})
+
+    def delete_collection(self, name):
+        self.collections.pop(name, None)
+
+    def upsert_documents(self, collection, documents, embeddings, metadatas, ids):
+        for doc, emb, meta, id_ in zip(documents, embeddings, metadatas, ids):
+            collection[id_] = (doc, emb, meta)
+
+    def delete_documents(self, collection, ids):
+        for id_ in ids:
+            collection.pop(id_, None)
+
+    def get_documents(self, collection, filter_metadata=None):
+        items = [
+            (id_, row) for id_, row in collection.items()
+            if all(row[2].get(k) == v for k, v in (filter_metadata or {}).items())
+        ]
+        return {
+            "ids": [id_ for id_, _ in items],
+            "documents": [row[0] for _, row in items],
+            "embeddings": [row[1] for _, row in items],
+            "metadatas": [row[2] for _, row in items]
+        }
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.texts = []
+        self.fail = False
+
+    async def __call__(self, texts):
+        if self.fail:
+            return []
+        self.texts += texts
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+def make_docs(n, suffix=""):
+    return [
+        {"id": f"college_{i}", "content": f"College {i}{suffix}", "metadata": {"source": "college", "college_id": i}}
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def indexer(tmp_path):
+    return KnowledgeIndexer(
+        persist_directory=tmp_path, vector_store=MemoryStore(),
+        embed_fn=CountingEmbedder(), embedding_model="test-model"
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_embeds_only_changes(indexer):
+    store, embedder = indexer.vector_store, indexer._embed_fn
+    stats = await indexer.sync(make_docs(10))
+    assert stats["embedded"] == 10 and len(store.collections["career_knowledge"]) == 10
+
+    # Chatbot-learned document in the same collection
+    store.collections["career_knowledge"]["llm_1"] = ("answer", [0.0, 1.0], {"source": "llm_generated"})
+
+    embedder.texts.clear()
+    stats = await indexer.sync(make_docs(10))
+    assert stats["embedded"] == 0 and stats["unchanged"] == 10 and not embedder.texts
+
+    docs = make_docs(9)
+    docs[3]["content"] = "College 3 (renamed)"
+    docs[4]["metadata"]["college_name"] = "New name"
+    docs.append({"id": "exam_1", "content": "JEE Main entrance exam", "metadata": {"source": "entrance_exam"}})
+    stats = await indexer.sync(docs)
+
+    assert sorted(embedder.texts) == sorted(["College 3 (renamed)", "College 4", "JEE Main entrance exam"])
+    assert stats["deleted"] == 1 and stats["unchanged"] == 7
+    live = store.collections["career_knowledge"]
+    assert "college_9" not in live and live["college_3"][0] == "College 3 (renamed)"
+    assert "llm_1" in live
+
+    manifest = indexer.open_manifest()
+    assert manifest.count() == len(docs) and manifest.get("college_9") is None
+    assert manifest.get("exam_1")["hash"] == KnowledgeIndexer.content_hash(docs[-1])
+    manifest.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_embeddings_are_retried(indexer, monkeypatch):
+    from ai_career_advisor.core.config import settings
+    monkeypatch.setattr(settings, "RAG_INDEX_BATCH_SIZE", 4)
+
+    indexer._embed_fn.fail = True
+    stats = await indexer.sync(make_docs(6))
+    assert stats["failed"] == 6 and indexer.get_stats()["tracked_documents"] == 0
+
+    indexer._embed_fn.fail = False
+    stats = await indexer.sync(make_docs(6))
+    assert stats["embedded"] == 6 and stats["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_rebuild_swaps_shadow_collection(indexer):
+    store = indexer.vector_store
+    await indexer.sync(make_docs(5))
+    store.collections["career_knowledge"]["llm_1"] = ("answer", [0.0, 1.0], {"source": "llm_generated"})
+
+    stats = await indexer.sync(make_docs(5, suffix=" v2"), full_rebuild=True)
+    assert stats["swapped"] and indexer.active_collection() == "career_knowledge_shadow"
+    assert "career_knowledge" not in store.collections
+    live = store.collections["career_knowledge_shadow"]
+    assert live["college_0"][0] == "College 0 v2" and "llm_1" in live
+
+    # A fresh reader (another process) resolves the same pointer
+    reader = KnowledgeIndexer(persist_directory=indexer.persist_directory, vector_store=store)
+    assert reader.active_collection() == "career_knowledge_shadow"
+
+    # Incremental syncs now target the swapped-in collection
+    stats = await indexer.sync(make_docs(5, suffix=" v2"))
+    assert stats["embedded"] == 0 and stats["collection"] == "career_knowledge_shadow"
+
+    # The next rebuild flips back
+    await indexer.sync(make_docs(5), full_rebuild=True)
+    assert indexer.active_collection() == "career_knowledge"
+    assert set(store.collections) == {"career_knowledge"}
+    assert not indexer.manifest_path("career_knowledge_shadow").exists()
+
+
+@pytest.mark.asyncio
+async def test_failed_shadow_build_keeps_live_collection(indexer):
+    store = indexer.vector_store
+    await indexer.sync(make_docs(5))
+
+    indexer._embed_fn.fail = True
+    stats = await indexer.sync(make_docs(5), full_rebuild=True)
+    assert not stats["swapped"] and indexer.active_collection() == "career_knowledge"
+    assert set(store.collections) == {"career_knowledge"} and len(store.collections["career_knowledge"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_embedding_model_change_forces_rebuild(indexer):
+    await indexer.sync(make_docs(3))
+    indexer._embedding_model = "other-model"
+    stats = await indexer.sync(make_docs(3))
+    assert stats["mode"] == "full_rebuild" and stats["embedded"] == 3 and stats["swapped"]
+    assert indexer.get_stats()["embedding_model"] == "other-model"
+
+
+@pytest.mark.asyncio
+async def test_shadow_build_with_some_failed_docs_is_not_swapped_in(indexer, monkeypatch):
+    from ai_career_advisor.core.config import settings
+    monkeypatch.setattr(settings, "RAG_INDEX_BATCH_SIZE", 2)
+    store = indexer.vector_store
+    await indexer.sync(make_docs(6))
+
+    async def flaky_embed(texts):
+        # One batch of the rebuild fails, the others succeed
+        return [[float("nan"), 0.0] if "College 3" in t else [float(len(t)), 1.0] for t in texts]
+
+    indexer._embed_fn = flaky_embed
+    stats = await indexer.sync(make_docs(6, suffix=" v2"), full_rebuild=True)
+    assert stats["embedded"] == 5 and stats["failed"] == 1 and not stats["swapped"]
+    assert set(store.collections) == {"career_knowledge"} and len(store.collections["career_knowledge"]) == 6
+
+
+@pytest.mark.asyncio
+async def test_concurrent_syncs_are_serialized(indexer):
+    import asyncio
+    first, second = await asyncio.gather(indexer.sync(make_docs(4)), indexer.sync(make_docs(4)))
+    # The second run starts after the first committed its manifest
+    assert (first["embedded"], second["embedded"], second["unchanged"]) == (4, 0, 4)
+
+
+@pytest.mark.asyncio
+async def test_sync_rejected_while_another_process_holds_the_lock(indexer):
+    from ai_career_advisor.rag.indexer import IndexSyncInProgressError
+    other = KnowledgeIndexer(
+        persist_directory=indexer.persist_directory, vector_store=indexer.vector_store,
+        embed_fn=CountingEmbedder(), embedding_model="test-model"
+    )
+    with other._process_lock():
+        with pytest.raises(IndexSyncInProgressError):
+            await indexer.sync(make_docs(2))
+    assert (await indexer.sync(make_docs(2)))["embedded"] == 2
+
+
+def test_manifest_lookups_span_several_in_chunks(tmp_path):
+    from ai_career_advisor.rag.indexer import IndexManifest
+    from ai_career_advisor.rag.sqlite_utils import IN_CHUNK
+    manifest = IndexManifest(tmp_path / "manifest.sqlite")
+    ids = [f"doc_{i}" for i in range(2 * IN_CHUNK + 5)]
+    manifest.record([(doc_id, "h") for doc_id in ids], run=1)
+    assert len(manifest.hashes(ids + ["missing"])) == len(ids)
+    manifest.close()
@@ -0,0 +1,102 @@
+"""
+Tests for the streaming, keyset-paginated KnowledgeLoader and the
+streamed indexer pipeline on top of it
+
+Run from backend directory: pytest test/test_knowledge_loader.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from test_knowledge_indexer import MemoryStore, CountingEmbedder
+
+import ai_career_advisor.models  # noqa: F401  (registers every table)
+from ai_career_advisor.core.database import Base
+from ai_career_advisor.models.college import College
+from ai_career_advisor.models.college_details import CollegeDetails
+from ai_career_advisor.models.degree import Degree
+from ai_career_advisor.rag.indexer import KnowledgeIndexer
+from ai_career_advisor.rag.knowledge_loader import KnowledgeLoader
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'kb.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as db:
+        db.add_all([College(id=i, name=f"College {i}", city="City", state="State", nirf_rank=i) for i in range(1, 6)])
+        db.add_all([
+            CollegeDetails(id=i, college_id=(i % 5) + 1, degree="B.Tech", branch=f"Branch {i}", fees_value=f"{i} L")
+            for i in range(1, 12)
+        ])
+        # Detail whose college row is gone -> skipped, as before
+        db.add(CollegeDetails(id=99, college_id=404, degree="B.Tech", branch="Orphan"))
+        db.add_all([Degree(id=i, name=f"Degree {i}", stream="Science") for i in range(1, 3)])
+        await db.commit()
+    yield Session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_stream_source_pages_and_joins(session_factory):
+    batches = [b async for b in KnowledgeLoader.stream_source("college_detail", 3, session_factory)]
+
+    assert [len(b) for b in batches] == [3, 3, 3, 2]
+    docs = [doc for batch in batches for doc in batch]
+    assert [doc["id"] for doc in docs] == [f"college_detail_{i}" for i in range(1, 12)]
+
+    third = docs[2]
+    assert third["metadata"]["college_name"] == "College 4"
+    assert third["content"] == "College 4 B.Tech Branch 3: Fees: 3 L"
+
+
+@pytest.mark.asyncio
+async def test_stream_all_matches_list_loaders(session_factory, monkeypatch):
+    monkeypatch.setattr("ai_career_advisor.rag.knowledge_loader.AsyncSessionLocal", session_factory)
+    failed = []
+    streamed = [doc async for batch in KnowledgeLoader.stream_all(4, failed_sources=failed) for doc in batch]
+
+    assert not failed
+    assert streamed == await KnowledgeLoader.load_all()
+    assert await KnowledgeLoader.load_colleges() == [d for d in streamed if d["metadata"]["source"] == "college"]
+
+
+@pytest.mark.asyncio
+async def test_streamed_sync_and_partial_source_failure(session_factory, tmp_path, monkeypatch):
+    from ai_career_advisor.core.config import settings
+    monkeypatch.setattr(settings, "RAG_LOADER_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "RAG_INDEX_BATCH_SIZE", 3)
+    monkeypatch.setattr(settings, "RAG_INDEX_QUEUE_SIZE", 1)
+    indexer = KnowledgeIndexer(
+        persist_directory=tmp_path / "chroma", vector_store=MemoryStore(),
+        embed_fn=CountingEmbedder(), embedding_model="test-model"
+    )
+
+    stats = await indexer.sync(session_factory=session_factory)
+    total = stats["documents"]
+    assert stats["embedded"] == total and total >= 16
+
+    async with session_factory() as db:
+        await db.execute(delete(CollegeDetails).where(CollegeDetails.id == 1))
+        await db.commit()
+    stats = await indexer.sync(session_factory=session_factory)
+    assert stats["embedded"] == 0 and stats["deleted"] == 1
+    assert "college_detail_1" not in indexer.vector_store.collections["career_knowledge"]
+
+    # A source that fails to load must not look like deleted rows
+    async with session_factory() as db:
+        await db.execute(text("DROP TABLE colleges"))
+        await db.commit()
+    stats = await indexer.sync(session_factory=session_factory)
+    assert "college" in stats["failed_sources"] and stats["deleted"] == 0
+    assert indexer.get_stats()["tracked_documents"] == total - 1
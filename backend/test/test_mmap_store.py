@@ -0,0 +1,150 @@
+"""
+Tests for the memory-mapped vector store backend (rag/mmap_store.py)
+
+Results are checked against a plain NumPy brute-force search; a second
+MmapVectorStore on the same directory stands in for another worker.
+
+Run from backend directory: pytest test/test_mmap_store.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.rag.indexer import KnowledgeIndexer
+from ai_career_advisor.rag.mmap_store import MmapVectorStore
+from test_knowledge_indexer import make_docs
+
+
+DIM = 16
+SOURCES = ["college", "entrance_exam", "llm_generated"]
+
+
+def corpus(n, seed=0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(n, DIM)).astype(np.float32)
+    ids = [f"doc_{i}" for i in range(n)]
+    documents = [f"Document {i} ₹{i * 1000}" for i in range(n)]
+    metadatas = [{"source": SOURCES[i % 3], "rank": i} for i in range(n)]
+    return ids, vectors, documents, metadatas
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MmapVectorStore(tmp_path)
+
+
+def brute_force(vectors, ids, query, k, keep=None):
+    distances = ((vectors - query) ** 2).sum(axis=1)
+    order = [i for i in np.argsort(distances) if keep is None or keep[i]]
+    return [ids[i] for i in order[:k]], distances[order[:k]]
+
+
+def test_query_matches_brute_force_and_filters(store):
+    ids, vectors, documents, metadatas = corpus(300)
+    collection = store.get_or_create_collection("career_knowledge")
+    store.add_documents(collection, documents, vectors, metadatas, ids)
+    assert store.count(collection) == 300
+
+    query = np.random.default_rng(1).normal(size=DIM).astype(np.float32)
+    results = store.search(collection, query.tolist(), top_k=10, include_embeddings=True)
+    expected_ids, expected_distances = brute_force(vectors, ids, query, 10)
+    assert results["ids"][0] == expected_ids
+    np.testing.assert_allclose(results["distances"][0], expected_distances, rtol=1e-4)
+    first = ids.index(expected_ids[0])
+    assert results["documents"][0][0] == documents[first]
+    assert results["metadatas"][0][0] == metadatas[first]
+    np.testing.assert_allclose(results["embeddings"][0][0], vectors[first])
+
+    exams = np.array([m["source"] == "entrance_exam" for m in metadatas])
+    filtered = store.search(collection, query.tolist(), top_k=5, filter_metadata={"source": "entrance_exam"})
+    assert filtered["ids"][0] == brute_force(vectors, ids, query, 5, keep=exams)[0]
+
+    where = {"$and": [{"source": {"$in": ["college", "llm_generated"]}}, {"rank": {"$ne": 0}}]}
+    assert sorted(collection.get(where=where)["ids"]) == sorted(
+        doc_id for doc_id, m in zip(ids, metadatas) if m["source"] != "entrance_exam" and m["rank"] != 0
+    )
+    assert collection.get(where={"$or": [{"rank": 3}, {"rank": 4}]})["ids"] == ["doc_3", "doc_4"]
+    assert store.get_documents(collection, {"source": "missing"})["ids"] == []
+
+
+def test_add_upsert_delete_semantics(store):
+    ids, vectors, documents, metadatas = corpus(20)
+    collection = store.get_or_create_collection("kb")
+    store.add_documents(collection, documents, vectors, metadatas, ids)
+
+    # add keeps existing IDs, upsert overwrites them
+    store.add_documents(collection, ["ignored"], [np.zeros(DIM)], [{"source": "x"}], ["doc_1"])
+    store.upsert_documents(collection, ["updated", "new"], np.ones((2, DIM)), [{"source": "y"}, {}], ["doc_2", "doc_new"])
+    store.delete_documents(collection, ["doc_3", "not_there"])
+
+    assert store.count(collection) == 20
+    found = collection.get(ids=["doc_1", "doc_2", "doc_3", "doc_new"], include=["documents", "metadatas"])
+    assert found["ids"] == ["doc_1", "doc_2", "doc_new"]
+    assert found["documents"] == [documents[1], "updated", "new"]
+    assert found["metadatas"][1:] == [{"source": "y"}, {}]
+    assert list(store.get_embeddings(collection, ["doc_2"])["doc_2"]) == [1.0] * DIM
+
+    with pytest.raises(ValueError):
+        store.upsert_documents(collection, ["bad"], np.ones((1, DIM + 1)), [{}], ["doc_bad"])
+
+
+def test_other_workers_see_swaps_and_old_mappings_stay_valid(tmp_path, store):
+    ids, vectors, documents, metadatas = corpus(50)
+    collection = store.get_or_create_collection("kb")
+    store.add_documents(collection, documents, vectors, metadatas, ids)
+
+    other = MmapVectorStore(tmp_path).get_or_create_collection("kb")
+    query = vectors[7].tolist()
+    assert other.query([query], n_results=1)["ids"][0] == ["doc_7"]
+    stale_vectors = other._segments[0].vectors
+
+    collection.delete(["doc_7"])
+    collection.upsert(ids=["doc_new"], embeddings=[vectors[7]], documents=["moved"], metadatas=[{"source": "x"}])
+    assert other.query([query], n_results=1)["ids"][0] == ["doc_new"]
+    assert other.count() == 50
+    # Pages mapped before the swap remain readable
+    assert float(stale_vectors[7][0]) == float(vectors[7][0])
+
+
+def test_segments_are_merged(store, monkeypatch):
+    monkeypatch.setattr(settings, "RAG_MMAP_MAX_SEGMENTS", 3)
+    ids, vectors, documents, metadatas = corpus(40)
+    collection = store.get_or_create_collection("kb")
+    for start in range(0, 40, 5):
+        collection.upsert(ids=ids[start:start + 5], embeddings=vectors[start:start + 5],
+                          documents=documents[start:start + 5], metadatas=metadatas[start:start + 5])
+        assert len(collection._segments) <= 3
+
+    assert collection.count() == 40
+    segment_dirs = [p for p in collection.directory.iterdir() if p.name.startswith("seg-")]
+    assert len(segment_dirs) == len(collection._segments)
+    assert collection.query([vectors[33]], n_results=1)["ids"][0] == ["doc_33"]
+    assert collection.get(ids=["doc_39", "doc_0"])["documents"] == [documents[39], documents[0]]
+
+    collection.delete(ids[:30])
+    assert len(collection._segments) == 1 and collection.count() == 10
+
+
+@pytest.mark.asyncio
+async def test_indexer_runs_on_mmap_backend(tmp_path):
+    async def embed(texts):
+        return np.asarray([[float(len(t)), 1.0] for t in texts], dtype=np.float32)
+
+    store = MmapVectorStore(tmp_path / "vectors")
+    indexer = KnowledgeIndexer(persist_directory=tmp_path, vector_store=store, embed_fn=embed, embedding_model="test")
+    await indexer.sync(make_docs(10))
+    live = store.get_or_create_collection("career_knowledge")
+    live.add(ids=["llm_1"], embeddings=[[1.0, 0.0]], documents=["answer"], metadatas=[{"source": "llm_generated"}])
+
+    stats = await indexer.sync(make_docs(8), full_rebuild=True)
+    assert stats["swapped"]
+    rebuilt = store.get_or_create_collection(indexer.active_collection())
+    assert rebuilt.count() == 9 and rebuilt.get(ids=["llm_1"])["documents"] == ["answer"]
+    assert not (tmp_path / "vectors" / "career_knowledge").exists()
@@ -0,0 +1,104 @@
+"""
+Load test: native async Gemini path under concurrency
+
+Verifies that 200 concurrent generations spread over several API keys never
+leak one key's credentials into another call (the old genai.configure()
+process-global race). Upstream is an in-memory httpx.MockTransport.
+
+Run from backend directory: pytest test/test_model_manager_load.py
+"""
+
+import asyncio
+import json
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from google.api_core.exceptions import ResourceExhausted
+from ai_career_advisor.core.llm_providers import GeminiClient
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.model_manager import ModelManager
+
+
+FAKE_KEYS = ["key-alpha-1111", "key-bravo-2222", "key-charlie-3333"]
+CONCURRENCY = 200
+
+
+async def _echo_gemini(request: httpx.Request) -> httpx.Response:
+    """Fake Gemini: answers with the key it was called with and the prompt it received"""
+    await asyncio.sleep(random.uniform(0, 0.01))  # interleave the coroutines
+    prompt = json.loads(request.content)["contents"][0]["parts"][0]["text"]
+    key = request.headers["x-goog-api-key"]
+    return httpx.Response(200, json={
+        "candidates": [{"content": {"parts": [{"text": f"{key}::{prompt}"}]}}]
+    })
+
+
+@pytest.mark.asyncio
+async def test_per_key_clients_no_cross_key_contamination():
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_echo_gemini)) as http:
+        clients = [GeminiClient(key, http_client=http) for key in FAKE_KEYS]
+
+        async def call(i: int):
+            client = clients[i % len(clients)]
+            return client.api_key, i, await client.generate("gemini-2.5-flash", f"prompt-{i}")
+
+        results = await asyncio.gather(*[call(i) for i in range(CONCURRENCY)])
+
+    assert len(results) == CONCURRENCY
+    for key, i, text in results:
+        assert text == f"{key}::prompt-{i}"
+
+
+@pytest.mark.asyncio
+async def test_model_manager_concurrent_generation_rotates_keys(monkeypatch):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_echo_gemini)) as http:
+        monkeypatch.setattr(ModelManager, "GEMINI_API_KEYS", FAKE_KEYS)
+        monkeypatch.setattr(ModelManager, "_scheduler", None)
+        monkeypatch.setattr(settings, "REDIS_URL", None)
+        monkeypatch.setattr(settings, "GEMINI_REQUESTS_PER_MINUTE", 1_000_000)
+        monkeypatch.setattr(settings, "GEMINI_BURST", CONCURRENCY)
+        monkeypatch.setattr(
+            ModelManager, "_gemini_clients",
+            {key: GeminiClient(key, http_client=http) for key in FAKE_KEYS}
+        )
+
+        results = await asyncio.gather(*[
+            ModelManager.generate_with_gemini(f"prompt-{i}", model="gemini-2.5-flash")
+            for i in range(CONCURRENCY)
+        ])
+
+    used_keys = Counter()
+    for i, text in enumerate(results):
+        key, prompt = text.split("::")
+        assert prompt == f"prompt-{i}"
+        assert key in FAKE_KEYS
+        used_keys[key] += 1
+
+    # Least-loaded selection spreads concurrent calls across every key
+    assert set(used_keys) == set(FAKE_KEYS)
+    assert max(used_keys.values()) <= 2 * min(used_keys.values())
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_maps_to_resource_exhausted():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            429,
+            headers={"retry-after": "7"},
+            json={"error": {"message": "Quota exceeded"}}
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = GeminiClient(FAKE_KEYS[0], http_client=http)
+        with pytest.raises(ResourceExhausted) as exc_info:
+            await client.generate("gemini-2.5-flash", "hello")
+
+    assert exc_info.value.retry_after == "7"
@@ -0,0 +1,152 @@
+"""
+Tests for persisted profile embeddings
+
+The embedding backend is replaced by a deterministic counter so the tests
+check WHEN vectors are computed, not their values.
+
+Run from backend directory: pytest test/test_profile_embedding.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.models.career_attributes import CareerAttributes
+from ai_career_advisor.models.user_preferences import UserPreferences
+from ai_career_advisor.models.user_career_interaction import UserCareerInteraction
+from ai_career_advisor.models.user_recommendation import UserRecommendation
+from ai_career_advisor.services.profile_embedding import ProfileEmbeddingService, profile_embeddings
+from ai_career_advisor.services.recommendation_service import RecommendationService
+
+
+DIM = 8
+
+
+@pytest.fixture
+def embed_calls(monkeypatch):
+    calls = []
+
+    async def fake_embed(text):
+        calls.append(text)
+        return [float(len(calls))] + [1.0] * (DIM - 1)
+
+    monkeypatch.setattr(ProfileEmbeddingService, "embed", staticmethod(fake_embed))
+    return calls
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    tables = [
+        UserPreferences.__table__, CareerAttributes.__table__,
+        UserCareerInteraction.__table__, UserRecommendation.__table__
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(UserPreferences.metadata.create_all, tables=tables)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as db:
+        db.add_all([
+            CareerAttributes(career_name=f"Career {i}", required_skills=["python"], interest_tags=["data"],
+                             semantic_vector=[1.0] * DIM)
+            for i in range(3)
+        ])
+        await db.commit()
+        yield db
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_vector_recomputed_only_when_profile_changes(session, embed_calls):
+    prefs = {"skills": ["python"], "interests": ["data"], "education_level": "12th"}
+
+    saved = await RecommendationService.save_user_preferences(session, "a@example.com", prefs)
+    assert len(embed_calls) == 1
+    assert saved.profile_vector_hash == ProfileEmbeddingService.profile_hash(embed_calls[0])
+    assert saved.profile_vector_model == ProfileEmbeddingService.model_id()
+
+    await RecommendationService.save_user_preferences(session, "a@example.com", prefs)
+    assert len(embed_calls) == 1
+
+    await RecommendationService.save_user_preferences(session, "a@example.com", {**prefs, "skills": ["sql"]})
+    assert len(embed_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_recommendations_reuse_stored_vector(session, embed_calls):
+    await RecommendationService.save_user_preferences(session, "b@example.com", {"skills": ["python"]})
+    hits = profile_embeddings.hits
+
+    for _ in range(3):
+        results = await RecommendationService.get_recommendations(session, "b@example.com", top_k=2)
+        assert results[0]["recommendation_type"] == "semantic_hybrid"
+
+    assert len(embed_calls) == 1
+    assert profile_embeddings.hits == hits + 3
+
+
+@pytest.mark.asyncio
+async def test_legacy_profile_is_backfilled_once(session, embed_calls):
+    session.add(UserPreferences(user_email="c@example.com", skills=["python"]))
+    await session.commit()
+
+    await RecommendationService.get_recommendations(session, "c@example.com")
+    await RecommendationService.get_recommendations(session, "c@example.com")
+    assert len(embed_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_dimension_mismatch_falls_back_to_keywords(session, embed_calls):
+    session.add(UserPreferences(user_email="d@example.com", skills=["python"]))
+    await session.commit()
+    prefs = await RecommendationService._get_user_preferences(session, "d@example.com")
+    await profile_embeddings.refresh(prefs)
+    prefs.profile_vector = [1.0] * (DIM * 2)
+    mismatches = profile_embeddings.dimension_mismatches
+
+    results = await RecommendationService.get_recommendations(session, "d@example.com")
+    assert results[0]["recommendation_type"] == "keyword_match"
+    assert profile_embeddings.dimension_mismatches == mismatches + 1
+
+
+@pytest.mark.asyncio
+async def test_batch_scoring_embeds_stale_profiles_in_one_batch(session, embed_calls, monkeypatch):
+    session.add_all([UserPreferences(user_email=f"e{i}@example.com", skills=["python"]) for i in range(3)])
+    await session.commit()
+    await RecommendationService.save_user_preferences(session, "fresh@example.com", {"skills": ["sql"]})
+    calls_before = len(embed_calls)
+
+    batches = []
+    original = ProfileEmbeddingService.embed_many
+
+    async def recording_embed_many(texts):
+        batches.append(len(texts))
+        return await original(texts)
+
+    monkeypatch.setattr(ProfileEmbeddingService, "embed_many", staticmethod(recording_embed_many))
+    emails = [f"e{i}@example.com" for i in range(3)] + ["fresh@example.com"]
+    results = await RecommendationService.get_batch_recommendations(session, emails, top_k=2)
+
+    assert batches == [3] and len(embed_calls) == calls_before + 3
+    assert all(results[email][0]["recommendation_type"] == "semantic_hybrid" for email in emails)
+    # Backfilled vectors were committed -> the online path reuses them
+    await RecommendationService.get_recommendations(session, "e0@example.com")
+    assert len(embed_calls) == calls_before + 3
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_embedding_falls_back_to_keywords(session, monkeypatch):
+    async def failing_embed(text):
+        raise RuntimeError("quota")
+
+    monkeypatch.setattr(ProfileEmbeddingService, "embed", staticmethod(failing_embed))
+    session.add(UserPreferences(user_email="f@example.com", skills=["python"]))
+    await session.commit()
+
+    results = await RecommendationService.get_batch_recommendations(session, ["f@example.com"], top_k=2)
+    assert results["f@example.com"][0]["recommendation_type"] == "keyword_match"
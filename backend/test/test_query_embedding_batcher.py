@@ -0,0 +1,90 @@
+"""
+Tests for coalescing concurrent RAG query embeddings into one encode call
+
+A fake model stands in for the SentenceTransformer; no download needed.
+
+Run from backend directory: pytest test/test_query_embedding_batcher.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.rag.embeddings import EmbeddingService
+
+
+def vector_for(text):
+    return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, show_progress_bar=None):
+        if isinstance(texts, str):
+            self.calls.append(texts)
+            return np.array(vector_for(texts))
+        self.calls.append(list(texts))
+        return np.array([vector_for(t) for t in texts])
+
+
+@pytest_asyncio.fixture
+async def model(monkeypatch):
+    fake = FakeModel()
+    monkeypatch.setattr(EmbeddingService, "_model", fake)
+    monkeypatch.setattr(EmbeddingService, "_query_batcher", None)
+    monkeypatch.setattr(settings, "RAG_EMBED_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "RAG_QUERY_BATCH_ENABLED", True)
+    monkeypatch.setattr(settings, "RAG_QUERY_BATCH_MAX_SIZE", 8)
+    monkeypatch.setattr(settings, "RAG_QUERY_BATCH_MAX_WAIT_MS", 50)
+    yield fake
+    if EmbeddingService._query_batcher is not None:
+        EmbeddingService._query_batcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_encode(model):
+    queries = [f"how to become engineer {i % 5}" for i in range(12)]
+    results = await asyncio.gather(*(EmbeddingService.generate_query_embedding(q) for q in queries))
+
+    assert results == [pytest.approx(vector_for(q)) for q in queries]
+    # 12 callers -> batches of 8 + 4, duplicates inside a window encoded once
+    assert model.calls == [
+        [f"how to become engineer {i}" for i in range(5)],
+        [f"how to become engineer {i}" for i in (3, 4, 0, 1)]
+    ]
+
+    stats = EmbeddingService.get_query_batching_stats()
+    assert stats["batches"] == 2 and stats["items"] == 12
+
+
+@pytest.mark.asyncio
+async def test_cached_queries_skip_the_batcher(model, monkeypatch, tmp_path):
+    import ai_career_advisor.rag.embeddings as embeddings_module
+    from ai_career_advisor.rag.embedding_cache import EmbeddingCache
+    monkeypatch.setattr(settings, "RAG_EMBED_CACHE_ENABLED", True)
+    monkeypatch.setattr(embeddings_module, "embedding_cache", EmbeddingCache(path=tmp_path / "cache.sqlite"))
+
+    first = await EmbeddingService.generate_query_embedding("  mbbs colleges ")
+    second = await EmbeddingService.generate_query_embedding("mbbs colleges")
+    assert first == second and model.calls == [["mbbs colleges"]]
+
+
+@pytest.mark.asyncio
+async def test_disabled_batching_encodes_per_request(model, monkeypatch):
+    monkeypatch.setattr(settings, "RAG_QUERY_BATCH_ENABLED", False)
+    await asyncio.gather(*(EmbeddingService.generate_query_embedding(q) for q in ["a", "b"]))
+    assert sorted(model.calls) == ["a", "b"]
+    assert EmbeddingService.get_query_batching_stats() is None
+
+    with pytest.raises(ValueError):
+        await EmbeddingService.generate_query_embedding("   ")
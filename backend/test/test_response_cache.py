@@ -0,0 +1,153 @@
+"""
+Tests for the two-tier LLM response cache in front of ModelManager
+
+Semantic-tier embeddings are replaced with a tiny bag-of-words vector so the
+test does not need sentence-transformers.
+
+Run from backend directory: pytest test/test_response_cache.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.response_cache import ResponseCache
+from ai_career_advisor.core import model_manager as model_manager_module
+from ai_career_advisor.core.model_manager import ModelManager
+
+
+VOCAB = ["data", "scientist", "become", "doctor", "how", "a", "i", "do", "to"]
+
+
+async def fake_embed(text):
+    words = ResponseCache.normalize(text).split()
+    vector = np.array([words.count(w) for w in VOCAB], dtype=np.float32)
+    # Filler words barely move the vector
+    vector[4:] *= 0.05
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else None
+
+
+def template(question):
+    return f"You are a career counselor.\n\nUser Query: {question}"
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache(max_entries=3, default_ttl=60, similarity_threshold=0.9)
+    monkeypatch.setattr(ResponseCache, "_embed", staticmethod(fake_embed))
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_exact_tier_ignores_case_and_whitespace(cache):
+    result = {"content": "answer", "citations": ["https://a.example"], "model": "gemini-2.5-flash"}
+    await cache.put("Hello   World", "auto", result, latency=2.0)
+
+    hit = await cache.get("hello world", "auto")
+    assert hit == result
+    assert await cache.get("hello world", "sonar-pro") is None
+
+    metrics = cache.get_metrics()
+    assert metrics["exact_hits"] == 1
+    assert metrics["misses"] == 1
+    assert metrics["latency_saved_seconds"] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_semantic_tier_matches_paraphrase_within_same_template(cache):
+    first = "how to become data scientist"
+    await cache.put(template(first), "auto", {"content": "ds roadmap"}, semantic_key=first)
+
+    paraphrase = "how do i become a data scientist"
+    hit = await cache.get(template(paraphrase), "auto", semantic_key=paraphrase)
+    assert hit["content"] == "ds roadmap"
+
+    other = "how to become doctor"
+    assert await cache.get(template(other), "auto", semantic_key=other) is None
+
+    # Same question under a different template (e.g. different RAG context) never matches
+    assert await cache.get(f"Other context\n{paraphrase}", "auto", semantic_key=paraphrase) is None
+    assert cache.get_metrics()["semantic_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_and_lru_eviction(cache):
+    await cache.put("expired", "auto", {"content": "x"}, ttl=-1)
+    assert await cache.get("expired", "auto") is None
+
+    for i in range(4):
+        await cache.put(f"prompt {i}", "auto", {"content": str(i)})
+
+    assert await cache.get("prompt 0", "auto") is None
+    assert (await cache.get("prompt 3", "auto"))["content"] == "3"
+    assert cache.get_metrics()["entries"] == 3
+
+
+@pytest.mark.asyncio
+async def test_model_manager_serves_repeat_prompts_from_cache(cache, monkeypatch):
+    calls = []
+
+    async def fake_generate_with_gemini(prompt, model=None):
+        calls.append(model)
+        return f"generated by {model}"
+
+    monkeypatch.setattr(model_manager_module, "response_cache", cache)
+    monkeypatch.setattr(ModelManager, "generate_with_gemini", staticmethod(fake_generate_with_gemini))
+
+    first = await ModelManager.generate_smart("Explain JEE", return_full=True)
+    second = await ModelManager.generate_extended("explain   jee")
+    text = await ModelManager.generate("Explain JEE")
+    assert first == second
+    assert text == "generated by gemini-2.5-flash"
+    assert calls == ["gemini-2.5-flash"]
+
+    await ModelManager.generate_smart("Explain JEE", use_cache=False)
+    assert len(calls) == 2
+
+    ModelManager.invalidate_cached("Explain JEE")
+    await ModelManager.generate_smart("Explain JEE")
+    assert len(calls) == 3
+    assert cache.get_metrics()["bypassed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_entry_served_by_semantic_hit(cache):
+    first = "how to become data scientist"
+    await cache.put(template(first), "auto", {"content": "not json"}, semantic_key=first)
+
+    paraphrase = "how do i become a data scientist"
+    assert (await cache.get(template(paraphrase), "auto", semantic_key=paraphrase))["content"] == "not json"
+
+    # The caller rejects the answer: the retry must not be served it again
+    cache.invalidate(template(paraphrase), "auto")
+    assert await cache.get(template(paraphrase), "auto", semantic_key=paraphrase) is None
+    assert await cache.get(template(first), "auto") is None
+
+
+@pytest.mark.asyncio
+async def test_close_career_names_do_not_share_answers(cache, monkeypatch):
+    from ai_career_advisor.services.career_llm import generate_career_details
+
+    async def same_vector(text):
+        # Worst case: every career name embeds identically
+        return np.ones(4, dtype=np.float32) / 2
+
+    async def fake_generate_with_gemini(prompt, model=None):
+        career = "Data Analyst" if "Data Analyst" in prompt else "Data Scientist"
+        return f'{{"career": "{career}"}}'
+
+    monkeypatch.setattr(ResponseCache, "_embed", staticmethod(same_vector))
+    monkeypatch.setattr(model_manager_module, "response_cache", cache)
+    monkeypatch.setattr(ModelManager, "generate_with_gemini", staticmethod(fake_generate_with_gemini))
+
+    assert (await generate_career_details("Data Scientist"))["career"] == "Data Scientist"
+    assert (await generate_career_details("Data Analyst"))["career"] == "Data Analyst"
+    assert (await generate_career_details("data   scientist"))["career"] == "Data Scientist"
+    metrics = cache.get_metrics()
+    assert (metrics["exact_hits"], metrics["semantic_hits"]) == (1, 0)
@@ -0,0 +1,164 @@
+"""
+Tests for the chatbot write-behind queue (services/write_behind.py)
+
+Conversations go to a file SQLite database (separate connections, so the
+test's reads never share the flusher's open transaction); RAG saves go to
+a recording fake instead of Chroma.
+
+Run from backend directory: pytest test/test_write_behind.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.models.chatconversation import ChatConversation
+from ai_career_advisor.services import chatbot_service as chatbot_module
+from ai_career_advisor.services.chatbot_service import ChatbotService
+from ai_career_advisor.services.write_behind import ChatWriteBehind
+
+
+def _row(i: int, **overrides):
+    row = {
+        "sessionid": f"s{i}",
+        "useremail": "student@example.com",
+        "userquery": f"question {i}",
+        "botresponse": f"answer {i}",
+        "sources": ["AI Career Counselor"],
+        "confidence": 0.9,
+        "responsetype": "rag_verified",
+        "responsetime": 0.1
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest_asyncio.fixture
+async def Session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'chat.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(ChatConversation.metadata.create_all, tables=[ChatConversation.__table__])
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def rag_batches():
+    return []
+
+
+@pytest_asyncio.fixture
+async def queue(Session, rag_batches, monkeypatch):
+    monkeypatch.setattr(settings, "WRITE_BEHIND_ENABLED", True)
+    monkeypatch.setattr(settings, "WRITE_BEHIND_QUEUE_SIZE", 100)
+    monkeypatch.setattr(settings, "WRITE_BEHIND_BATCH_SIZE", 10)
+    monkeypatch.setattr(settings, "WRITE_BEHIND_FLUSH_MS", 50.0)
+
+    async def fake_rag_writer(items):
+        rag_batches.append(items)
+        return len(items)
+
+    write_behind = ChatWriteBehind(session_factory=Session, rag_writer=fake_rag_writer)
+    yield write_behind
+    await write_behind.drain(timeout=1)
+
+
+async def _count(Session) -> int:
+    async with Session() as db:
+        return (await db.execute(select(func.count()).select_from(ChatConversation))).scalar()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_are_flushed_in_batches(queue, Session, rag_batches):
+    await asyncio.gather(*[queue.save_conversation(**_row(i)) for i in range(25)])
+    await asyncio.gather(*[queue.save_to_rag(f"q{i}", f"answer {i}", {"session_id": f"s{i}"}) for i in range(4)])
+    # Nothing written on the producer's path (checked before yielding to the flusher)
+    assert queue.get_metrics()["written"]["conversation"] == 0
+
+    assert await queue.drain(timeout=5)
+    assert await _count(Session) == 25
+
+    metrics = queue.get_metrics()
+    assert metrics["written"] == {"conversation": 25, "rag": 4}
+    assert metrics["flushes"] < 25 + 4
+    assert metrics["max_queue_depth"] >= 10
+    assert metrics["queue_depth"] == 0
+    assert metrics["p95_flush_ms"] > 0
+    assert sum(len(batch) for batch in rag_batches) == 4
+    assert len(rag_batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_bad_row_does_not_lose_the_batch(queue, Session):
+    await queue.save_conversation(**_row(1))
+    await queue.save_conversation(**_row(2, userquery=None))  # NOT NULL violation
+    await queue.save_conversation(**_row(3))
+    await queue.drain(timeout=5)
+
+    assert await _count(Session) == 2
+    assert queue.get_metrics()["failed"]["conversation"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure_then_drops(Session, monkeypatch):
+    monkeypatch.setattr(settings, "WRITE_BEHIND_ENABLED", True)
+    monkeypatch.setattr(settings, "WRITE_BEHIND_QUEUE_SIZE", 2)
+    monkeypatch.setattr(settings, "WRITE_BEHIND_BATCH_SIZE", 1)
+    monkeypatch.setattr(settings, "WRITE_BEHIND_FLUSH_MS", 0.0)
+    monkeypatch.setattr(settings, "WRITE_BEHIND_ENQUEUE_TIMEOUT", 0.05)
+
+    release = asyncio.Event()
+
+    async def stuck_rag_writer(items):
+        await release.wait()
+        return len(items)
+
+    queue = ChatWriteBehind(session_factory=Session, rag_writer=stuck_rag_writer)
+    results = [await queue.save_to_rag(f"q{i}", f"a{i}") for i in range(4)]
+
+    # The third waited until the flusher took the first; the fourth waited and was dropped
+    assert results == [True, True, True, False]
+    metrics = queue.get_metrics()
+    assert metrics["dropped"] == 1
+    assert metrics["backpressure_waits"] == 2
+    assert metrics["queue_depth"] == 2
+
+    release.set()
+    assert await queue.drain(timeout=5)
+    assert queue.get_metrics()["written"]["rag"] == 3
+
+
+@pytest.mark.asyncio
+async def test_disabled_writes_inline(queue, Session, monkeypatch):
+    monkeypatch.setattr(settings, "WRITE_BEHIND_ENABLED", False)
+    await queue.save_conversation(**_row(1))
+
+    assert await _count(Session) == 1
+    assert queue.get_metrics()["inline_writes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_chatbot_save_conversation_only_enqueues(queue, Session, monkeypatch):
+    monkeypatch.setattr(chatbot_module, "write_behind", queue)
+
+    await ChatbotService._save_conversation(
+        object(), "s1", "student@example.com", "JEE fees?", "₹1000", "rag_verified", 0.9, 0.2, ["DB"]
+    )
+    await ChatbotService._save_conversation(
+        None, "s2", None, "skipped", "no db", "greeting", 1.0, 0.1, []
+    )
+    assert queue.get_metrics()["written"]["conversation"] == 0
+
+    await queue.drain(timeout=5)
+    async with Session() as db:
+        saved = (await db.execute(select(ChatConversation))).scalars().all()
+    assert [(c.sessionid, c.userquery, c.sources) for c in saved] == [("s1", "JEE fees?", ["DB"])]